@@ -34,6 +34,7 @@ class AgentConfig:
     max_iterations: int = 10  # Default, should be overridden by contract
     max_retries: int = 3  # Backward compatibility with existing agents
     use_sdk: bool = True  # Use Claude Agent SDK (True) or CLI wrapper (False)
+    reuse_session: bool = False  # Keep one SDK conversation across iterations (IterationLoop)
 
 
 class BaseAgent(ABC):
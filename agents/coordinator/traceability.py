@@ -10,14 +10,24 @@ This enables:
 3. Audit trail (how did we get here?)
 4. RIS correlation (what guardrail patterns were triggered?)
 
+Storage:
+    Links are indexed in memory by (type, id) in both directions, so chain
+    building is a dict lookup per hop. On disk, traceability-log.json is a
+    snapshot and traceability-log.jsonl an append-only journal of links added
+    since; the snapshot is rewritten only once the journal is at least
+    COMPACT_AFTER_LINKS lines and as long as the snapshot itself.
+
 Integration: Phase 3 of Governance Harmonization
 """
 
 import json
-from dataclasses import dataclass, field
+import os
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import yaml
 
@@ -29,6 +39,13 @@ VIBE_KANBAN_ADRS = VIBE_KANBAN_ROOT / "adrs"
 BOARD_STATE_PATH = VIBE_KANBAN_ROOT / "board-state.json"
 MISSION_CONTROL_RIS = Path("/Users/tmac/1_REPOS/MissionControl/governance/ris")
 TRACEABILITY_LOG = VIBE_KANBAN_ROOT / "traceability-log.json"
+TRACEABILITY_JOURNAL = VIBE_KANBAN_ROOT / "traceability-log.jsonl"
+
+# Minimum journal lines before the snapshot is rewritten
+COMPACT_AFTER_LINKS = 1000
+
+NodeKey = Tuple[str, str]               # (type, id)
+LinkKey = Tuple[str, str, str, str]     # (source_type, source_id, target_type, target_id)
 
 
 def utc_now() -> datetime:
@@ -84,6 +101,10 @@ class TraceChain:
             "links": [l.to_dict() for l in self.links],
         }
 
+    def copy(self) -> "TraceChain":
+        """Copy that can be modified without touching a memoized chain."""
+        return replace(self, ris_resolutions=list(self.ris_resolutions), links=list(self.links))
+
     def to_chain_string(self) -> str:
         """Generate a human-readable chain string."""
         parts = []
@@ -137,6 +158,25 @@ class TraceabilityEngine:
 
     def __init__(self):
         self.links: List[TraceLink] = []
+
+        # Adjacency indexes
+        self._by_key: Dict[LinkKey, TraceLink] = {}
+        self._forward: Dict[NodeKey, List[TraceLink]] = {}
+        self._reverse: Dict[NodeKey, List[TraceLink]] = {}
+        self._source_type_counts: Counter = Counter()
+        self._target_type_counts: Counter = Counter()
+
+        # Persistence
+        self._journal_lines = 0
+        self._unsaved: List[TraceLink] = []
+        self._batch_depth = 0
+
+        # Memoized chains (cleared when links or board state change)
+        self._task_chains: Dict[str, TraceChain] = {}
+        self._objective_chains: Dict[str, Tuple[Optional[str], List[TraceChain]]] = {}
+        self._board_cache: Optional[Tuple[float, Dict[str, Dict[str, Any]]]] = None
+        self._objective_titles: Dict[str, Tuple[float, Optional[str]]] = {}
+
         self._ensure_directories()
         self._load_state()
 
@@ -144,29 +184,92 @@ class TraceabilityEngine:
         """Ensure required directories exist."""
         VIBE_KANBAN_ROOT.mkdir(parents=True, exist_ok=True)
 
+    def _index(self, link: TraceLink) -> bool:
+        """Add a link to the in-memory graph; False if it already exists."""
+        key = (link.source_type, link.source_id, link.target_type, link.target_id)
+        if key in self._by_key:
+            return False
+        self._by_key[key] = link
+        self.links.append(link)
+        self._forward.setdefault((link.source_type, link.source_id), []).append(link)
+        self._reverse.setdefault((link.target_type, link.target_id), []).append(link)
+        self._source_type_counts[link.source_type] += 1
+        self._target_type_counts[link.target_type] += 1
+        self._task_chains.clear()
+        self._objective_chains.clear()
+        return True
+
     def _load_state(self) -> None:
-        """Load traceability state."""
+        """Load the snapshot, then replay links journaled since."""
         if TRACEABILITY_LOG.exists():
             try:
                 with open(TRACEABILITY_LOG, 'r') as f:
                     data = json.load(f)
                 for link_data in data.get("links", []):
-                    self.links.append(TraceLink(**link_data))
+                    self._index(TraceLink(**link_data))
             except Exception as e:
                 print(f"Error loading traceability state: {e}")
 
+        if TRACEABILITY_JOURNAL.exists():
+            try:
+                with open(TRACEABILITY_JOURNAL, 'r') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        self._journal_lines += 1
+                        try:
+                            self._index(TraceLink(**json.loads(line)))
+                        except (json.JSONDecodeError, TypeError):
+                            continue  # Torn write at the tail
+            except Exception as e:
+                print(f"Error loading traceability journal: {e}")
+
     def _save_state(self) -> None:
-        """Save traceability state."""
+        """Journal links added since the last save; compact when the journal is long."""
+        if not self._unsaved:
+            return
+        pending, self._unsaved = self._unsaved, []
+        try:
+            with open(TRACEABILITY_JOURNAL, 'a') as f:
+                f.write("".join(json.dumps(l.to_dict()) + "\n" for l in pending))
+            self._journal_lines += len(pending)
+        except Exception as e:
+            print(f"Error saving traceability state: {e}")
+            return
+
+        # Compact once the journal rivals the snapshot, so rewrites stay
+        # amortized O(1) per link however large the graph gets
+        if self._journal_lines >= max(COMPACT_AFTER_LINKS, len(self.links) - self._journal_lines):
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the snapshot with every link and truncate the journal."""
         try:
             data = {
-                "version": "1.0",
+                "version": "1.1",
                 "last_updated": utc_now().isoformat(),
                 "links": [l.to_dict() for l in self.links],
             }
-            with open(TRACEABILITY_LOG, 'w') as f:
+            tmp = TRACEABILITY_LOG.with_suffix(".json.tmp")
+            with open(tmp, 'w') as f:
                 json.dump(data, f, indent=2)
+            os.replace(tmp, TRACEABILITY_LOG)
+            with open(TRACEABILITY_JOURNAL, 'w'):
+                pass
+            self._journal_lines = 0
         except Exception as e:
-            print(f"Error saving traceability state: {e}")
+            print(f"Error compacting traceability state: {e}")
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Journal all links added inside the block with a single write."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._save_state()
 
     # ═══════════════════════════════════════════════════════════════════════════
     # LINK MANAGEMENT
@@ -209,8 +312,10 @@ class TraceabilityEngine:
         if existing:
             return existing
 
-        self.links.append(link)
-        self._save_state()
+        self._index(link)
+        self._unsaved.append(link)
+        if self._batch_depth == 0:
+            self._save_state()
 
         return link
 
@@ -222,27 +327,15 @@ class TraceabilityEngine:
         target_id: str,
     ) -> Optional[TraceLink]:
         """Find an existing link."""
-        for link in self.links:
-            if (link.source_type == source_type and
-                link.source_id == source_id and
-                link.target_type == target_type and
-                link.target_id == target_id):
-                return link
-        return None
+        return self._by_key.get((source_type, source_id, target_type, target_id))
 
     def get_links_from(self, source_type: str, source_id: str) -> List[TraceLink]:
         """Get all links from a source."""
-        return [
-            l for l in self.links
-            if l.source_type == source_type and l.source_id == source_id
-        ]
+        return list(self._forward.get((source_type, source_id), ()))
 
     def get_links_to(self, target_type: str, target_id: str) -> List[TraceLink]:
         """Get all links to a target."""
-        return [
-            l for l in self.links
-            if l.target_type == target_type and l.target_id == target_id
-        ]
+        return list(self._reverse.get((target_type, target_id), ()))
 
     # ═══════════════════════════════════════════════════════════════════════════
     # CHAIN BUILDING
@@ -260,11 +353,18 @@ class TraceabilityEngine:
         Returns:
             Complete TraceChain
         """
+        self._board_tasks()  # Drops memoized chains if board state changed
+        cached = self._task_chains.get(task_id)
+        if cached is None:
+            cached = self._task_chains[task_id] = self._build_chain_from_task(task_id)
+        return cached.copy()
+
+    def _build_chain_from_task(self, task_id: str) -> TraceChain:
         chain = TraceChain(task_id=task_id)
         collected_links = []
 
         # Trace up: Task → ADR
-        adr_links = self.get_links_to("task", task_id)
+        adr_links = self._reverse.get(("task", task_id), ())
         for link in adr_links:
             if link.source_type == "adr":
                 chain.adr_id = link.source_id
@@ -272,7 +372,7 @@ class TraceabilityEngine:
                 collected_links.append(link)
 
                 # Continue up: ADR → Objective
-                obj_links = self.get_links_to("adr", link.source_id)
+                obj_links = self._reverse.get(("adr", link.source_id), ())
                 for obj_link in obj_links:
                     if obj_link.source_type == "objective":
                         chain.objective_id = obj_link.source_id
@@ -282,7 +382,7 @@ class TraceabilityEngine:
                 break
 
         # Trace down: Task → RIS
-        ris_links = self.get_links_from("task", task_id)
+        ris_links = self._forward.get(("task", task_id), ())
         for link in ris_links:
             if link.target_type == "ris":
                 chain.ris_resolutions.append(link.target_id)
@@ -306,18 +406,30 @@ class TraceabilityEngine:
         Returns:
             List of TraceChains (one per task)
         """
-        chains = []
+        self._board_tasks()  # Drops memoized chains if board state changed
         objective_title = self._get_objective_title(objective_id)
+        cached = self._objective_chains.get(objective_id)
+        if cached is None or cached[0] != objective_title:
+            chains = self._build_chains_from_objective(objective_id, objective_title)
+            cached = self._objective_chains[objective_id] = (objective_title, chains)
+        return [chain.copy() for chain in cached[1]]
+
+    def _build_chains_from_objective(
+        self,
+        objective_id: str,
+        objective_title: Optional[str],
+    ) -> List[TraceChain]:
+        chains = []
 
         # Get ADRs for this objective
-        adr_links = self.get_links_from("objective", objective_id)
+        adr_links = self._forward.get(("objective", objective_id), ())
         for adr_link in adr_links:
             if adr_link.target_type == "adr":
                 adr_id = adr_link.target_id
                 adr_title = adr_link.metadata.get("adr_title")
 
                 # Get tasks for this ADR
-                task_links = self.get_links_from("adr", adr_id)
+                task_links = self._forward.get(("adr", adr_id), ())
                 for task_link in task_links:
                     if task_link.target_type == "task":
                         task_id = task_link.target_id
@@ -330,30 +442,59 @@ class TraceabilityEngine:
 
         return chains
 
+    def _board_tasks(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Board-state tasks by ID, re-read only when the file changes.
+
+        A change also drops memoized chains, since they carry task titles.
+        """
+        try:
+            mtime = BOARD_STATE_PATH.stat().st_mtime
+        except OSError:
+            mtime = -1.0
+
+        if self._board_cache is None or self._board_cache[0] != mtime:
+            tasks: Dict[str, Dict[str, Any]] = {}
+            if mtime >= 0:
+                try:
+                    with open(BOARD_STATE_PATH, 'r') as f:
+                        state = json.load(f)
+                    for task in state.get("tasks", []):
+                        tasks.setdefault(task.get("id"), task)
+                except Exception:
+                    pass
+            if self._board_cache is not None:
+                self._task_chains.clear()
+                self._objective_chains.clear()
+            self._board_cache = (mtime, tasks)
+        return self._board_cache[1]
+
     def _get_task_title(self, task_id: str) -> Optional[str]:
         """Try to get task title from board state."""
-        try:
-            if BOARD_STATE_PATH.exists():
-                with open(BOARD_STATE_PATH, 'r') as f:
-                    state = json.load(f)
-                for task in state.get("tasks", []):
-                    if task.get("id") == task_id:
-                        return task.get("title")
-        except Exception:
-            pass
-        return None
+        task = self._board_tasks().get(task_id)
+        return task.get("title") if task else None
 
     def _get_objective_title(self, objective_id: str) -> Optional[str]:
-        """Try to get objective title."""
+        """Try to get objective title (cached per file mtime)."""
         obj_file = VIBE_KANBAN_OBJECTIVES / f"{objective_id}.yaml"
-        if obj_file.exists():
-            try:
-                with open(obj_file, 'r') as f:
-                    data = yaml.safe_load(f)
-                return data.get("title")
-            except Exception:
-                pass
-        return None
+        try:
+            mtime = obj_file.stat().st_mtime
+        except OSError:
+            return None
+
+        cached = self._objective_titles.get(objective_id)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        title = None
+        try:
+            with open(obj_file, 'r') as f:
+                data = yaml.safe_load(f)
+            title = data.get("title")
+        except Exception:
+            pass
+        self._objective_titles[objective_id] = (mtime, title)
+        return title
 
     # ═══════════════════════════════════════════════════════════════════════════
     # RIS CORRELATION
@@ -472,16 +613,12 @@ class TraceabilityEngine:
                 "status": "no_tasks",
             }
 
-        # Load board state to get task statuses
-        task_statuses = {}
-        if BOARD_STATE_PATH.exists():
-            try:
-                with open(BOARD_STATE_PATH, 'r') as f:
-                    state = json.load(f)
-                for task in state.get("tasks", []):
-                    task_statuses[task.get("id")] = task.get("status", "pending")
-            except Exception:
-                pass
+        # Board state gives task statuses
+        board = self._board_tasks()
+        task_statuses = {
+            chain.task_id: board[chain.task_id].get("status", "pending")
+            for chain in chains if chain.task_id in board
+        }
 
         total = len(chains)
         completed = sum(
@@ -546,7 +683,7 @@ class TraceabilityEngine:
             Impact analysis
         """
         # Get objective for this ADR
-        obj_links = self.get_links_to("adr", adr_id)
+        obj_links = self._reverse.get(("adr", adr_id), ())
         objective_id = None
         objective_title = None
         for link in obj_links:
@@ -556,7 +693,7 @@ class TraceabilityEngine:
                 break
 
         # Get tasks for this ADR
-        task_links = self.get_links_from("adr", adr_id)
+        task_links = self._forward.get(("adr", adr_id), ())
         task_ids = [
             link.target_id
             for link in task_links
@@ -596,47 +733,46 @@ class TraceabilityEngine:
         """
         links_created = []
         objective_title = self._get_objective_title(objective_id)
-
-        # Objective → ADR links
-        for adr in adrs:
-            adr_id = adr.get("id")
-            if not adr_id:
-                continue
-            link = self.add_link(
-                source_type="objective",
-                source_id=objective_id,
-                target_type="adr",
-                target_id=adr_id,
-                relationship="decomposed_to",
-                metadata={
-                    "objective_title": objective_title,
-                    "adr_title": adr.get("title"),
-                },
-            )
-            links_created.append(link.to_dict())
-
-        # ADR → Task links
-        for task in tasks:
-            adr_id = task.get("adr_id")
-            task_id = task.get("id")
-            if not adr_id or not task_id:
-                continue
-            adr_title = next(
-                (a.get("title") for a in adrs if a.get("id") == adr_id),
-                None
-            )
-            link = self.add_link(
-                source_type="adr",
-                source_id=adr_id,
-                target_type="task",
-                target_id=task_id,
-                relationship="implements",
-                metadata={
-                    "adr_title": adr_title,
-                    "task_title": task.get("title"),
-                },
-            )
-            links_created.append(link.to_dict())
+        adr_titles = {a.get("id"): a.get("title") for a in reversed(adrs)}
+
+        with self.batch():
+            # Objective → ADR links
+            for adr in adrs:
+                adr_id = adr.get("id")
+                if not adr_id:
+                    continue
+                link = self.add_link(
+                    source_type="objective",
+                    source_id=objective_id,
+                    target_type="adr",
+                    target_id=adr_id,
+                    relationship="decomposed_to",
+                    metadata={
+                        "objective_title": objective_title,
+                        "adr_title": adr.get("title"),
+                    },
+                )
+                links_created.append(link.to_dict())
+
+            # ADR → Task links
+            for task in tasks:
+                adr_id = task.get("adr_id")
+                task_id = task.get("id")
+                if not adr_id or not task_id:
+                    continue
+                adr_title = adr_titles.get(adr_id)
+                link = self.add_link(
+                    source_type="adr",
+                    source_id=adr_id,
+                    target_type="task",
+                    target_id=task_id,
+                    relationship="implements",
+                    metadata={
+                        "adr_title": adr_title,
+                        "task_title": task.get("title"),
+                    },
+                )
+                links_created.append(link.to_dict())
 
         return {
             "objective_id": objective_id,
@@ -680,9 +816,9 @@ class TraceabilityEngine:
             "total_links": len(self.links),
             "objectives": objective_progress,
             "link_summary": {
-                "objective_to_adr": len([l for l in self.links if l.source_type == "objective"]),
-                "adr_to_task": len([l for l in self.links if l.source_type == "adr"]),
-                "task_to_ris": len([l for l in self.links if l.target_type == "ris"]),
+                "objective_to_adr": self._source_type_counts["objective"],
+                "adr_to_task": self._source_type_counts["adr"],
+                "task_to_ris": self._target_type_counts["ris"],
             },
         }
 
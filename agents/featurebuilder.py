@@ -135,10 +135,14 @@ class FeatureBuilderAgent(BaseAgent):
         project_dir = Path(self.app_context.project_path)
 
         from claude.cli_wrapper import ClaudeCliWrapper
-        from claude.sdk_adapter import ClaudeSDKAdapter
-
-        wrapper: ClaudeSDKAdapter | ClaudeCliWrapper
-        if self.config.use_sdk:
+        from claude.sdk_adapter import AgentSession, ClaudeSDKAdapter
+
+        wrapper: AgentSession | ClaudeSDKAdapter | ClaudeCliWrapper
+        if getattr(self, 'agent_session', None) is not None:
+            # Warm session kept open by IterationLoop (config.reuse_session)
+            wrapper = self.agent_session
+            print(f"♻️  Continuing in warm agent session...")
+        elif self.config.use_sdk:
             # Use Claude Agent SDK
             wrapper = ClaudeSDKAdapter(project_dir)
             print(f"🚀 Building feature via Claude Agent SDK...")
@@ -70,6 +70,7 @@ from orchestration.circuit_breaker import (
 from governance.resource_tracker import ResourceTracker, ResourceLimits
 from governance.cost_estimator import estimate_iteration_cost, format_cost
 from orchestration.session_state import SessionState
+from monitoring.profiler import profiling
 import logging
 
 logger = logging.getLogger(__name__)
@@ -1245,6 +1246,17 @@ Features:
         action="store_true",
         help="Use Claude CLI wrapper instead of SDK for multi-agent orchestration. No API key needed, uses OAuth from claude.ai subscription."
     )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Sample Python stacks continuously and write hourly collapsed-stack flamegraphs to .aibrain/profiles/ (also enabled by AIBRAIN_PROFILE=1)"
+    )
+    parser.add_argument(
+        "--profile-hz",
+        type=float,
+        default=None,
+        help="Profiler sampling rate in samples/second (default: 50, or AIBRAIN_PROFILE_HZ). Sampling backs off to stay under 1%% overhead."
+    )
 
     args = parser.parse_args()
 
@@ -1259,19 +1271,20 @@ Features:
 
     # Run loop
     try:
-        asyncio.run(run_autonomous_loop(
-            project_dir=project_dir,
-            max_iterations=args.max_iterations,
-            project_name=args.project,
-            queue_type=args.queue,
-            non_interactive=args.non_interactive,
-            bypass_mode=args.bypass_mode,
-            enable_monitoring=args.enable_monitoring,
-            use_sqlite=args.use_sqlite,
-            epic_id=args.epic,
-            webhook_url=args.webhook_url,
-            use_cli=args.use_cli
-        ))
+        with profiling("autonomous_loop", enabled=args.profile or None, hz=args.profile_hz):
+            asyncio.run(run_autonomous_loop(
+                project_dir=project_dir,
+                max_iterations=args.max_iterations,
+                project_name=args.project,
+                queue_type=args.queue,
+                non_interactive=args.non_interactive,
+                bypass_mode=args.bypass_mode,
+                enable_monitoring=args.enable_monitoring,
+                use_sqlite=args.use_sqlite,
+                epic_id=args.epic,
+                webhook_url=args.webhook_url,
+                use_cli=args.use_cli
+            ))
     except KeyboardInterrupt:
         print("\n\n⚠️  Interrupted by user")
         print("   To resume, run the same command again")
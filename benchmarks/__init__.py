@@ -0,0 +1,16 @@
+"""
+Benchmark suite for orchestration hot paths.
+
+Synthetic, seeded fixtures (N tasks, N KOs, N audit entries, N guardrail
+files) exercise the operations the autonomous loop runs on every task:
+work queue load/save/selection, KO lookup, guardrail scanning, risk
+classification, wave planning, event logging, audit lookups and TOON
+encoding. Results are written as JSON and compared against a stored
+baseline with regression thresholds.
+
+Usage:
+    python -m benchmarks                      # Run all, compare to baseline.json
+    python -m benchmarks --list
+    python -m benchmarks -k ko. --output results.json
+    python -m benchmarks --save-baseline      # After an intentional change
+"""
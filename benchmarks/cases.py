@@ -0,0 +1,250 @@
+"""
+Benchmark cases for orchestration hot paths.
+
+Each case is a generator registered with @benchmark: it builds fixtures in
+the given work directory, yields the zero-argument callable to time, and
+cleans up after the yield. A case that raises ImportError during setup is
+reported as skipped (e.g. sqlalchemy not installed).
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, Iterator
+
+from benchmarks import fixtures
+
+Case = Callable[[int, Path], ContextManager[Callable[[], Any]]]
+
+
+@dataclass
+class Benchmark:
+    """A registered benchmark case."""
+    name: str
+    setup: Case
+    size: int      # Default fixture size at scale 1.0
+    unit: str      # What size counts ("tasks", "KOs", ...)
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, size: int, unit: str) -> Callable[[Callable[..., Iterator[Any]]], Case]:
+    """Register a generator-style case under name."""
+
+    def decorator(func: Callable[..., Iterator[Any]]) -> Case:
+        case = contextmanager(func)
+        BENCHMARKS[name] = Benchmark(name=name, setup=case, size=size, unit=unit)
+        return case
+
+    return decorator
+
+
+@contextmanager
+def _patched(target: Any, **attrs: Any) -> Iterator[None]:
+    """Temporarily replace module/object attributes."""
+    originals = {name: getattr(target, name) for name in attrs}
+    for name, value in attrs.items():
+        setattr(target, name, value)
+    try:
+        yield
+    finally:
+        for name, value in originals.items():
+            setattr(target, name, value)
+
+
+@contextmanager
+def _chdir(path: Path) -> Iterator[None]:
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# WORK QUEUE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@benchmark("work_queue.load", size=2000, unit="tasks")
+def bench_work_queue_load(n: int, workdir: Path) -> Iterator[Callable[[], Any]]:
+    from tasks.work_queue import WorkQueue
+
+    path = workdir / "work_queue.json"
+    fixtures.make_work_queue(n).save(path)
+    yield lambda: WorkQueue.load(path)
+
+
+@benchmark("work_queue.save", size=2000, unit="tasks")
+def bench_work_queue_save(n: int, workdir: Path) -> Iterator[Callable[[], Any]]:
+    queue = fixtures.make_work_queue(n)
+    path = workdir / "work_queue.json"
+    yield lambda: queue.save(path)
+
+
+@benchmark("work_queue.get_next_pending", size=2000, unit="tasks")
+def bench_work_queue_next(n: int, workdir: Path) -> Iterator[Callable[[], Any]]:
+    queue = fixtures.make_work_queue(n)
+    yield queue.get_next_pending
+
+
+@benchmark("queue_manager.get_next_ready[json]", size=2000, unit="tasks")
+def bench_queue_manager_json(n: int, workdir: Path) -> Iterator[Callable[[], Any]]:
+    from orchestration.queue_manager import WorkQueueManager
+
+    with _chdir(workdir):
+        manager = WorkQueueManager("bench", use_db=False)
+        queue = fixtures.make_work_queue(n)
+        manager._save_json({"tasks": [
+            {"id": t.id, "description": t.description, "status": t.status,
+             "priority": t.priority, "attempts": t.attempts, "retry_budget": 15}
+            for t in queue.features
+        ]})
+        yield manager.get_next_ready
+
+
+@benchmark("queue_manager.get_next_ready[sqlite]", size=500, unit="tasks")
+def bench_queue_manager_sqlite(n: int, workdir: Path) -> Iterator[Callable[[], Any]]:
+    from orchestration.queue_manager import WorkQueueManager
+
+    with _chdir(workdir):
+        manager = WorkQueueManager("bench", use_db=True)
+        features = [manager.add_feature(f"feature {p}", priority=p) for p in range(3)]
+        for i in range(n):
+            manager.add_task(
+                f"task {i}",
+                feature_id=features[i % 3],
+                status="pending" if i % 10 == 0 else "completed",
+            )
+        yield manager.get_next_ready
+
+
+@benchmark("parallel_executor.coordinate_execution", size=200, unit="tasks")
+def bench_coordinate_execution(n: int, workdir: Path) -> Iterator[Callable[[], Any]]:
+    from agents.coordinator import parallel_executor
+
+    tasks = fixtures.make_coordination_tasks(n)
+    with _patched(
+        parallel_executor,
+        LOCKS_DIR=workdir / "locks",
+        BOARD_STATE_PATH=workdir / "board-state.json",
+    ):
+        executor = parallel_executor.ParallelExecutor()
+        yield lambda: executor.coordinate_execution(tasks)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# KNOWLEDGE OBJECTS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@contextmanager
+def _ko_corpus(n: int, workdir: Path) -> Iterator[Any]:
+    """Point the KO service (and its retrieval metrics) at a synthetic corpus."""
+    from knowledge import metrics as ko_metrics
+    from knowledge import service
+
+    approved = workdir / "approved"
+    fixtures.write_kos(approved, fixtures.make_kos(n))
+
+    with _patched(service, KO_APPROVED_DIR=approved), \
+            _patched(ko_metrics, METRICS_DB=workdir / "metrics.db",
+                     METRICS_FILE=workdir / "metrics.json"):
+        service.invalidate_cache()
+        try:
+            yield service
+        finally:
+            if ko_metrics._aggregator is not None:
+                ko_metrics._aggregator.close()
+                ko_metrics._aggregator = None
+            service.invalidate_cache()
+
+
+@benchmark("ko.find_relevant[tag]", size=1000, unit="KOs")
+def bench_ko_tag(n: int, workdir: Path) -> Iterator[Callable[[], Any]]:
+    with _ko_corpus(n, workdir) as service:
+        service.find_relevant("bench", tags=["auth"])  # Build cache + indexes
+        yield lambda: service.find_relevant("bench", tags=["auth", "cache"])
+
+
+@benchmark("ko.find_relevant[hybrid]", size=1000, unit="KOs")
+def bench_ko_hybrid(n: int, workdir: Path) -> Iterator[Callable[[], Any]]:
+    with _ko_corpus(n, workdir) as service:
+        service.find_relevant("bench", query="session token", hybrid=True)
+        yield lambda: service.find_relevant(
+            "bench", tags=["auth"], query="session token expired middleware", hybrid=True
+        )
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# RALPH
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@benchmark("ralph.scan_for_violations", size=200, unit="files")
+def bench_scan_for_violations(n: int, workdir: Path) -> Iterator[Callable[[], Any]]:
+    from ralph.guardrails import scan_for_violations
+
+    paths = fixtures.write_guardrail_tree(workdir, n)
+    yield lambda: scan_for_violations(
+        workdir, changed_files=paths, check_only_changed_lines=False
+    )
+
+
+@benchmark("ralph.classify_risk", size=1000, unit="paths")
+def bench_classify_risk(n: int, workdir: Path) -> Iterator[Callable[[], Any]]:
+    from ralph.risk import classify_risk
+
+    paths = fixtures.risky_paths(n)
+    yield lambda: [classify_risk(p) for p in paths]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# LOGGING / AUDIT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@benchmark("event_logger.log_event", size=1000, unit="events")
+def bench_log_event(n: int, workdir: Path) -> Iterator[Callable[[], Any]]:
+    from orchestration.event_logger import Event, EventLogger, EventType
+
+    event_logger = EventLogger(workdir)
+    types = [EventType.RALPH_PASS, EventType.RALPH_BLOCKED, EventType.ADVISOR_AUTO_DECIDED]
+    events = [
+        Event(type=types[i % len(types)], agent="bench", context={"task_id": f"TASK-{i:05d}"})
+        for i in range(n)
+    ]
+
+    def log_all() -> None:
+        for event in events:
+            event_logger.log_event(event)
+
+    try:
+        yield log_all
+    finally:
+        event_logger.close()
+
+
+@benchmark("decision_audit.get_decisions_for_task", size=5000, unit="entries")
+def bench_decisions_for_task(n: int, workdir: Path) -> Iterator[Callable[[], Any]]:
+    from orchestration.decision_audit import DecisionAudit
+
+    task_ids = fixtures.write_audit_trail(workdir, "bench", n)
+    audit = DecisionAudit(project="bench", audit_dir=workdir)
+    next_task = itertools.cycle(task_ids).__next__
+    yield lambda: audit.get_decisions_for_task(next_task())
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# RESPONSE OPTIMIZATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@benchmark("toon.to_toon", size=200, unit="items")
+def bench_to_toon(n: int, workdir: Path) -> Iterator[Callable[[], Any]]:
+    from optimization.toon_format import TOONFormatter
+
+    formatter = TOONFormatter()
+    payload = fixtures.make_toon_payload(n)
+    yield lambda: formatter.to_toon(payload)
@@ -0,0 +1,209 @@
+"""
+Synthetic fixture generators for the benchmark suite.
+
+Every generator is deterministic for a given seed so runs are comparable
+across machines and commits.
+"""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from typing import Any, Dict, List
+
+from tasks.work_queue import Task, WorkQueue
+
+_TOPICS = [
+    ("auth", "authentication token session login middleware"),
+    ("database", "database migration schema query index transaction"),
+    ("api", "rest endpoint request response validation status"),
+    ("testing", "unit test fixture mock assertion coverage"),
+    ("deploy", "deployment pipeline container rollout environment"),
+    ("cache", "cache invalidation ttl eviction memory redis"),
+    ("frontend", "react component render state props hook"),
+    ("security", "secret credential encryption permission audit"),
+]
+
+_DIRS = ["src/auth", "src/api", "src/db", "src/ui", "src/lib", "tests/unit", "tests/e2e"]
+
+_RISKY_PATHS = [
+    "src/auth/session.ts", "migrations/0042_add_index.sql", "infra/terraform/main.tf",
+    "src/api/users.ts", "docs/README.md", "src/billing/invoice.py", ".env.production",
+    "src/components/Button.tsx", "tests/unit/auth.test.ts", "package.json",
+]
+
+
+def source_path(i: int) -> str:
+    """A stable synthetic source path for index i."""
+    directory = _DIRS[i % len(_DIRS)]
+    ext = ".test.ts" if directory.startswith("tests") else ".ts"
+    return f"{directory}/module_{i:05d}{ext}"
+
+
+# ─── Work queue ──────────────────────────────────────────────────────────────
+
+def make_work_queue(n_tasks: int, pending_share: float = 0.1, seed: int = 7) -> WorkQueue:
+    """
+    Work queue with mostly finished tasks and pending ones at the end.
+
+    Pending tasks sit at the tail so get_next_pending() walks most of the
+    list, as it does late in a long run.
+    """
+    rng = random.Random(seed)
+    n_pending = max(1, int(n_tasks * pending_share))
+    features = []
+    for i in range(n_tasks):
+        pending = i >= n_tasks - n_pending
+        features.append(Task(
+            id=f"TASK-{i:05d}",
+            description=f"Fix {rng.choice(_TOPICS)[0]} issue in module {i}",
+            file=source_path(i),
+            status="pending" if pending else rng.choice(["complete", "complete", "blocked"]),
+            tests=[source_path(i).replace("src/", "tests/unit/")],
+            attempts=0 if pending else rng.randint(1, 5),
+            priority=rng.randint(0, 2),
+            fingerprint=f"{i:064x}",
+            metadata={"estimate_hours": rng.randint(1, 8)},
+        ))
+    return WorkQueue(
+        project="bench",
+        features=features,
+        sequence=n_tasks,
+        fingerprints={t.fingerprint for t in features if t.fingerprint},
+    )
+
+
+def make_coordination_tasks(n_tasks: int, seed: int = 7) -> List[Dict[str, Any]]:
+    """Task dicts for ParallelExecutor.coordinate_execution (files overlap)."""
+    rng = random.Random(seed)
+    pool = max(4, n_tasks // 2)
+    tasks = []
+    for i in range(n_tasks):
+        files = sorted({source_path(rng.randrange(pool)) for _ in range(rng.randint(1, 4))})
+        deps = [f"TASK-{rng.randrange(i):05d}"] if i and rng.random() < 0.2 else []
+        tasks.append({"id": f"TASK-{i:05d}", "files": files, "repo": "bench", "dependencies": deps})
+    return tasks
+
+
+# ─── Knowledge objects ───────────────────────────────────────────────────────
+
+def make_kos(n_kos: int, project: str = "bench", seed: int = 7) -> List[Any]:
+    """Approved KOs spread over a fixed set of topics."""
+    from knowledge.service import KnowledgeObject
+
+    rng = random.Random(seed)
+    kos = []
+    for i in range(n_kos):
+        tag, vocab = rng.choice(_TOPICS)
+        words = vocab.split()
+        detail = " ".join(rng.choice(words) for _ in range(8))
+        kos.append(KnowledgeObject(
+            id=f"KO-ben-{i:05d}",
+            project=project,
+            title=f"{tag.title()} lesson {i}: {rng.choice(words)} {rng.choice(words)}",
+            what_was_learned=f"When handling {detail}, the {rng.choice(words)} failed.",
+            why_it_matters="Regressions reach production.",
+            prevention_rule=f"Always check {rng.choice(words)} before {rng.choice(words)}.",
+            tags=[tag, rng.choice(words)],
+            status="approved",
+            created_at="2026-01-01T00:00:00",
+            approved_at="2026-01-02T00:00:00",
+            file_patterns=[f"{_DIRS[i % len(_DIRS)]}/**/*.ts"],
+        ))
+    return kos
+
+
+def write_kos(directory: Path, kos: List[Any]) -> None:
+    """Write KOs in the on-disk format the service loads."""
+    from knowledge.service import _save_ko_to_file
+
+    directory.mkdir(parents=True, exist_ok=True)
+    for ko in kos:
+        _save_ko_to_file(ko, directory)
+
+
+# ─── Audit trail ─────────────────────────────────────────────────────────────
+
+def write_audit_trail(
+    audit_dir: Path,
+    project: str,
+    n_entries: int,
+    n_tasks: int = 100,
+    seed: int = 7,
+) -> List[str]:
+    """Log n_entries decisions spread over n_tasks tasks; returns task IDs."""
+    from orchestration.decision_audit import DecisionAudit, DecisionType
+
+    rng = random.Random(seed)
+    task_ids = [f"TASK-{i:05d}" for i in range(n_tasks)]
+    types = list(DecisionType)
+    audit = DecisionAudit(project=project, audit_dir=audit_dir)
+    for i in range(n_entries):
+        audit.log_decision(
+            decision_type=rng.choice(types),
+            decision=f"decision {i}",
+            reason=f"because {rng.choice(_TOPICS)[1]}",
+            task_id=rng.choice(task_ids),
+            agent="bench",
+            iteration=rng.randint(1, 15),
+            metadata={"n": i},
+        )
+    return task_ids
+
+
+# ─── Guardrail scanning ──────────────────────────────────────────────────────
+
+def write_guardrail_tree(
+    root: Path,
+    n_files: int,
+    lines_per_file: int = 200,
+    violation_rate: float = 0.02,
+    seed: int = 7,
+) -> List[str]:
+    """Source files with occasional suppressions; returns relative paths."""
+    rng = random.Random(seed)
+    violations = ["// @ts-ignore", "// eslint-disable-next-line", "it.skip('flaky', () => {})"]
+    paths = []
+    for i in range(n_files):
+        rel = source_path(i)
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        lines = []
+        for j in range(lines_per_file):
+            if rng.random() < violation_rate:
+                lines.append(rng.choice(violations))
+            else:
+                lines.append(f"export const value{j} = compute({j}, '{rng.choice(_TOPICS)[0]}');")
+        path.write_text("\n".join(lines) + "\n")
+        paths.append(rel)
+    return paths
+
+
+def risky_paths(n_paths: int) -> List[str]:
+    """A mix of paths across every risk level for classify_risk()."""
+    return [
+        _RISKY_PATHS[i % len(_RISKY_PATHS)] if i % 3 == 0 else source_path(i)
+        for i in range(n_paths)
+    ]
+
+
+# ─── TOON ────────────────────────────────────────────────────────────────────
+
+def make_toon_payload(n_items: int, seed: int = 7) -> Dict[str, Any]:
+    """Nested verdict-like payload of the shape TOON is used for."""
+    rng = random.Random(seed)
+    return {
+        "project": "bench",
+        "status": "FAIL",
+        "summary": {"passed": n_items // 2, "failed": n_items - n_items // 2},
+        "files": [source_path(i) for i in range(n_items)],
+        "steps": [
+            {
+                "step": rng.choice(["lint", "typecheck", "test"]),
+                "passed": rng.random() < 0.5,
+                "duration_ms": rng.randint(10, 5000),
+                "output": f"line {i}: {rng.choice(_TOPICS)[1]}",
+            }
+            for i in range(n_items)
+        ],
+    }
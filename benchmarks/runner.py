@@ -0,0 +1,276 @@
+"""
+Benchmark runner: timing, JSON results and baseline comparison.
+
+Each case is timed timeit-style: one warm-up call, calibrate how many calls
+make a round of at least --min-time seconds, then take the per-call median
+over --rounds rounds (GC disabled while timing).
+
+A result regresses when its median exceeds the baseline median by more than
+the threshold (global --threshold, or per benchmark via "thresholds" in the
+baseline file). Results are only compared when the fixture size matches.
+
+Usage:
+    python -m benchmarks                          # Run all, compare to benchmarks/baseline.json
+    python -m benchmarks -k work_queue --scale 0.1
+    python -m benchmarks --output results.json
+    python -m benchmarks --save-baseline          # Record a new baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.cases import BENCHMARKS, Benchmark
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_ROUNDS = 5
+DEFAULT_MIN_TIME = 0.05
+MAX_CALLS_PER_ROUND = 1_000_000
+
+
+def time_callable(
+    fn: Callable[[], Any],
+    rounds: int = DEFAULT_ROUNDS,
+    min_time: float = DEFAULT_MIN_TIME,
+) -> Dict[str, Any]:
+    """Per-call timings of fn in microseconds."""
+    fn()  # Warm caches, lazy imports, JIT-ish first-call costs
+
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= MAX_CALLS_PER_ROUND:
+            break
+        number = min(MAX_CALLS_PER_ROUND, max(number * 2, int(number * min_time / max(elapsed, 1e-9))))
+
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for _ in range(number):
+                fn()
+            samples.append((time.perf_counter() - start) / number * 1e6)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return {
+        "number": number,
+        "rounds": rounds,
+        "median_us": round(statistics.median(samples), 3),
+        "min_us": round(min(samples), 3),
+        "max_us": round(max(samples), 3),
+        "stdev_us": round(statistics.stdev(samples), 3) if len(samples) > 1 else 0.0,
+    }
+
+
+def run_benchmark(
+    bench: Benchmark,
+    scale: float = 1.0,
+    rounds: int = DEFAULT_ROUNDS,
+    min_time: float = DEFAULT_MIN_TIME,
+) -> Dict[str, Any]:
+    """Set up fixtures in a scratch directory and time one case."""
+    n = max(1, int(bench.size * scale))
+    result: Dict[str, Any] = {"n": n, "unit": bench.unit}
+    with tempfile.TemporaryDirectory(prefix="aibrain-bench-") as tmp:
+        try:
+            with bench.setup(n, Path(tmp)) as fn:
+                result.update(time_callable(fn, rounds=rounds, min_time=min_time))
+        except ImportError as e:
+            result["skipped"] = f"missing dependency: {e.name or e}"
+    return result
+
+
+def select(patterns: Optional[List[str]]) -> List[Benchmark]:
+    """Benchmarks whose names contain (or glob-match) any pattern."""
+    if not patterns:
+        return list(BENCHMARKS.values())
+    return [
+        bench for name, bench in BENCHMARKS.items()
+        if any(p in name or fnmatch.fnmatch(name, p) for p in patterns)
+    ]
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).parent, capture_output=True, text=True, timeout=5,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_all(
+    benchmarks: List[Benchmark],
+    scale: float = 1.0,
+    rounds: int = DEFAULT_ROUNDS,
+    min_time: float = DEFAULT_MIN_TIME,
+    progress: bool = True,
+) -> Dict[str, Any]:
+    """Run benchmarks and return the results document."""
+    results: Dict[str, Any] = {}
+    for bench in benchmarks:
+        if progress:
+            print(f"   ⏱️  {bench.name:<45}", end="", flush=True)
+        results[bench.name] = result = run_benchmark(bench, scale, rounds, min_time)
+        if progress:
+            if "skipped" in result:
+                print(f" skipped ({result['skipped']})")
+            else:
+                print(f" {result['median_us']:>12.1f} µs  (n={result['n']} {result['unit']})")
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "scale": scale,
+            "rounds": rounds,
+        },
+        "results": results,
+    }
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# BASELINE COMPARISON
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Compare a results document against a baseline.
+
+    Returns:
+        name -> {"status": ok|regression|improved|new|skipped|incomparable,
+                 "ratio": current/baseline median (when comparable)}
+    """
+    thresholds = baseline.get("thresholds", {})
+    base_results = baseline.get("results", {})
+    comparison: Dict[str, Dict[str, Any]] = {}
+
+    for name, result in current.get("results", {}).items():
+        base = base_results.get(name)
+        if "skipped" in result:
+            comparison[name] = {"status": "skipped"}
+            continue
+        if not base or "median_us" not in base:
+            comparison[name] = {"status": "new"}
+            continue
+        if base.get("n") != result.get("n"):
+            comparison[name] = {"status": "incomparable"}
+            continue
+
+        limit = thresholds.get(name, threshold)
+        ratio = result["median_us"] / base["median_us"] if base["median_us"] else 1.0
+        if ratio > 1 + limit:
+            status = "regression"
+        elif ratio < 1 / (1 + limit):
+            status = "improved"
+        else:
+            status = "ok"
+        comparison[name] = {"status": status, "ratio": round(ratio, 3), "threshold": limit}
+
+    return comparison
+
+
+def _print_comparison(comparison: Dict[str, Dict[str, Any]]) -> None:
+    icons = {"ok": "✅", "improved": "🚀", "regression": "❌", "new": "🆕",
+             "skipped": "⏭️ ", "incomparable": "➖"}
+    print()
+    for name, entry in comparison.items():
+        ratio = f"{entry['ratio']:.2f}x" if "ratio" in entry else ""
+        print(f"   {icons[entry['status']]} {name:<45} {ratio:>7}  {entry['status']}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark orchestration hot paths against a stored baseline",
+    )
+    parser.add_argument("-k", dest="patterns", action="append",
+                        help="Only run benchmarks matching this substring/glob (repeatable)")
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Multiply fixture sizes (default: 1.0)")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS,
+                        help=f"Timed rounds per benchmark (default: {DEFAULT_ROUNDS})")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME,
+                        help=f"Minimum seconds per round (default: {DEFAULT_MIN_TIME})")
+    parser.add_argument("--output", "-o", help="Write results JSON here")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE),
+                        help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Allowed slowdown before flagging a regression (default: {DEFAULT_THRESHOLD:.2f} = {DEFAULT_THRESHOLD * 100:.0f}%%)")
+    parser.add_argument("--no-compare", action="store_true", help="Skip baseline comparison")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Write results to the baseline file (keeps its thresholds)")
+    args = parser.parse_args(argv)
+
+    benchmarks = select(args.patterns)
+    if args.list:
+        for bench in benchmarks:
+            print(f"{bench.name:<45} n={bench.size} {bench.unit}")
+        return 0
+    if not benchmarks:
+        print("No benchmarks match")
+        return 1
+
+    print(f"\n📊 Running {len(benchmarks)} benchmark(s) (scale {args.scale})\n")
+    document = run_all(benchmarks, scale=args.scale, rounds=args.rounds, min_time=args.min_time)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(document, indent=2) + "\n")
+        print(f"\n   Results written to {args.output}")
+
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else None
+
+    if args.save_baseline:
+        if baseline and "thresholds" in baseline:
+            document["thresholds"] = baseline["thresholds"]
+        baseline_path.write_text(json.dumps(document, indent=2) + "\n")
+        print(f"\n   Baseline saved to {baseline_path}\n")
+        return 0
+
+    if args.no_compare or baseline is None:
+        print()
+        return 0
+
+    comparison = compare(document, baseline, threshold=args.threshold)
+    _print_comparison(comparison)
+    regressions = [name for name, entry in comparison.items() if entry["status"] == "regression"]
+    if regressions:
+        print(f"\n   {len(regressions)} regression(s) vs {baseline_path.name}\n")
+        return 1
+    print(f"\n   No regressions vs {baseline_path.name}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
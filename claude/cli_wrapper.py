@@ -7,19 +7,33 @@ Provides clean Python interface to Claude Code CLI with:
 - Output parsing
 - Session management
 - Startup protocol injection (v6.0)
+- Streaming output pipeline: stream-json events parsed incrementally and
+  fanned out to sinks (terminal, log file, websocket) off the reader thread
 """
 
 import os
-import re
 import selectors
 import subprocess
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional, List, Callable, Any
+from collections import deque
+from typing import Optional, List, Callable, Any, Deque, Dict
 import time
 
-# Regex to strip ANSI escape sequences (cursor movement, colors, etc.)
-ANSI_ESCAPE_PATTERN = re.compile(r'\x1b\[[0-9;]*[a-zA-Z]|\x1b\].*?\x07')
+from claude.output_pipeline import (
+    ANSI_ESCAPE_PATTERN,
+    DEFAULT_MAX_RETAINED_BYTES,
+    OutputAccumulator,
+    OutputPipeline,
+    OutputSink,
+    StreamJsonParser,
+    TerminalSink,
+    parse_change_markers,
+)
+from monitoring.tracing import annotate, traced
+
+# Bytes read from the CLI's pipes per syscall
+READ_CHUNK_SIZE = 64 * 1024
 
 # v6.0: Import context preparation for startup protocol
 _STARTUP_PROTOCOL_AVAILABLE = False
@@ -46,6 +60,7 @@ class ClaudeResult:
     error: Optional[str] = None
     files_changed: List[str] = field(default_factory=list)
     duration_ms: int = 0
+    output_truncated: bool = False  # Older output dropped (max_retained_bytes)
 
 
 class ClaudeError(Exception):
@@ -71,7 +86,14 @@ class ClaudeNotInstalledError(ClaudeError):
 class ClaudeCliWrapper:
     """Wrapper for Claude Code CLI subprocess calls"""
 
-    def __init__(self, project_dir: Path, repo_name: Optional[str] = None, enable_startup_protocol: bool = True):
+    def __init__(
+        self,
+        project_dir: Path,
+        repo_name: Optional[str] = None,
+        enable_startup_protocol: bool = True,
+        sinks: Optional[List[OutputSink]] = None,
+        max_retained_bytes: int = DEFAULT_MAX_RETAINED_BYTES,
+    ):
         """
         Initialize Claude CLI wrapper.
 
@@ -79,10 +101,15 @@ class ClaudeCliWrapper:
             project_dir: Path to project directory
             repo_name: Repository name (ai_orchestrator, karematch, credentialmate)
             enable_startup_protocol: Whether to inject 10-step startup protocol (v6.0)
+            sinks: Where streamed output is displayed (default: terminal;
+                   [] for none, e.g. parallel workers logging to files)
+            max_retained_bytes: Cap on assistant text kept in ClaudeResult.output
         """
         self.project_dir = project_dir
         self.repo_name = repo_name or self._infer_repo_name(project_dir)
         self.enable_startup_protocol = enable_startup_protocol
+        self.sinks = sinks
+        self.max_retained_bytes = max_retained_bytes
 
     def _infer_repo_name(self, project_dir: Path) -> str:
         """Infer repository name from project path"""
@@ -95,6 +122,7 @@ class ClaudeCliWrapper:
             return "ai_orchestrator"
         return "unknown"
 
+    @traced("claude.execute_task")
     def execute_task(
         self,
         prompt: str,
@@ -102,7 +130,9 @@ class ClaudeCliWrapper:
         timeout: int = 300,  # 5 minutes
         allow_dangerous_permissions: Optional[bool] = None,
         task_type: Optional[str] = None,
-        skip_startup_protocol: bool = False
+        skip_startup_protocol: bool = False,
+        sinks: Optional[List[OutputSink]] = None,
+        env: Optional[Dict[str, str]] = None,
     ) -> ClaudeResult:
         """
         Execute a task via Claude Code CLI
@@ -114,11 +144,15 @@ class ClaudeCliWrapper:
             allow_dangerous_permissions: Whether to skip permission prompts
             task_type: Type of task (bugfix, feature, etc.) - used to determine if startup protocol is needed
             skip_startup_protocol: Explicitly skip startup protocol injection
+            sinks: Output sinks for this call (overrides the wrapper's)
+            env: Environment for the CLI process (e.g. a scheduler worker's
+                 isolated config dirs); inherits ours when omitted
 
         Returns:
             ClaudeResult with execution details
         """
         start = time.time()
+        annotate(task_type=task_type, timeout=timeout, files=len(files or []))
 
         # v6.0: Inject startup protocol if enabled and available
         if (self.enable_startup_protocol and
@@ -145,7 +179,8 @@ class ClaudeCliWrapper:
         # The --print flag is for printing session output, not for accepting prompts
         cmd = [
             "claude",
-            "--output-format", "json",  # Structured output for reliable parsing
+            "--output-format", "stream-json",  # One JSON event per line, as it happens
+            "--verbose",  # Required by stream-json
             "--dangerously-skip-permissions"  # Skip permission prompts in automation
         ]
 
@@ -160,6 +195,7 @@ class ClaudeCliWrapper:
             process = subprocess.Popen(
                 cmd,
                 cwd=self.project_dir,
+                env=env,
                 stdin=subprocess.PIPE,  # NEW: stdin for prompt input
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
@@ -173,11 +209,15 @@ class ClaudeCliWrapper:
                 process.stdin.flush()
                 process.stdin.close()  # Signal end of input
 
-            # Stream output in real-time without blocking on newline flush
-            output_chunks: list[bytes] = []
-            error_chunks: list[bytes] = []
+            # Events are parsed as they arrive; sinks display them off this thread
+            parser = StreamJsonParser()
+            accumulator = OutputAccumulator(self.project_dir, self.max_retained_bytes)
+            if sinks is None:
+                sinks = self.sinks if self.sinks is not None else [TerminalSink()]
+            pipeline = OutputPipeline(sinks)
+            error_tail: Deque[bytes] = deque()
+            error_bytes = 0
 
-            import sys
             selector = selectors.DefaultSelector()
             if process.stdout:
                 selector.register(process.stdout, selectors.EVENT_READ, data="stdout")
@@ -186,69 +226,82 @@ class ClaudeCliWrapper:
 
             start_time = time.time()
             timed_out = False
-            while selector.get_map():
-                if time.time() - start_time > timeout:
-                    process.kill()
-                    try:
-                        process.wait(timeout=1)
-                    except subprocess.TimeoutExpired:
-                        pass
-                    timed_out = True
-                    break
-
-                events = selector.select(timeout=0.1)
-                if not events:
-                    if process.poll() is not None:
+            try:
+                while selector.get_map():
+                    if time.time() - start_time > timeout:
+                        process.kill()
+                        try:
+                            process.wait(timeout=1)
+                        except subprocess.TimeoutExpired:
+                            pass
+                        timed_out = True
                         break
-                    continue
-
-                for key, _ in events:
-                    fileobj = key.fileobj
-                    fd = fileobj if isinstance(fileobj, int) else fileobj.fileno()
-                    data = os.read(fd, 4096)
-                    if not data:
-                        selector.unregister(key.fileobj)
+
+                    events = selector.select(timeout=0.1)
+                    if not events:
+                        if process.poll() is not None:
+                            break
                         continue
 
-                    text = data.decode(errors="replace")
-                    # Strip ANSI escape sequences for clean terminal display
-                    clean_text = ANSI_ESCAPE_PATTERN.sub('', text)
-                    if key.data == "stdout":
-                        print(clean_text, end="", flush=True)
-                        output_chunks.append(data)
-                    else:
-                        print(clean_text, end="", file=sys.stderr, flush=True)
-                        error_chunks.append(data)
+                    for key, _ in events:
+                        fileobj = key.fileobj
+                        fd = fileobj if isinstance(fileobj, int) else fileobj.fileno()
+                        data = os.read(fd, READ_CHUNK_SIZE)
+                        if not data:
+                            selector.unregister(key.fileobj)
+                            continue
+
+                        if key.data == "stdout":
+                            for event in parser.feed(data):
+                                accumulator.add(event)
+                                pipeline.publish(event)
+                        else:
+                            error_tail.append(data)
+                            error_bytes += len(data)
+                            while error_bytes > self.max_retained_bytes and len(error_tail) > 1:
+                                error_bytes -= len(error_tail.popleft())
+                            pipeline.publish({"type": "stderr", "text": data.decode(errors="replace")})
+
+                for event in parser.close():
+                    accumulator.add(event)
+                    pipeline.publish(event)
+            finally:
+                selector.close()
+                pipeline.close()
 
             duration = int((time.time() - start) * 1000)
-            output = b"".join(output_chunks).decode(errors="replace")
-            error = b"".join(error_chunks).decode(errors="replace") if error_chunks else None
-
-            # Parse output
-            files_changed = self._parse_changed_files(output)
+            output = accumulator.output
+            error = b"".join(error_tail).decode(errors="replace") if error_tail else None
+            annotate(events=accumulator.events, sink_dropped=pipeline.dropped)
 
             if timed_out:
                 return ClaudeResult(
                     success=False,
                     output=output,
                     error=f"Timeout after {timeout} seconds",
-                    duration_ms=duration
+                    duration_ms=duration,
+                    output_truncated=accumulator.truncated
                 )
 
             returncode = process.poll()
-            if returncode == 0:
+            if returncode == 0 and not accumulator.is_error:
                 return ClaudeResult(
                     success=True,
                     output=output,
-                    files_changed=files_changed,
-                    duration_ms=duration
+                    files_changed=accumulator.files_changed,
+                    duration_ms=duration,
+                    output_truncated=accumulator.truncated
                 )
             else:
+                final = accumulator.result or {}
+                if accumulator.is_error and not error:
+                    error = str(final.get("result") or final.get("subtype"))
                 return ClaudeResult(
                     success=False,
                     output=output,
                     error=error,
-                    duration_ms=duration
+                    duration_ms=duration,
+                    output_truncated=accumulator.truncated
                 )
 
         except subprocess.TimeoutExpired:
@@ -317,15 +370,7 @@ class ClaudeCliWrapper:
         - "Created: src/bar.ts"
         - "Updated: src/baz.ts"
         """
-        files = []
-        for line in output.split('\n'):
-            line_stripped = line.strip()
-            if line_stripped.startswith(('Modified:', 'Created:', 'Updated:')):
-                # Extract filename
-                parts = line_stripped.split(':', 1)
-                if len(parts) == 2:
-                    files.append(parts[1].strip())
-        return files
+        return parse_change_markers(output)
 
     @staticmethod
     def _allow_dangerous_permissions(override: Optional[bool]) -> bool:
@@ -0,0 +1,435 @@
+"""
+Claude CLI Output Pipeline - Incremental processing of stream-json output
+
+Turns the byte stream of `claude --output-format stream-json` into events
+as it arrives, so the wrapper never re-scans or re-decodes the whole
+transcript, and fans those events out to display sinks off the reader's
+thread.
+
+Features:
+- StreamJsonParser: incremental NDJSON decoder; a partial line is held
+  until its newline arrives, and non-JSON lines become "raw" text events
+- OutputAccumulator: the assistant text retained for ClaudeResult.output
+  (tail kept, capped at max_retained_bytes), files_changed taken from
+  Edit/Write/MultiEdit/NotebookEdit tool-use events, and the final
+  "result" event
+- Sinks: TerminalSink (one write + flush per batch), LogFileSink (raw
+  NDJSON), WebSocketSink (agent_output events for the monitoring dashboard)
+- OutputPipeline: bounded queue drained by one dispatch thread; when the
+  sinks fall behind, display events are dropped and counted instead of
+  stalling the CLI's stdout pipe
+
+Usage:
+    from claude.output_pipeline import (
+        OutputAccumulator, OutputPipeline, StreamJsonParser, TerminalSink
+    )
+
+    parser = StreamJsonParser()
+    accumulator = OutputAccumulator(project_dir, max_retained_bytes=1 << 20)
+    pipeline = OutputPipeline([TerminalSink()])
+    for chunk in chunks:
+        for event in parser.feed(chunk):
+            accumulator.add(event)
+            pipeline.publish(event)
+    pipeline.close()
+    print(accumulator.output, accumulator.files_changed)
+"""
+
+import json
+import queue
+import re
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Callable, Deque, Dict, List, Optional
+
+# Regex to strip ANSI escape sequences (cursor movement, colors, etc.)
+ANSI_ESCAPE_PATTERN = re.compile(r'\x1b\[[0-9;]*[a-zA-Z]|\x1b\].*?\x07')
+
+# Assistant text kept for ClaudeResult.output (the tail survives)
+DEFAULT_MAX_RETAINED_BYTES = 1024 * 1024
+
+# Events buffered for sinks before new ones are dropped
+DEFAULT_MAX_PENDING_EVENTS = 1000
+
+# How long the dispatch thread waits to batch more events
+DISPATCH_INTERVAL_SECONDS = 0.05
+
+# Tool-use events that write files, and where their path lives
+FILE_EDIT_TOOLS = {
+    "Edit": "file_path",
+    "MultiEdit": "file_path",
+    "Write": "file_path",
+    "NotebookEdit": "notebook_path",
+}
+
+# Plain-text change markers (older CLI output, or models reporting changes)
+CHANGE_MARKERS = ("Modified:", "Created:", "Updated:")
+
+
+def parse_change_markers(text: str) -> List[str]:
+    """Paths from "Modified: x" / "Created: x" / "Updated: x" lines."""
+    files = []
+    for line in text.split('\n'):
+        line_stripped = line.strip()
+        if line_stripped.startswith(CHANGE_MARKERS):
+            parts = line_stripped.split(':', 1)
+            if len(parts) == 2:
+                files.append(parts[1].strip())
+    return files
+
+
+def iter_content(event: Dict[str, Any], block_type: str) -> List[Dict[str, Any]]:
+    """Content blocks of one type from an assistant/user message event."""
+    message = event.get("message")
+    if not isinstance(message, dict):
+        return []
+    content = message.get("content")
+    if not isinstance(content, list):
+        return []
+    return [b for b in content if isinstance(b, dict) and b.get("type") == block_type]
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Parsing
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class StreamJsonParser:
+    """
+    Incremental newline-delimited JSON decoder.
+
+    feed() accepts arbitrary byte chunks and returns the events completed by
+    them. Lines that aren't JSON objects come back as {"type": "raw", "text": ...}
+    so plain-text output is never lost.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> List[Dict[str, Any]]:
+        self._buffer += data
+        end = self._buffer.rfind(b"\n")
+        if end < 0:
+            return []
+        complete = bytes(self._buffer[:end])
+        del self._buffer[:end + 1]
+        return [e for e in (self._decode(line) for line in complete.split(b"\n")) if e]
+
+    def close(self) -> List[Dict[str, Any]]:
+        """Events from a final line that had no trailing newline."""
+        rest, self._buffer = bytes(self._buffer), bytearray()
+        event = self._decode(rest)
+        return [event] if event else []
+
+    @staticmethod
+    def _decode(line: bytes) -> Optional[Dict[str, Any]]:
+        line = line.strip()
+        if not line:
+            return None
+        if line.startswith(b"{"):
+            try:
+                event = json.loads(line)
+                if isinstance(event, dict):
+                    return event
+            except ValueError:
+                pass
+        return {"type": "raw", "text": line.decode(errors="replace")}
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Accumulation
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class OutputAccumulator:
+    """
+    What execute_task keeps from the stream.
+
+    Only assistant text (and raw lines) is retained, newest last; once it
+    exceeds max_retained_bytes the oldest pieces are discarded and
+    `truncated` is set. Changed files are collected as tool-use events
+    arrive, in first-seen order.
+    """
+
+    def __init__(self, project_dir: Optional[Path] = None,
+                 max_retained_bytes: int = DEFAULT_MAX_RETAINED_BYTES):
+        self.project_dir = Path(project_dir).resolve() if project_dir else None
+        self.max_retained_bytes = max_retained_bytes
+
+        self._texts: Deque[str] = deque()
+        self._retained_bytes = 0
+        self._files: Dict[str, None] = {}  # Ordered set
+
+        self.result: Optional[Dict[str, Any]] = None
+        self.session_id: Optional[str] = None
+        self.truncated = False
+        self.events = 0
+
+    def add(self, event: Dict[str, Any]) -> None:
+        self.events += 1
+        kind = event.get("type")
+        if self.session_id is None and event.get("session_id"):
+            self.session_id = event["session_id"]
+
+        if kind == "assistant":
+            for block in iter_content(event, "text"):
+                self._retain(block.get("text") or "")
+            for block in iter_content(event, "tool_use"):
+                key = FILE_EDIT_TOOLS.get(block.get("name", ""))
+                tool_input = block.get("input")
+                if key and isinstance(tool_input, dict) and tool_input.get(key):
+                    self._add_file(str(tool_input[key]))
+        elif kind == "result":
+            self.result = event
+        elif kind == "raw":
+            self._retain(event.get("text", ""))
+
+    @property
+    def output(self) -> str:
+        """Retained text, plus the final result if it wasn't already streamed."""
+        texts = list(self._texts)
+        final = self.result.get("result") if self.result else None
+        if isinstance(final, str) and final and (not texts or texts[-1] != final):
+            texts.append(final)
+        return "\n".join(texts)
+
+    @property
+    def files_changed(self) -> List[str]:
+        return list(self._files)
+
+    @property
+    def is_error(self) -> bool:
+        return bool(self.result and self.result.get("is_error"))
+
+    def _retain(self, text: str) -> None:
+        if not text:
+            return
+        for path in parse_change_markers(text):
+            self._add_file(path)
+        self._texts.append(text)
+        self._retained_bytes += len(text)
+        while self._retained_bytes > self.max_retained_bytes and len(self._texts) > 1:
+            self._retained_bytes -= len(self._texts.popleft())
+            self.truncated = True
+        if self._retained_bytes > self.max_retained_bytes:
+            # A single oversized piece: keep its tail
+            self._texts[0] = self._texts[0][-self.max_retained_bytes:]
+            self._retained_bytes = len(self._texts[0])
+            self.truncated = True
+
+    def _add_file(self, path: str) -> None:
+        if self.project_dir and Path(path).is_absolute():
+            try:
+                path = str(Path(path).resolve().relative_to(self.project_dir))
+            except ValueError:
+                pass  # Outside the project: keep it absolute
+        self._files.setdefault(path, None)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Sinks
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class OutputSink:
+    """Receives batches of stream events on the pipeline's dispatch thread."""
+
+    def write(self, events: List[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+def render_event(event: Dict[str, Any]) -> str:
+    """Human-readable text for one event ("" for events not worth showing)."""
+    kind = event.get("type")
+    if kind == "assistant":
+        parts = [b.get("text") or "" for b in iter_content(event, "text")]
+        for block in iter_content(event, "tool_use"):
+            tool_input = block.get("input") if isinstance(block.get("input"), dict) else {}
+            target = next(
+                (tool_input[k] for k in ("file_path", "notebook_path", "path", "command", "pattern")
+                 if tool_input.get(k)),
+                "",
+            )
+            parts.append(f"→ {block.get('name', 'tool')} {target}".rstrip())
+        return "\n".join(p for p in parts if p)
+    if kind == "result":
+        return f"✓ {event.get('subtype', 'done')} ({event.get('duration_ms', 0)}ms)"
+    if kind in ("raw", "stderr"):
+        return event.get("text", "")
+    return ""
+
+
+class TerminalSink(OutputSink):
+    """Renders events to a terminal stream: one write and flush per batch."""
+
+    def __init__(self, stream: Optional[IO[str]] = None, stderr: Optional[IO[str]] = None):
+        self.stream = stream
+        self.stderr = stderr
+
+    def write(self, events: List[Dict[str, Any]]) -> None:
+        out = self.stream or sys.stdout
+        err = self.stderr or sys.stderr
+        text = "\n".join(t for t in (render_event(e) for e in events if e.get("type") != "stderr") if t)
+        errors = "".join(e.get("text", "") for e in events if e.get("type") == "stderr")
+        if text:
+            out.write(ANSI_ESCAPE_PATTERN.sub("", text) + "\n")
+            out.flush()
+        if errors:
+            err.write(ANSI_ESCAPE_PATTERN.sub("", errors))
+            err.flush()
+
+
+class LogFileSink(OutputSink):
+    """Appends every event to a file as NDJSON."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: Optional[IO[str]] = None
+
+    def write(self, events: List[Dict[str, Any]]) -> None:
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write("".join(json.dumps(e, default=str) + "\n" for e in events))
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class WebSocketSink(OutputSink):
+    """
+    Forwards rendered output to the monitoring dashboard as agent_output events.
+
+    publish receives each formatted event dict; use for_event_loop() to feed
+    orchestration.websocket_server's asyncio event_queue from this thread.
+    """
+
+    def __init__(self, publish: Callable[[Dict[str, Any]], None], task_id: Optional[str] = None):
+        self.publish = publish
+        self.task_id = task_id
+
+    @classmethod
+    def for_event_loop(cls, loop: Any, event_queue: Any, task_id: Optional[str] = None) -> "WebSocketSink":
+        def publish(event: Dict[str, Any]) -> None:
+            loop.call_soon_threadsafe(event_queue.put_nowait, event)
+        return cls(publish, task_id)
+
+    def write(self, events: List[Dict[str, Any]]) -> None:
+        text = "\n".join(t for t in (render_event(e) for e in events) if t)
+        if not text:
+            return
+        self.publish({
+            "type": "agent_output",
+            "severity": "info",
+            "timestamp": datetime.now().isoformat(),
+            "data": {"task_id": self.task_id, "output": ANSI_ESCAPE_PATTERN.sub("", text)},
+        })
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Pipeline
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class OutputPipeline:
+    """
+    Fans stream events out to sinks from one background thread.
+
+    publish() never blocks: events beyond max_pending are counted in
+    `dropped` and skipped (sinks are display only; the accumulator already
+    has everything). close() delivers what's queued, waiting at most its
+    timeout for stalled sinks, and closes the sinks.
+    """
+
+    def __init__(
+        self,
+        sinks: List[OutputSink],
+        max_pending: int = DEFAULT_MAX_PENDING_EVENTS,
+        dispatch_interval: float = DISPATCH_INTERVAL_SECONDS,
+    ):
+        self.sinks = list(sinks)
+        self.dispatch_interval = dispatch_interval
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_pending)
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+        # Stats
+        self.published = 0
+        self.dropped = 0
+        self.batches = 0
+
+        if self.sinks:
+            self._thread = threading.Thread(
+                target=self._dispatch_loop, name="claude-output-pipeline", daemon=True
+            )
+            self._thread.start()
+
+    def publish(self, event: Dict[str, Any]) -> bool:
+        """Queue an event for the sinks; False if it was dropped."""
+        if not self.sinks or self._closed:
+            return False
+        try:
+            self._queue.put_nowait(event)
+            self.published += 1
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def close(self, timeout: float = 5.0) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            deadline = time.monotonic() + timeout
+            try:
+                self._queue.put(None, timeout=timeout)  # Waits only while the queue is full
+            except queue.Full:
+                # A sink is stuck; don't let it hold up execute_task
+                undelivered = self._queue.qsize()
+                self.dropped += undelivered
+                print(f"⚠️  Output sinks stalled; dropped {undelivered} undelivered events")
+            else:
+                self._thread.join(max(0.0, deadline - time.monotonic()))
+            self._thread = None
+        for sink in self.sinks:
+            try:
+                sink.close()
+            except Exception as e:
+                print(f"⚠️  Output sink close error: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        return {"published": self.published, "dropped": self.dropped, "batches": self.batches}
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            batch: List[Dict[str, Any]] = []
+            stop = False
+            try:
+                item = self._queue.get(timeout=self.dispatch_interval)
+                while item is not None:
+                    batch.append(item)
+                    item = self._queue.get_nowait()
+                stop = True
+            except queue.Empty:
+                pass
+
+            if batch:
+                self.batches += 1
+                for sink in self.sinks:
+                    try:
+                        sink.write(batch)
+                    except Exception as e:  # One broken sink mustn't stop the others
+                        print(f"⚠️  Output sink error ({type(sink).__name__}): {e}")
+            if stop:
+                return
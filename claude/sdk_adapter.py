@@ -9,6 +9,8 @@ Key Features:
 - PostToolUse hooks for file change tracking (replaces output parsing)
 - Stop hooks for Wiggum iteration control (replaces subprocess monitoring)
 - Session persistence via SDK sessions
+- AgentSession: one warm conversation per task, reused across iterations
+  and retries (no process spawn or startup protocol re-read per turn)
 - ~37% token savings via automatic compaction and prompt caching
 
 Authentication:
@@ -22,10 +24,18 @@ Usage:
     adapter = ClaudeSDKAdapter(project_dir)
     result = adapter.execute_task("Fix the bug in auth.ts")
     # Returns ClaudeResult (same as ClaudeCliWrapper)
+
+    # Warm session: follow-ups go into the same conversation
+    with adapter.open_session(task_type="bugfix") as session:
+        result = session.execute_task("Fix the bug in auth.ts")
+        session.queue_follow_up("Ralph: 2 type errors in auth.ts - fix them")
+        result = session.execute_task("Fix the bug in auth.ts")
 """
 
 import asyncio
+import concurrent.futures
 import os
+import threading
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -36,6 +46,7 @@ if TYPE_CHECKING:
 
 # Import shared types from cli_wrapper for interface compatibility
 from claude.cli_wrapper import ClaudeResult
+from claude.output_pipeline import FILE_EDIT_TOOLS
 
 # v6.0: Import context preparation for startup protocol
 _STARTUP_PROTOCOL_AVAILABLE = False
@@ -209,49 +220,8 @@ class ClaudeSDKAdapter:
                 duration_ms=duration,
             )
 
-        # v6.0: Inject startup protocol if enabled
-        if (
-            self.enable_startup_protocol
-            and not skip_startup_protocol
-            and _STARTUP_PROTOCOL_AVAILABLE
-        ):
-            try:
-                if (
-                    get_startup_protocol_prompt is not None
-                    and should_include_startup_protocol is not None
-                ):
-                    if not task_type or should_include_startup_protocol(task_type):
-                        startup_prompt = get_startup_protocol_prompt(
-                            self.project_dir,
-                            self.repo_name,
-                            include_cross_repo=True,
-                            task_type=task_type,
-                        )
-                        if startup_prompt:
-                            prompt = startup_prompt + "\n" + prompt
-            except Exception as e:
-                print(f"Warning: Could not inject startup protocol: {e}")
-
-        # Add files to focus on if specified
-        if files:
-            file_context = "\n\nFocus on these files:\n" + "\n".join(
-                f"- {f}" for f in files
-            )
-            prompt = prompt + file_context
-
-        # Determine permission mode
-        if self._allow_dangerous_permissions(allow_dangerous_permissions):
-            permission_mode = "dangerouslySkipPermissions"
-        else:
-            permission_mode = "acceptEdits"
-
-        # Build SDK options
-        options = ClaudeAgentOptions(
-            cwd=str(self.project_dir),
-            permission_mode=permission_mode,
-            # System prompt uses default Claude Code preset
-            system_prompt={"type": "preset", "preset": "claude_code"},
-        )
+        prompt = self._prepare_prompt(prompt, files, task_type, skip_startup_protocol)
+        options = self._build_options(ClaudeAgentOptions, allow_dangerous_permissions)
 
         # Execute via SDK query()
         output_chunks: list[str] = []
@@ -335,6 +305,77 @@ class ClaudeSDKAdapter:
                 duration_ms=duration,
             )
 
+    def _prepare_prompt(
+        self,
+        prompt: str,
+        files: Optional[list[str]] = None,
+        task_type: Optional[str] = None,
+        skip_startup_protocol: bool = False,
+    ) -> str:
+        """Prompt with the startup protocol and file focus list added."""
+        # v6.0: Inject startup protocol if enabled
+        if (
+            self.enable_startup_protocol
+            and not skip_startup_protocol
+            and _STARTUP_PROTOCOL_AVAILABLE
+        ):
+            try:
+                if (
+                    get_startup_protocol_prompt is not None
+                    and should_include_startup_protocol is not None
+                ):
+                    if not task_type or should_include_startup_protocol(task_type):
+                        startup_prompt = get_startup_protocol_prompt(
+                            self.project_dir,
+                            self.repo_name,
+                            include_cross_repo=True,
+                            task_type=task_type,
+                        )
+                        if startup_prompt:
+                            prompt = startup_prompt + "\n" + prompt
+            except Exception as e:
+                print(f"Warning: Could not inject startup protocol: {e}")
+
+        # Add files to focus on if specified
+        if files:
+            file_context = "\n\nFocus on these files:\n" + "\n".join(
+                f"- {f}" for f in files
+            )
+            prompt = prompt + file_context
+
+        return prompt
+
+    def _build_options(self, options_cls: Any, allow_dangerous_permissions: Optional[bool]) -> Any:
+        """ClaudeAgentOptions for this project."""
+        # Determine permission mode
+        if self._allow_dangerous_permissions(allow_dangerous_permissions):
+            permission_mode = "dangerouslySkipPermissions"
+        else:
+            permission_mode = "acceptEdits"
+
+        # Build SDK options
+        return options_cls(
+            cwd=str(self.project_dir),
+            permission_mode=permission_mode,
+            # System prompt uses default Claude Code preset
+            system_prompt={"type": "preset", "preset": "claude_code"},
+        )
+
+    def open_session(
+        self,
+        task_type: Optional[str] = None,
+        allow_dangerous_permissions: Optional[bool] = None,
+    ) -> "AgentSession":
+        """
+        Start a warm session for one task.
+
+        Raises:
+            RuntimeError: SDK not installed, no API key, or connect failed
+        """
+        session = AgentSession(self, task_type, allow_dangerous_permissions)
+        session.open()
+        return session
+
     def execute_task_with_retry(
         self,
         prompt: str,
@@ -395,6 +436,348 @@ class ClaudeSDKAdapter:
             )
 
 
+# Sent when an agent re-issues its original prompt and no feedback is queued
+CONTINUE_PROMPT = (
+    "Continue working on the task above. "
+    "Verify your changes and report the result when finished."
+)
+
+# Seconds allowed to (re)connect the SDK client, separate from the turn timeout
+SESSION_CONNECT_TIMEOUT = 60
+
+# Extra seconds execute_task() waits past the turn and connect timeouts
+SESSION_TURN_GRACE = 30
+
+
+class AgentSession:
+    """
+    One long-lived Agent SDK conversation, reused for every turn of a task.
+
+    The first execute_task() sends the full prompt (startup protocol, file
+    list); later turns send only follow-ups - queued feedback such as Ralph
+    failures or retry context - into the same conversation, so there is no
+    process spawn, no context re-reading and the prompt cache stays warm.
+
+    Agents that re-send their original prompt each iteration get the queued
+    follow-up (or CONTINUE_PROMPT) instead, so the session is a drop-in for
+    ClaudeSDKAdapter / ClaudeCliWrapper. The SDK client lives on a private
+    event loop thread, so sync and async callers can share one session.
+    A turn that fails or times out drops the conversation; the next turn
+    reconnects and starts over with the full prompt.
+    """
+
+    def __init__(
+        self,
+        adapter: ClaudeSDKAdapter,
+        task_type: Optional[str] = None,
+        allow_dangerous_permissions: Optional[bool] = None,
+    ):
+        self.adapter = adapter
+        self.task_type = task_type
+        self.allow_dangerous_permissions = allow_dangerous_permissions
+
+        self._client: Any = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._initial_prompt: Optional[str] = None
+        self._follow_ups: list[str] = []
+        self._follow_ups_lock = threading.Lock()  # Never held across a turn
+        self._turn_lock = threading.Lock()
+        self._last_result: Any = None  # ResultMessage of the current turn
+
+        # Stats
+        self.session_id: Optional[str] = None
+        self.turns = 0  # Turns in the current conversation
+        self.total_turns = 0
+        self.reconnects = 0
+        self.total_cost_usd = 0.0
+        self.usage: dict[str, int] = {}
+
+    # ─── Lifecycle ───────────────────────────────────────────────────────────
+
+    def open(self) -> None:
+        """
+        Connect the SDK client.
+
+        Raises:
+            RuntimeError: SDK not installed, no API key, or connect failed
+        """
+        try:
+            from claude_agent_sdk import ClaudeSDKClient, ClaudeAgentOptions  # type: ignore  # noqa: F401
+        except ImportError:
+            raise RuntimeError(
+                "Claude Agent SDK not installed. Install with: pip install claude-agent-sdk"
+            )
+        if not os.environ.get("ANTHROPIC_API_KEY"):
+            raise RuntimeError("ANTHROPIC_API_KEY environment variable required")
+
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._loop.run_forever, name="claude-agent-session", daemon=True
+            )
+            self._thread.start()
+        try:
+            self._call(
+                asyncio.wait_for(self._connect(), SESSION_CONNECT_TIMEOUT),
+                timeout=SESSION_CONNECT_TIMEOUT + 5,
+            )
+        except Exception as e:
+            self.close()
+            raise RuntimeError(f"Could not start agent session: {e}") from e
+
+    def close(self) -> None:
+        """Disconnect and stop the session's event loop."""
+        loop, thread = self._loop, self._thread
+        if loop is None:
+            return
+        try:
+            if self._client is not None:
+                self._call(self._disconnect(), timeout=10)
+        except Exception as e:
+            print(f"Warning: Agent session disconnect failed: {e}")
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not None:
+                thread.join(timeout=5)
+            if not loop.is_running():
+                loop.close()
+            self._loop = None
+            self._thread = None
+
+    def __enter__(self) -> "AgentSession":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    @property
+    def connected(self) -> bool:
+        return self._client is not None
+
+    # ─── Turns ───────────────────────────────────────────────────────────────
+
+    def queue_follow_up(self, text: Optional[str]) -> None:
+        """Feedback to send with the next turn (e.g. Ralph failures)."""
+        if text:
+            with self._follow_ups_lock:
+                self._follow_ups.append(text)
+
+    def execute_task(
+        self,
+        prompt: str,
+        files: Optional[list[str]] = None,
+        timeout: int = 300,
+        allow_dangerous_permissions: Optional[bool] = None,
+        task_type: Optional[str] = None,
+        skip_startup_protocol: bool = False,
+        context: Optional[SDKExecutionContext] = None,
+    ) -> ClaudeResult:
+        """Run one turn (sync); same interface as ClaudeSDKAdapter.execute_task."""
+        with self._turn_lock:
+            if self._loop is None:
+                return ClaudeResult(success=False, output="", error="Agent session is closed")
+            message = self._next_message(prompt, files, task_type, skip_startup_protocol)
+            try:
+                return self._call(
+                    self._turn(message, timeout, context),
+                    timeout=timeout + SESSION_CONNECT_TIMEOUT + SESSION_TURN_GRACE,
+                )
+            except concurrent.futures.TimeoutError:
+                # The turn is wedged past its own timeouts; it was cancelled,
+                # so drop the conversation and start over on the next turn
+                try:
+                    self._call(self._drop_conversation(), timeout=10)
+                except Exception:
+                    self._client = None
+                    self.turns = 0
+                return ClaudeResult(
+                    success=False,
+                    output="",
+                    error=f"Agent turn did not finish within {timeout} seconds",
+                )
+
+    async def execute_task_async(
+        self,
+        prompt: str,
+        files: Optional[list[str]] = None,
+        timeout: int = 300,
+        allow_dangerous_permissions: Optional[bool] = None,
+        task_type: Optional[str] = None,
+        skip_startup_protocol: bool = False,
+        context: Optional[SDKExecutionContext] = None,
+    ) -> ClaudeResult:
+        """Run one turn from any event loop."""
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            lambda: self.execute_task(
+                prompt, files, timeout, allow_dangerous_permissions,
+                task_type, skip_startup_protocol, context,
+            ),
+        )
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "connected": self.connected,
+            "turns": self.total_turns,
+            "reconnects": self.reconnects,
+            "total_cost_usd": round(self.total_cost_usd, 6),
+            "usage": dict(self.usage),
+        }
+
+    def _next_message(
+        self,
+        prompt: str,
+        files: Optional[list[str]],
+        task_type: Optional[str],
+        skip_startup_protocol: bool,
+    ) -> str:
+        with self._follow_ups_lock:
+            queued, self._follow_ups = self._follow_ups, []
+        follow_up = "\n\n".join(queued)
+
+        if self.turns == 0:
+            # New conversation (first turn, or the last one was lost): full
+            # task prompt, then any feedback and a different prompt if given
+            if self._initial_prompt is None:
+                self._initial_prompt = prompt
+            parts = [self.adapter._prepare_prompt(
+                self._initial_prompt, files, task_type or self.task_type, skip_startup_protocol
+            )]
+            if follow_up:
+                parts.append(follow_up)
+            if prompt != self._initial_prompt:
+                parts.append(prompt)
+            return "\n\n".join(parts)
+        if prompt == self._initial_prompt:
+            return follow_up or CONTINUE_PROMPT
+        return follow_up + "\n\n" + prompt if follow_up else prompt
+
+    # ─── Event loop side ─────────────────────────────────────────────────────
+
+    def _call(self, coro: Any, timeout: float) -> Any:
+        assert self._loop is not None
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    async def _connect(self) -> None:
+        from claude_agent_sdk import ClaudeSDKClient, ClaudeAgentOptions  # type: ignore
+
+        options = self.adapter._build_options(ClaudeAgentOptions, self.allow_dangerous_permissions)
+        client = ClaudeSDKClient(options=options)
+        try:
+            await client.connect()
+        except BaseException:
+            # Failed or timed out mid-connect: don't leave the CLI running
+            try:
+                await client.disconnect()
+            except Exception:
+                pass
+            raise
+        self._client = client
+        self.turns = 0
+
+    async def _disconnect(self) -> None:
+        client, self._client = self._client, None
+        self.turns = 0
+        if client is not None:
+            await client.disconnect()
+
+    async def _turn(
+        self, message: str, timeout: int, context: Optional[SDKExecutionContext]
+    ) -> ClaudeResult:
+        start = time.time()
+        output_chunks: list[str] = []
+        changed_files: list[str] = []
+        result_message: Any = None
+
+        try:
+            if self._client is None:
+                self.reconnects += 1
+                try:
+                    await asyncio.wait_for(self._connect(), SESSION_CONNECT_TIMEOUT)
+                except asyncio.TimeoutError:
+                    raise RuntimeError(
+                        f"Reconnect timed out after {SESSION_CONNECT_TIMEOUT} seconds"
+                    ) from None
+            self.turns += 1
+            self.total_turns += 1
+            await asyncio.wait_for(
+                self._exchange(message, output_chunks, changed_files), timeout
+            )
+            result_message = self._last_result
+        except asyncio.TimeoutError:
+            await self._drop_conversation()
+            return ClaudeResult(
+                success=False,
+                output="".join(output_chunks),
+                error=f"Timeout after {timeout} seconds",
+                files_changed=changed_files,
+                duration_ms=int((time.time() - start) * 1000),
+            )
+        except Exception as e:
+            await self._drop_conversation()
+            return ClaudeResult(
+                success=False,
+                output="".join(output_chunks),
+                error=str(e),
+                files_changed=changed_files,
+                duration_ms=int((time.time() - start) * 1000),
+            )
+
+        if context is not None:
+            context.changed_files.extend(f for f in changed_files if f not in context.changed_files)
+            context.session_id = self.session_id or context.session_id
+
+        is_error = bool(getattr(result_message, "is_error", False))
+        return ClaudeResult(
+            success=not is_error,
+            output="".join(output_chunks),
+            error=str(getattr(result_message, "result", "") or "Agent turn failed") if is_error else None,
+            files_changed=changed_files,
+            duration_ms=int((time.time() - start) * 1000),
+        )
+
+    async def _exchange(
+        self, message: str, output_chunks: list[str], changed_files: list[str]
+    ) -> None:
+        self._last_result = None
+        await self._client.query(message)
+        async for reply in self._client.receive_response():
+            if hasattr(reply, "is_error"):  # ResultMessage ends the turn
+                self._record_result(reply)
+                continue
+            for block in getattr(reply, "content", None) or []:
+                text = getattr(block, "text", None)
+                if isinstance(text, str):
+                    output_chunks.append(text)
+                    continue
+                key = FILE_EDIT_TOOLS.get(getattr(block, "name", "") or "")
+                tool_input = getattr(block, "input", None)
+                if key and isinstance(tool_input, dict) and tool_input.get(key):
+                    if tool_input[key] not in changed_files:
+                        changed_files.append(tool_input[key])
+
+    def _record_result(self, reply: Any) -> None:
+        self._last_result = reply
+        self.session_id = getattr(reply, "session_id", None) or self.session_id
+        self.total_cost_usd += getattr(reply, "total_cost_usd", None) or 0.0
+        for key, value in (getattr(reply, "usage", None) or {}).items():
+            if isinstance(value, int):
+                self.usage[key] = self.usage.get(key, 0) + value
+
+    async def _drop_conversation(self) -> None:
+        try:
+            await self._disconnect()
+        except Exception:
+            pass  # Already broken; reconnect on the next turn
+
+
 def get_adapter(
     project_dir: Path,
     use_sdk: Optional[bool] = None,
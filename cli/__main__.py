@@ -19,7 +19,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Import command modules
-from cli.commands import wiggum, ko, discover, tasks, adr, pm_report, oversight_setup, docs, email, council, icebox
+from cli.commands import wiggum, ko, discover, tasks, adr, pm_report, oversight_setup, docs, email, council, icebox, audit, profile
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -67,6 +67,12 @@ def create_parser() -> argparse.ArgumentParser:
     # Register icebox command (Parking Lot for ideas)
     icebox.setup_parser(subparsers)
 
+    # Register audit command (Decision audit trail index)
+    audit.setup_parser(subparsers)
+
+    # Register profile command (Continuous profiling output)
+    profile.setup_parser(subparsers)
+
     # Placeholder commands (to be implemented)
     status_parser = subparsers.add_parser('status', help='Show system or task status')
     status_parser.add_argument('task_id', nargs='?', help='Task ID to check')
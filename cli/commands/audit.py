@@ -0,0 +1,196 @@
+"""
+CLI commands for the decision audit trail.
+
+Usage:
+    aibrain audit reindex                          # Rebuild index for every project
+    aibrain audit reindex --project credentialmate
+    aibrain audit task TASK-001 --project credentialmate
+    aibrain audit seal --project credentialmate    # Extend hash chain to yesterday
+    aibrain audit verify --project credentialmate --start 2026-01-01 --end 2026-03-31 --chain
+
+The offset index (.aibrain/audit/decisions-{project}.index.db) is maintained
+on every append; reindex rebuilds it from the JSONL files after manual edits,
+restores, or corruption.
+"""
+
+import re
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from orchestration.decision_audit import DecisionAudit
+
+_AUDIT_FILE_RE = re.compile(r"^decisions-(.+)-\d{8}\.jsonl$")
+
+
+def _discover_projects(audit_dir: Path) -> list[str]:
+    """Find project names from audit file names."""
+    projects = set()
+    for path in audit_dir.glob("decisions-*.jsonl"):
+        match = _AUDIT_FILE_RE.match(path.name)
+        if match:
+            projects.add(match.group(1))
+    return sorted(projects)
+
+
+def audit_reindex_command(args: Any) -> int:
+    """Rebuild the decision audit offset index."""
+    audit_dir = Path(args.audit_dir)
+    if not audit_dir.exists():
+        print(f"\n❌ Audit directory not found: {audit_dir}")
+        return 1
+
+    projects = [args.project] if args.project else _discover_projects(audit_dir)
+    if not projects:
+        print(f"\n📭 No audit files found in {audit_dir}")
+        return 0
+
+    print(f"\n🔄 Reindexing decision audit trail in {audit_dir}\n")
+    for project in projects:
+        start = time.perf_counter()
+        count = DecisionAudit(project=project, audit_dir=audit_dir).reindex()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"   ✅ {project:<30} {count:>8} decisions  ({elapsed_ms:.0f}ms)")
+
+    print()
+    return 0
+
+
+def audit_task_command(args: Any) -> int:
+    """Show the decision tree for one task."""
+    audit = DecisionAudit(project=args.project, audit_dir=Path(args.audit_dir))
+    tree = audit.build_decision_tree(args.task_id)
+
+    if not tree["decision_count"]:
+        print(f"\n📭 No decisions recorded for {args.task_id}")
+        return 0
+
+    print(f"\n🌳 {args.task_id} ({tree['decision_count']} decisions)\n")
+
+    def print_node(node: dict[str, Any], depth: int) -> None:
+        print(f"   {'  ' * depth}• [{node['type']}] {node['decision']} - {node['reason']}")
+        for child in node["children"]:
+            print_node(child, depth + 1)
+
+    for root in tree["tree"]:
+        print_node(root, 0)
+    print()
+    return 0
+
+
+def audit_seal_command(args: Any) -> int:
+    """Extend the hash chain with finished days."""
+    audit = DecisionAudit(project=args.project, audit_dir=Path(args.audit_dir))
+    through = date.fromisoformat(args.through) if args.through else None
+    links = audit.seal(through=through)
+
+    if not links:
+        print("\n✅ Nothing to seal")
+        return 0
+
+    print(f"\n🔒 Sealed {len(links)} file(s)\n")
+    for link in links:
+        print(f"   {link.file:<45} {link.entries:>8} entries")
+    print(f"\n   Chain head: {links[-1].root}\n")
+    return 0
+
+
+def audit_verify_command(args: Any) -> int:
+    """Verify entry checksums (and optionally the hash chain) over a date range."""
+    audit = DecisionAudit(project=args.project, audit_dir=Path(args.audit_dir))
+    start = date.fromisoformat(args.start) if args.start else None
+    end = date.fromisoformat(args.end) if args.end else None
+
+    print(f"\n🔍 Verifying {args.project} audit trail\n")
+    began = time.perf_counter()
+    files = entries = failed = 0
+
+    for result in audit.verify_range(start, end, chain=args.chain, max_workers=args.workers):
+        files += 1
+        entries += result["total"]
+        chain_note = ""
+        if args.chain:
+            chain_note = {True: " chain ✓", False: " chain ✗", None: " unsealed"}[result["chain_ok"]]
+        if result["integrity_ok"]:
+            print(f"   ✅ {result['file']:<45} {result['total']:>8}{chain_note}")
+        else:
+            failed += 1
+            print(f"   ❌ {result['file']:<45} {result['total']:>8}{chain_note}"
+                  f"  invalid={result['invalid']} unparseable={result['parse_errors']}"
+                  f" lines={result['invalid_lines']}")
+
+    elapsed = time.perf_counter() - began
+    print(f"\n   {files} files, {entries} entries in {elapsed:.2f}s - "
+          f"{'OK' if not failed else f'{failed} FAILED'}\n")
+    return 1 if failed else 0
+
+
+def setup_parser(subparsers: Any) -> None:
+    """Setup argparse for audit commands."""
+
+    audit_parser = subparsers.add_parser(
+        "audit",
+        help="Decision audit trail maintenance",
+        description="Inspect and maintain the JSONL decision audit trail"
+    )
+
+    audit_subparsers = audit_parser.add_subparsers(
+        dest='audit_command',
+        help='Audit subcommand'
+    )
+
+    # audit reindex
+    reindex_parser = audit_subparsers.add_parser(
+        "reindex",
+        help="Rebuild the per-task offset index"
+    )
+    reindex_parser.add_argument("--project", "-p",
+                                help="Project to reindex (default: all found)")
+    reindex_parser.add_argument("--audit-dir", default=".aibrain/audit",
+                                help="Audit directory (default: .aibrain/audit)")
+    reindex_parser.set_defaults(func=audit_reindex_command)
+
+    # audit task
+    task_parser = audit_subparsers.add_parser(
+        "task",
+        help="Show the decision tree for a task"
+    )
+    task_parser.add_argument("task_id", help="Task ID (e.g., TASK-001)")
+    task_parser.add_argument("--project", "-p", required=True, help="Project name")
+    task_parser.add_argument("--audit-dir", default=".aibrain/audit",
+                             help="Audit directory (default: .aibrain/audit)")
+    task_parser.set_defaults(func=audit_task_command)
+
+    # audit seal
+    seal_parser = audit_subparsers.add_parser(
+        "seal",
+        help="Extend the hash chain with finished days"
+    )
+    seal_parser.add_argument("--project", "-p", required=True, help="Project name")
+    seal_parser.add_argument("--through", help="Last day to seal, YYYY-MM-DD (default: yesterday)")
+    seal_parser.add_argument("--audit-dir", default=".aibrain/audit",
+                             help="Audit directory (default: .aibrain/audit)")
+    seal_parser.set_defaults(func=audit_seal_command)
+
+    # audit verify
+    verify_parser = audit_subparsers.add_parser(
+        "verify",
+        help="Verify checksums over a date range in parallel"
+    )
+    verify_parser.add_argument("--project", "-p", required=True, help="Project name")
+    verify_parser.add_argument("--start", help="First day, YYYY-MM-DD (default: earliest)")
+    verify_parser.add_argument("--end", help="Last day, YYYY-MM-DD (default: latest)")
+    verify_parser.add_argument("--chain", action="store_true",
+                               help="Also check sealed files against the hash chain")
+    verify_parser.add_argument("--workers", "-w", type=int,
+                               help="Worker processes (default: CPU count)")
+    verify_parser.add_argument("--audit-dir", default=".aibrain/audit",
+                               help="Audit directory (default: .aibrain/audit)")
+    verify_parser.set_defaults(func=audit_verify_command)
+
+    audit_parser.set_defaults(func=lambda args: audit_parser.print_help())
@@ -0,0 +1,97 @@
+"""
+CLI commands for continuous-profiling output.
+
+Usage:
+    aibrain profile list                                   # Hourly profiles on disk
+    aibrain profile diff BEFORE.folded AFTER.folded        # Biggest shifts
+    aibrain profile diff BEFORE.folded AFTER.folded --folded diff.folded
+
+Profiles are written by the loops when run with --profile (or
+AIBRAIN_PROFILE=1); see monitoring/profiler.py.
+"""
+
+import sys
+from pathlib import Path
+from typing import Any
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from monitoring.profiler import diff_profiles, load_folded, write_diff_folded
+
+
+def profile_list_command(args: Any) -> int:
+    """List collected profiles."""
+    profile_dir = Path(args.profile_dir)
+    files = sorted(profile_dir.glob("*.folded")) if profile_dir.exists() else []
+    if not files:
+        print(f"\n📭 No profiles found in {profile_dir}")
+        return 0
+
+    print(f"\n🔬 Profiles in {profile_dir}\n")
+    for path in files:
+        samples = sum(load_folded(path).values())
+        print(f"   {path.name:<50} {samples:>10} stacks")
+    print()
+    return 0
+
+
+def profile_diff_command(args: Any) -> int:
+    """Compare two collapsed-stack profiles."""
+    before_path, after_path = Path(args.before), Path(args.after)
+    for path in (before_path, after_path):
+        if not path.exists():
+            print(f"\n❌ Profile not found: {path}")
+            return 1
+
+    before = load_folded(before_path)
+    after = load_folded(after_path)
+
+    print(f"\n🔬 {before_path.name} ({sum(before.values())} stacks) → "
+          f"{after_path.name} ({sum(after.values())} stacks)\n")
+    print(f"   {'before':>7} {'after':>7} {'delta':>7}  {'self':>13}  frame")
+    for row in diff_profiles(before, after, top=args.top):
+        print(f"   {row.before_pct:6.1f}% {row.after_pct:6.1f}% {row.delta_pct:+6.1f}%"
+              f"  {row.before_self_pct:5.1f}→{row.after_self_pct:5.1f}%  {row.frame}")
+
+    if args.folded:
+        write_diff_folded(Path(args.folded), before, after)
+        print(f"\n   Differential stacks written to {args.folded} (flamegraph difffolded format)")
+    print()
+    return 0
+
+
+def setup_parser(subparsers: Any) -> None:
+    """Setup argparse for profile commands."""
+
+    profile_parser = subparsers.add_parser(
+        "profile",
+        help="Continuous profiling output",
+        description="Inspect and compare collapsed-stack profiles from --profile runs"
+    )
+
+    profile_subparsers = profile_parser.add_subparsers(
+        dest='profile_command',
+        help='Profile subcommand'
+    )
+
+    # profile list
+    list_parser = profile_subparsers.add_parser("list", help="List collected profiles")
+    list_parser.add_argument("--profile-dir", default=".aibrain/profiles",
+                             help="Profile directory (default: .aibrain/profiles)")
+    list_parser.set_defaults(func=profile_list_command)
+
+    # profile diff
+    diff_parser = profile_subparsers.add_parser(
+        "diff",
+        help="Show frames whose share of samples changed most"
+    )
+    diff_parser.add_argument("before", help="Baseline .folded profile")
+    diff_parser.add_argument("after", help="Comparison .folded profile")
+    diff_parser.add_argument("--top", "-n", type=int, default=20,
+                             help="Frames to show (default: 20)")
+    diff_parser.add_argument("--folded",
+                             help="Also write a differential folded file for flamegraph.pl")
+    diff_parser.set_defaults(func=profile_diff_command)
+
+    profile_parser.set_defaults(func=lambda args: profile_parser.print_help())
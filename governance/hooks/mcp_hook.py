@@ -9,7 +9,14 @@ This hook is called by the MCP provider before and after each tool call.
 Token Optimization:
 - Compiles regex patterns once at startup
 - Caches permission checks for session
-- Batches audit log writes
+- Audit entries go to a background writer thread (AuditSink): the caller
+  only enqueues, memory is bounded, and pending entries are flushed at exit
+
+Rate Limiting:
+- Token bucket per agent: bursts up to max_calls_per_minute, refilled at
+  max_calls_per_minute / 60 tokens per second (no 2x burst at window edges)
+- Buckets live in a small SQLite file next to the audit log, so every
+  process using the same contract shares one budget per agent
 
 Usage:
     from governance.hooks.mcp_hook import MCPGovernanceHook
@@ -28,13 +35,31 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Pattern, Set
+import atexit
 import fnmatch
 import json
+import os
+import queue
 import re
+import sqlite3
 import time
 import threading
+import weakref
 import yaml
 
+# Audit entries held in memory while the writer catches up (beyond: dropped)
+AUDIT_MAX_PENDING = 10_000
+
+# Max seconds between audit file flushes
+AUDIT_FLUSH_INTERVAL_SECONDS = 1.0
+
+# Rate limit state file, relative to the audit log's directory
+RATE_LIMIT_DB_NAME = "mcp-rate-limits.db"
+
+# Tokens a bucket starts with when the shared state is unavailable and this
+# process has never seen the agent's shared level (fail almost closed)
+RATE_LIMIT_FALLBACK_BURST = 1.0
+
 
 @dataclass
 class ToolPermission:
@@ -47,11 +72,302 @@ class ToolPermission:
 
 @dataclass
 class RateLimitState:
-    """Rate limiting state for an agent."""
-    calls_this_minute: int = 0
+    """Rate limiting state for an agent (this hook only)."""
     calls_this_session: int = 0
-    minute_start: float = 0.0
-    blocked_until: Optional[float] = None
+
+
+@dataclass
+class _Bucket:
+    tokens: float
+    updated: float
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TOKEN BUCKET
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TokenBucketLimiter:
+    """
+    Token buckets keyed by agent, optionally shared across processes.
+
+    With a db_path, bucket state lives in SQLite and each acquire is one
+    short IMMEDIATE transaction. Without one, buckets are kept in memory for
+    this process only.
+
+    If the shared database is busy or broken, the process falls back to a
+    local bucket continuing from the last shared level it saw (or a small
+    RATE_LIMIT_FALLBACK_BURST if it never saw one), so contention doesn't
+    hand every process a fresh full allowance.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_second: float,
+        db_path: Optional[Path] = None,
+    ):
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self.db_path = db_path
+
+        self._lock = threading.Lock()
+        self._local: Dict[str, _Bucket] = {}  # Mirrors the shared level when there is one
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid = os.getpid()
+        self._fallback_logged = False
+
+        # Stats
+        self.fallbacks = 0  # Acquires decided locally although db_path is set
+
+        if db_path is not None:
+            self._open()
+
+    def _open(self) -> None:
+        try:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.db_path), timeout=1.0, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")  # Losing a refill on power loss is fine
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets "
+                "(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+            self._conn = conn
+        except sqlite3.Error as e:
+            self._log_fallback(f"shared state unavailable ({e})")
+            self._conn = None
+
+    def _log_fallback(self, reason: str) -> None:
+        if not self._fallback_logged:
+            self._fallback_logged = True
+            print(f"MCP rate limiter: {reason}, using in-process buckets")
+
+    def try_acquire(self, key: str, tokens: float = 1.0) -> bool:
+        """Take tokens from key's bucket if it has enough."""
+        with self._lock:
+            if os.getpid() != self._pid and self.db_path is not None:
+                # Forked child: don't share the parent's SQLite connection
+                self._pid = os.getpid()
+                self._open()
+            now = time.time()
+            if self._conn is not None:
+                try:
+                    return self._acquire_shared(key, tokens, now)
+                except sqlite3.Error as e:
+                    self._log_fallback(f"shared state error ({e})")
+            if self.db_path is not None:
+                self.fallbacks += 1
+                initial = min(self.capacity, RATE_LIMIT_FALLBACK_BURST)
+            else:
+                initial = self.capacity
+            bucket = self._local.setdefault(key, _Bucket(initial, now))
+            bucket.tokens = self._refill(bucket.tokens, bucket.updated, now)
+            bucket.updated = now
+            if bucket.tokens >= tokens:
+                bucket.tokens -= tokens
+                return True
+            return False
+
+    def _acquire_shared(self, key: str, tokens: float, now: float) -> bool:
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT tokens, updated FROM buckets WHERE key = ?", (key,)
+            ).fetchone()
+            available = self._refill(*row, now) if row else self.capacity
+            allowed = available >= tokens
+            if allowed:
+                available -= tokens
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (key, tokens, updated) VALUES (?, ?, ?)",
+                (key, available, now),
+            )
+            conn.execute("COMMIT")
+            self._local[key] = _Bucket(available, now)  # Seeds any later fallback
+            return allowed
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _refill(self, tokens: float, updated: float, now: float) -> float:
+        elapsed = max(0.0, now - updated)  # Clocks may step backwards
+        return min(self.capacity, tokens + elapsed * self.refill_per_second)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# AUDIT SINK
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class AuditSink:
+    """
+    Appends audit entries (JSON lines) from a background writer thread.
+
+    write() never blocks: entries beyond max_pending are counted and dropped,
+    and an "audit_dropped" record is written once the writer catches up.
+    Sinks still open at interpreter exit are flushed by an atexit handler.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_pending: int = AUDIT_MAX_PENDING,
+        flush_interval: float = AUDIT_FLUSH_INTERVAL_SECONDS,
+    ):
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_pending)
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self._pid = os.getpid()
+        self._closed = False
+
+        # Stats
+        self.written = 0
+        self.dropped = 0
+        self._dropped_reported = 0
+
+        _live_sinks.add(self)
+
+    def write(self, entry: Dict[str, Any]) -> bool:
+        """Queue an entry; False if it was dropped."""
+        if self._closed:
+            self._write_batch([entry])
+            return True
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait(entry)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until every entry queued so far is on disk."""
+        writer = self._writer
+        if writer is None or not writer.is_alive() or os.getpid() != self._pid:
+            self._drain_inline()
+            return True
+        done = threading.Event()
+        self._queue.put(done)  # Blocks only if the queue is full
+        return done.wait(timeout)
+
+    def close(self) -> None:
+        """Flush pending entries and stop the writer thread."""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        writer = self._writer
+        if writer is not None and writer.is_alive():
+            self._queue.put(None)
+            writer.join(timeout=5)
+        self._writer = None
+        self._drain_inline()
+
+    def _ensure_writer(self) -> None:
+        if os.getpid() != self._pid:
+            # Forked child: the parent's writer thread doesn't exist here
+            self._pid = os.getpid()
+            self._queue = queue.Queue(maxsize=self.max_pending)
+            self._writer = None
+        if self._writer is not None and self._writer.is_alive():
+            return
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._writer_loop, name="mcp-audit-sink", daemon=True
+                )
+                self._writer.start()
+
+    def _writer_loop(self) -> None:
+        while True:
+            batch: List[Dict[str, Any]] = []
+            waiters: List[threading.Event] = []
+            stop = False
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+                while True:
+                    if item is None:
+                        stop = True
+                        break
+                    if isinstance(item, threading.Event):
+                        waiters.append(item)
+                        break
+                    batch.append(item)
+                    item = self._queue.get_nowait()
+            except queue.Empty:
+                pass
+
+            try:
+                self._write_batch(batch)
+            except Exception as e:  # Keep the writer alive
+                print(f"MCP audit write error: {e}")
+            finally:
+                for waiter in waiters:
+                    waiter.set()
+            if stop:
+                return
+
+    def _drain_inline(self) -> None:
+        batch = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, dict):
+                batch.append(item)
+            elif isinstance(item, threading.Event):
+                item.set()
+        self._write_batch(batch)
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        dropped = self.dropped - self._dropped_reported
+        if not batch and not dropped:
+            return
+        if dropped:
+            batch.append({
+                "timestamp": datetime.now().isoformat(),
+                "event": "audit_dropped",
+                "count": dropped,
+            })
+            self._dropped_reported += dropped
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a") as f:
+            f.write("".join(json.dumps(entry) + "\n" for entry in batch))
+        self.written += len(batch)
+
+
+# Sinks still alive at interpreter exit get flushed
+_live_sinks: "weakref.WeakSet[AuditSink]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_sinks_at_exit() -> None:
+    for sink in list(_live_sinks):
+        try:
+            sink.close()
+        except Exception:
+            pass
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# GOVERNANCE HOOK
+# ═══════════════════════════════════════════════════════════════════════════════
 
 
 class MCPGovernanceHook:
@@ -85,14 +401,22 @@ class MCPGovernanceHook:
         # Permission cache (session-scoped)
         self._permission_cache: Dict[str, bool] = {}
 
-        # Rate limit tracking
+        # Rate limit tracking (the per-minute budget is shared across processes)
         self._rate_limits: Dict[str, RateLimitState] = {}
         self._rate_lock = threading.Lock()
+        max_per_minute = self._limit("max_calls_per_minute", 60)
+        shared_state = self._security.get("rate_limit_state_path")
+        if shared_state is None:
+            shared_state = self._audit_path().parent / RATE_LIMIT_DB_NAME
+        self._limiter = TokenBucketLimiter(
+            capacity=max_per_minute,
+            refill_per_second=max_per_minute / 60.0,
+            db_path=Path(shared_state) if shared_state else None,
+        )
 
-        # Audit buffer (batched writes)
-        self._audit_buffer: List[Dict[str, Any]] = []
+        # Audit trail (written by a background thread)
+        self._audit_sink: Optional[AuditSink] = None
         self._audit_lock = threading.Lock()
-        self._last_audit_flush = time.time()
 
     def _compile_patterns(self) -> None:
         """Compile sensitive operation patterns for efficient matching."""
@@ -124,6 +448,16 @@ class MCPGovernanceHook:
         Returns:
             ToolPermission with allowed status and any approval requirements
         """
+        return self._check_permission(agent, server, tool, enforce_rate_limit=True)
+
+    def _check_permission(
+        self,
+        agent: str,
+        server: str,
+        tool: str,
+        enforce_rate_limit: bool
+    ) -> ToolPermission:
+        """Permission checks; the rate limit (which spends a token) is optional."""
         # Check cache first
         cache_key = f"{agent}:{server}:{tool}"
         if cache_key in self._permission_cache:
@@ -163,7 +497,7 @@ class MCPGovernanceHook:
             )
 
         # Check rate limits
-        if not self._check_rate_limit(agent):
+        if enforce_rate_limit and not self._check_rate_limit(agent):
             return ToolPermission(
                 tool_name=tool,
                 allowed=False,
@@ -234,46 +568,23 @@ class MCPGovernanceHook:
                 error=error
             )
 
+    def _limit(self, name: str, default: Any) -> Any:
+        """A limit from the contract's limits section (or its security section)."""
+        return self._limits.get(name, self._security.get(name, default))
+
     def _check_rate_limit(self, agent: str) -> bool:
-        """Check if agent is within rate limits."""
+        """Check the session cap, then take a token from the agent's bucket."""
         with self._rate_lock:
-            now = time.time()
-
-            if agent not in self._rate_limits:
-                self._rate_limits[agent] = RateLimitState(minute_start=now)
-
-            state = self._rate_limits[agent]
-
-            # Check if blocked
-            if state.blocked_until and now < state.blocked_until:
-                return False
-
-            # Reset minute counter if needed
-            if now - state.minute_start > 60:
-                state.calls_this_minute = 0
-                state.minute_start = now
-
-            # Check limits
-            max_per_minute = self._limits.get("max_calls_per_minute", 60)
-            max_per_session = self._limits.get("max_calls_per_session", 1000)
-
-            if state.calls_this_minute >= max_per_minute:
-                state.blocked_until = state.minute_start + 60
-                return False
-
-            if state.calls_this_session >= max_per_session:
+            state = self._rate_limits.setdefault(agent, RateLimitState())
+            if state.calls_this_session >= self._limit("max_calls_per_session", 1000):
                 return False
 
-            return True
+        return self._limiter.try_acquire(agent)
 
     def _increment_rate_limit(self, agent: str) -> None:
-        """Increment rate limit counters."""
+        """Count a completed call against the session cap."""
         with self._rate_lock:
-            if agent not in self._rate_limits:
-                self._rate_limits[agent] = RateLimitState(minute_start=time.time())
-
-            state = self._rate_limits[agent]
-            state.calls_this_minute += 1
+            state = self._rate_limits.setdefault(agent, RateLimitState())
             state.calls_this_session += 1
 
     def _log_audit(
@@ -296,27 +607,29 @@ class MCPGovernanceHook:
             "error": error,
         }
 
-        with self._audit_lock:
-            self._audit_buffer.append(entry)
-
-            # Flush if buffer is large or time elapsed
-            if len(self._audit_buffer) >= 100 or time.time() - self._last_audit_flush > 10:
-                self._flush_audit_buffer()
+        self._get_audit_sink().write(entry)
 
-    def _flush_audit_buffer(self) -> None:
-        """Flush audit buffer to file."""
-        if not self._audit_buffer:
-            return
+    def _audit_path(self) -> Path:
+        return Path(self._security.get("audit_log_path", ".meta/audit/mcp-tools.log"))
 
-        audit_path = Path(self._security.get("audit_log_path", ".meta/audit/mcp-tools.log"))
-        audit_path.parent.mkdir(parents=True, exist_ok=True)
+    def _get_audit_sink(self) -> AuditSink:
+        if self._audit_sink is None:
+            with self._audit_lock:
+                if self._audit_sink is None:
+                    self._audit_sink = AuditSink(self._audit_path())
+        return self._audit_sink
 
-        with open(audit_path, "a") as f:
-            for entry in self._audit_buffer:
-                f.write(json.dumps(entry) + "\n")
+    def flush_audit(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until every audit entry logged so far is written."""
+        if self._audit_sink is None:
+            return True
+        return self._audit_sink.flush(timeout)
 
-        self._audit_buffer.clear()
-        self._last_audit_flush = time.time()
+    def close(self) -> None:
+        """Flush the audit trail and release the rate limit database."""
+        if self._audit_sink is not None:
+            self._audit_sink.close()
+        self._limiter.close()
 
     def get_filtered_tools(
         self,
@@ -343,8 +656,10 @@ class MCPGovernanceHook:
             server = tool_info.get("server", "")
             tool_name = tool_info.get("name", "")
 
-            # Check permission
-            permission = self.pre_tool_use(agent, server, tool_name)
+            # Check permission (listing tools doesn't spend rate limit tokens)
+            permission = self._check_permission(
+                agent, server, tool_name, enforce_rate_limit=False
+            )
             if permission.allowed:
                 # Add priority score
                 priority = 1.0 if tool_name in priority_tools else 0.0
@@ -377,11 +692,3 @@ class MCPGovernanceHook:
             limits=config.get("limits", {}),
             security=config.get("security", {}),
         )
-
-    def __del__(self):
-        """Flush audit buffer on destruction."""
-        try:
-            with self._audit_lock:
-                self._flush_audit_buffer()
-        except Exception:
-            pass  # Ignore errors during cleanup
@@ -9,11 +9,14 @@ Usage:
 """
 
 from .data_collector import DataCollector
+from .session_index import SessionAggregates, SessionIndex
 from .coo_metrics import OperationalMetrics
 from .hr_metrics import AgentPerformance
 
 __all__ = [
     "DataCollector",
+    "SessionIndex",
+    "SessionAggregates",
     "OperationalMetrics",
     "AgentPerformance",
     "generate_report",
@@ -35,8 +38,8 @@ def generate_report(period: str = "daily", days_back: int = 30) -> str:
     collector = DataCollector()
     data = collector.collect_all(days_back=days_back)
     
-    # Calculate metrics
-    coo_metrics = OperationalMetrics.from_sessions(data["sessions"])
+    # Calculate metrics (totals come straight from the session index)
+    coo_metrics = OperationalMetrics.from_aggregates(collector.session_aggregates(days_back))
     
     # Generate agent performance metrics
     agent_performance = {}
@@ -69,8 +72,10 @@ def generate_report(period: str = "daily", days_back: int = 30) -> str:
     
     elif period == "quarterly":
         from .reporters.quarterly_review import generate_quarterly_report
-        # For quarterly, need previous quarter metrics (placeholder)
-        previous_metrics = OperationalMetrics()  # Would load from historical data
+        # Previous period of the same length, e.g. days 90-180 back for a 90-day review
+        previous_metrics = OperationalMetrics.from_aggregates(
+            collector.session_aggregates(days_back * 2, end_days_back=days_back)
+        )
         return generate_quarterly_report(
             coo_metrics, previous_metrics, agent_scores, consolidation
         )
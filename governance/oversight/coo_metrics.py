@@ -8,11 +8,16 @@ Usage:
     from governance.oversight.coo_metrics import OperationalMetrics
     metrics = OperationalMetrics.from_sessions(sessions)
     print(f"Autonomy: {metrics.current_autonomy_pct}%")
+
+    # Or straight from SQL totals over the session index
+    metrics = OperationalMetrics.from_aggregates(collector.session_aggregates(days_back=90))
 """
 
 from dataclasses import dataclass, field
 from typing import List, Dict, Any
 
+from .session_index import SessionAggregates
+
 
 @dataclass
 class OperationalMetrics:
@@ -128,6 +133,41 @@ class OperationalMetrics:
             autonomy_trend=autonomy_trend,
             session_data=sessions
         )
+    
+    @classmethod
+    def from_aggregates(cls, aggregates: SessionAggregates) -> "OperationalMetrics":
+        """
+        Calculate operational metrics from session index totals.
+        
+        Same figures as from_sessions() for indexed sessions, without
+        loading the sessions (session_data stays empty).
+        
+        Args:
+            aggregates: Totals from SessionIndex.aggregate()
+            
+        Returns:
+            OperationalMetrics with calculated values
+        """
+        if not aggregates.total_sessions:
+            return cls()
+        
+        total_tasks = aggregates.total_tasks
+        autonomy_pct = (aggregates.autonomous_tasks / total_tasks * 100) if total_tasks > 0 else 0.0
+        
+        autonomy_trend = "stable"
+        if aggregates.recent_autonomy_pct is not None and aggregates.previous_autonomy_pct is not None:
+            if aggregates.recent_autonomy_pct > aggregates.previous_autonomy_pct + 5:
+                autonomy_trend = "improving"
+            elif aggregates.recent_autonomy_pct < aggregates.previous_autonomy_pct - 5:
+                autonomy_trend = "declining"
+        
+        return cls(
+            current_autonomy_pct=autonomy_pct,
+            tasks_per_session_avg=total_tasks / aggregates.total_sessions,
+            total_sessions=aggregates.total_sessions,
+            total_tasks=total_tasks,
+            autonomy_trend=autonomy_trend,
+        )
 
 
 @dataclass
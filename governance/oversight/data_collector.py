@@ -4,31 +4,44 @@ Data Collector - Aggregate metrics from sessions, work queues, KO system
 Reads data from:
 - sessions/*.md (session handoffs)
 - tasks/work_queue*.json (task completion data)
-- knowledge/metrics.json (KO consultation rates)
+- knowledge/metrics.db (KO consultation rates, via knowledge.metrics)
 - governance/resource_tracker_state.json (cost data)
 
+Parsed session metrics are cached in governance/oversight/session_index.db
+(see session_index.py), so each report only parses new or changed sessions.
+
 Usage:
     from governance.oversight.data_collector import DataCollector
     collector = DataCollector()
     data = collector.collect_all()
+    totals = collector.session_aggregates(days_back=90)
 """
 
 import json
 import re
+import sqlite3
+from dataclasses import asdict
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 
+from .session_index import SessionAggregates, SessionIndex
+
 
 class DataCollector:
     """Collect metrics data from various sources."""
     
-    def __init__(self, orchestrator_root: Optional[Path] = None):
+    def __init__(
+        self,
+        orchestrator_root: Optional[Path] = None,
+        index_path: Optional[Path] = None,
+    ):
         """
         Initialize data collector.
         
         Args:
             orchestrator_root: AI_Orchestrator root directory (auto-detects if None)
+            index_path: Session index database (default: governance/oversight/session_index.db)
         """
         if orchestrator_root is None:
             # Auto-detect: assumes we're in governance/oversight/
@@ -40,6 +53,8 @@ class DataCollector:
         self.tasks_dir = self.root / "tasks"
         self.knowledge_dir = self.root / "knowledge"
         self.governance_dir = self.root / "governance"
+        self.index_path = index_path or self.governance_dir / "oversight" / "session_index.db"
+        self._index: Optional[SessionIndex] = None
     
     def collect_all(self, days_back: int = 30) -> Dict[str, Any]:
         """
@@ -59,9 +74,24 @@ class DataCollector:
             "collection_timestamp": datetime.now().isoformat()
         }
     
+    @property
+    def session_index(self) -> SessionIndex:
+        """Session index (opened on first use)."""
+        if self._index is None:
+            try:
+                self._index = SessionIndex(self.index_path)
+            except (sqlite3.Error, OSError) as e:
+                print(f"Warning: Session index unavailable ({e}), parsing all sessions")
+                self._index = SessionIndex(Path(":memory:"))
+        return self._index
+    
+    def refresh_sessions(self) -> int:
+        """Parse session files added or changed since the last refresh."""
+        return self.session_index.refresh(self.sessions_dir, self._parse_session_file)
+    
     def collect_sessions(self, days_back: int = 30) -> List[Dict[str, Any]]:
         """
-        Parse session handoff files for metrics.
+        Session handoff metrics from the index.
         
         Args:
             days_back: How many days of session history to read
@@ -69,32 +99,32 @@ class DataCollector:
         Returns:
             List of session data dicts
         """
-        sessions = []
-        cutoff_date = datetime.now() - timedelta(days=days_back)
-        
-        if not self.sessions_dir.exists():
-            return sessions
+        self.refresh_sessions()
+        return self.session_index.sessions(since=self._window_start(days_back))
+    
+    def session_aggregates(self, days_back: int = 30, end_days_back: int = 0) -> SessionAggregates:
+        """
+        Session totals computed in SQL.
         
-        # Read all session markdown files
-        for session_file in sorted(self.sessions_dir.glob("*.md")):
-            # Extract date from filename (format: YYYY-MM-DD-*.md)
-            date_match = re.search(r'(\d{4}-\d{2}-\d{2})', session_file.name)
-            if not date_match:
-                continue
-            
-            try:
-                file_date = datetime.strptime(date_match.group(1), "%Y-%m-%d")
-                if file_date < cutoff_date:
-                    continue
-            except ValueError:
-                continue
+        Args:
+            days_back: Start of the window, in days before now
+            end_days_back: End of the window, in days before now (0 = up to today)
             
-            # Parse session file
-            session_data = self._parse_session_file(session_file)
-            if session_data:
-                sessions.append(session_data)
-        
-        return sessions
+        Returns:
+            SessionAggregates for the window
+        """
+        self.refresh_sessions()
+        until = self._window_start(end_days_back) if end_days_back else None
+        return self.session_index.aggregate(since=self._window_start(days_back), until=until)
+    
+    @staticmethod
+    def _window_start(days_back: int) -> str:
+        """First session date inside a window reaching days_back days into the past."""
+        cutoff = datetime.now() - timedelta(days=days_back)
+        first = cutoff.date()
+        if cutoff > datetime.combine(first, datetime.min.time()):
+            first += timedelta(days=1)  # Sessions are dated at midnight
+        return first.isoformat()
     
     def _parse_session_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
         """Parse a session handoff markdown file."""
@@ -182,15 +212,32 @@ class DataCollector:
         return work_queues
     
     def collect_ko_metrics(self) -> Optional[Dict[str, Any]]:
-        """Collect Knowledge Object metrics."""
-        metrics_file = self.knowledge_dir / "metrics.json"
-        
-        if not metrics_file.exists():
+        """
+        Collect Knowledge Object metrics (ko_id -> counters).
+
+        Reads knowledge/metrics.db; a legacy metrics.json is imported on
+        first read. For this repo's own database, the process-wide
+        aggregator is used so counts buffered in this process are included.
+        KOs that were only returned by searches, never consulted, are left out.
+        """
+        from knowledge import metrics as ko_metrics
+
+        db_path = self.knowledge_dir / "metrics.db"
+        legacy_json = self.knowledge_dir / "metrics.json"
+        if not db_path.exists() and not legacy_json.exists():
             return None
         
         try:
-            with open(metrics_file) as f:
-                return json.load(f)
+            if db_path.resolve() == Path(ko_metrics.METRICS_DB).resolve():
+                aggregator = ko_metrics.get_aggregator()
+            else:
+                aggregator = ko_metrics.MetricsAggregator(
+                    db_path, flush_interval=0, legacy_json=legacy_json
+                )
+            return {
+                ko_id: asdict(m) for ko_id, m in aggregator.load().items()
+                if m.total_consultations > 0
+            }
         except Exception as e:
             print(f"Warning: Failed to read KO metrics: {e}")
             return None
@@ -0,0 +1,313 @@
+"""
+Session Index - SQLite cache of parsed session handoff metrics
+
+Each sessions/*.md file is parsed once and its metrics stored keyed by file
+name, modification time and size. Later report runs only re-parse files that
+are new or changed, and aggregate queries run in SQL instead of over a list
+of parsed dicts.
+
+Features:
+- Incremental: refresh() stats the directory and parses only changed files
+- Deleted session files are dropped from the index
+- Files that fail to parse are remembered by (mtime, size) and not retried
+  until they change
+- Re-parses everything when PARSER_VERSION changes (new extraction rules)
+- aggregate() returns the totals OperationalMetrics needs for any date window
+
+File Structure:
+    governance/oversight/session_index.db
+
+Usage:
+    from governance.oversight.session_index import SessionIndex
+
+    index = SessionIndex(db_path)
+    index.refresh(sessions_dir, parse=collector._parse_session_file)
+    rows = index.sessions(since="2026-01-01")
+    totals = index.aggregate(since="2026-01-01")
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Bump when DataCollector's extraction rules change so cached rows are re-parsed
+PARSER_VERSION = 1
+
+# Sessions compared when computing the autonomy trend (recent vs previous)
+TREND_WINDOW = 10
+
+_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+
+_COLUMNS = (
+    "filename", "date", "tasks_completed", "ralph_verdict", "iterations",
+    "human_intervention_required", "completed", "files_modified",
+)
+_BOOL_COLUMNS = ("human_intervention_required", "completed")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    filename                    TEXT PRIMARY KEY,
+    mtime_ns                    INTEGER NOT NULL,
+    size                        INTEGER NOT NULL,
+    date                        TEXT NOT NULL,
+    tasks_completed             INTEGER NOT NULL,
+    ralph_verdict               TEXT NOT NULL,
+    iterations                  INTEGER NOT NULL,
+    human_intervention_required INTEGER NOT NULL,
+    completed                   INTEGER NOT NULL,
+    files_modified              INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_date ON sessions(date);
+CREATE TABLE IF NOT EXISTS failures (
+    filename TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size     INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+@dataclass
+class SessionAggregates:
+    """Session totals for a date window."""
+    total_sessions: int = 0
+    total_tasks: int = 0
+    autonomous_tasks: int = 0
+    human_intervention_sessions: int = 0
+    completed_sessions: int = 0
+    avg_iterations: float = 0.0
+    files_modified: int = 0
+    verdicts: Dict[str, int] = field(default_factory=dict)
+
+    # Autonomy % of the last TREND_WINDOW sessions and the window before
+    # (None when there are fewer than 2 * TREND_WINDOW sessions)
+    recent_autonomy_pct: Optional[float] = None
+    previous_autonomy_pct: Optional[float] = None
+
+
+class SessionIndex:
+    """Parsed session metrics, keyed by file name and (mtime, size)."""
+
+    def __init__(self, db_path: Path):
+        """
+        Open (or create) the index.
+
+        Args:
+            db_path: SQLite file (":memory:" for a throwaway index)
+        """
+        self.db_path = db_path
+        if str(db_path) != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._check_parser_version()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _check_parser_version(self) -> None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'parser_version'"
+            ).fetchone()
+            if row is None or int(row[0]) != PARSER_VERSION:
+                self._conn.execute("DELETE FROM sessions")
+                self._conn.execute("DELETE FROM failures")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('parser_version', ?)",
+                    (str(PARSER_VERSION),),
+                )
+            self._conn.commit()
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Maintenance
+    # ─────────────────────────────────────────────────────────────────────
+
+    def refresh(
+        self,
+        sessions_dir: Path,
+        parse: Callable[[Path], Optional[Dict[str, Any]]],
+    ) -> int:
+        """
+        Bring the index in line with sessions_dir.
+
+        Args:
+            sessions_dir: Directory of YYYY-MM-DD-*.md session files
+            parse: Parses one file into a session dict (None on failure)
+
+        Returns:
+            Number of files parsed successfully
+        """
+        on_disk: Dict[str, os.stat_result] = {}
+        if Path(sessions_dir).is_dir():
+            with os.scandir(sessions_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".md") and entry.is_file() and _file_date(entry.name):
+                        on_disk[entry.name] = entry.stat()
+
+        with self._lock:
+            known = {
+                name: (mtime_ns, size)
+                for name, mtime_ns, size in self._conn.execute(
+                    "SELECT filename, mtime_ns, size FROM sessions "
+                    "UNION ALL SELECT filename, mtime_ns, size FROM failures"
+                )
+            }
+
+        changed = [
+            name for name, st in on_disk.items()
+            if known.get(name) != (st.st_mtime_ns, st.st_size)
+        ]
+        removed = [name for name in known if name not in on_disk]
+
+        rows, failed = [], []
+        for name in changed:
+            session = parse(Path(sessions_dir) / name)
+            st = on_disk[name]
+            if session is None:
+                failed.append((name, st.st_mtime_ns, st.st_size))
+                continue
+            rows.append((
+                name, st.st_mtime_ns, st.st_size, _file_date(name),
+                int(session.get("tasks_completed", 0)),
+                session.get("ralph_verdict", "UNKNOWN"),
+                int(session.get("iterations", 0)),
+                int(bool(session.get("human_intervention_required"))),
+                int(bool(session.get("completed"))),
+                int(session.get("files_modified", 0)),
+            ))
+
+        if changed or removed:
+            with self._lock:
+                # A changed file's old row (parsed or failed) is replaced
+                stale = [(n,) for n in changed + removed]
+                self._conn.executemany("DELETE FROM sessions WHERE filename = ?", stale)
+                self._conn.executemany("DELETE FROM failures WHERE filename = ?", stale)
+                self._conn.executemany(
+                    "INSERT INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+                )
+                self._conn.executemany("INSERT INTO failures VALUES (?, ?, ?)", failed)
+                self._conn.commit()
+
+        return len(rows)
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Queries
+    # ─────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _window(since: Optional[str], until: Optional[str]) -> tuple[str, list]:
+        clauses, params = [], []
+        if since:
+            clauses.append("date >= ?")
+            params.append(since)
+        if until:
+            clauses.append("date < ?")
+            params.append(until)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def sessions(
+        self,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Session dicts (as DataCollector returns them) in file-name order.
+
+        Args:
+            since: First date included (YYYY-MM-DD)
+            until: First date excluded (YYYY-MM-DD)
+        """
+        where, params = self._window(since, until)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM sessions{where} ORDER BY filename",
+                params,
+            ).fetchall()
+
+        sessions = []
+        for row in rows:
+            session = dict(zip(_COLUMNS, row))
+            for column in _BOOL_COLUMNS:
+                session[column] = bool(session[column])
+            sessions.append(session)
+        return sessions
+
+    def aggregate(
+        self,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> SessionAggregates:
+        """Totals over the sessions in [since, until)."""
+        where, params = self._window(since, until)
+        with self._lock:
+            (total, tasks, autonomous, human, completed, avg_iterations,
+             files) = self._conn.execute(
+                f"""
+                SELECT COUNT(*),
+                       COALESCE(SUM(tasks_completed), 0),
+                       COALESCE(SUM(CASE WHEN human_intervention_required = 0
+                                         THEN tasks_completed ELSE 0 END), 0),
+                       COALESCE(SUM(human_intervention_required), 0),
+                       COALESCE(SUM(completed), 0),
+                       COALESCE(AVG(iterations), 0.0),
+                       COALESCE(SUM(files_modified), 0)
+                FROM sessions{where}
+                """,
+                params,
+            ).fetchone()
+            verdicts = dict(self._conn.execute(
+                f"SELECT ralph_verdict, COUNT(*) FROM sessions{where} GROUP BY ralph_verdict",
+                params,
+            ).fetchall())
+            latest = self._conn.execute(
+                f"SELECT tasks_completed, human_intervention_required FROM sessions{where} "
+                f"ORDER BY filename DESC LIMIT ?",
+                params + [2 * TREND_WINDOW],
+            ).fetchall()
+
+        aggregates = SessionAggregates(
+            total_sessions=total,
+            total_tasks=tasks,
+            autonomous_tasks=autonomous,
+            human_intervention_sessions=human,
+            completed_sessions=completed,
+            avg_iterations=avg_iterations,
+            files_modified=files,
+            verdicts=verdicts,
+        )
+        if len(latest) == 2 * TREND_WINDOW:
+            aggregates.recent_autonomy_pct = _autonomy_pct(latest[:TREND_WINDOW])
+            aggregates.previous_autonomy_pct = _autonomy_pct(latest[TREND_WINDOW:])
+        return aggregates
+
+
+def _file_date(filename: str) -> Optional[str]:
+    """YYYY-MM-DD from a session file name, if present and valid."""
+    match = _DATE_RE.search(filename)
+    if not match:
+        return None
+    try:
+        datetime.strptime(match.group(1), "%Y-%m-%d")
+    except ValueError:
+        return None
+    return match.group(1)
+
+
+def _autonomy_pct(rows: List[tuple]) -> float:
+    total = sum(tasks for tasks, _ in rows)
+    autonomous = sum(tasks for tasks, human in rows if not human)
+    return autonomous / total * 100 if total else 0.0
@@ -0,0 +1,285 @@
+"""
+Vector Backend Benchmark
+
+Compares the Chroma and LanceDB backends on the same synthetic KO corpus:
+recall@k against exact (brute-force cosine) search with the project filter
+applied, result fill rate (how often k results come back), and query
+latency. The legacy post-filter strategy (fetch top_k * 2, filter in Python)
+is measured alongside pre-filtering to show the fill-rate gap for small
+projects inside a large shared store.
+
+Usage:
+    python -m knowledge.backend_benchmark                      # all installed backends
+    python -m knowledge.backend_benchmark --backend lancedb --kos 5000 --output bench.json
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from .service import KnowledgeObject
+from .vector_backend import VectorBackend, VectorFilter, ko_embedding_text
+
+
+_TOPICS = [
+    ("auth", "authentication token session login middleware"),
+    ("database", "database migration schema query index transaction"),
+    ("api", "rest endpoint request response validation status"),
+    ("testing", "unit test fixture mock assertion coverage"),
+    ("deploy", "deployment pipeline container rollout environment"),
+    ("cache", "cache invalidation ttl eviction memory redis"),
+    ("frontend", "react component render state props hook"),
+    ("security", "secret credential encryption permission audit"),
+]
+
+
+def generate_kos(
+    n_kos: int,
+    projects: Dict[str, float],
+    seed: int = 7
+) -> List[KnowledgeObject]:
+    """
+    Generate a synthetic KO corpus.
+
+    Args:
+        n_kos: Number of KOs
+        projects: Project name -> share of the corpus (e.g. {"big": 0.95, "small": 0.05})
+        seed: RNG seed for reproducibility
+
+    Returns:
+        List of approved KnowledgeObjects
+    """
+    rng = random.Random(seed)
+    names = list(projects)
+    weights = [projects[name] for name in names]
+    kos = []
+
+    for i in range(n_kos):
+        project = rng.choices(names, weights=weights)[0]
+        tag, vocab = rng.choice(_TOPICS)
+        words = vocab.split()
+        detail = " ".join(rng.choice(words) for _ in range(8))
+        kos.append(KnowledgeObject(
+            id=f"KO-{project[:3]}-{i:05d}",
+            project=project,
+            title=f"{tag.title()} lesson {i}: {rng.choice(words)} {rng.choice(words)}",
+            what_was_learned=f"When handling {detail}, the {rng.choice(words)} failed.",
+            why_it_matters="Regressions reach production.",
+            prevention_rule=f"Always check {rng.choice(words)} before {rng.choice(words)}.",
+            tags=[tag],
+            status="approved",
+            created_at="2026-01-01T00:00:00",
+        ))
+    return kos
+
+
+def generate_queries(n_queries: int, seed: int = 11) -> List[str]:
+    """Generate natural-language queries over the synthetic topics."""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(n_queries):
+        _, vocab = rng.choice(_TOPICS)
+        words = vocab.split()
+        queries.append(f"how to fix {rng.choice(words)} {rng.choice(words)} {rng.choice(words)}")
+    return queries
+
+
+def exact_top_k(
+    embedder: Any,
+    kos: List[KnowledgeObject],
+    ko_embeddings: List[List[float]],
+    query: str,
+    project: str,
+    top_k: int
+) -> List[str]:
+    """Ground truth: brute-force cosine over the project's KOs."""
+    import numpy as np
+
+    query_vec = np.asarray(embedder.embed(query))
+    scored = [
+        (float(np.dot(query_vec, np.asarray(vec))), ko.id)
+        for ko, vec in zip(kos, ko_embeddings)
+        if ko.project == project
+    ]
+    scored.sort(reverse=True)
+    return [ko_id for _, ko_id in scored[:top_k]]
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def benchmark_backend(
+    backend: VectorBackend,
+    kos: List[KnowledgeObject],
+    queries: List[Tuple[str, str]],
+    truth: Dict[Tuple[str, str], List[str]],
+    top_k: int
+) -> Dict[str, Any]:
+    """
+    Index the corpus into a backend and measure search quality and latency.
+
+    Args:
+        backend: Empty backend instance
+        kos: Corpus
+        queries: (query, project) pairs
+        truth: Exact top_k IDs per (query, project)
+        top_k: Results requested per query
+
+    Returns:
+        Dict of metrics per strategy ("prefilter", "postfilter")
+    """
+    start = time.perf_counter()
+    backend.upsert(kos)
+    index_seconds = time.perf_counter() - start
+
+    project_of = {ko.id: ko.project for ko in kos}
+    results: Dict[str, Any] = {"backend": backend.name, "index_seconds": round(index_seconds, 3)}
+
+    for strategy in ("prefilter", "postfilter"):
+        latencies = []
+        recalls = []
+        filled = 0
+
+        for query, project in queries:
+            t0 = time.perf_counter()
+            if strategy == "prefilter":
+                hits = backend.search(query, top_k=top_k, flt=VectorFilter(project=project))
+                ids = [hit.ko_id for hit in hits]
+            else:
+                # Legacy: over-fetch top_k * 2 unfiltered, filter in Python
+                raw = backend.search(query, top_k=top_k * 2)
+                ids = [hit.ko_id for hit in raw if project_of.get(hit.ko_id) == project][:top_k]
+            latencies.append((time.perf_counter() - t0) * 1000)
+
+            expected = truth[(query, project)]
+            if expected:
+                recalls.append(len(set(ids) & set(expected)) / len(expected))
+            if len(ids) >= min(top_k, len(expected)):
+                filled += 1
+
+        results[strategy] = {
+            "recall_at_k": round(statistics.mean(recalls), 4) if recalls else 0.0,
+            "fill_rate": round(filled / len(queries), 4) if queries else 0.0,
+            "latency_ms_p50": round(_percentile(latencies, 50), 3),
+            "latency_ms_p95": round(_percentile(latencies, 95), 3),
+        }
+
+    return results
+
+
+def _make_backend(name: str, workdir: Path) -> Optional[VectorBackend]:
+    """Create an isolated backend instance in a temp directory."""
+    try:
+        if name == "chroma":
+            from .semantic_search import ChromaKnowledgeStore
+            from .vector_backend import ChromaBackend
+            return ChromaBackend(store=ChromaKnowledgeStore(persist_directory=str(workdir / "chroma")))
+        if name == "lancedb":
+            import lancedb  # noqa: F401
+            from .embeddings import get_embedder
+            from .vector_backend import LanceDBBackend
+            from .vector_store import KOVectorStore
+            return LanceDBBackend(store=KOVectorStore(db_path=workdir / "lancedb"), embedder=get_embedder())
+    except ImportError:
+        return None
+    return None
+
+
+def run_benchmark(
+    backends: List[str],
+    n_kos: int = 2000,
+    n_queries: int = 50,
+    top_k: int = 5,
+    small_project_share: float = 0.02
+) -> Dict[str, Any]:
+    """
+    Run the benchmark for the given backends.
+
+    The corpus has one large project and two small ones; queries are issued
+    against the small projects, which is where post-filtering loses results.
+    """
+    from .embeddings import get_embedder
+
+    projects = {
+        "shared": 1.0 - 2 * small_project_share,
+        "small-a": small_project_share,
+        "small-b": small_project_share,
+    }
+    kos = generate_kos(n_kos, projects)
+    query_texts = generate_queries(n_queries)
+    queries = [(q, "small-a" if i % 2 == 0 else "small-b") for i, q in enumerate(query_texts)]
+
+    embedder = get_embedder()
+    ko_embeddings = embedder.embed_batch([ko_embedding_text(ko) for ko in kos])
+    truth = {
+        (q, p): exact_top_k(embedder, kos, ko_embeddings, q, p, top_k)
+        for q, p in queries
+    }
+
+    report: Dict[str, Any] = {
+        "config": {
+            "kos": n_kos,
+            "queries": n_queries,
+            "top_k": top_k,
+            "projects": projects,
+        },
+        "results": [],
+        "skipped": [],
+    }
+
+    for name in backends:
+        with tempfile.TemporaryDirectory() as tmp:
+            backend = _make_backend(name, Path(tmp))
+            if backend is None:
+                report["skipped"].append(name)
+                continue
+            report["results"].append(benchmark_backend(backend, kos, queries, truth, top_k))
+
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark KO vector backends")
+    parser.add_argument("--backend", choices=["chroma", "lancedb"], action="append",
+                        help="Backend to benchmark (repeatable, default: all)")
+    parser.add_argument("--kos", type=int, default=2000, help="Corpus size")
+    parser.add_argument("--queries", type=int, default=50, help="Number of queries")
+    parser.add_argument("--top-k", type=int, default=5, help="Results per query")
+    parser.add_argument("--small-share", type=float, default=0.02,
+                        help="Corpus share of each small project")
+    parser.add_argument("--output", type=Path, help="Write JSON report to this file")
+    args = parser.parse_args(argv)
+
+    try:
+        report = run_benchmark(
+            backends=args.backend or ["chroma", "lancedb"],
+            n_kos=args.kos,
+            n_queries=args.queries,
+            top_k=args.top_k,
+            small_project_share=args.small_share,
+        )
+    except ImportError as e:
+        print(f"Benchmark requires sentence-transformers: {e}", file=sys.stderr)
+        return 1
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output)
+    print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,15 @@ Metrics tracked:
 - Success rate (consultations that led to successful task completion)
 - Iteration reduction (fewer iterations after seeing relevant KOs)
 - Time saved (estimated developer time saved)
+- Retrieval count (how often find_relevant() returned the KO)
+
+Storage:
+    Counters are aggregated in memory and flushed in batches to SQLite
+    (knowledge/metrics.db) with additive upserts, either periodically by a
+    background thread, when enough updates are pending, before any query,
+    or at interpreter exit. Additive upserts make concurrent processes safe:
+    each process only ever adds its own deltas, so no counts are lost.
+    Legacy metrics.json is imported once when the database is created.
 
 Usage:
     from knowledge.metrics import record_consultation, record_outcome, get_effectiveness
@@ -28,14 +37,73 @@ Usage:
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
+import atexit
 import json
+import os
+import sqlite3
+import threading
+
+
+METRICS_FILE = Path(__file__).parent / "metrics.json"  # Legacy, imported once
+METRICS_DB = Path(__file__).parent / "metrics.db"
+
+# Flush policy for the in-memory aggregator
+FLUSH_INTERVAL_SECONDS = 5.0
+FLUSH_MAX_PENDING = 200  # Flush inline once this many updates are buffered
+
+_COUNTER_COLUMNS = (
+    "total_consultations",
+    "total_retrievals",
+    "successful_outcomes",
+    "failed_outcomes",
+    "total_iterations_with_ko",
+    "total_iterations_without_ko",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ko_metrics (
+    ko_id TEXT PRIMARY KEY,
+    total_consultations INTEGER NOT NULL DEFAULT 0,
+    total_retrievals INTEGER NOT NULL DEFAULT 0,
+    successful_outcomes INTEGER NOT NULL DEFAULT 0,
+    failed_outcomes INTEGER NOT NULL DEFAULT 0,
+    total_iterations_with_ko INTEGER NOT NULL DEFAULT 0,
+    total_iterations_without_ko INTEGER NOT NULL DEFAULT 0,
+    first_consulted TEXT,
+    last_consulted TEXT
+);
+CREATE TABLE IF NOT EXISTS ko_metrics_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
 
-
-METRICS_FILE = Path(__file__).parent / "metrics.json"
+_UPSERT = """
+INSERT INTO ko_metrics (
+    ko_id, total_consultations, total_retrievals, successful_outcomes, failed_outcomes,
+    total_iterations_with_ko, total_iterations_without_ko, first_consulted, last_consulted
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(ko_id) DO UPDATE SET
+    total_consultations = total_consultations + excluded.total_consultations,
+    total_retrievals = total_retrievals + excluded.total_retrievals,
+    successful_outcomes = successful_outcomes + excluded.successful_outcomes,
+    failed_outcomes = failed_outcomes + excluded.failed_outcomes,
+    total_iterations_with_ko = total_iterations_with_ko + excluded.total_iterations_with_ko,
+    total_iterations_without_ko = total_iterations_without_ko + excluded.total_iterations_without_ko,
+    first_consulted = MIN(
+        COALESCE(first_consulted, excluded.first_consulted),
+        COALESCE(excluded.first_consulted, first_consulted)
+    ),
+    last_consulted = MAX(
+        COALESCE(last_consulted, excluded.last_consulted),
+        COALESCE(excluded.last_consulted, last_consulted)
+    )
+"""
 
 
 @dataclass
@@ -49,66 +117,319 @@ class ConsultationMetrics:
     total_iterations_without_ko: int = 0
     first_consulted: Optional[str] = None
     last_consulted: Optional[str] = None
+    total_retrievals: int = 0
 
 
-def _load_metrics() -> Dict[str, ConsultationMetrics]:
-    """Load metrics from JSON file."""
-    if not METRICS_FILE.exists():
-        return {}
-
-    try:
-        with open(METRICS_FILE, 'r') as f:
-            data = json.load(f)
-            return {
-                ko_id: ConsultationMetrics(**metrics_data)
-                for ko_id, metrics_data in data.items()
-            }
-    except (json.JSONDecodeError, FileNotFoundError):
-        return {}
-
-
-def _save_metrics(metrics: Dict[str, ConsultationMetrics]):
-    """Save metrics to JSON file."""
-    data = {
-        ko_id: {
-            'ko_id': m.ko_id,
-            'total_consultations': m.total_consultations,
-            'successful_outcomes': m.successful_outcomes,
-            'failed_outcomes': m.failed_outcomes,
-            'total_iterations_with_ko': m.total_iterations_with_ko,
-            'total_iterations_without_ko': m.total_iterations_without_ko,
-            'first_consulted': m.first_consulted,
-            'last_consulted': m.last_consulted
+@dataclass
+class _PendingDelta:
+    """Buffered counter increments for one KO, not yet flushed."""
+    counters: Dict[str, int] = field(default_factory=dict)
+    first_consulted: Optional[str] = None
+    last_consulted: Optional[str] = None
+
+    def add(self, column: str, amount: int = 1) -> None:
+        self.counters[column] = self.counters.get(column, 0) + amount
+
+
+class MetricsAggregator:
+    """
+    In-memory KO metrics aggregator with batched SQLite flush.
+
+    Recording is a dict update under a lock; disk I/O happens in flush(),
+    which writes one upsert per dirty KO inside a single transaction.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+        max_pending: int = FLUSH_MAX_PENDING,
+        legacy_json: Optional[Path] = None
+    ):
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.legacy_json = legacy_json
+
+        self._pending: Dict[str, _PendingDelta] = {}
+        self._pending_updates = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._initialized = False
+        self._pid = os.getpid()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Recording (hot path - no I/O unless max_pending is reached)
+    # ─────────────────────────────────────────────────────────────────────
+
+    def record_consultation(self, ko_id: str, timestamp: Optional[str] = None) -> None:
+        """Buffer one consultation of a KO."""
+        timestamp = timestamp or datetime.now().isoformat()
+        with self._lock:
+            delta = self._delta(ko_id)
+            delta.add("total_consultations")
+            if delta.first_consulted is None or timestamp < delta.first_consulted:
+                delta.first_consulted = timestamp
+            if delta.last_consulted is None or timestamp > delta.last_consulted:
+                delta.last_consulted = timestamp
+        self._after_record()
+
+    def record_retrievals(self, ko_ids: List[str]) -> None:
+        """Buffer one retrieval for each KO returned by a search."""
+        if not ko_ids:
+            return
+        with self._lock:
+            for ko_id in ko_ids:
+                self._delta(ko_id).add("total_retrievals")
+        self._after_record()
+
+    def record_outcome(self, ko_ids: List[str], success: bool, iterations: int) -> None:
+        """Buffer a task outcome for every KO consulted during the task."""
+        column = "successful_outcomes" if success else "failed_outcomes"
+        with self._lock:
+            for ko_id in ko_ids:
+                delta = self._delta(ko_id)
+                delta.add(column)
+                delta.add("total_iterations_with_ko", iterations)
+        self._after_record()
+
+    def _delta(self, ko_id: str) -> _PendingDelta:
+        """Get the pending delta for a KO. Caller must hold _lock."""
+        if os.getpid() != self._pid:
+            # Forked child: parent's buffered counts belong to the parent
+            self._pending.clear()
+            self._pending_updates = 0
+            self._pid = os.getpid()
+            self._thread = None
+        self._pending_updates += 1
+        delta = self._pending.get(ko_id)
+        if delta is None:
+            delta = self._pending[ko_id] = _PendingDelta()
+        return delta
+
+    def _after_record(self) -> None:
+        if self._pending_updates >= self.max_pending:
+            self.flush()
+        else:
+            self._ensure_flusher()
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Flushing
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _ensure_flusher(self) -> None:
+        """Start the periodic flush thread on first use."""
+        if self.flush_interval <= 0:
+            return
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._flush_loop, name="ko-metrics-flusher", daemon=True
+        )
+        self._thread.start()
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except sqlite3.Error as e:
+                print(f"KO metrics flush error: {e}")
+
+    def flush(self) -> int:
+        """
+        Write buffered deltas to SQLite in one transaction.
+
+        Returns:
+            Number of KOs written
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                pending = self._pending
+                self._pending = {}
+                self._pending_updates = 0
+
+            rows = [
+                (
+                    ko_id,
+                    *(delta.counters.get(col, 0) for col in _COUNTER_COLUMNS),
+                    delta.first_consulted,
+                    delta.last_consulted,
+                )
+                for ko_id, delta in pending.items()
+            ]
+
+            try:
+                with self._connect() as conn:
+                    conn.executemany(_UPSERT, rows)
+            except sqlite3.Error:
+                # Put the deltas back so they are retried on the next flush
+                with self._lock:
+                    for ko_id, delta in pending.items():
+                        merged = self._pending.setdefault(ko_id, _PendingDelta())
+                        for col, amount in delta.counters.items():
+                            merged.add(col, amount)
+                        if delta.first_consulted and (
+                            merged.first_consulted is None or delta.first_consulted < merged.first_consulted
+                        ):
+                            merged.first_consulted = delta.first_consulted
+                        if delta.last_consulted and (
+                            merged.last_consulted is None or delta.last_consulted > merged.last_consulted
+                        ):
+                            merged.last_consulted = delta.last_consulted
+                raise
+
+            return len(rows)
+
+    def close(self) -> None:
+        """Stop the flush thread and write any remaining deltas."""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.flush_interval + 1)
+        self._thread = None
+        try:
+            self.flush()
+        except sqlite3.Error as e:
+            print(f"KO metrics flush error: {e}")
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Storage
+    # ─────────────────────────────────────────────────────────────────────
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a short-lived connection; commits on success, always closes."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            if not self._initialized:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+                self._import_legacy_json(conn)
+                self._initialized = True
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _import_legacy_json(self, conn: sqlite3.Connection) -> None:
+        """One-time import of metrics.json counters into a new database."""
+        if self.legacy_json is None or not self.legacy_json.exists():
+            return
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            done = conn.execute(
+                "SELECT 1 FROM ko_metrics_meta WHERE key = 'legacy_json_imported'"
+            ).fetchone()
+            if not done:
+                try:
+                    data = json.loads(self.legacy_json.read_text())
+                except (json.JSONDecodeError, OSError):
+                    data = {}
+                for ko_id, m in data.items():
+                    conn.execute(_UPSERT, (
+                        ko_id,
+                        *(int(m.get(col, 0) or 0) for col in _COUNTER_COLUMNS),
+                        m.get("first_consulted"),
+                        m.get("last_consulted"),
+                    ))
+                conn.execute(
+                    "INSERT INTO ko_metrics_meta (key, value) VALUES ('legacy_json_imported', ?)",
+                    (datetime.now().isoformat(),)
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def load(self, ko_id: Optional[str] = None) -> Dict[str, ConsultationMetrics]:
+        """
+        Flush pending deltas and read metrics.
+
+        Args:
+            ko_id: Only load this KO (None = all)
+
+        Returns:
+            Dict of ko_id -> ConsultationMetrics
+        """
+        self.flush()
+        columns = ("ko_id",) + _COUNTER_COLUMNS + ("first_consulted", "last_consulted")
+        sql = f"SELECT {', '.join(columns)} FROM ko_metrics"
+        params: tuple = ()
+        if ko_id is not None:
+            sql += " WHERE ko_id = ?"
+            params = (ko_id,)
+
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        return {
+            row[0]: ConsultationMetrics(**dict(zip(columns, row)))
+            for row in rows
         }
-        for ko_id, m in metrics.items()
-    }
 
-    with open(METRICS_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+
+_aggregator: Optional[MetricsAggregator] = None
+_aggregator_lock = threading.Lock()
+
+
+def get_aggregator() -> MetricsAggregator:
+    """
+    Get the process-wide metrics aggregator.
+
+    Re-created if METRICS_DB is changed (e.g. by tests).
+    """
+    global _aggregator
+    with _aggregator_lock:
+        if _aggregator is None or _aggregator.db_path != METRICS_DB:
+            if _aggregator is not None:
+                _aggregator.close()
+            _aggregator = MetricsAggregator(METRICS_DB, legacy_json=METRICS_FILE)
+        return _aggregator
+
+
+def flush() -> int:
+    """Flush buffered metrics to disk. Returns number of KOs written."""
+    return get_aggregator().flush()
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    if _aggregator is not None:
+        _aggregator.close()
+
+
+def _load_metrics() -> Dict[str, ConsultationMetrics]:
+    """Load metrics for all KOs (flushing this process's pending deltas)."""
+    return get_aggregator().load()
 
 
 def record_consultation(ko_id: str, task_id: str):
     """
     Record that a KO was consulted for a task.
 
+    Buffered in memory; written on the next batched flush.
+
     Args:
         ko_id: Knowledge Object ID
         task_id: Task ID being worked on
     """
-    metrics = _load_metrics()
-
-    if ko_id not in metrics:
-        metrics[ko_id] = ConsultationMetrics(ko_id=ko_id)
+    get_aggregator().record_consultation(ko_id)
 
-    m = metrics[ko_id]
-    m.total_consultations += 1
 
-    timestamp = datetime.now().isoformat()
-    if m.first_consulted is None:
-        m.first_consulted = timestamp
-    m.last_consulted = timestamp
+def record_retrievals(ko_ids: List[str]):
+    """
+    Record that KOs were returned by a knowledge search.
 
-    _save_metrics(metrics)
+    Args:
+        ko_ids: Knowledge Object IDs returned
+    """
+    get_aggregator().record_retrievals(ko_ids)
 
 
 def record_outcome(
@@ -129,41 +450,11 @@ def record_outcome(
     if not consulted_ko_ids:
         return  # No KOs consulted, nothing to record
 
-    metrics = _load_metrics()
-
-    for ko_id in consulted_ko_ids:
-        if ko_id not in metrics:
-            metrics[ko_id] = ConsultationMetrics(ko_id=ko_id)
+    get_aggregator().record_outcome(consulted_ko_ids, success, iterations)
 
-        m = metrics[ko_id]
 
-        if success:
-            m.successful_outcomes += 1
-        else:
-            m.failed_outcomes += 1
-
-        m.total_iterations_with_ko += iterations
-
-    _save_metrics(metrics)
-
-
-def get_effectiveness(ko_id: str) -> Optional[Dict[str, any]]:
-    """
-    Get effectiveness report for a KO.
-
-    Returns:
-        Dict with:
-        - success_rate: % of consultations that led to success
-        - avg_iterations: Average iterations when this KO was consulted
-        - total_consultations: Total times consulted
-        - impact_score: Composite effectiveness score (0-100)
-    """
-    metrics = _load_metrics()
-
-    if ko_id not in metrics:
-        return None
-
-    m = metrics[ko_id]
+def _build_report(m: ConsultationMetrics) -> Dict[str, any]:
+    """Build an effectiveness report from raw counters."""
     total_outcomes = m.successful_outcomes + m.failed_outcomes
 
     if total_outcomes == 0:
@@ -178,8 +469,9 @@ def get_effectiveness(ko_id: str) -> Optional[Dict[str, any]]:
     impact_score = (success_rate * 0.7) + (min(m.total_consultations / 10, 1.0) * 30)
 
     return {
-        'ko_id': ko_id,
+        'ko_id': m.ko_id,
         'total_consultations': m.total_consultations,
+        'total_retrievals': m.total_retrievals,
         'successful_outcomes': m.successful_outcomes,
         'failed_outcomes': m.failed_outcomes,
         'success_rate': round(success_rate, 1),
@@ -190,25 +482,48 @@ def get_effectiveness(ko_id: str) -> Optional[Dict[str, any]]:
     }
 
 
-def get_all_effectiveness() -> List[Dict[str, any]]:
+def get_effectiveness(ko_id: str) -> Optional[Dict[str, any]]:
+    """
+    Get effectiveness report for a KO.
+
+    Returns:
+        Dict with:
+        - success_rate: % of consultations that led to success
+        - avg_iterations: Average iterations when this KO was consulted
+        - total_consultations: Total times consulted
+        - impact_score: Composite effectiveness score (0-100)
+    """
+    metrics = get_aggregator().load(ko_id)
+
+    if ko_id not in metrics:
+        return None
+
+    return _build_report(metrics[ko_id])
+
+
+def get_all_effectiveness(
+    min_consultations: int = 0,
+    limit: Optional[int] = None
+) -> List[Dict[str, any]]:
     """
     Get effectiveness reports for all KOs, sorted by impact score.
 
+    Args:
+        min_consultations: Skip KOs consulted fewer times than this
+        limit: Maximum reports to return (None = all)
+
     Returns:
         List of effectiveness reports, highest impact first
     """
-    metrics = _load_metrics()
-    reports = []
-
-    for ko_id in metrics.keys():
-        report = get_effectiveness(ko_id)
-        if report:
-            reports.append(report)
+    reports = [
+        _build_report(m) for m in _load_metrics().values()
+        if m.total_consultations >= min_consultations
+    ]
 
     # Sort by impact score (highest first)
     reports.sort(key=lambda r: r['impact_score'], reverse=True)
 
-    return reports
+    return reports[:limit] if limit is not None else reports
 
 
 def get_summary_stats() -> Dict[str, any]:
@@ -222,7 +537,8 @@ def get_summary_stats() -> Dict[str, any]:
         - overall_success_rate: Success rate across all KO consultations
         - top_kos: Top 5 KOs by impact score
     """
-    reports = get_all_effectiveness()
+    # KOs that were only retrieved by searches have rows but no consultations
+    reports = get_all_effectiveness(min_consultations=1)
 
     if not reports:
         return {
@@ -0,0 +1,218 @@
+"""
+File-Pattern Index for Knowledge Objects
+
+Compiles every KO's `file_patterns` globs into a path-segment trie so that a
+list of changed file paths can be matched against all KOs in one pass.
+
+Pattern semantics (gitignore-flavoured):
+- Segments are split on "/"; "*", "?" and "[...]" match within one segment
+- "**" matches zero or more whole segments
+- A pattern without "/" matches the basename anywhere ("*.py" == "**/*.py")
+- A pattern ending in "/" or containing no wildcards also matches everything
+  below it as a directory ("src/auth" matches "src/auth/session.ts")
+
+Usage:
+    from knowledge.pattern_index import FilePatternIndex
+
+    index = FilePatternIndex()
+    index.add("KO-km-001", ["src/auth/*", "**/middleware.ts"])
+
+    index.match(["src/auth/login.ts", "README.md"])
+    # Returns: ["KO-km-001"]
+"""
+
+from __future__ import annotations
+from fnmatch import fnmatchcase
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+_GLOB_CHARS = frozenset("*?[")
+_GLOBSTAR = "**"
+
+
+def _has_glob(segment: str) -> bool:
+    return any(c in _GLOB_CHARS for c in segment)
+
+
+def normalize_path(path: str) -> str:
+    """Normalize a file path or pattern to forward-slash, no leading ./ or /."""
+    path = path.strip().replace("\\", "/")
+    while path.startswith("./"):
+        path = path[2:]
+    return path.lstrip("/")
+
+
+def compile_pattern(pattern: str) -> List[Tuple[str, ...]]:
+    """
+    Expand one glob into the segment sequences stored in the trie.
+
+    Returns:
+        List of segment tuples (a pattern may expand to a file match plus a
+        directory-prefix match)
+    """
+    raw = pattern.strip().replace("\\", "/")
+    is_dir = raw.endswith("/")
+    norm = normalize_path(raw).rstrip("/")
+    if not norm:
+        return []
+
+    segments = [s for s in norm.split("/") if s]
+    # Collapse consecutive "**" - they are equivalent to a single one
+    collapsed: List[str] = []
+    for seg in segments:
+        if seg == _GLOBSTAR and collapsed and collapsed[-1] == _GLOBSTAR:
+            continue
+        collapsed.append(seg)
+
+    if "/" not in norm and collapsed[0] != _GLOBSTAR:
+        collapsed.insert(0, _GLOBSTAR)
+
+    compiled = []
+    if not is_dir:
+        compiled.append(tuple(collapsed))
+    if is_dir or not any(_has_glob(seg) for seg in collapsed):
+        compiled.append(tuple(collapsed) + (_GLOBSTAR,))
+    return compiled
+
+
+class _Node:
+    """Trie node: literal children by segment, wildcard children by glob."""
+
+    __slots__ = ("literal", "wild", "globstar", "is_globstar", "ko_ids")
+
+    def __init__(self, is_globstar: bool = False):
+        self.literal: Dict[str, _Node] = {}
+        self.wild: Dict[str, _Node] = {}
+        self.globstar: Optional[_Node] = None
+        self.is_globstar = is_globstar
+        self.ko_ids: Set[str] = set()
+
+    def child(self, segment: str) -> _Node:
+        if segment == _GLOBSTAR:
+            if self.globstar is None:
+                self.globstar = _Node(is_globstar=True)
+            return self.globstar
+        table = self.wild if _has_glob(segment) else self.literal
+        node = table.get(segment)
+        if node is None:
+            node = table[segment] = _Node()
+        return node
+
+
+class FilePatternIndex:
+    """
+    Segment trie over KO file-pattern globs.
+
+    Matching runs an NFA walk over the trie: each path segment advances the
+    set of live nodes, so cost is proportional to path depth times the number
+    of live wildcard branches, not to the number of KOs.
+    """
+
+    def __init__(self) -> None:
+        self._root = _Node()
+        self._patterns: Dict[str, List[str]] = {}  # KO ID -> original patterns
+        self._order: Dict[str, int] = {}           # KO ID -> insertion order
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def add(self, ko_id: str, patterns: Iterable[str]) -> None:
+        """Register a KO's file patterns (replacing any previous ones)."""
+        if ko_id in self._patterns:
+            self.remove(ko_id)
+
+        patterns = [p for p in patterns if p and p.strip()]
+        if not patterns:
+            return
+
+        self._patterns[ko_id] = patterns
+        self._order[ko_id] = len(self._order)
+        for pattern in patterns:
+            for segments in compile_pattern(pattern):
+                node = self._root
+                for seg in segments:
+                    node = node.child(seg)
+                node.ko_ids.add(ko_id)
+
+    def remove(self, ko_id: str) -> bool:
+        """
+        Unregister a KO.
+
+        Empty trie branches are left in place; they are cheap and get reused.
+
+        Returns:
+            True if the KO was present
+        """
+        patterns = self._patterns.pop(ko_id, None)
+        if patterns is None:
+            return False
+        self._order.pop(ko_id, None)
+
+        for pattern in patterns:
+            for segments in compile_pattern(pattern):
+                node: Optional[_Node] = self._root
+                for seg in segments:
+                    if seg == _GLOBSTAR:
+                        node = node.globstar
+                    else:
+                        table = node.wild if _has_glob(seg) else node.literal
+                        node = table.get(seg)
+                    if node is None:
+                        break
+                if node is not None:
+                    node.ko_ids.discard(ko_id)
+        return True
+
+    def patterns_for(self, ko_id: str) -> List[str]:
+        """Return the patterns registered for a KO."""
+        return list(self._patterns.get(ko_id, []))
+
+    def match_path(self, path: str) -> Set[str]:
+        """Return IDs of KOs with a pattern matching a single path."""
+        segments = [s for s in normalize_path(path).split("/") if s]
+        if not segments:
+            return set()
+
+        states = self._closure({id(self._root): self._root})
+        for seg in segments:
+            next_states: Dict[int, _Node] = {}
+            for node in states.values():
+                if node.is_globstar:
+                    next_states[id(node)] = node
+                child = node.literal.get(seg)
+                if child is not None:
+                    next_states[id(child)] = child
+                for glob, child in node.wild.items():
+                    if fnmatchcase(seg, glob):
+                        next_states[id(child)] = child
+            if not next_states:
+                return set()
+            states = self._closure(next_states)
+
+        matched: Set[str] = set()
+        for node in states.values():
+            matched |= node.ko_ids
+        return matched
+
+    def match(self, paths: Iterable[str]) -> List[str]:
+        """
+        Return IDs of KOs matching any of the given paths.
+
+        Results are de-duplicated and ordered by KO registration order so the
+        output is stable across calls.
+        """
+        matched: Set[str] = set()
+        for path in paths:
+            matched |= self.match_path(path)
+        return sorted(matched, key=lambda ko_id: self._order.get(ko_id, 0))
+
+    @staticmethod
+    def _closure(states: Dict[int, _Node]) -> Dict[int, _Node]:
+        """Add globstar children, which may match zero segments."""
+        pending = list(states.values())
+        while pending:
+            node = pending.pop()
+            star = node.globstar
+            if star is not None and id(star) not in states:
+                states[id(star)] = star
+                pending.append(star)
+        return states
@@ -43,7 +43,7 @@ Usage:
     )
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import os
 
 
@@ -109,7 +109,9 @@ class ChromaKnowledgeStore:
         self,
         ko_id: str,
         content: str,
-        tags: Optional[List[str]] = None
+        tags: Optional[List[str]] = None,
+        project: Optional[str] = None,
+        status: Optional[str] = None
     ) -> None:
         """
         Add or update a Knowledge Object in the vector store.
@@ -120,6 +122,8 @@ class ChromaKnowledgeStore:
             ko_id: Unique KO identifier (e.g., "KO-km-001")
             content: Text content to embed and search
             tags: Optional list of tags for hybrid filtering
+            project: Optional project, stored for pre-filtered search
+            status: Optional KO status, stored for pre-filtered search
 
         Example:
             store.add_ko(
@@ -128,32 +132,92 @@ class ChromaKnowledgeStore:
                 tags=["auth", "security"]
             )
         """
-        if tags is None:
-            tags = []
+        self.add_kos([(ko_id, content, tags, project, status)])
+
+    def add_kos(
+        self,
+        items: List[Tuple[str, str, Optional[List[str]], Optional[str], Optional[str]]]
+    ) -> int:
+        """
+        Add or update many Knowledge Objects in one upsert call.
+
+        Args:
+            items: List of (ko_id, content, tags, project, status) tuples
 
-        # Store tags as comma-separated string AND individual tag_N fields
-        # Chroma only supports str, int, float, bool, SparseVector, or None
-        metadata = {
-            "tags": ",".join(tags)  # For display
-        }
+        Returns:
+            Number of KOs upserted
+        """
+        if not items:
+            return 0
 
-        # Add individual tag fields for filtering (tag_0, tag_1, etc.)
-        # This allows exact matching in where clauses
-        for i, tag in enumerate(tags):
-            metadata[f"tag_{i}"] = tag
+        ids = []
+        documents = []
+        metadatas = []
+        for ko_id, content, tags, project, status in items:
+            ids.append(ko_id)
+            documents.append(content)
+            metadatas.append(_build_metadata(tags or [], project, status))
 
         # Chroma uses upsert behavior - adds if new, updates if exists
         self.collection.upsert(
-            ids=[ko_id],
-            documents=[content],
-            metadatas=[metadata]
+            ids=ids,
+            documents=documents,
+            metadatas=metadatas  # type: ignore[arg-type]
+        )
+        return len(ids)
+
+    def update_metadata(
+        self,
+        items: List[Tuple[str, Optional[List[str]], Optional[str], Optional[str]]]
+    ) -> int:
+        """
+        Rewrite KO metadata without re-embedding.
+
+        Args:
+            items: List of (ko_id, tags, project, status) tuples
+
+        Returns:
+            Number of KOs updated
+        """
+        if not items:
+            return 0
+
+        self.collection.update(
+            ids=[ko_id for ko_id, _, _, _ in items],
+            metadatas=[  # type: ignore[arg-type]
+                _build_metadata(tags or [], project, status)
+                for _, tags, project, status in items
+            ]
         )
+        return len(items)
+
+    def ids_missing_metadata(self, key: str = "project") -> List[str]:
+        """
+        IDs of KOs indexed without a metadata key.
+
+        KOs indexed before project/status were stored have neither, so a
+        `where` clause on them silently excludes those KOs.
+
+        Returns:
+            List of KO identifiers lacking `key`
+        """
+        try:
+            results = self.collection.get(include=["metadatas"])
+        except Exception:
+            return []
+        ids = results.get('ids') or []
+        metadatas = results.get('metadatas') or []
+        return [
+            ko_id for i, ko_id in enumerate(ids)
+            if i >= len(metadatas) or key not in (metadatas[i] or {})
+        ]
 
     def search(
         self,
         query: str,
         tags: Optional[List[str]] = None,
-        top_k: int = 5
+        top_k: int = 5,
+        where: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
         """
         Hybrid search: semantic similarity + optional tag filtering.
@@ -167,6 +231,8 @@ class ChromaKnowledgeStore:
             tags: Optional tags to filter results (OR semantics)
                  KOs matching ANY tag will be included
             top_k: Maximum number of results to return (default: 5)
+            where: Optional extra metadata filter (e.g. {"project": "karematch"}),
+                  ANDed with the tag filter and applied inside the query
 
         Returns:
             List of dictionaries with keys:
@@ -174,6 +240,7 @@ class ChromaKnowledgeStore:
             - score: Similarity score (higher = more similar)
             - content: KO text content
             - tags: List of tags
+            - project: KO project ("" if indexed without one)
 
         Example:
             # Pure semantic search
@@ -203,6 +270,9 @@ class ChromaKnowledgeStore:
             elif len(conditions) > 1:
                 where_filter = {"$or": conditions}  # type: ignore[dict-item]
 
+        if where:
+            where_filter = {"$and": [where_filter, where]} if where_filter else where
+
         # Execute semantic search
         try:
             results = self.collection.query(
@@ -238,7 +308,8 @@ class ChromaKnowledgeStore:
                     "id": ko_id,
                     "score": score,
                     "content": documents[i] if i < len(documents) else "",
-                    "tags": tags_list
+                    "tags": tags_list,
+                    "project": str(metadatas[i].get('project', '')) if i < len(metadatas) else ''
                 })
 
         return formatted
@@ -305,6 +376,34 @@ class ChromaKnowledgeStore:
             return []
 
 
+def _build_metadata(
+    tags: List[str],
+    project: Optional[str],
+    status: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Build Chroma metadata for a KO.
+
+    Stores tags as comma-separated string AND individual tag_N fields.
+    Chroma only supports str, int, float, bool, SparseVector, or None.
+    """
+    metadata: Dict[str, Any] = {
+        "tags": ",".join(tags)  # For display
+    }
+
+    # Add individual tag fields for filtering (tag_0, tag_1, etc.)
+    # This allows exact matching in where clauses
+    for i, tag in enumerate(tags):
+        metadata[f"tag_{i}"] = tag
+
+    if project is not None:
+        metadata["project"] = project
+    if status is not None:
+        metadata["status"] = status
+
+    return metadata
+
+
 # Singleton instance for efficiency
 _default_store: Optional[ChromaKnowledgeStore] = None
 
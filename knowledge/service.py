@@ -39,6 +39,8 @@ import glob
 import time
 import threading
 
+from monitoring.tracing import traced
+
 
 # Directories for Knowledge Objects
 KO_DRAFTS_DIR = Path(__file__).parent / "drafts"
@@ -53,21 +55,29 @@ KO_APPROVED_DIR.mkdir(exist_ok=True)
 # Provides 10-100x speedup for repeated queries
 _ko_cache: Optional[Dict[str, Any]] = None
 _tag_index: Optional[Dict[str, List[str]]] = None  # tag → list of KO IDs
+_file_pattern_index: Optional[Any] = None  # FilePatternIndex over file_patterns globs
 _cache_lock = threading.Lock()
 _cache_expiry_seconds = 300  # 5 minutes
 
+# BM25 full-text index (persisted, updated incrementally on cache rebuild)
+_text_index: Optional[Any] = None
+_text_index_path: Optional[Path] = None
+
 def _get_cached_kos() -> List[KnowledgeObject]:
     """
     Get approved KOs from cache or rebuild cache if stale.
 
-    Also builds tag index for O(1) tag lookup.
+    Also builds tag index for O(1) tag lookup and the file-pattern trie
+    for glob matching against changed paths.
     Cache is invalidated after 5 minutes or when approve() is called.
     Thread-safe for concurrent access.
 
     Returns:
         List of all approved KnowledgeObject instances
     """
-    global _ko_cache, _tag_index
+    global _ko_cache, _tag_index, _file_pattern_index
+
+    from .pattern_index import FilePatternIndex
 
     with _cache_lock:
         # Check if cache exists and is valid
@@ -77,6 +87,7 @@ def _get_cached_kos() -> List[KnowledgeObject]:
         # Rebuild cache from disk
         all_kos = []
         tag_index = {}  # tag → list of KO IDs
+        pattern_index = FilePatternIndex()
 
         for ko_file in KO_APPROVED_DIR.glob("*.md"):
             ko = _load_ko_from_file(ko_file)
@@ -89,25 +100,61 @@ def _get_cached_kos() -> List[KnowledgeObject]:
                         tag_index[tag] = []
                     tag_index[tag].append(ko.id)
 
+                # Build file-pattern trie: glob → KO IDs
+                pattern_index.add(ko.id, ko.file_patterns)
+
         # Update cache and index
         _ko_cache = {
             'kos': all_kos,
             'timestamp': time.time()
         }
         _tag_index = tag_index
+        _file_pattern_index = pattern_index
+
+        _sync_text_index(all_kos)
 
         return all_kos
 
+
+def _get_text_index_path() -> Path:
+    """Location of the persisted BM25 index (next to the approved KO dir)."""
+    return KO_APPROVED_DIR.parent / "index" / "bm25.json.gz"
+
+
+def _sync_text_index(all_kos: List[KnowledgeObject]) -> None:
+    """
+    Bring the BM25 index in line with the approved KOs.
+
+    Loads the persisted index on first use and only re-tokenizes KOs whose
+    content changed. Caller must hold _cache_lock.
+    """
+    global _text_index, _text_index_path
+
+    from .text_index import BM25Index
+
+    index_path = _get_text_index_path()
+    if _text_index is None or _text_index_path != index_path:
+        _text_index = BM25Index.load(index_path)
+        _text_index_path = index_path
+
+    added, removed = _text_index.sync(all_kos)
+    if added or removed or not index_path.exists():
+        try:
+            _text_index.save(index_path)
+        except OSError:
+            pass  # Index is still usable in memory
+
 def invalidate_cache():
     """
     Invalidate the KO cache and tag index.
 
     Call this after modifying KO files (approve, edit, delete).
     """
-    global _ko_cache, _tag_index
+    global _ko_cache, _tag_index, _file_pattern_index
     with _cache_lock:
         _ko_cache = None
         _tag_index = None
+        _file_pattern_index = None
 
 
 @dataclass
@@ -135,6 +182,7 @@ class KnowledgeObject:
             self.file_patterns = []
 
 
+@traced("ko.find_relevant")
 def find_relevant(
     project: str,
     tags: Optional[List[str]] = None,
@@ -149,7 +197,8 @@ def find_relevant(
     Supports three search modes:
     1. Tag-only: Fast O(1) tag index lookup (default when no query)
     2. Semantic-only: Vector similarity search (when query provided, hybrid=False)
-    3. Hybrid: Tag index first, semantic re-rank (query provided, hybrid=True)
+    3. Hybrid: Tag index + BM25 keyword candidates first, semantic re-rank
+       (query provided, hybrid=True). Without semantic deps, BM25 order is kept.
 
     Token Optimization:
     - Returns top-K results (default 5) instead of all matches
@@ -158,7 +207,7 @@ def find_relevant(
     Args:
         project: Project to search within
         tags: Tags to match (ANY match returns the KO - OR semantics)
-        file_patterns: File patterns to match
+        file_patterns: File paths (or patterns) to match against KO globs
         query: Semantic search query (e.g., "how to fix null pointer in auth")
         hybrid: Combine tag + semantic search (True by default)
         top_k: Maximum results to return
@@ -190,22 +239,19 @@ def find_relevant(
                             relevant_kos.append(ko)
                             matched_ko_ids.add(ko_id)
 
-    # File pattern matching (slower, but rare)
+    # File pattern matching via glob trie (one pass over all paths)
     if file_patterns:
-        for ko in all_kos:
-            # Skip if already matched by tags
-            if ko.id in matched_ko_ids:
-                continue
-
-            # Filter by project
-            if ko.project != project:
-                continue
-
-            # Match file patterns
-            if any(pattern in ko.file_patterns for pattern in file_patterns):
+        for ko in _match_file_patterns(file_patterns, project, ko_map):
+            if ko.id not in matched_ko_ids:
                 relevant_kos.append(ko)
                 matched_ko_ids.add(ko.id)
 
+    # BM25 keyword retrieval as first stage for hybrid mode
+    if query and hybrid:
+        for ko in _keyword_search(query, project, ko_map, matched_ko_ids, top_k * 2):
+            relevant_kos.append(ko)
+            matched_ko_ids.add(ko.id)
+
     # Semantic search if query provided
     if query:
         semantic_results = _semantic_search(
@@ -233,10 +279,39 @@ def find_relevant(
     # Limit results
     relevant_kos = relevant_kos[:top_k]
 
-    # Update consultation metrics
-    # Legacy: Log to file
-    for ko in relevant_kos:
-        _increment_consultation_count(ko.id)
+    # Update retrieval metrics (buffered, flushed in batches)
+    _record_retrievals([ko.id for ko in relevant_kos])
+
+    return relevant_kos
+
+
+@traced("ko.find_relevant_for_files")
+def find_relevant_for_files(
+    project: str,
+    file_paths: List[str]
+) -> List[KnowledgeObject]:
+    """
+    Find all Knowledge Objects whose file_patterns match the given paths.
+
+    Intended for changed-file lists (e.g. `git diff --name-only`): every
+    applicable KO is returned, not just the top-K.
+
+    Args:
+        project: Project to search within
+        file_paths: Paths relative to the project root
+
+    Returns:
+        List of matching approved Knowledge Objects
+    """
+    if not file_paths:
+        return []
+
+    all_kos = _get_cached_kos()
+    ko_map = {ko.id: ko for ko in all_kos}
+
+    relevant_kos = _match_file_patterns(file_paths, project, ko_map)
+
+    _record_retrievals([ko.id for ko in relevant_kos])
 
     return relevant_kos
 
@@ -463,17 +538,64 @@ def _load_ko_from_file(file_path: Path) -> Optional[KnowledgeObject]:
         return None
 
 
-def _increment_consultation_count(ko_id: str) -> None:
+def _record_retrievals(ko_ids: List[str]) -> None:
+    """
+    Record that KOs were returned by a search.
+
+    Buffered in the in-memory metrics aggregator; no file I/O on this path.
+    """
+    if not ko_ids:
+        return
+
+    from .metrics import record_retrievals
+    record_retrievals(ko_ids)
+
+
+def _match_file_patterns(
+    file_paths: List[str],
+    project: str,
+    ko_map: Dict[str, KnowledgeObject]
+) -> List[KnowledgeObject]:
+    """
+    Match paths against the file-pattern trie.
+
+    Expects _get_cached_kos() to have been called (it builds the trie).
+
+    Returns:
+        KOs in the given project with at least one matching glob
+    """
+    with _cache_lock:
+        if _file_pattern_index is None:
+            return []
+        ko_ids = _file_pattern_index.match(file_paths)
+
+    return [
+        ko_map[ko_id] for ko_id in ko_ids
+        if ko_id in ko_map and ko_map[ko_id].project == project
+    ]
+
+
+def _keyword_search(
+    query: str,
+    project: str,
+    ko_map: Dict[str, KnowledgeObject],
+    exclude_ids: set,
+    top_k: int = 5
+) -> List[KnowledgeObject]:
     """
-    Increment consultation count for a KO.
+    BM25 keyword search over approved KOs.
 
-    In MVP, this just logs the consultation.
-    In production, would update database.
+    Expects _get_cached_kos() to have been called (it syncs the index).
+
+    Returns:
+        List of KOs sorted by BM25 score
     """
-    # For MVP, just log to a file
-    metrics_file = Path(__file__).parent / "consultation_metrics.log"
-    with open(metrics_file, "a") as f:
-        f.write(f"{datetime.now().isoformat()},{ko_id},consulted\n")
+    with _cache_lock:
+        if _text_index is None:
+            return []
+        hits = _text_index.search(query, project=project, top_k=top_k, exclude_ids=exclude_ids)
+
+    return [ko_map[ko_id] for ko_id, _ in hits if ko_id in ko_map]
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -545,7 +667,9 @@ def _semantic_search(
     """
     Perform semantic search using vector embeddings.
 
-    Uses either Chroma or LanceDB backend based on availability.
+    Uses either Chroma or LanceDB backend based on availability. The project
+    filter and excluded IDs are pushed down into the vector query (see
+    knowledge.vector_backend), so small projects still get top_k results.
 
     Args:
         query: Natural language query
@@ -561,60 +685,23 @@ def _semantic_search(
         return []  # Graceful fallback if deps not installed
 
     try:
-        global _semantic_backend
-
-        if _semantic_backend == "chroma":
-            # Use Chroma backend
-            from .semantic_search import get_chroma_store
-
-            store = get_chroma_store()
-            # Chroma returns dict results with id, score, content, tags
-            results = store.search(query, top_k=top_k * 2)
-
-            semantic_kos = []
-            for result in results:
-                ko_id = result["id"]
-                if ko_id in exclude_ids:
-                    continue
-
-                ko = ko_map.get(ko_id)
-                if ko and ko.project == project:
-                    semantic_kos.append(ko)
-
-                if len(semantic_kos) >= top_k:
-                    break
-
-            return semantic_kos
+        from .vector_backend import VectorFilter, get_backend
 
-        elif _semantic_backend == "lancedb":
-            # Use LanceDB backend
-            from .embeddings import get_embedder
-            from .vector_store import get_vector_store
-
-            # Get query embedding
-            embedder = get_embedder()
-            query_embedding = embedder.embed(query)
-
-            # Search vector store
-            store = get_vector_store()
-            results = store.search(query_embedding, top_k=top_k * 2)
-
-            semantic_kos = []
-            for result in results:
-                if result.ko_id in exclude_ids:
-                    continue
-
-                ko = ko_map.get(result.ko_id)
-                if ko and ko.project == project:
-                    semantic_kos.append(ko)
+        backend = get_backend(_semantic_backend)
+        if backend is None:
+            return []
 
-                if len(semantic_kos) >= top_k:
-                    break
+        # Entries indexed before project metadata existed (no-op afterwards)
+        backend.backfill(list(ko_map.values()))
 
-            return semantic_kos
+        hits = backend.search(
+            query,
+            top_k=top_k,
+            flt=VectorFilter(project=project, exclude_ids=set(exclude_ids))
+        )
 
-        else:
-            return []
+        # Vector store may lag behind disk (deleted/unapproved KOs)
+        return [ko_map[hit.ko_id] for hit in hits if hit.ko_id in ko_map]
 
     except Exception as e:
         # Log error and return empty (graceful degradation)
@@ -647,13 +734,13 @@ def _rerank_by_semantic(
         embedder = get_embedder()
         query_embedding = embedder.embed(query)
 
-        # Generate embeddings for each KO and compute similarity
-        scored = []
-        for ko in kos:
-            ko_text = f"{ko.title}\n{ko.what_was_learned}\n{ko.prevention_rule}"
-            ko_embedding = embedder.embed(ko_text)
-            similarity = embedder.similarity(query_embedding, ko_embedding)
-            scored.append((ko, similarity))
+        # Embed all candidates in one batch and compute similarity
+        ko_texts = [f"{ko.title}\n{ko.what_was_learned}\n{ko.prevention_rule}" for ko in kos]
+        ko_embeddings = embedder.embed_batch(ko_texts)
+        scored = [
+            (ko, embedder.similarity(query_embedding, ko_embedding))
+            for ko, ko_embedding in zip(kos, ko_embeddings)
+        ]
 
         # Sort by similarity descending
         scored.sort(key=lambda x: x[1], reverse=True)
@@ -670,7 +757,7 @@ def index_all_kos() -> int:
     Index all approved KOs in the vector store.
 
     Call this after approving new KOs or to rebuild the index.
-    Supports both Chroma and LanceDB backends.
+    Supports both Chroma and LanceDB backends; both do a single bulk upsert.
 
     Returns:
         Number of KOs indexed
@@ -679,47 +766,13 @@ def index_all_kos() -> int:
         return 0
 
     try:
-        global _semantic_backend
-        kos = _get_cached_kos()
-        indexed = 0
-
-        if _semantic_backend == "chroma":
-            # Use Chroma backend
-            from .semantic_search import get_chroma_store
-
-            store = get_chroma_store()
-
-            for ko in kos:
-                # Combine KO text for embedding
-                ko_text = f"{ko.title}\n{ko.what_was_learned}\n{ko.prevention_rule}"
-
-                # Index with tags
-                store.add_ko(ko.id, ko_text, ko.tags)
-                indexed += 1
-
-        elif _semantic_backend == "lancedb":
-            # Use LanceDB backend
-            from .embeddings import get_embedder
-            from .vector_store import get_vector_store
-
-            embedder = get_embedder()
-            store = get_vector_store()
-
-            for ko in kos:
-                # Generate embedding
-                ko_text = f"{ko.title}\n{ko.what_was_learned}\n{ko.prevention_rule}"
-                embedding = embedder.embed(ko_text)
-
-                # Index with metadata
-                metadata = {
-                    "title": ko.title,
-                    "project": ko.project,
-                    "tags": ko.tags,
-                }
-                store.index_ko(ko.id, embedding, metadata)
-                indexed += 1
-
-        return indexed
+        from .vector_backend import get_backend
+
+        backend = get_backend(_semantic_backend)
+        if backend is None:
+            return 0
+
+        return backend.upsert(_get_cached_kos())
 
     except Exception as e:
         print(f"Indexing error ({_semantic_backend}): {e}")
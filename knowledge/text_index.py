@@ -0,0 +1,333 @@
+"""
+Full-Text Index for Knowledge Objects
+
+BM25 inverted index over KO title, what_was_learned, prevention_rule and tags.
+Sits between the O(1) tag index and model-based semantic search: keyword
+queries are answered in microseconds without loading an embedding model.
+
+Features:
+- Incremental: only KOs whose text fingerprint changed are re-tokenized
+- Compact persistence: gzip'd JSON with flat [doc, tf, ...] posting lists
+- Project filtering: results are filtered during scoring, not afterwards
+
+Usage:
+    from knowledge.text_index import BM25Index
+
+    index = BM25Index.load(path)          # Empty index if file missing
+    added, removed = index.sync(kos)      # Incremental update from KO list
+    index.save(path)
+
+    hits = index.search("null check auth middleware", project="karematch", top_k=5)
+    # Returns: [("KO-km-001", 7.42), ("KO-km-003", 3.18), ...]
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+import gzip
+import hashlib
+import json
+import math
+import re
+
+if TYPE_CHECKING:
+    from .service import KnowledgeObject
+
+
+INDEX_FORMAT_VERSION = 1
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Small stopword list - KO text is short, so aggressive filtering hurts recall
+_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "if", "in",
+    "is", "it", "of", "on", "or", "that", "the", "this", "to", "was", "were",
+    "when", "with",
+})
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase alphanumeric terms, dropping stopwords.
+
+    "null-check" and "null_check" both become ["null", "check"] so that
+    tag spellings and prose match each other.
+    """
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def ko_index_text(ko: KnowledgeObject) -> str:
+    """
+    Build the indexed text for a KO.
+
+    Title and tags are repeated to weight them above the body fields.
+    """
+    tags = " ".join(ko.tags)
+    return "\n".join([
+        ko.title, ko.title,
+        tags, tags,
+        ko.what_was_learned,
+        ko.prevention_rule,
+    ])
+
+
+def _fingerprint(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+class BM25Index:
+    """
+    Okapi BM25 inverted index keyed by KO ID.
+
+    Postings map term -> {doc_num: term_frequency}. Removed documents leave a
+    tombstone slot that is compacted away on save.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._doc_ids: List[Optional[str]] = []      # doc_num -> KO ID (None = removed)
+        self._doc_projects: List[str] = []
+        self._doc_lens: List[int] = []
+        self._doc_terms: List[Tuple[str, ...]] = []  # For O(terms) removal
+        self._doc_nums: Dict[str, int] = {}          # KO ID -> doc_num
+        self._fingerprints: Dict[str, str] = {}      # KO ID -> text fingerprint
+        self._total_len = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_nums)
+
+    def __contains__(self, ko_id: str) -> bool:
+        return ko_id in self._doc_nums
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Mutation
+    # ─────────────────────────────────────────────────────────────────────
+
+    def add(self, ko_id: str, text: str, project: str = "", fingerprint: str = "") -> None:
+        """
+        Add or replace a document.
+
+        Args:
+            ko_id: Knowledge Object ID
+            text: Text to index
+            project: Project the KO belongs to (used for filtering)
+            fingerprint: Content fingerprint (computed from text if empty)
+        """
+        if ko_id in self._doc_nums:
+            self.remove(ko_id)
+
+        terms = tokenize(text)
+        counts: Dict[str, int] = {}
+        for term in terms:
+            counts[term] = counts.get(term, 0) + 1
+
+        doc_num = len(self._doc_ids)
+        self._doc_ids.append(ko_id)
+        self._doc_projects.append(project)
+        self._doc_lens.append(len(terms))
+        self._doc_terms.append(tuple(counts))
+        self._doc_nums[ko_id] = doc_num
+        self._fingerprints[ko_id] = fingerprint or _fingerprint(text)
+        self._total_len += len(terms)
+
+        for term, tf in counts.items():
+            self._postings.setdefault(term, {})[doc_num] = tf
+
+    def remove(self, ko_id: str) -> bool:
+        """
+        Remove a document.
+
+        Returns:
+            True if the document was present
+        """
+        doc_num = self._doc_nums.pop(ko_id, None)
+        if doc_num is None:
+            return False
+
+        for term in self._doc_terms[doc_num]:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc_num, None)
+                if not postings:
+                    del self._postings[term]
+
+        self._total_len -= self._doc_lens[doc_num]
+        self._doc_ids[doc_num] = None
+        self._doc_terms[doc_num] = ()
+        self._doc_lens[doc_num] = 0
+        self._fingerprints.pop(ko_id, None)
+        return True
+
+    def sync(self, kos: Iterable[KnowledgeObject]) -> Tuple[int, int]:
+        """
+        Bring the index in line with a KO list.
+
+        Unchanged KOs (same fingerprint) are skipped; KOs missing from the list
+        are removed.
+
+        Returns:
+            (added_or_updated, removed) counts
+        """
+        seen: Set[str] = set()
+        added = 0
+
+        for ko in kos:
+            seen.add(ko.id)
+            text = ko_index_text(ko)
+            fp = _fingerprint(text)
+            if self._fingerprints.get(ko.id) == fp:
+                continue
+            self.add(ko.id, text, project=ko.project, fingerprint=fp)
+            added += 1
+
+        stale = [ko_id for ko_id in self._doc_nums if ko_id not in seen]
+        for ko_id in stale:
+            self.remove(ko_id)
+
+        return added, len(stale)
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Query
+    # ─────────────────────────────────────────────────────────────────────
+
+    def search(
+        self,
+        query: str,
+        project: Optional[str] = None,
+        top_k: int = 10,
+        exclude_ids: Optional[Set[str]] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank documents against a keyword query.
+
+        Args:
+            query: Free-text query
+            project: Only return KOs from this project (None = all)
+            top_k: Maximum results
+            exclude_ids: KO IDs to skip
+
+        Returns:
+            List of (ko_id, score) sorted by score descending
+        """
+        n_docs = len(self._doc_nums)
+        if n_docs == 0 or top_k <= 0:
+            return []
+
+        avg_len = self._total_len / n_docs if self._total_len else 1.0
+        k1, b = self.k1, self.b
+        scores: Dict[int, float] = {}
+
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+            for doc_num, tf in postings.items():
+                norm = k1 * (1.0 - b + b * self._doc_lens[doc_num] / avg_len)
+                scores[doc_num] = scores.get(doc_num, 0.0) + idf * tf * (k1 + 1.0) / (tf + norm)
+
+        results: List[Tuple[str, float]] = []
+        for doc_num, score in sorted(scores.items(), key=lambda x: x[1], reverse=True):
+            if project is not None and self._doc_projects[doc_num] != project:
+                continue
+            ko_id = self._doc_ids[doc_num]
+            if ko_id is None or (exclude_ids and ko_id in exclude_ids):
+                continue
+            results.append((ko_id, score))
+            if len(results) >= top_k:
+                break
+
+        return results
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Persistence
+    # ─────────────────────────────────────────────────────────────────────
+
+    def to_dict(self) -> Dict:
+        """
+        Serialize to a compact dict, renumbering documents to drop tombstones.
+
+        Postings are stored as flat [doc, tf, doc, tf, ...] lists.
+        """
+        renumber: Dict[int, int] = {}
+        docs = []
+        for doc_num, ko_id in enumerate(self._doc_ids):
+            if ko_id is None:
+                continue
+            renumber[doc_num] = len(docs)
+            docs.append([ko_id, self._doc_projects[doc_num], self._doc_lens[doc_num],
+                         self._fingerprints[ko_id]])
+
+        postings = {}
+        for term, entries in self._postings.items():
+            flat: List[int] = []
+            for doc_num, tf in sorted(entries.items()):
+                flat.extend((renumber[doc_num], tf))
+            postings[term] = flat
+
+        return {
+            "version": INDEX_FORMAT_VERSION,
+            "k1": self.k1,
+            "b": self.b,
+            "docs": docs,
+            "postings": postings,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> BM25Index:
+        """Rebuild an index from to_dict() output."""
+        index = cls(k1=data.get("k1", 1.5), b=data.get("b", 0.75))
+        doc_terms: List[List[str]] = []
+
+        for doc_num, (ko_id, project, length, fp) in enumerate(data.get("docs", [])):
+            index._doc_ids.append(ko_id)
+            index._doc_projects.append(project)
+            index._doc_lens.append(length)
+            index._doc_nums[ko_id] = doc_num
+            index._fingerprints[ko_id] = fp
+            index._total_len += length
+            doc_terms.append([])
+
+        for term, flat in data.get("postings", {}).items():
+            entries = {}
+            for i in range(0, len(flat), 2):
+                entries[flat[i]] = flat[i + 1]
+                doc_terms[flat[i]].append(term)
+            index._postings[term] = entries
+
+        index._doc_terms = [tuple(terms) for terms in doc_terms]
+        return index
+
+    def save(self, path: Path) -> None:
+        """Persist the index atomically as gzip'd JSON."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        payload = json.dumps(self.to_dict(), separators=(",", ":")).encode("utf-8")
+        with gzip.open(tmp_path, "wb") as f:
+            f.write(payload)
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> BM25Index:
+        """
+        Load a persisted index.
+
+        Returns an empty index if the file is missing, corrupt, or written by
+        an incompatible format version; the next sync() rebuilds it.
+        """
+        try:
+            with gzip.open(path, "rb") as f:
+                data = json.loads(f.read().decode("utf-8"))
+        except (OSError, EOFError, ValueError):
+            return cls()
+
+        if data.get("version") != INDEX_FORMAT_VERSION:
+            return cls()
+
+        try:
+            return cls.from_dict(data)
+        except (KeyError, IndexError, TypeError, ValueError):
+            return cls()
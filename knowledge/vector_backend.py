@@ -0,0 +1,341 @@
+"""
+Unified Vector Backend for Knowledge Objects
+
+One interface over the Chroma and LanceDB stores so the KO service does not
+branch on backend, with metadata filters (project, tags, status) pushed down
+into the vector query instead of filtered in Python afterwards.
+
+Features:
+- Pre-filtering: project/status/tags become a Chroma `where` clause or a
+  LanceDB SQL prefilter, so small projects in a large shared store still get
+  top_k results
+- Adaptive over-fetch: when a filter cannot be pushed down (legacy LanceDB
+  tables, excluded IDs on Chroma), the backend widens the search until k
+  matches are found or the store is exhausted
+- Bulk upsert: one call per backend for a whole KO list
+- Legacy entries: Chroma entries indexed without project/status metadata
+  disable pushdown (post-filtering instead) until `backfill` writes it
+
+Usage:
+    from knowledge.vector_backend import VectorFilter, get_backend
+
+    backend = get_backend()            # None if no backend installed
+    backend.upsert(kos)
+    hits = backend.search(
+        "null check in auth middleware",
+        top_k=5,
+        flt=VectorFilter(project="karematch", exclude_ids={"KO-km-001"}),
+    )
+    # Returns: [VectorHit(ko_id="KO-km-003", score=0.82, ...), ...]
+"""
+
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+import os
+
+if TYPE_CHECKING:
+    from .service import KnowledgeObject
+
+
+# Over-fetch policy when filters have to be applied after the vector query
+OVERFETCH_FACTOR = 4
+MAX_FETCH = 1000
+
+
+def ko_embedding_text(ko: KnowledgeObject) -> str:
+    """Text embedded for a KO (kept identical across backends)."""
+    return f"{ko.title}\n{ko.what_was_learned}\n{ko.prevention_rule}"
+
+
+@dataclass
+class VectorFilter:
+    """Metadata filter for a vector query."""
+    project: Optional[str] = None
+    status: Optional[str] = None
+    tags: Optional[List[str]] = None           # ANY-match (OR semantics)
+    exclude_ids: Set[str] = field(default_factory=set)
+
+    def matches(self, ko_id: str, metadata: Dict[str, Any]) -> bool:
+        """Post-filter check, used for anything the store could not push down."""
+        if ko_id in self.exclude_ids:
+            return False
+        if self.project is not None and metadata.get("project") != self.project:
+            return False
+        if self.status is not None and metadata.get("status", "approved") != self.status:
+            return False
+        if self.tags:
+            ko_tags = metadata.get("tags") or []
+            if isinstance(ko_tags, str):
+                ko_tags = [t for t in ko_tags.split(",") if t]
+            if not set(self.tags) & set(ko_tags):
+                return False
+        return True
+
+
+@dataclass
+class VectorHit:
+    """One vector search result."""
+    ko_id: str
+    score: float
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+class VectorBackend(ABC):
+    """
+    Base class for KO vector backends.
+
+    Subclasses implement `_query`, which should push down as much of the
+    filter as the store supports; `search` handles post-filtering and
+    adaptive over-fetch for whatever is left.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def upsert(self, kos: List[KnowledgeObject]) -> int:
+        """Insert or update KOs. Returns number indexed."""
+
+    @abstractmethod
+    def delete(self, ko_id: str) -> bool:
+        """Remove a KO from the store."""
+
+    @abstractmethod
+    def count(self) -> int:
+        """Number of indexed KOs."""
+
+    @abstractmethod
+    def _query(self, query: str, limit: int, flt: VectorFilter) -> List[VectorHit]:
+        """Run one vector query, pushing down what the store supports."""
+
+    def _fully_pushed_down(self, flt: VectorFilter) -> bool:
+        """Whether `_query` applies every condition in `flt` itself."""
+        return False
+
+    def backfill(self, kos: List[KnowledgeObject]) -> int:
+        """
+        Write filter metadata for entries indexed without it.
+
+        Args:
+            kos: Current KOs (entries not among them are left alone)
+
+        Returns:
+            Number of entries updated
+        """
+        return 0
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 5,
+        flt: Optional[VectorFilter] = None,
+        max_fetch: int = MAX_FETCH
+    ) -> List[VectorHit]:
+        """
+        Filtered semantic search.
+
+        Args:
+            query: Natural language query
+            top_k: Number of matches wanted
+            flt: Metadata filter (None = no filtering)
+            max_fetch: Upper bound on rows fetched while over-fetching
+
+        Returns:
+            Up to top_k hits satisfying the filter, best first
+        """
+        flt = flt or VectorFilter()
+        if top_k <= 0:
+            return []
+
+        if self._fully_pushed_down(flt):
+            return self._query(query, top_k, flt)[:top_k]
+
+        fetch = top_k + len(flt.exclude_ids)
+        while True:
+            raw = self._query(query, fetch, flt)
+            hits = [hit for hit in raw if flt.matches(hit.ko_id, hit.metadata)]
+            if len(hits) >= top_k or len(raw) < fetch or fetch >= max_fetch:
+                return hits[:top_k]
+            fetch = min(max_fetch, fetch * OVERFETCH_FACTOR)
+
+
+class ChromaBackend(VectorBackend):
+    """Chroma backend: project/status/tags pushed down as a `where` clause."""
+
+    name = "chroma"
+
+    def __init__(self, store: Any = None):
+        if store is None:
+            from .semantic_search import get_chroma_store
+            store = get_chroma_store()
+        self.store = store
+        self._legacy_ids: Optional[Set[str]] = None  # Loaded on first use
+
+    @property
+    def legacy_ids(self) -> Set[str]:
+        """IDs indexed without project/status metadata (a `where` would drop them)."""
+        if self._legacy_ids is None:
+            self._legacy_ids = set(self.store.ids_missing_metadata())
+        return self._legacy_ids
+
+    @property
+    def has_filter_metadata(self) -> bool:
+        return not self.legacy_ids
+
+    def upsert(self, kos: List[KnowledgeObject]) -> int:
+        indexed = self.store.add_kos([
+            (ko.id, ko_embedding_text(ko), ko.tags, ko.project, ko.status)
+            for ko in kos
+        ])
+        if self._legacy_ids:
+            self._legacy_ids.difference_update(ko.id for ko in kos)
+        return indexed
+
+    def backfill(self, kos: List[KnowledgeObject]) -> int:
+        if not self.legacy_ids:
+            return 0
+        updated = self.store.update_metadata([
+            (ko.id, ko.tags, ko.project, ko.status)
+            for ko in kos if ko.id in self.legacy_ids
+        ])
+        # Whatever is left isn't a current KO; callers drop those hits anyway
+        self._legacy_ids = set()
+        return updated
+
+    def delete(self, ko_id: str) -> bool:
+        if self._legacy_ids:
+            self._legacy_ids.discard(ko_id)
+        return self.store.delete(ko_id)
+
+    def count(self) -> int:
+        return self.store.count()
+
+    def _fully_pushed_down(self, flt: VectorFilter) -> bool:
+        return not flt.exclude_ids and self.has_filter_metadata
+
+    def _query(self, query: str, limit: int, flt: VectorFilter) -> List[VectorHit]:
+        conditions: List[Dict[str, Any]] = []
+        if self.has_filter_metadata:
+            if flt.project is not None:
+                conditions.append({"project": {"$eq": flt.project}})
+            if flt.status is not None:
+                conditions.append({"status": {"$eq": flt.status}})
+
+        where: Optional[Dict[str, Any]] = None
+        if len(conditions) == 1:
+            where = conditions[0]
+        elif conditions:
+            where = {"$and": conditions}
+
+        results = self.store.search(query, tags=flt.tags, top_k=limit, where=where)
+        return [
+            VectorHit(
+                ko_id=r["id"],
+                score=r["score"],
+                metadata={"project": r.get("project", ""), "tags": r.get("tags", [])},
+            )
+            for r in results
+        ]
+
+
+class LanceDBBackend(VectorBackend):
+    """LanceDB backend: filters pushed down as an SQL prefilter."""
+
+    name = "lancedb"
+
+    def __init__(self, store: Any = None, embedder: Any = None):
+        if store is None:
+            import lancedb  # noqa: F401 - fail fast; the store imports lazily
+            from .vector_store import get_vector_store
+            store = get_vector_store()
+        if embedder is None:
+            from .embeddings import get_embedder
+            embedder = get_embedder()
+        self.store = store
+        self.embedder = embedder
+
+    def upsert(self, kos: List[KnowledgeObject]) -> int:
+        if not kos:
+            return 0
+        embeddings = self.embedder.embed_batch([ko_embedding_text(ko) for ko in kos])
+        return self.store.index_batch([
+            (ko.id, embedding, {
+                "title": ko.title,
+                "project": ko.project,
+                "status": ko.status,
+                "tags": ko.tags,
+            })
+            for ko, embedding in zip(kos, embeddings)
+        ])
+
+    def delete(self, ko_id: str) -> bool:
+        return self.store.delete(ko_id)
+
+    def count(self) -> int:
+        return self.store.count()
+
+    def _fully_pushed_down(self, flt: VectorFilter) -> bool:
+        return self.store.has_filter_columns
+
+    def _where_clause(self, flt: VectorFilter) -> Optional[str]:
+        from .vector_store import sql_quote
+
+        clauses = []
+        if flt.project is not None:
+            clauses.append(f"project = {sql_quote(flt.project)}")
+        if flt.status is not None:
+            clauses.append(f"status = {sql_quote(flt.status)}")
+        if flt.tags:
+            tag_clauses = [f"tags LIKE {sql_quote('%,' + tag + ',%')}" for tag in flt.tags]
+            clauses.append("(" + " OR ".join(tag_clauses) + ")")
+        if flt.exclude_ids:
+            ids = ", ".join(sql_quote(ko_id) for ko_id in sorted(flt.exclude_ids))
+            clauses.append(f"ko_id NOT IN ({ids})")
+        return " AND ".join(clauses) or None
+
+    def _query(self, query: str, limit: int, flt: VectorFilter) -> List[VectorHit]:
+        query_embedding = self.embedder.embed(query)
+        where = self._where_clause(flt) if self.store.has_filter_columns else None
+        return [
+            VectorHit(ko_id=r.ko_id, score=r.score, metadata=r.metadata)
+            for r in self.store.search(query_embedding, top_k=limit, where=where)
+        ]
+
+
+_BACKENDS = {
+    "chroma": ChromaBackend,
+    "lancedb": LanceDBBackend,
+}
+
+_backend_cache: Dict[str, VectorBackend] = {}
+
+
+def get_backend(name: Optional[str] = None) -> Optional[VectorBackend]:
+    """
+    Get a (cached) vector backend.
+
+    Args:
+        name: "chroma" or "lancedb". Defaults to SEMANTIC_SEARCH_BACKEND, then
+              the first backend whose dependencies are installed (Chroma first).
+
+    Returns:
+        VectorBackend instance, or None if no backend is available
+    """
+    requested = name or os.environ.get("SEMANTIC_SEARCH_BACKEND", "").lower() or None
+    candidates = [requested] if requested else list(_BACKENDS)
+
+    for candidate in candidates:
+        if candidate in _backend_cache:
+            return _backend_cache[candidate]
+        backend_cls = _BACKENDS.get(candidate)
+        if backend_cls is None:
+            continue
+        try:
+            backend = backend_cls()
+        except ImportError:
+            continue
+        _backend_cache[candidate] = backend
+        return backend
+
+    return None
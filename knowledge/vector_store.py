@@ -9,6 +9,8 @@ Features:
 - Fast similarity search: ~1ms for 10K vectors
 - Persistent: Survives restarts
 - Incremental: Add/update vectors without rebuilding
+- Bulk upsert: index_batch() is a single merge_insert keyed on ko_id
+- ANN index: IVF_PQ index created automatically past ANN_INDEX_MIN_ROWS
 
 Token Optimization:
 - Semantic search returns top-3 KOs instead of all matches
@@ -22,6 +24,9 @@ Usage:
     # Index a Knowledge Object
     store.index_ko(ko_id="KO-km-001", embedding=embedding, metadata={"title": "..."})
 
+    # Bulk reindex (one upsert, builds ANN index when large enough)
+    store.index_batch([(ko_id, embedding, metadata), ...])
+
     # Semantic search
     results = store.search(query_embedding, top_k=3)
     # Returns: [("KO-km-001", 0.95), ("KO-km-003", 0.82), ...]
@@ -51,11 +56,17 @@ class KOVectorStore:
     """
 
     TABLE_NAME = "knowledge_objects"
+    DISTANCE_METRIC = "cosine"
+
+    # Below this many rows brute-force search is faster than an ANN index
+    # (and IVF_PQ training needs at least 256 rows anyway)
+    ANN_INDEX_MIN_ROWS = 5000
 
     def __init__(
         self,
         db_path: Optional[Path] = None,
-        embedding_dim: int = 384  # MiniLM default
+        embedding_dim: int = 384,  # MiniLM default
+        ann_index_min_rows: Optional[int] = None
     ):
         """
         Initialize or open vector store.
@@ -63,12 +74,18 @@ class KOVectorStore:
         Args:
             db_path: Path to store database (defaults to knowledge/vectors/)
             embedding_dim: Dimension of embeddings (384 for MiniLM)
+            ann_index_min_rows: Row count that triggers ANN index creation
+                (defaults to ANN_INDEX_MIN_ROWS; 0 disables automatic indexing)
         """
         if db_path is None:
             db_path = Path(__file__).parent / "vectors"
 
         self._db_path = db_path
         self._embedding_dim = embedding_dim
+        self._ann_index_min_rows = (
+            self.ANN_INDEX_MIN_ROWS if ann_index_min_rows is None else ann_index_min_rows
+        )
+        self._ann_indexed_rows = 0  # Row count when ANN index was last built
         self._db = None  # Lazy initialized
         self._table = None
 
@@ -87,6 +104,35 @@ class KOVectorStore:
                 )
         return self._db
 
+    @property
+    def has_filter_columns(self) -> bool:
+        """
+        Whether the table stores project/status/tags as columns.
+
+        Tables created before filter columns existed only have JSON metadata;
+        callers must post-filter those (see knowledge.vector_backend).
+        """
+        if self.table is None:
+            return True  # New tables get the full schema
+        try:
+            return "project" in self._table.schema.names
+        except Exception:
+            return False
+
+    def _row(self, ko_id: str, embedding: List[float], metadata: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build a table row, filling filter columns when the schema has them."""
+        metadata = metadata or {}
+        row = {
+            "ko_id": ko_id,
+            "vector": embedding,
+            "metadata": json.dumps(metadata),
+        }
+        if self.has_filter_columns:
+            row["project"] = metadata.get("project", "")
+            row["status"] = metadata.get("status", "approved")
+            row["tags"] = "," + ",".join(metadata.get("tags", [])) + ","
+        return row
+
     @property
     def table(self):
         """Get or create the KO table."""
@@ -112,6 +158,10 @@ class KOVectorStore:
                 pa.field("ko_id", pa.string()),
                 pa.field("vector", pa.list_(pa.float32(), self._embedding_dim)),
                 pa.field("metadata", pa.string()),  # JSON-encoded
+                # Filter columns, pushed down as prefilters in search()
+                pa.field("project", pa.string()),
+                pa.field("status", pa.string()),
+                pa.field("tags", pa.string()),  # ",tag1,tag2," for LIKE matching
             ])
             self._table = self.db.create_table(
                 self.TABLE_NAME,
@@ -138,15 +188,11 @@ class KOVectorStore:
         self._ensure_table()
 
         # Prepare data
-        data = {
-            "ko_id": ko_id,
-            "vector": embedding,
-            "metadata": json.dumps(metadata or {}),
-        }
+        data = self._row(ko_id, embedding, metadata)
 
         # Delete existing if present (for update)
         try:
-            self._table.delete(f"ko_id = '{ko_id}'")
+            self._table.delete(f"ko_id = {sql_quote(ko_id)}")
         except Exception:
             pass  # Ignore if doesn't exist
 
@@ -158,7 +204,11 @@ class KOVectorStore:
         items: List[Tuple[str, List[float], Dict[str, Any]]]
     ) -> int:
         """
-        Index multiple Knowledge Objects efficiently.
+        Upsert multiple Knowledge Objects in one write.
+
+        Uses a single merge_insert keyed on ko_id, so existing KOs are
+        updated in place instead of delete + add per row. Creates the ANN
+        index once the table crosses the row threshold.
 
         Args:
             items: List of (ko_id, embedding, metadata) tuples
@@ -166,25 +216,91 @@ class KOVectorStore:
         Returns:
             Number of items indexed
         """
+        if not items:
+            return 0
+
         self._ensure_table()
 
-        data = [
-            {
-                "ko_id": ko_id,
-                "vector": embedding,
-                "metadata": json.dumps(metadata or {}),
-            }
-            for ko_id, embedding, metadata in items
-        ]
+        import pyarrow as pa
+
+        # Last write wins for duplicate IDs within one batch
+        deduped = {ko_id: (embedding, metadata) for ko_id, embedding, metadata in items}
+        rows = [self._row(ko_id, embedding, metadata) for ko_id, (embedding, metadata) in deduped.items()]
+        data = pa.Table.from_pylist(rows, schema=self._table.schema)
+
+        if hasattr(self._table, "merge_insert"):
+            (
+                self._table
+                .merge_insert("ko_id")
+                .when_matched_update_all()
+                .when_not_matched_insert_all()
+                .execute(data)
+            )
+        else:
+            # Older lancedb: one delete + one append for the whole batch
+            id_list = ", ".join(sql_quote(ko_id) for ko_id in deduped)
+            self._table.delete(f"ko_id IN ({id_list})")
+            self._table.add(data)
+
+        self.ensure_ann_index()
+        return len(deduped)
+
+    def ensure_ann_index(self, force: bool = False) -> bool:
+        """
+        Create (or rebuild) the IVF_PQ vector index when the table is large.
 
-        self._table.add(data)
-        return len(items)
+        The index is rebuilt when the row count has doubled since it was last
+        built, so partitions stay balanced as the store grows.
+
+        Args:
+            force: Build regardless of row threshold
+
+        Returns:
+            True if an index was built
+        """
+        if self.table is None:
+            return False
+
+        rows = self.count()
+        if not self._ann_indexed_rows and self._has_vector_index():
+            self._ann_indexed_rows = rows  # Built by an earlier process
+
+        if not force:
+            if self._ann_index_min_rows <= 0 or rows < self._ann_index_min_rows:
+                return False
+            if self._ann_indexed_rows and rows < self._ann_indexed_rows * 2:
+                return False
+
+        if rows < 256:
+            return False  # Not enough rows to train PQ codebooks
+
+        try:
+            self._table.create_index(
+                metric=self.DISTANCE_METRIC,
+                num_partitions=max(1, min(256, int(rows ** 0.5))),
+                num_sub_vectors=_pick_sub_vectors(self._embedding_dim),
+                replace=True,
+            )
+        except Exception as e:
+            print(f"ANN index creation error: {e}")
+            return False
+
+        self._ann_indexed_rows = rows
+        return True
+
+    def _has_vector_index(self) -> bool:
+        """Check whether the table already has a vector index."""
+        try:
+            return any("vector" in getattr(idx, "columns", []) for idx in self._table.list_indices())
+        except Exception:
+            return False
 
     def search(
         self,
         query_embedding: List[float],
         top_k: int = 5,
-        min_score: float = 0.0
+        min_score: float = 0.0,
+        where: Optional[str] = None
     ) -> List[SearchResult]:
         """
         Search for similar Knowledge Objects.
@@ -193,6 +309,8 @@ class KOVectorStore:
             query_embedding: Query vector
             top_k: Maximum number of results
             min_score: Minimum similarity score (0-1)
+            where: Optional SQL filter over ko_id/project/status/tags, applied
+                before the vector search (prefilter) so top_k is honoured
 
         Returns:
             List of SearchResult, sorted by similarity
@@ -201,28 +319,32 @@ class KOVectorStore:
             return []
 
         try:
+            query = self._table.search(query_embedding).metric(self.DISTANCE_METRIC)
+            if where:
+                query = query.where(where, prefilter=True)
             results = (
-                self._table
-                .search(query_embedding)
+                query
+                .select(["ko_id", "metadata"])
                 .limit(top_k)
-                .to_pandas()
+                .to_arrow()
             )
 
-            search_results = []
-            for _, row in results.iterrows():
-                # LanceDB returns _distance, convert to similarity
-                # For cosine distance: similarity = 1 - distance
-                distance = row.get("_distance", 0)
-                score = 1 - distance
+            ko_ids = results.column("ko_id").to_pylist()
+            metadatas = results.column("metadata").to_pylist()
+            # LanceDB returns _distance, convert to similarity
+            # For cosine distance: similarity = 1 - distance
+            distances = results.column("_distance").to_pylist()
 
+            search_results = []
+            for ko_id, metadata, distance in zip(ko_ids, metadatas, distances):
+                score = 1 - (distance or 0)
                 if score < min_score:
                     continue
 
-                metadata = json.loads(row.get("metadata", "{}"))
                 search_results.append(SearchResult(
-                    ko_id=row["ko_id"],
+                    ko_id=ko_id,
                     score=score,
-                    metadata=metadata
+                    metadata=json.loads(metadata or "{}")
                 ))
 
             return search_results
@@ -246,7 +368,7 @@ class KOVectorStore:
             return False
 
         try:
-            self._table.delete(f"ko_id = '{ko_id}'")
+            self._table.delete(f"ko_id = {sql_quote(ko_id)}")
             return True
         except Exception:
             return False
@@ -257,8 +379,7 @@ class KOVectorStore:
             return []
 
         try:
-            df = self._table.to_pandas()
-            return df["ko_id"].tolist()
+            return self._table.to_arrow().column("ko_id").to_pylist()
         except Exception:
             return []
 
@@ -268,7 +389,7 @@ class KOVectorStore:
             return 0
 
         try:
-            return len(self._table.to_pandas())
+            return self._table.count_rows()
         except Exception:
             return 0
 
@@ -280,6 +401,20 @@ class KOVectorStore:
             except Exception:
                 pass
             self._table = None
+            self._ann_indexed_rows = 0
+
+
+def sql_quote(value: str) -> str:
+    """Quote a string literal for a LanceDB filter expression."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _pick_sub_vectors(dim: int) -> int:
+    """Largest PQ sub-vector count <= dim/8 that divides the dimension."""
+    for candidate in (96, 64, 48, 32, 24, 16, 8, 4, 2, 1):
+        if candidate <= max(1, dim // 8) and dim % candidate == 0:
+            return candidate
+    return 1
 
 
 # Singleton store instance
@@ -7,6 +7,8 @@ Components:
 - MCPProvider: Extends ClaudeProvider with MCP tool support
 - MCPServerConfig: Configuration for MCP servers (npx/Docker)
 - MCPToolFilter: Session-scoped tool filtering
+- MCPConnection: Multiplexed JSON-RPC connection to one server process
+- MCPConnectionPool: Per-server process pool with warm spares and health checks
 
 Usage:
     from mcp_integration import MCPProvider, MCPServerConfig
@@ -29,11 +31,15 @@ Usage:
 
 from .server_config import MCPServerConfig, MCPServerType
 from .tool_filter import MCPToolFilter
-from .provider import MCPProvider, MCPConnection
+from .connection import MCPConnection, MCPTimeoutError
+from .pool import MCPConnectionPool
+from .provider import MCPProvider
 
 __all__ = [
     "MCPProvider",
     "MCPConnection",
+    "MCPConnectionPool",
+    "MCPTimeoutError",
     "MCPServerConfig",
     "MCPServerType",
     "MCPToolFilter",
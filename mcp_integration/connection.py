@@ -0,0 +1,361 @@
+"""
+MCP Connection
+
+One MCP server subprocess and the multiplexed JSON-RPC channel to it.
+
+Each request gets its own id, and a background reader task routes responses
+to the waiting caller, so concurrent calls on one server neither block nor
+steal each other's replies.
+
+Usage:
+    from mcp_integration.connection import MCPConnection
+
+    conn = MCPConnection(server_name="filesystem", config=config)
+    if await conn.connect():
+        result = await conn.call_tool("read_file", {"path": "/tmp/x"}, timeout=10)
+        await conn.disconnect()
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterator, List, Optional, Set, Union
+import asyncio
+import itertools
+import json
+import logging
+import os
+
+from .server_config import MCPServerConfig
+from .tool_filter import Tool
+
+logger = logging.getLogger(__name__)
+
+# StreamReader line limit; tool results can be far larger than asyncio's 64 KiB default
+MAX_MESSAGE_BYTES = 32 * 1024 * 1024
+
+class MCPTimeoutError(RuntimeError):
+    """A request got no response within its timeout."""
+
+
+NotificationHandler = Callable[[Dict[str, Any]], Union[None, Awaitable[None]]]
+
+
+@dataclass
+class MCPConnection:
+    """
+    Active connection to an MCP server.
+
+    Manages the subprocess and a multiplexed JSON-RPC channel: each request
+    gets its own id, and a background reader task routes responses to the
+    waiting caller, so concurrent calls on one server don't block or steal
+    each other's replies. Notifications go to handlers registered with
+    on_notification().
+    """
+    server_name: str
+    config: MCPServerConfig
+    process: Optional[Any] = None  # asyncio.subprocess.Process
+    tools: List[Tool] = field(default_factory=list)
+    connected: bool = False
+    last_error: Optional[str] = None
+
+    # JSON-RPC multiplexing state
+    _ids: Iterator[int] = field(default_factory=lambda: itertools.count(1), init=False, repr=False)
+    _pending: Dict[int, "asyncio.Future[Dict[str, Any]]"] = field(default_factory=dict, init=False, repr=False)
+    _notification_handlers: Dict[str, List[NotificationHandler]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _reader_task: Optional["asyncio.Task[None]"] = field(default=None, init=False, repr=False)
+    _stderr_task: Optional["asyncio.Task[None]"] = field(default=None, init=False, repr=False)
+    _stderr_tail: Deque[str] = field(default_factory=lambda: deque(maxlen=20), init=False, repr=False)
+    _write_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
+    _replies: Set["asyncio.Task[None]"] = field(default_factory=set, init=False, repr=False)
+
+    async def connect(self, tools: Optional[List[Tool]] = None) -> bool:
+        """
+        Establish connection to MCP server.
+
+        Args:
+            tools: Tool list already fetched from another process of the
+                same server (skips tools/list)
+
+        Returns:
+            True if connection successful
+        """
+        try:
+            cmd = self.config.get_command()
+            env = os.environ.copy()
+            env.update(self.config.env)
+
+            # Start subprocess with stdin/stdout for JSON-RPC
+            self.process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=env,
+                limit=MAX_MESSAGE_BYTES,
+            )
+            self._reader_task = asyncio.create_task(self._read_loop())
+            self._stderr_task = asyncio.create_task(self._drain_stderr())
+
+            await self.request("initialize", {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {},
+                "clientInfo": {
+                    "name": "ai-orchestrator",
+                    "version": "1.0.0"
+                }
+            })
+            await self.notify("notifications/initialized")
+
+            # Fetch available tools
+            if tools is None:
+                await self._load_tools()
+            else:
+                self.tools = tools
+            self.connected = True
+            return True
+
+        except Exception as e:
+            self.last_error = str(e)
+            await self.disconnect()
+            return False
+
+    async def disconnect(self) -> None:
+        """Close connection to MCP server."""
+        self.connected = False
+        if self.process:
+            try:
+                self.process.terminate()
+                await asyncio.wait_for(self.process.wait(), timeout=5.0)
+            except ProcessLookupError:
+                pass
+            except asyncio.TimeoutError:
+                self.process.kill()
+            finally:
+                self.process = None
+
+        for task in (self._reader_task, self._stderr_task):
+            if task and not task.done():
+                task.cancel()
+        self._reader_task = self._stderr_task = None
+        self._fail_pending(RuntimeError(f"Disconnected from server: {self.server_name}"))
+
+    async def call_tool(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Call a tool on this MCP server.
+
+        Safe to call concurrently; each call waits only for its own response.
+
+        Args:
+            tool_name: Name of the tool to call
+            arguments: Tool arguments
+            timeout: Seconds to wait (default: config.timeout_seconds)
+
+        Returns:
+            Tool result as dictionary
+        """
+        if not self.connected:
+            raise RuntimeError(f"Not connected to server: {self.server_name}")
+
+        result = await self.request(
+            "tools/call",
+            {"name": tool_name, "arguments": arguments},
+            timeout=timeout,
+        )
+        if not isinstance(result, dict):
+            raise RuntimeError(f"Expected dict result, got {type(result)}")
+        return result
+
+    async def request(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Send a JSON-RPC request and wait for its response.
+
+        On timeout or cancellation the server is sent notifications/cancelled
+        for the request, and a late response is dropped.
+
+        Args:
+            method: JSON-RPC method
+            params: Method params
+            timeout: Seconds to wait (default: config.timeout_seconds)
+
+        Returns:
+            The response's "result" member
+
+        Raises:
+            MCPTimeoutError: No response within the timeout
+            RuntimeError: On error response or lost connection
+        """
+        if not self._reader_task or self._reader_task.done():
+            raise RuntimeError(f"Not connected to server: {self.server_name}")
+
+        request_id = next(self._ids)
+        future: "asyncio.Future[Dict[str, Any]]" = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            await self._send({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}})
+            response = await asyncio.wait_for(
+                future, timeout=timeout if timeout is not None else self.config.timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            self.last_error = f"Response timeout ({method})"
+            await self._cancel_request(request_id, "timeout")
+            raise MCPTimeoutError(f"Timed out waiting for {method} on {self.server_name}") from None
+        except asyncio.CancelledError:
+            await self._cancel_request(request_id, "cancelled by client")
+            raise
+        finally:
+            self._pending.pop(request_id, None)
+
+        if "error" in response:
+            error = response["error"]
+            prefix = "Tool call failed" if method == "tools/call" else f"{method} failed"
+            raise RuntimeError(f"{prefix}: {error}")
+        return response.get("result")
+
+    async def notify(self, method: str, params: Optional[Dict[str, Any]] = None) -> None:
+        """Send a JSON-RPC notification (no response expected)."""
+        message: Dict[str, Any] = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        await self._send(message)
+
+    def on_notification(self, method: str, handler: NotificationHandler) -> None:
+        """
+        Register a handler for server notifications (sync or async).
+
+        Handlers run on the reader task, so they should return quickly.
+        """
+        self._notification_handlers.setdefault(method, []).append(handler)
+
+    async def _load_tools(self) -> None:
+        """Load available tools from server."""
+        result = await self.request("tools/list")
+        tools_data = (result or {}).get("tools", [])
+        self.tools = [
+            Tool(
+                name=t["name"],
+                description=t.get("description", ""),
+                input_schema=t.get("inputSchema", {}),
+                server=self.server_name
+            )
+            for t in tools_data
+        ]
+
+    async def _send(self, message: Dict[str, Any]) -> None:
+        """Write one JSON-RPC message (writes are serialized, reads are not)."""
+        if not self.process or not self.process.stdin:
+            raise RuntimeError("Process not started")
+
+        data = (json.dumps(message) + "\n").encode()
+        async with self._write_lock:
+            self.process.stdin.write(data)
+            await self.process.stdin.drain()
+
+    async def ping(self, timeout: float = 5.0) -> bool:
+        """True if the server answers a ping within timeout."""
+        try:
+            await self.request("ping", timeout=timeout)
+            return True
+        except Exception:
+            return False
+
+    async def _cancel_request(self, request_id: int, reason: str) -> None:
+        try:
+            await self.notify("notifications/cancelled", {"requestId": request_id, "reason": reason})
+        except Exception:
+            pass  # Server already gone
+
+    # ─── Background tasks ────────────────────────────────────────────────────
+
+    async def _read_loop(self) -> None:
+        """Route every message from the server until it closes stdout."""
+        assert self.process and self.process.stdout
+        stdout = self.process.stdout
+        error: Exception = RuntimeError(f"Server closed connection: {self.server_name}")
+        try:
+            while True:
+                try:
+                    line = await stdout.readline()
+                except ValueError as e:  # Line longer than MAX_MESSAGE_BYTES
+                    error = RuntimeError(f"Message from {self.server_name} too large: {e}")
+                    break
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError as e:
+                    self.last_error = f"Invalid JSON: {e}"
+                    logger.debug(f"{self.server_name}: ignoring non-JSON output: {line[:200]!r}")
+                    continue
+                if isinstance(message, dict):
+                    await self._dispatch(message)
+
+            # Server went away: its last stderr line usually says why
+            self.connected = False
+            self._fail_pending(error)
+            if self._stderr_task is not None:
+                await asyncio.wait([self._stderr_task], timeout=1.0)
+            if self._stderr_tail:
+                self.last_error = self._stderr_tail[-1]
+        finally:
+            self.connected = False
+            self._fail_pending(error)
+
+    async def _dispatch(self, message: Dict[str, Any]) -> None:
+        if "method" not in message:
+            future = self._pending.get(message.get("id"))  # type: ignore[arg-type]
+            if future is not None and not future.done():
+                future.set_result(message)
+            return
+
+        method = message["method"]
+        if "id" in message:
+            # Server-to-client request: answer ping, reject the rest
+            if method == "ping":
+                reply: Dict[str, Any] = {"jsonrpc": "2.0", "id": message["id"], "result": {}}
+            else:
+                reply = {"jsonrpc": "2.0", "id": message["id"],
+                         "error": {"code": -32601, "message": f"Method not found: {method}"}}
+            # Sent from a separate task: the reader must never wait on stdin
+            task = asyncio.create_task(self._send(reply))
+            self._replies.add(task)
+            task.add_done_callback(self._replies.discard)
+            return
+
+        for handler in self._notification_handlers.get(method, []):
+            try:
+                outcome = handler(message.get("params", {}))
+                if asyncio.iscoroutine(outcome):
+                    await outcome
+            except Exception as e:
+                logger.warning(f"{self.server_name}: notification handler for {method} failed: {e}")
+
+    async def _drain_stderr(self) -> None:
+        """Keep the server's stderr pipe from filling up (and blocking it)."""
+        assert self.process and self.process.stderr
+        stderr = self.process.stderr
+        while True:
+            try:
+                line = await stderr.readline()
+            except ValueError:
+                continue
+            if not line:
+                return
+            self._stderr_tail.append(line.decode(errors="replace").rstrip())
+
+    def _fail_pending(self, error: Exception) -> None:
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
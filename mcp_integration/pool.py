@@ -0,0 +1,285 @@
+"""
+MCP Connection Pool
+
+Per-server pool of MCP server processes, so tool calls don't pay process
+startup plus tools/list on the critical path.
+
+Features:
+- Warm spares: `warm_spares` idle processes are kept connected ahead of
+  demand (pre-spawned by start(), topped up after each checkout)
+- Health checks: idle processes are pinged every `health_check_interval`
+  seconds; crashed processes, and processes that stop answering pings
+  after a call times out, are recycled
+- One tools/list per server: later processes reuse the first one's result
+- Concurrency: a `concurrency_safe` server multiplexes calls onto its
+  processes; otherwise each process serves one call at a time and
+  `pool_size` processes run calls in parallel
+
+Usage:
+    from mcp_integration.pool import MCPConnectionPool
+
+    pool = MCPConnectionPool("filesystem", config)
+    await pool.start()                       # Optional pre-warm
+    async with pool.connection() as conn:
+        result = await conn.call_tool("read_file", {"path": "/tmp/x"})
+    await pool.close()
+"""
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set
+import asyncio
+import logging
+import time
+
+from .connection import MCPConnection, MCPTimeoutError
+from .server_config import MCPServerConfig
+from .tool_filter import Tool
+
+logger = logging.getLogger(__name__)
+
+# Ping timeout for health checks (capped by the server's own timeout)
+PING_TIMEOUT_SECONDS = 5.0
+
+
+class MCPConnectionPool:
+    """Pool of connections to one MCP server."""
+
+    def __init__(
+        self,
+        server_name: str,
+        config: MCPServerConfig,
+        connection_factory: Callable[..., MCPConnection] = MCPConnection,
+    ):
+        self.server_name = server_name
+        self.config = config
+        self.size = max(1, config.pool_size)
+        self.warm_spares = max(0, min(config.warm_spares, self.size))
+        self._factory = connection_factory
+
+        self.tools: Optional[List[Tool]] = None
+        self._connections: List[MCPConnection] = []
+        self._in_flight: Dict[int, int] = {}  # id(conn) -> active calls
+        self._spawning = 0
+        self._cond = asyncio.Condition()
+        self._tools_lock = asyncio.Lock()  # Held by the spawn that fetches tools/list
+        self._background: Set["asyncio.Task[Any]"] = set()
+        self._health_task: Optional["asyncio.Task[None]"] = None
+        self._closed = False
+
+        # Stats
+        self.spawned = 0
+        self.recycled = 0
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+    # ─── Lifecycle ───────────────────────────────────────────────────────────
+
+    async def start(self) -> None:
+        """Pre-spawn warm spares (at least one process) and start health checks."""
+        self._closed = False
+        self._start_health_checks()
+        want = max(1, self.warm_spares) - len(self._connections) - self._spawning
+        if want > 0:
+            async with self._cond:
+                self._spawning += want
+            results = await asyncio.gather(
+                *(self._spawn() for _ in range(want)), return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.warning(f"MCP pool {self.server_name}: warm-up failed: {result}")
+
+    async def close(self) -> None:
+        """Stop health checks and disconnect every process."""
+        self._closed = True
+        for task in [self._health_task, *self._background]:
+            if task and not task.done():
+                task.cancel()
+        self._health_task = None
+        self._background.clear()
+
+        async with self._cond:
+            connections, self._connections = self._connections, []
+            self._in_flight.clear()
+            self._cond.notify_all()
+        await asyncio.gather(*(c.disconnect() for c in connections), return_exceptions=True)
+
+    # ─── Checkout ────────────────────────────────────────────────────────────
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[MCPConnection]:
+        """Check out a connection for one or more calls."""
+        conn = await self._acquire()
+        try:
+            yield conn
+        except MCPTimeoutError:
+            # Slow call or hung process: find out which before reusing it
+            self._in_background(self._check(conn))
+            raise
+        finally:
+            await self._release(conn)
+
+    async def _acquire(self) -> MCPConnection:
+        if self._closed:
+            raise RuntimeError(f"Connection pool closed: {self.server_name}")
+        self._start_health_checks()
+
+        waited_since: Optional[float] = None
+        async with self._cond:
+            while True:
+                self._drop_dead()
+                idle = [c for c in self._connections if not self._in_flight[id(c)]]
+                if idle:
+                    conn = idle[0]
+                    break
+                if len(self._connections) + self._spawning < self.size:
+                    self._spawning += 1
+                    conn = None
+                    break
+                if self.config.concurrency_safe and self._connections:
+                    conn = min(self._connections, key=lambda c: self._in_flight[id(c)])
+                    break
+                if waited_since is None:
+                    waited_since = time.monotonic()
+                    self.waits += 1
+                await self._cond.wait()
+
+            if conn is not None:
+                self._in_flight[id(conn)] += 1
+
+        if waited_since is not None:
+            self.wait_seconds += time.monotonic() - waited_since
+
+        if conn is None:
+            conn = await self._spawn(checkout=True)
+
+        self.checkouts += 1
+        self._top_up()
+        return conn
+
+    async def _release(self, conn: MCPConnection) -> None:
+        async with self._cond:
+            if id(conn) in self._in_flight:
+                self._in_flight[id(conn)] -= 1
+            self._cond.notify_all()
+
+    # ─── Process management ──────────────────────────────────────────────────
+
+    async def _spawn(self, checkout: bool = False) -> MCPConnection:
+        """Start one process; the caller has already counted it in _spawning."""
+        conn = self._factory(server_name=self.server_name, config=self.config)
+        ok = False
+        try:
+            if self.tools is None:
+                # Spawns racing at cold start wait for the first tools/list
+                async with self._tools_lock:
+                    ok = await conn.connect(tools=self.tools)
+                    if ok and self.tools is None:
+                        self.tools = conn.tools
+            else:
+                ok = await conn.connect(tools=self.tools)
+        finally:
+            async with self._cond:
+                self._spawning -= 1
+                if ok and not self._closed:
+                    self._connections.append(conn)
+                    self._in_flight[id(conn)] = 1 if checkout else 0
+                    self.spawned += 1
+                self._cond.notify_all()
+
+        if not ok:
+            raise RuntimeError(f"Failed to connect to {self.server_name}: {conn.last_error}")
+        if self._closed:
+            await conn.disconnect()
+            raise RuntimeError(f"Connection pool closed: {self.server_name}")
+        return conn
+
+    def _top_up(self) -> None:
+        """Spawn in the background until warm_spares processes are idle."""
+        if self._closed or not self.warm_spares:
+            return
+        idle = sum(1 for c in self._connections if c.connected and not self._in_flight[id(c)])
+        room = self.size - len(self._connections) - self._spawning
+        for _ in range(min(self.warm_spares - idle - self._spawning, room)):
+            self._spawning += 1
+            self._in_background(self._spawn())
+
+    def _drop_dead(self) -> None:
+        """Forget crashed processes (caller holds the condition lock)."""
+        for conn in [c for c in self._connections if not c.connected]:
+            self._remove(conn)
+
+    def _remove(self, conn: MCPConnection) -> None:
+        if any(c is conn for c in self._connections):
+            self._connections = [c for c in self._connections if c is not conn]
+            self._in_flight.pop(id(conn), None)
+            self.recycled += 1
+            logger.info(f"MCP pool {self.server_name}: recycling process ({conn.last_error})")
+            self._in_background(conn.disconnect())
+            self._cond.notify_all()
+
+    async def _check(self, conn: MCPConnection) -> bool:
+        """Ping one process and recycle it if it doesn't answer."""
+        timeout = min(PING_TIMEOUT_SECONDS, float(self.config.timeout_seconds))
+        if conn.connected and await conn.ping(timeout=timeout):
+            return True
+        async with self._cond:
+            conn.last_error = conn.last_error or "health check failed"
+            self._remove(conn)
+        self._top_up()
+        return False
+
+    # ─── Health checks ───────────────────────────────────────────────────────
+
+    def _start_health_checks(self) -> None:
+        if self.config.health_check_interval <= 0 or self._closed:
+            return
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def _health_loop(self) -> None:
+        while not self._closed:
+            await asyncio.sleep(self.config.health_check_interval)
+            await self.check_health()
+
+    async def check_health(self) -> int:
+        """
+        Ping idle processes and recycle unresponsive ones.
+
+        Returns:
+            Number of processes recycled
+        """
+        async with self._cond:
+            self._drop_dead()
+            idle = [c for c in self._connections if not self._in_flight[id(c)]]
+        results = await asyncio.gather(*(self._check(c) for c in idle))
+        self._top_up()
+        return results.count(False)
+
+    def _in_background(self, coro: Any) -> None:
+        task = asyncio.ensure_future(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        task.add_done_callback(_log_failure)
+
+    def stats(self) -> Dict[str, Any]:
+        in_use = sum(1 for n in self._in_flight.values() if n)
+        return {
+            "server": self.server_name,
+            "size": self.size,
+            "connections": len(self._connections),
+            "idle": len(self._connections) - in_use,
+            "in_use": in_use,
+            "spawning": self._spawning,
+            "spawned": self.spawned,
+            "recycled": self.recycled,
+            "checkouts": self.checkouts,
+            "waits": self.waits,
+            "avg_wait_ms": round(self.wait_seconds / self.waits * 1000, 2) if self.waits else 0.0,
+        }
+
+
+def _log_failure(task: "asyncio.Task[Any]") -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug(f"MCP pool background task failed: {task.exception()}")
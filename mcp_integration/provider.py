@@ -5,6 +5,10 @@ Extends ClaudeProvider with MCP tool support, lazy loading, and response optimiz
 
 Key Features:
 - Lazy connection: Only connects to MCP servers when tools are invoked
+  (or ahead of time via warm_up() for servers with warm_spares)
+- Connection pools: per-server processes with health checks (see pool.py)
+- Multiplexed JSON-RPC: concurrent tool calls share one server process, each
+  matched to its response by request id, with per-call timeouts
 - Tool filtering: Exposes 5-10 relevant tools per agent vs 50+ available
 - Response summarization: Uses Haiku to summarize responses >15K tokens
 - Intent-aware: Summarizes based on task intent for context preservation
@@ -31,11 +35,9 @@ Usage:
     )
 """
 
-from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 import asyncio
 import json
-import os
 
 from agents.llm_interface import (
     ClaudeProvider,
@@ -44,185 +46,11 @@ from agents.llm_interface import (
     SkillOutput,
     SkillExecutionStatus,
 )
+from .pool import MCPConnectionPool
 from .server_config import MCPServerConfig
 from .tool_filter import MCPToolFilter, Tool
 
 
-@dataclass
-class MCPConnection:
-    """
-    Active connection to an MCP server.
-
-    Manages the subprocess and communication channel.
-    """
-    server_name: str
-    config: MCPServerConfig
-    process: Optional[Any] = None  # asyncio.subprocess.Process
-    tools: List[Tool] = field(default_factory=list)
-    connected: bool = False
-    last_error: Optional[str] = None
-
-    async def connect(self) -> bool:
-        """
-        Establish connection to MCP server.
-
-        Returns:
-            True if connection successful
-        """
-        try:
-            cmd = self.config.get_command()
-            env = os.environ.copy()
-            env.update(self.config.env)
-
-            # Start subprocess with stdin/stdout for JSON-RPC
-            self.process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                env=env,
-            )
-
-            # Send initialize request
-            init_request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "initialize",
-                "params": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {},
-                    "clientInfo": {
-                        "name": "ai-orchestrator",
-                        "version": "1.0.0"
-                    }
-                }
-            }
-
-            await self._send_request(init_request)
-            response = await self._read_response()
-
-            if response and "result" in response:
-                # Fetch available tools
-                await self._load_tools()
-                self.connected = True
-                return True
-            else:
-                self.last_error = "Initialize failed: no result"
-                return False
-
-        except Exception as e:
-            self.last_error = str(e)
-            return False
-
-    async def disconnect(self) -> None:
-        """Close connection to MCP server."""
-        if self.process:
-            try:
-                self.process.terminate()
-                await asyncio.wait_for(self.process.wait(), timeout=5.0)
-            except asyncio.TimeoutError:
-                self.process.kill()
-            finally:
-                self.process = None
-                self.connected = False
-
-    async def call_tool(
-        self,
-        tool_name: str,
-        arguments: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """
-        Call a tool on this MCP server.
-
-        Args:
-            tool_name: Name of the tool to call
-            arguments: Tool arguments
-
-        Returns:
-            Tool result as dictionary
-        """
-        if not self.connected:
-            raise RuntimeError(f"Not connected to server: {self.server_name}")
-
-        request = {
-            "jsonrpc": "2.0",
-            "id": 2,
-            "method": "tools/call",
-            "params": {
-                "name": tool_name,
-                "arguments": arguments
-            }
-        }
-
-        await self._send_request(request)
-        response = await self._read_response()
-
-        if response and "result" in response:
-            result = response["result"]
-            if not isinstance(result, dict):
-                raise RuntimeError(f"Expected dict result, got {type(result)}")
-            return result
-        elif response and "error" in response:
-            raise RuntimeError(f"Tool call failed: {response['error']}")
-        else:
-            raise RuntimeError("No response from MCP server")
-
-    async def _load_tools(self) -> None:
-        """Load available tools from server."""
-        request = {
-            "jsonrpc": "2.0",
-            "id": 3,
-            "method": "tools/list",
-            "params": {}
-        }
-
-        await self._send_request(request)
-        response = await self._read_response()
-
-        if response and "result" in response:
-            tools_data = response["result"].get("tools", [])
-            self.tools = [
-                Tool(
-                    name=t["name"],
-                    description=t.get("description", ""),
-                    input_schema=t.get("inputSchema", {}),
-                    server=self.server_name
-                )
-                for t in tools_data
-            ]
-
-    async def _send_request(self, request: Dict[str, Any]) -> None:
-        """Send JSON-RPC request to server."""
-        if not self.process or not self.process.stdin:
-            raise RuntimeError("Process not started")
-
-        data = json.dumps(request) + "\n"
-        self.process.stdin.write(data.encode())
-        await self.process.stdin.drain()
-
-    async def _read_response(self) -> Optional[Dict[str, Any]]:
-        """Read JSON-RPC response from server."""
-        if not self.process or not self.process.stdout:
-            return None
-
-        try:
-            line = await asyncio.wait_for(
-                self.process.stdout.readline(),
-                timeout=self.config.timeout_seconds
-            )
-            if line:
-                result = json.loads(line.decode().strip())
-                if isinstance(result, dict):
-                    return result
-                return None
-        except asyncio.TimeoutError:
-            self.last_error = "Response timeout"
-        except json.JSONDecodeError as e:
-            self.last_error = f"Invalid JSON: {e}"
-
-        return None
-
-
 class MCPProvider(ClaudeProvider):
     """
     MCP-aware provider with lazy loading and response optimization.
@@ -254,7 +82,7 @@ class MCPProvider(ClaudeProvider):
         super().__init__(model=model, api_key=api_key)
 
         self._server_configs = servers
-        self._connections: Dict[str, MCPConnection] = {}  # Lazy initialized
+        self._pools: Dict[str, MCPConnectionPool] = {}  # Lazy initialized
         self._tools_cache: Dict[str, List[Tool]] = {}  # Server -> tools
         self._tool_filter = tool_filter
         self._summarize_responses = summarize_large_responses
@@ -263,37 +91,41 @@ class MCPProvider(ClaudeProvider):
         # MCP-specific capabilities
         self.capabilities.supports_tools = True
 
-    async def _ensure_connected(self, server_name: str) -> MCPConnection:
+    def _get_pool(self, server_name: str) -> MCPConnectionPool:
         """
-        Ensure connection to server, connecting lazily if needed.
+        Connection pool for a server, created on first use.
 
-        This is the key optimization - we only connect to MCP servers
-        when their tools are actually invoked.
+        Creating the pool spawns nothing; processes start on the first
+        tool call (or in warm_up()), so unused servers cost nothing.
 
         Args:
-            server_name: Name of server to connect to
+            server_name: Name of server
 
         Returns:
-            Active connection
+            The server's pool
         """
-        if server_name in self._connections:
-            conn = self._connections[server_name]
-            if conn.connected:
-                return conn
-
-        # Lazy connect
-        if server_name not in self._server_configs:
-            raise ValueError(f"Unknown MCP server: {server_name}")
-
-        config = self._server_configs[server_name]
-        conn = MCPConnection(server_name=server_name, config=config)
+        pool = self._pools.get(server_name)
+        if pool is None:
+            if server_name not in self._server_configs:
+                raise ValueError(f"Unknown MCP server: {server_name}")
+            pool = MCPConnectionPool(server_name, self._server_configs[server_name])
+            self._pools[server_name] = pool
+        return pool
+
+    async def warm_up(self, servers: Optional[List[str]] = None) -> None:
+        """
+        Pre-spawn server processes so first tool calls skip startup.
 
-        if await conn.connect():
-            self._connections[server_name] = conn
-            self._tools_cache[server_name] = conn.tools
-            return conn
-        else:
-            raise RuntimeError(f"Failed to connect to {server_name}: {conn.last_error}")
+        Args:
+            servers: Servers to warm (default: those with warm_spares > 0)
+        """
+        if servers is None:
+            servers = [name for name, c in self._server_configs.items() if c.warm_spares > 0]
+        pools = [self._get_pool(name) for name in servers]
+        await asyncio.gather(*(pool.start() for pool in pools))
+        for pool in pools:
+            if pool.tools is not None:
+                self._tools_cache[pool.server_name] = pool.tools
 
     async def call_tool(
         self,
@@ -314,8 +146,7 @@ class MCPProvider(ClaudeProvider):
         Returns:
             Tool result (possibly summarized)
         """
-        # Lazy connect
-        conn = await self._ensure_connected(server)
+        pool = self._get_pool(server)
 
         # Check if approval required
         config = self._server_configs.get(server)
@@ -326,8 +157,11 @@ class MCPProvider(ClaudeProvider):
                 "Please approve in governance dashboard."
             )
 
-        # Call tool
-        result = await conn.call_tool(tool, arguments)
+        # Call tool (lazy connect happens on first checkout)
+        async with pool.connection() as conn:
+            result = await conn.call_tool(tool, arguments)
+        if pool.tools is not None:
+            self._tools_cache[server] = pool.tools
 
         # Summarize if large
         if self._summarize_responses:
@@ -475,9 +309,12 @@ Provide a structured summary that captures the essential information."""
 
     async def disconnect_all(self) -> None:
         """Disconnect all MCP servers."""
-        for conn in self._connections.values():
-            await conn.disconnect()
-        self._connections.clear()
+        await asyncio.gather(*(pool.close() for pool in self._pools.values()))
+        self._pools.clear()
+
+    def get_pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-server pool statistics."""
+        return {name: pool.stats() for name, pool in self._pools.items()}
 
     def get_capabilities(self) -> ProviderCapabilities:
         """Get provider capabilities including MCP info."""
@@ -486,7 +323,9 @@ Provide a structured summary that captures the essential information."""
         # Add MCP-specific capability info
         mcp_info = {
             "mcp_servers": list(self._server_configs.keys()),
-            "connected_servers": list(self._connections.keys()),
+            "connected_servers": [
+                name for name, pool in self._pools.items() if pool.stats()["connections"]
+            ],
             "total_tools_available": sum(len(t) for t in self._tools_cache.values()),
         }
 
@@ -72,6 +72,12 @@ class MCPServerConfig:
     summarize_responses: bool = True  # Use Haiku to summarize large responses
     response_token_threshold: int = 15000  # Threshold for summarization
 
+    # Connection pool (see pool.py)
+    pool_size: int = 1  # Max server processes
+    warm_spares: int = 0  # Idle processes kept connected ahead of demand
+    concurrency_safe: bool = True  # One process may serve concurrent calls
+    health_check_interval: int = 30  # Seconds between pings of idle processes (0 = off)
+
     def get_command(self) -> List[str]:
         """
         Get the command to start this MCP server.
@@ -120,6 +126,10 @@ class MCPServerConfig:
             "max_tools_exposed": self.max_tools_exposed,
             "summarize_responses": self.summarize_responses,
             "response_token_threshold": self.response_token_threshold,
+            "pool_size": self.pool_size,
+            "warm_spares": self.warm_spares,
+            "concurrency_safe": self.concurrency_safe,
+            "health_check_interval": self.health_check_interval,
         }
 
     @classmethod
@@ -141,6 +151,10 @@ class MCPServerConfig:
             max_tools_exposed=data.get("max_tools_exposed", 50),
             summarize_responses=data.get("summarize_responses", True),
             response_token_threshold=data.get("response_token_threshold", 15000),
+            pool_size=data.get("pool_size", 1),
+            warm_spares=data.get("warm_spares", 0),
+            concurrency_safe=data.get("concurrency_safe", True),
+            health_check_interval=data.get("health_check_interval", 30),
         )
 
 
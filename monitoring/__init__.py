@@ -5,13 +5,24 @@ from .metrics import (
     MetricPoint,
     MetricType,
     DashboardData,
+    MetricsRegistry,
+    REGISTRY,
     generate_dashboard,
+    render_prometheus,
 )
+from .tracing import annotate, configure as configure_tracing, span, traced
 
 __all__ = [
     "MetricsCollector",
     "MetricPoint",
     "MetricType",
     "DashboardData",
+    "MetricsRegistry",
+    "REGISTRY",
     "generate_dashboard",
+    "render_prometheus",
+    "span",
+    "traced",
+    "annotate",
+    "configure_tracing",
 ]
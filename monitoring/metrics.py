@@ -3,6 +3,17 @@ Metrics Collection and Dashboard (Priority 6)
 
 Production monitoring with key metrics for autonomous agent execution.
 
+Storage model:
+- MetricsRegistry: counters, gauges and fixed-bucket histograms. Each metric
+  interns its label sets to integer slots and keeps values in preallocated
+  arrays, so recording is a dict lookup plus an array update and memory is
+  bounded by the number of series (capped per metric), not by event count.
+- Recent raw points are kept in bounded ring buffers (per metric name) for
+  get_points() and dashboards.
+- flush() appends only points recorded since the last flush (sequence
+  watermark) to metrics.jsonl and snapshots the registry to state.json, so
+  startup restores totals from the snapshot instead of replaying JSONL.
+
 Usage:
     from monitoring.metrics import MetricsCollector, generate_dashboard
 
@@ -11,16 +22,23 @@ Usage:
 
     dashboard = generate_dashboard(collector)
     print(f"Success rate: {dashboard.success_rate:.1%}")
+
+    print(render_prometheus())   # Exposition for every live collector (/metrics)
 """
 
 import json
-import time
-from dataclasses import dataclass, field, asdict
+import os
+import re
+import threading
+import weakref
+from array import array
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-import threading
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
 
 
 class MetricType(str, Enum):
@@ -30,6 +48,48 @@ class MetricType(str, Enum):
     HISTOGRAM = "histogram"  # Distribution of values
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# LIMITS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Series per metric before new label sets collapse into an overflow series
+MAX_SERIES_PER_METRIC = 500
+
+# Raw points retained in memory (overall and per metric name)
+MAX_BUFFERED_POINTS = 50_000
+MAX_POINTS_PER_NAME = 5_000
+
+# Bytes of metrics.jsonl read at startup to restore recent points
+STARTUP_TAIL_BYTES = 2 * 1024 * 1024
+
+# Tags kept on raw points but dropped from aggregated series (unbounded values)
+HIGH_CARDINALITY_TAGS = frozenset({"task_id", "error", "session_id"})
+
+OVERFLOW_LABELS = (("overflow", "true"),)
+
+# Histogram buckets
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DURATION_MS_BUCKETS = (
+    50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000,
+    120000, 300000, 600000, 1800000, 3600000,
+)
+SPAN_DURATION_MS_BUCKETS = (
+    0.1, 0.5, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000,
+    10000, 30000, 60000, 300000, 900000,
+)
+
+# Metrics that are always histograms, whatever type callers pass (legacy
+# callers record durations with the default counter type)
+HISTOGRAM_METRICS: Dict[str, Tuple[float, ...]] = {
+    "task.duration_ms": DURATION_MS_BUCKETS,
+    "trace.span.duration_ms": SPAN_DURATION_MS_BUCKETS,
+}
+
+_INITIAL_CAPACITY = 8
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+
 @dataclass
 class MetricPoint:
     """A single metric data point."""
@@ -73,6 +133,395 @@ class DashboardData:
     error_breakdown: Dict[str, int] = field(default_factory=dict)
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# REGISTRY
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class _Metric:
+    """
+    One metric family: label sets interned to slots in preallocated arrays.
+
+    Callers must hold the owning registry's lock.
+    """
+
+    kind = ""
+
+    def __init__(self, name: str, width: int = 1):
+        self.name = name
+        self.width = width  # Array cells per series
+        self._slots: Dict[LabelSet, int] = {}
+        self._labels: List[LabelSet] = []
+        self._capacity = _INITIAL_CAPACITY
+        self._values = array("d", bytes(8 * width * self._capacity))
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def slot(self, labels: LabelSet) -> int:
+        """Intern a label set; new sets beyond the cap share an overflow slot."""
+        slot = self._slots.get(labels)
+        if slot is not None:
+            return slot
+        if len(self._labels) >= MAX_SERIES_PER_METRIC:
+            labels = OVERFLOW_LABELS
+            slot = self._slots.get(labels)
+            if slot is not None:
+                return slot
+
+        slot = len(self._labels)
+        if slot >= self._capacity:
+            self._values.extend(array("d", bytes(8 * self.width * self._capacity)))
+            self._capacity *= 2
+        self._slots[labels] = slot
+        self._labels.append(labels)
+        return slot
+
+    def series(self) -> Iterable[Tuple[LabelSet, int]]:
+        return zip(self._labels, range(len(self._labels)))
+
+
+class _Counter(_Metric):
+    kind = MetricType.COUNTER.value
+
+    def add(self, labels: LabelSet, value: float) -> None:
+        self._values[self.slot(labels)] += value
+
+    def value(self, labels: LabelSet) -> float:
+        slot = self._slots.get(labels)
+        return self._values[slot] if slot is not None else 0.0
+
+    def total(self) -> float:
+        return sum(self._values[slot] for _, slot in self.series())
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"series": [[dict(labels), self._values[slot]] for labels, slot in self.series()]}
+
+    def restore(self, data: Dict[str, Any]) -> None:
+        for labels, value in data.get("series", []):
+            self.add(_labelset(labels), value)
+
+
+class _Gauge(_Counter):
+    kind = MetricType.GAUGE.value
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.last_slot: Optional[int] = None  # Series set most recently
+
+    def set(self, labels: LabelSet, value: float) -> None:
+        self.last_slot = self.slot(labels)
+        self._values[self.last_slot] = value
+
+    def last(self) -> float:
+        """Most recently set value, whatever its labels."""
+        return self._values[self.last_slot] if self.last_slot is not None else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {**super().snapshot(), "last": self.last_slot}
+
+    def restore(self, data: Dict[str, Any]) -> None:
+        series = data.get("series", [])
+        for labels, value in series:
+            self.set(_labelset(labels), value)
+        last = data.get("last")
+        if isinstance(last, int) and 0 <= last < len(series):
+            self.last_slot = self.slot(_labelset(series[last][0]))
+
+
+class _Histogram(_Metric):
+    """Fixed buckets; per series cells are [bucket counts..., +Inf count, sum]."""
+
+    kind = MetricType.HISTOGRAM.value
+
+    def __init__(self, name: str, buckets: Sequence[float]):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, width=len(self.buckets) + 2)
+
+    def observe(self, labels: LabelSet, value: float) -> None:
+        base = self.slot(labels) * self.width
+        self._values[base + bisect_left(self.buckets, value)] += 1
+        self._values[base + self.width - 1] += value
+
+    def stats(self, slot: int) -> Tuple[List[float], float, float]:
+        """(per-bucket counts incl. +Inf, count, sum) for one series."""
+        base = slot * self.width
+        counts = list(self._values[base:base + self.width - 1])
+        return counts, sum(counts), self._values[base + self.width - 1]
+
+    def totals(self) -> Tuple[float, float]:
+        """(count, sum) across all series."""
+        count = total = 0.0
+        for _, slot in self.series():
+            _, c, s = self.stats(slot)
+            count += c
+            total += s
+        return count, total
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "buckets": list(self.buckets),
+            "series": [
+                [dict(labels), list(self._values[slot * self.width:(slot + 1) * self.width])]
+                for labels, slot in self.series()
+            ],
+        }
+
+    def restore(self, data: Dict[str, Any]) -> None:
+        if tuple(data.get("buckets", ())) != self.buckets:
+            return  # Bucket layout changed; start fresh rather than misattribute
+        for labels, cells in data.get("series", []):
+            base = self.slot(_labelset(labels)) * self.width
+            for i, cell in enumerate(cells[:self.width]):
+                self._values[base + i] += cell
+
+
+def _labelset(tags: Optional[Dict[str, Any]]) -> LabelSet:
+    """Canonical, interned label set for aggregation (drops unbounded tags)."""
+    if not tags:
+        return ()
+    return tuple(sorted(
+        (key, str(value)) for key, value in tags.items()
+        if key not in HIGH_CARDINALITY_TAGS and value not in (None, "")
+    ))
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of counters, gauges and histograms.
+
+    Metric names use the repo's dotted style ("task.completed"); they are
+    converted to Prometheus names on exposition.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _get(self, name: str, kind: str, buckets: Optional[Sequence[float]] = None) -> _Metric:
+        """Get or create a metric; a name keeps the type it was first registered with."""
+        metric = self._metrics.get(name)
+        if metric is None:
+            if kind == MetricType.HISTOGRAM.value:
+                metric = _Histogram(name, buckets or HISTOGRAM_METRICS.get(name, DEFAULT_BUCKETS))
+            elif kind == MetricType.GAUGE.value:
+                metric = _Gauge(name)
+            else:
+                metric = _Counter(name)
+            self._metrics[name] = metric
+        elif metric.kind != kind:
+            raise ValueError(
+                f"Metric '{name}' is registered as a {metric.kind}, not a {kind}"
+            )
+        return metric
+
+    def kind_of(self, name: str) -> Optional[str]:
+        metric = self._metrics.get(name)
+        return metric.kind if metric else None
+
+    def inc(self, name: str, value: float = 1.0, tags: Optional[Dict[str, Any]] = None) -> None:
+        """Add to a counter."""
+        labels = _labelset(tags)
+        with self._lock:
+            metric = self._get(name, MetricType.COUNTER.value)
+            metric.add(labels, value)  # type: ignore[attr-defined]
+
+    def set(self, name: str, value: float, tags: Optional[Dict[str, Any]] = None) -> None:
+        """Set a gauge."""
+        labels = _labelset(tags)
+        with self._lock:
+            metric = self._get(name, MetricType.GAUGE.value)
+            metric.set(labels, value)  # type: ignore[attr-defined]
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+        tags: Optional[Dict[str, Any]] = None,
+        buckets: Optional[Sequence[float]] = None,
+    ) -> None:
+        """Record a histogram observation."""
+        labels = _labelset(tags)
+        with self._lock:
+            metric = self._get(name, MetricType.HISTOGRAM.value, buckets)
+            metric.observe(labels, value)  # type: ignore[attr-defined]
+
+    def gauge_value(self, name: str, tags: Optional[Dict[str, Any]] = None) -> float:
+        """Value of one gauge series, or the most recently set one when tags is None."""
+        with self._lock:
+            metric = self._metrics.get(name)
+            if isinstance(metric, _Gauge) and tags is None:
+                return metric.last()
+            if isinstance(metric, _Counter):
+                return metric.value(_labelset(tags))
+            return 0.0
+
+    def total(self, name: str) -> float:
+        """Counter total across series (histogram: sum of observations)."""
+        with self._lock:
+            metric = self._metrics.get(name)
+            if isinstance(metric, _Histogram):
+                return metric.totals()[1]
+            if isinstance(metric, _Counter):
+                return metric.total()
+            return 0.0
+
+    def histogram_totals(self, name: str) -> Tuple[float, float]:
+        """(count, sum) of a histogram, (0, 0) if missing."""
+        with self._lock:
+            metric = self._metrics.get(name)
+            return metric.totals() if isinstance(metric, _Histogram) else (0.0, 0.0)
+
+    def breakdown(self, name: str, label: str, default: str = "unknown") -> Dict[str, float]:
+        """Sum a counter's series grouped by one label."""
+        result: Dict[str, float] = {}
+        with self._lock:
+            metric = self._metrics.get(name)
+            if not isinstance(metric, _Counter):
+                return result
+            for labels, slot in metric.series():
+                key = dict(labels).get(label, default)
+                result[key] = result.get(key, 0.0) + metric._values[slot]
+        return result
+
+    def scalar_values(self, kind: str) -> Dict[str, float]:
+        """name -> total for every counter or gauge (legacy export shape)."""
+        with self._lock:
+            return {
+                name: metric.total()  # type: ignore[attr-defined]
+                for name, metric in self._metrics.items()
+                if metric.kind == kind and isinstance(metric, _Counter)
+            }
+
+    def series_count(self) -> int:
+        with self._lock:
+            return sum(len(metric) for metric in self._metrics.values())
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Persistence
+    # ─────────────────────────────────────────────────────────────────────
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                name: {"kind": metric.kind, **metric.snapshot()}  # type: ignore[attr-defined]
+                for name, metric in self._metrics.items()
+            }
+
+    def restore(self, data: Dict[str, Any]) -> None:
+        with self._lock:
+            for name, entry in data.items():
+                kind = entry.get("kind", MetricType.COUNTER.value)
+                buckets = entry.get("buckets") if kind == MetricType.HISTOGRAM.value else None
+                try:
+                    metric = self._get(name, kind, buckets)
+                except ValueError:
+                    continue  # Registered under another type since the snapshot
+                metric.restore(entry)  # type: ignore[attr-defined]
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Prometheus exposition
+    # ─────────────────────────────────────────────────────────────────────
+
+    def collect(self) -> List[Tuple[str, str, List[Tuple[str, LabelSet, float]]]]:
+        """(prom_name, type, [(sample_name, labels, value), ...]) per metric."""
+        families = []
+        with self._lock:
+            for name, metric in sorted(self._metrics.items()):
+                prom = prometheus_name(name)
+                samples: List[Tuple[str, LabelSet, float]] = []
+                if isinstance(metric, _Histogram):
+                    for labels, slot in metric.series():
+                        counts, count, total = metric.stats(slot)
+                        cumulative = 0.0
+                        for bound, bucket_count in zip(metric.buckets, counts):
+                            cumulative += bucket_count
+                            samples.append((f"{prom}_bucket", labels + (("le", _fmt(bound)),), cumulative))
+                        samples.append((f"{prom}_bucket", labels + (("le", "+Inf"),), count))
+                        samples.append((f"{prom}_sum", labels, total))
+                        samples.append((f"{prom}_count", labels, count))
+                    families.append((prom, "histogram", samples))
+                elif isinstance(metric, _Gauge):
+                    samples = [(prom, labels, metric._values[slot]) for labels, slot in metric.series()]
+                    families.append((prom, "gauge", samples))
+                else:
+                    if not prom.endswith("_total"):
+                        prom += "_total"
+                    samples = [(prom, labels, metric._values[slot]) for labels, slot in metric.series()]
+                    families.append((prom, "counter", samples))
+        return families
+
+
+_PROM_INVALID = re.compile(r"[^a-zA-Z0-9_:]")
+
+
+def prometheus_name(name: str) -> str:
+    """Convert a dotted metric name to a valid Prometheus name."""
+    prom = _PROM_INVALID.sub("_", name)
+    return prom if not prom[:1].isdigit() else f"_{prom}"
+
+
+def _fmt(value: float) -> str:
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _render(families: List[Tuple[str, str, List[Tuple[str, LabelSet, float]]]]) -> str:
+    """Render collected families; same-named families from several registries are merged."""
+    merged: Dict[str, Tuple[str, Dict[Tuple[str, LabelSet], float]]] = {}
+    for prom, kind, samples in families:
+        _, existing = merged.setdefault(prom, (kind, {}))
+        for sample_name, labels, value in samples:
+            key = (sample_name, labels)
+            if kind == "gauge":
+                existing[key] = value
+            else:
+                existing[key] = existing.get(key, 0.0) + value
+
+    lines = []
+    for prom, (kind, samples) in merged.items():
+        lines.append(f"# TYPE {prom} {kind}")
+        for (sample_name, labels), value in samples.items():
+            label_str = ""
+            if labels:
+                label_str = "{" + ",".join(
+                    f'{prometheus_name(k)}="{_escape(v)}"' for k, v in labels
+                ) + "}"
+            lines.append(f"{sample_name}{label_str} {_fmt(value)}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+# Process-wide registry for ad-hoc instrumentation (e.g. server gauges)
+REGISTRY = MetricsRegistry()
+
+# Registries of live collectors, all exposed on /metrics
+_exposed: "weakref.WeakSet[MetricsRegistry]" = weakref.WeakSet()
+
+
+def render_prometheus(registries: Optional[Iterable[MetricsRegistry]] = None) -> str:
+    """
+    Prometheus text exposition (format 0.0.4).
+
+    Args:
+        registries: Registries to render (default: REGISTRY plus every live
+                    MetricsCollector)
+    """
+    if registries is None:
+        registries = [REGISTRY, *list(_exposed)]
+    families = []
+    for registry in registries:
+        families.extend(registry.collect())
+    return _render(families)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# COLLECTOR
+# ═══════════════════════════════════════════════════════════════════════════════
+
 class MetricsCollector:
     """
     Collects and stores metrics.
@@ -81,18 +530,29 @@ class MetricsCollector:
     Persists to disk for durability.
     """
 
-    def __init__(self, storage_dir: Optional[Path] = None):
+    def __init__(self, storage_dir: Optional[Path] = None, expose: bool = True):
         self.storage_dir = storage_dir or Path("./metrics")
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.metrics_file = self.storage_dir / "metrics.jsonl"
+        self.state_file = self.storage_dir / "state.json"
 
-        self._points: List[MetricPoint] = []
-        self._gauges: Dict[str, float] = {}
-        self._counters: Dict[str, float] = {}
+        self.registry = MetricsRegistry()
         self._lock = threading.Lock()
 
+        # Bounded raw point buffers; seq numbers drive the flush watermark
+        self._points: Deque[Tuple[int, MetricPoint]] = deque(maxlen=MAX_BUFFERED_POINTS)
+        self._by_name: Dict[str, Deque[MetricPoint]] = {}
+        self._seq = 0
+        self._flushed_seq = 0
+        self._flushed_offset = 0
+        self.points_dropped = 0  # Points evicted before they were flushed
+
         # Load existing data
         self._load()
 
+        if expose:
+            _exposed.add(self.registry)
+
     def record(
         self,
         name: str,
@@ -111,19 +571,38 @@ class MetricsCollector:
             tags: Additional metadata tags
             timestamp: Timestamp (defaults to now)
         """
+        tags = tags or {}
+        if name in HISTOGRAM_METRICS:
+            metric_type = MetricType.HISTOGRAM
+
+        if metric_type == MetricType.HISTOGRAM:
+            self.registry.observe(name, value, tags)
+        elif metric_type == MetricType.GAUGE:
+            self.registry.set(name, value, tags)
+        else:
+            self.registry.inc(name, value, tags)
+
+        point = MetricPoint(
+            name=name,
+            value=value,
+            timestamp=timestamp or datetime.now(),
+            tags=tags,
+            metric_type=metric_type,
+        )
         with self._lock:
-            point = MetricPoint(
-                name=name,
-                value=value,
-                timestamp=timestamp or datetime.now(),
-                tags=tags or {},
-                metric_type=metric_type,
-            )
-            self._points.append(point)
+            self._buffer(point)
 
-            # Also update running totals for counters
-            if metric_type == MetricType.COUNTER:
-                self._counters[name] = self._counters.get(name, 0) + value
+    def _buffer(self, point: MetricPoint) -> None:
+        """Add a point to the ring buffers (caller holds the lock)."""
+        self._seq += 1
+        if len(self._points) == self._points.maxlen and self._points[0][0] > self._flushed_seq:
+            self.points_dropped += 1
+        self._points.append((self._seq, point))
+
+        by_name = self._by_name.get(point.name)
+        if by_name is None:
+            by_name = self._by_name[point.name] = deque(maxlen=MAX_POINTS_PER_NAME)
+        by_name.append(point)
 
     def increment(self, name: str, tags: Optional[Dict[str, str]] = None) -> None:
         """Increment a counter by 1."""
@@ -131,19 +610,24 @@ class MetricsCollector:
 
     def set_gauge(self, name: str, value: float, tags: Optional[Dict[str, str]] = None) -> None:
         """Set a gauge to a specific value."""
-        with self._lock:
-            self._gauges[name] = value
         self.record(name, value, metric_type=MetricType.GAUGE, tags=tags)
 
-    def get_gauge(self, name: str) -> float:
-        """Get current value of a gauge."""
-        with self._lock:
-            return self._gauges.get(name, 0.0)
+    def observe(self, name: str, value: float, tags: Optional[Dict[str, str]] = None) -> None:
+        """Record a histogram observation (e.g. a duration)."""
+        self.record(name, value, metric_type=MetricType.HISTOGRAM, tags=tags)
+
+    def get_gauge(self, name: str, tags: Optional[Dict[str, str]] = None) -> float:
+        """
+        Get current value of a gauge.
+
+        Without tags, returns the value set most recently across all tag
+        sets; with tags, the value of that series only.
+        """
+        return self.registry.gauge_value(name, tags)
 
     def get_total(self, name: str) -> float:
         """Get total value of a counter."""
-        with self._lock:
-            return self._counters.get(name, 0.0)
+        return self.registry.total(name)
 
     def get_points(
         self,
@@ -151,7 +635,10 @@ class MetricsCollector:
         since: Optional[datetime] = None,
     ) -> List[MetricPoint]:
         """
-        Get metric points by name.
+        Get recent metric points by name.
+
+        Only the last MAX_POINTS_PER_NAME points per metric are retained;
+        use the registry (get_total, histograms) for all-time aggregates.
 
         Args:
             name: Metric name to filter by
@@ -161,71 +648,111 @@ class MetricsCollector:
             List of matching metric points
         """
         with self._lock:
-            points = [p for p in self._points if p.name == name]
-            if since:
-                points = [p for p in points if p.timestamp >= since]
-            return points
+            points = list(self._by_name.get(name, ()))
+        if since:
+            points = [p for p in points if p.timestamp >= since]
+        return points
 
     def flush(self) -> None:
-        """Flush metrics to disk."""
+        """
+        Flush metrics to disk.
+
+        Appends only points recorded since the previous flush, then
+        snapshots the registry atomically.
+        """
+        # Claim the pending points under the lock, so a concurrent flush
+        # can't append the same ones
         with self._lock:
-            metrics_file = self.storage_dir / "metrics.jsonl"
-            with metrics_file.open("a") as f:
-                for point in self._points:
-                    f.write(json.dumps(point.to_dict()) + "\n")
-
-            # Save gauges and counters
-            state_file = self.storage_dir / "state.json"
-            state_file.write_text(json.dumps({
-                "gauges": self._gauges,
-                "counters": self._counters,
-            }))
+            claimed_from = self._flushed_seq
+            pending = []
+            for seq, point in reversed(self._points):
+                if seq <= claimed_from:
+                    break
+                pending.append(point)
+            pending.reverse()
+            self._flushed_seq = self._seq
+
+        try:
+            if pending:
+                with self.metrics_file.open("a") as f:
+                    f.write("".join(json.dumps(point.to_dict()) + "\n" for point in pending))
+                    offset = f.tell()
+            else:
+                offset = self.metrics_file.stat().st_size if self.metrics_file.exists() else 0
+        except OSError:
+            with self._lock:
+                self._flushed_seq = min(self._flushed_seq, claimed_from)  # Retry next flush
+            raise
+
+        with self._lock:
+            self._flushed_offset = max(self._flushed_offset, offset)
+            state = {
+                "version": 2,
+                "flushed_offset": self._flushed_offset,
+                "registry": self.registry.snapshot(),
+            }
+
+        tmp_file = self.state_file.with_name(
+            f".{self.state_file.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        tmp_file.write_text(json.dumps(state))
+        os.replace(tmp_file, self.state_file)
 
     def _load(self) -> None:
-        """Load metrics from disk."""
-        # Load state
-        state_file = self.storage_dir / "state.json"
-        if state_file.exists():
-            state = json.loads(state_file.read_text())
-            self._gauges = state.get("gauges", {})
-            self._counters = state.get("counters", {})
-
-        # Load points from last 24 hours
-        metrics_file = self.storage_dir / "metrics.jsonl"
-        if metrics_file.exists():
+        """Load the registry snapshot and the recent tail of metrics.jsonl."""
+        if self.state_file.exists():
+            try:
+                state = json.loads(self.state_file.read_text())
+            except (json.JSONDecodeError, OSError):
+                state = {}
+
+            if "registry" in state:
+                self.registry.restore(state["registry"])
+                self._flushed_offset = state.get("flushed_offset", 0)
+            else:
+                # Legacy state.json: unlabeled counter/gauge totals
+                for name, value in state.get("counters", {}).items():
+                    if name in HISTOGRAM_METRICS:
+                        continue  # Legacy totals of durations can't become buckets
+                    self.registry.inc(name, value)
+                for name, value in state.get("gauges", {}).items():
+                    self.registry.set(name, value)
+
+        # Load recent points from the tail of the file only
+        if self.metrics_file.exists():
             cutoff = datetime.now() - timedelta(hours=24)
-            with metrics_file.open() as f:
+            with self.metrics_file.open("rb") as f:
+                size = f.seek(0, os.SEEK_END)
+                start = max(0, size - STARTUP_TAIL_BYTES)
+                f.seek(start)
+                if start:
+                    f.readline()  # Skip partial line
                 for line in f:
-                    if line.strip():
+                    if not line.strip():
+                        continue
+                    try:
                         point = MetricPoint.from_dict(json.loads(line))
-                        if point.timestamp >= cutoff:
-                            self._points.append(point)
+                    except (json.JSONDecodeError, KeyError, ValueError):
+                        continue
+                    if point.timestamp >= cutoff:
+                        self._buffer(point)
+            self._flushed_seq = self._seq
 
     def export_json(self) -> str:
         """Export metrics as JSON."""
         with self._lock:
-            return json.dumps({
-                "metrics": [p.to_dict() for p in self._points],
-                "gauges": self._gauges,
-                "counters": self._counters,
-                "exported_at": datetime.now().isoformat(),
-            }, indent=2)
+            points = [p.to_dict() for _, p in self._points]
+        return json.dumps({
+            "metrics": points,
+            "gauges": self.registry.scalar_values(MetricType.GAUGE.value),
+            "counters": self.registry.scalar_values(MetricType.COUNTER.value),
+            "registry": self.registry.snapshot(),
+            "exported_at": datetime.now().isoformat(),
+        }, indent=2)
 
     def export_prometheus(self) -> str:
         """Export metrics in Prometheus format."""
-        lines = []
-        with self._lock:
-            # Export counters
-            for name, value in self._counters.items():
-                prom_name = name.replace(".", "_")
-                lines.append(f"{prom_name} {value}")
-
-            # Export gauges
-            for name, value in self._gauges.items():
-                prom_name = name.replace(".", "_")
-                lines.append(f"{prom_name} {value}")
-
-        return "\n".join(lines)
+        return render_prometheus([self.registry])
 
     # Convenience methods for common operations
 
@@ -263,6 +790,9 @@ def generate_dashboard(collector: MetricsCollector) -> DashboardData:
     """
     Generate dashboard data from metrics.
 
+    Uses registry aggregates, so results cover all recorded history rather
+    than only the points still buffered in memory.
+
     Args:
         collector: MetricsCollector with recorded metrics
 
@@ -278,10 +808,8 @@ def generate_dashboard(collector: MetricsCollector) -> DashboardData:
     success_rate = completed / total if total > 0 else 0.0
 
     # Calculate average duration
-    duration_points = collector.get_points("task.duration_ms")
-    avg_duration = 0
-    if duration_points:
-        avg_duration = int(sum(p.value for p in duration_points) / len(duration_points))
+    count, duration_sum = collector.registry.histogram_totals("task.duration_ms")
+    avg_duration = int(duration_sum / count) if count else 0
 
     # Calculate agent utilization
     active = collector.get_gauge("agent.active")
@@ -291,10 +819,8 @@ def generate_dashboard(collector: MetricsCollector) -> DashboardData:
     # Build error breakdown from both naming conventions
     error_breakdown: Dict[str, int] = {}
     for metric_name in ["tasks.failed", "task.failed"]:
-        failed_points = collector.get_points(metric_name)
-        for point in failed_points:
-            error_type = point.tags.get("error_type", "unknown")
-            error_breakdown[error_type] = error_breakdown.get(error_type, 0) + 1
+        for error_type, value in collector.registry.breakdown(metric_name, "error_type").items():
+            error_breakdown[error_type] = error_breakdown.get(error_type, 0) + int(value)
 
     return DashboardData(
         total_tasks=total,
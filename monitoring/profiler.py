@@ -0,0 +1,350 @@
+"""
+Continuous Stack-Sampling Profiler
+
+Opt-in, in-process profiler for long-running loops (autonomous_loop,
+parallel_autonomous_loop, ralph watcher). A daemon thread periodically grabs
+every thread's Python stack via sys._current_frames() and counts collapsed
+stacks; counts are merged into one flamegraph file per hour.
+
+Features:
+- Collapsed-stack output ("thread;module:func;module:func count"), readable
+  by flamegraph.pl, speedscope and Perfetto's importer
+- Hourly files under .aibrain/profiles/{name}-YYYYMMDD-HH.folded, merged
+  under a file lock so restarts and sibling processes add to the same hour
+- Bounded overhead: sampling backs off so time spent sampling stays under
+  max_overhead (default 1%) of wall time, whatever the configured rate
+- Stacks parked in known idle waits (Event.wait, Queue.get, select) are
+  skipped by default so the profile shows where CPU goes, not where threads
+  sleep
+- diff_profiles() compares two profiles by per-frame share of samples
+
+Configuration (environment):
+    AIBRAIN_PROFILE=1          # Enable in the loops without --profile
+    AIBRAIN_PROFILE_HZ=50      # Target samples per second
+
+Usage:
+    from monitoring.profiler import profiling
+
+    with profiling("autonomous_loop", enabled=args.profile):
+        asyncio.run(run_autonomous_loop(...))
+
+    # Compare two hours
+    aibrain profile diff .aibrain/profiles/autonomous_loop-20260101-02.folded \\
+                         .aibrain/profiles/autonomous_loop-20260102-02.folded
+"""
+
+import fcntl
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE_DIR = Path(".aibrain/profiles")
+DEFAULT_HZ = 50.0
+DEFAULT_FLUSH_INTERVAL = 60.0
+DEFAULT_MAX_OVERHEAD = 0.01
+MAX_STACK_DEPTH = 128
+
+# Leaf frames that mean "thread is blocked, not burning CPU"
+IDLE_LEAVES = frozenset({
+    "threading:Condition.wait",
+    "threading:Event.wait",
+    "threading:Thread.join",
+    "threading:Thread._wait_for_tstate_lock",
+    "queue:Queue.get",
+    "selectors:EpollSelector.select",
+    "selectors:KqueueSelector.select",
+    "selectors:PollSelector.select",
+    "selectors:SelectSelector.select",
+    "concurrent.futures.thread:_worker",
+    "socketserver:BaseServer.serve_forever",
+})
+
+
+def profiling_enabled_from_env() -> bool:
+    return os.environ.get("AIBRAIN_PROFILE", "").lower() in ("1", "true", "yes")
+
+
+def _hz_from_env() -> float:
+    try:
+        return float(os.environ.get("AIBRAIN_PROFILE_HZ", DEFAULT_HZ))
+    except ValueError:
+        return DEFAULT_HZ
+
+
+class StackSampler:
+    """
+    Background thread sampling all Python thread stacks.
+
+    Not a replacement for py-spy: only Python frames are seen, and a thread
+    inside a C call is attributed to its innermost Python frame.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        output_dir: Path = DEFAULT_PROFILE_DIR,
+        hz: float = DEFAULT_HZ,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_overhead: float = DEFAULT_MAX_OVERHEAD,
+        include_idle: bool = False,
+    ):
+        if hz <= 0:
+            raise ValueError("hz must be positive")
+        self.name = name
+        self.output_dir = Path(output_dir)
+        self.interval = 1.0 / hz
+        self.flush_interval = flush_interval
+        self.max_overhead = max_overhead
+        self.include_idle = include_idle
+
+        self._pending: Dict[str, Counter] = {}
+        self._labels: Dict[CodeType, str] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Stats
+        self.samples = 0
+        self.stacks = 0
+        self.sampling_seconds = 0.0
+        self.started_at: Optional[float] = None
+
+    # ─── Lifecycle ───────────────────────────────────────────────────────────
+
+    def start(self) -> "StackSampler":
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self.started_at = time.monotonic()
+            self._thread = threading.Thread(
+                target=self._run, daemon=True, name=f"StackSampler-{self.name}"
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop sampling and flush what was collected."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        next_flush = time.monotonic() + self.flush_interval
+        while not self._stop.is_set():
+            began = time.perf_counter()
+            try:
+                self.sample_once()
+            except Exception as e:  # Never take the host process down
+                logger.debug(f"Stack sample failed: {e}")
+            cost = time.perf_counter() - began
+            self.sampling_seconds += cost
+
+            if time.monotonic() >= next_flush:
+                self.flush()
+                next_flush = time.monotonic() + self.flush_interval
+
+            # Stretch the interval when sampling is expensive (many threads,
+            # deep stacks) so cost / interval stays under max_overhead
+            self._stop.wait(max(self.interval, cost / self.max_overhead) - cost)
+
+    # ─── Sampling ────────────────────────────────────────────────────────────
+
+    def _label(self, code: CodeType, frame: FrameType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            module = frame.f_globals.get("__name__", "?")
+            func = getattr(code, "co_qualname", code.co_name)
+            label = f"{module}:{func}"
+            self._labels[code] = label
+        return label
+
+    def sample_once(self) -> int:
+        """Take one sample of every other thread; returns stacks recorded."""
+        own = threading.get_ident()
+        thread_names = {t.ident: t.name for t in threading.enumerate()}
+        hour = datetime.now().strftime("%Y%m%d-%H")
+        recorded = 0
+
+        collapsed = []
+        for tid, frame in sys._current_frames().items():
+            if tid == own:
+                continue
+            labels: List[str] = []
+            current: Optional[FrameType] = frame
+            while current is not None and len(labels) < MAX_STACK_DEPTH:
+                labels.append(self._label(current.f_code, current))
+                current = current.f_back
+            if not labels or (not self.include_idle and labels[0] in IDLE_LEAVES):
+                continue
+            labels.append(thread_names.get(tid, f"thread-{tid}").replace(";", ":").replace(" ", "_"))
+            labels.reverse()
+            collapsed.append(";".join(labels))
+
+        with self._lock:
+            counts = self._pending.setdefault(hour, Counter())
+            for stack in collapsed:
+                counts[stack] += 1
+                recorded += 1
+            self.samples += 1
+            self.stacks += recorded
+        return recorded
+
+    # ─── Output ──────────────────────────────────────────────────────────────
+
+    def profile_path(self, hour: str) -> Path:
+        return self.output_dir / f"{self.name}-{hour}.folded"
+
+    def flush(self) -> List[Path]:
+        """Merge pending counts into the hourly files."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return []
+
+        written = []
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            lock_path = self.output_dir / f".{self.name}.lock"
+            lock_path.touch(exist_ok=True)
+            with open(lock_path, "r+") as lock:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+                try:
+                    for hour, counts in sorted(pending.items()):
+                        path = self.profile_path(hour)
+                        merged = load_folded(path) if path.exists() else Counter()
+                        merged.update(counts)
+                        write_folded(path, merged)
+                        written.append(path)
+                finally:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+        except OSError as e:
+            logger.warning(f"Failed to write profile for {self.name}: {e}")
+        return written
+
+    def stats(self) -> Dict[str, float]:
+        elapsed = time.monotonic() - self.started_at if self.started_at else 0.0
+        return {
+            "samples": self.samples,
+            "stacks": self.stacks,
+            "sampling_seconds": round(self.sampling_seconds, 4),
+            "overhead": round(self.sampling_seconds / elapsed, 5) if elapsed else 0.0,
+        }
+
+
+@contextmanager
+def profiling(
+    name: str,
+    enabled: Optional[bool] = None,
+    hz: Optional[float] = None,
+    output_dir: Path = DEFAULT_PROFILE_DIR,
+) -> Iterator[Optional[StackSampler]]:
+    """
+    Run a block under the sampler when enabled (default: AIBRAIN_PROFILE).
+
+    Yields the sampler, or None when profiling is off.
+    """
+    if not (enabled or (enabled is None and profiling_enabled_from_env())):
+        yield None
+        return
+
+    sampler = StackSampler(name, output_dir=output_dir, hz=hz or _hz_from_env()).start()
+    print(f"🔬 Profiling enabled: {sampler.output_dir}/{name}-*.folded")
+    try:
+        yield sampler
+    finally:
+        sampler.stop()
+        stats = sampler.stats()
+        print(f"🔬 Profiler: {stats['samples']} samples, overhead {stats['overhead']:.2%}")
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# COLLAPSED-STACK FILES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def load_folded(path: Path) -> Counter:
+    """Read a collapsed-stack file into {stack: count}."""
+    counts: Counter = Counter()
+    with open(path, "r") as f:
+        for line in f:
+            stack, _, count = line.rstrip("\n").rpartition(" ")
+            if stack and count.isdigit():
+                counts[stack] += int(count)
+    return counts
+
+
+def write_folded(path: Path, counts: Counter) -> None:
+    """Atomically write {stack: count} as a collapsed-stack file."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "w") as f:
+        for stack, count in counts.most_common():
+            f.write(f"{stack} {count}\n")
+    os.replace(tmp, path)
+
+
+@dataclass
+class FrameDelta:
+    """Share of samples containing a frame, in two profiles."""
+    frame: str
+    before_pct: float
+    after_pct: float
+    before_self_pct: float
+    after_self_pct: float
+
+    @property
+    def delta_pct(self) -> float:
+        return self.after_pct - self.before_pct
+
+
+def _frame_shares(counts: Counter) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """Inclusive and self sample share per frame (thread names excluded)."""
+    total = sum(counts.values()) or 1
+    inclusive: Counter = Counter()
+    self_counts: Counter = Counter()
+    for stack, count in counts.items():
+        frames = stack.split(";")[1:]
+        if not frames:
+            continue
+        for frame in set(frames):
+            inclusive[frame] += count
+        self_counts[frames[-1]] += count
+    return (
+        {f: c * 100.0 / total for f, c in inclusive.items()},
+        {f: c * 100.0 / total for f, c in self_counts.items()},
+    )
+
+
+def diff_profiles(before: Counter, after: Counter, top: int = 20) -> List[FrameDelta]:
+    """Frames whose share of samples changed most between two profiles."""
+    before_incl, before_self = _frame_shares(before)
+    after_incl, after_self = _frame_shares(after)
+    rows = [
+        FrameDelta(
+            frame=frame,
+            before_pct=before_incl.get(frame, 0.0),
+            after_pct=after_incl.get(frame, 0.0),
+            before_self_pct=before_self.get(frame, 0.0),
+            after_self_pct=after_self.get(frame, 0.0),
+        )
+        for frame in set(before_incl) | set(after_incl)
+    ]
+    rows.sort(key=lambda r: abs(r.delta_pct), reverse=True)
+    return rows[:top]
+
+
+def write_diff_folded(path: Path, before: Counter, after: Counter) -> None:
+    """Write "stack before after" lines (difffolded format for flamegraph.pl)."""
+    with open(path, "w") as f:
+        for stack in sorted(set(before) | set(after)):
+            f.write(f"{stack} {before.get(stack, 0)} {after.get(stack, 0)}\n")
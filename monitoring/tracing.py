@@ -0,0 +1,313 @@
+"""
+Lightweight Tracing Spans
+
+Context-manager spans for the hot paths of the autonomous loop (iteration
+loop, Claude CLI calls, Ralph verification, work queue saves, git commits,
+KO lookups).
+
+Features:
+- Trace and parent span ids propagate through a ContextVar, so nested spans
+  (including across await points) attach to the right trace without passing
+  anything around
+- Every span's duration is aggregated into the per-phase histogram
+  trace.span.duration_ms{span="..."} on monitoring.metrics.REGISTRY (and so
+  shows up on /metrics)
+- Sampled traces are written as Chrome trace-event JSON, one file per root
+  span, viewable in Perfetto (ui.perfetto.dev) or chrome://tracing
+- Sampling is decided once per trace at the root span; spans in unsampled
+  traces only take two clock reads and one histogram update
+
+Configuration (environment):
+    AIBRAIN_TRACING=0                   # Disable spans entirely
+    AIBRAIN_TRACE_SAMPLE_RATE=0.01      # Fraction of traces written (default 0)
+    AIBRAIN_TRACE_DIR=.aibrain/traces   # Where trace files go
+
+Usage:
+    from monitoring.tracing import span, traced, annotate
+
+    with span("work_queue.save", tasks=len(features)):
+        ...
+
+    @traced("ralph.verify")
+    def verify(...):
+        annotate(project=project)
+        ...
+"""
+
+import functools
+import inspect
+import json
+import logging
+import os
+import random
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from monitoring.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+SPAN_METRIC = "trace.span.duration_ms"
+
+# Events buffered per trace before further spans are only counted
+MAX_EVENTS_PER_TRACE = 10_000
+
+
+@dataclass
+class TracingConfig:
+    """Tracing settings (read from the environment at import)."""
+    enabled: bool = True
+    sample_rate: float = 0.0
+    trace_dir: Path = Path(".aibrain/traces")
+
+    @classmethod
+    def from_env(cls) -> "TracingConfig":
+        try:
+            sample_rate = float(os.environ.get("AIBRAIN_TRACE_SAMPLE_RATE", "0"))
+        except ValueError:
+            sample_rate = 0.0
+        return cls(
+            enabled=os.environ.get("AIBRAIN_TRACING", "1").lower() not in ("0", "false", "no"),
+            sample_rate=min(max(sample_rate, 0.0), 1.0),
+            trace_dir=Path(os.environ.get("AIBRAIN_TRACE_DIR", ".aibrain/traces")),
+        )
+
+
+_config = TracingConfig.from_env()
+
+
+def configure(
+    enabled: Optional[bool] = None,
+    sample_rate: Optional[float] = None,
+    trace_dir: Optional[Path] = None,
+) -> TracingConfig:
+    """Override tracing settings at runtime; returns the active config."""
+    if enabled is not None:
+        _config.enabled = enabled
+    if sample_rate is not None:
+        _config.sample_rate = min(max(sample_rate, 0.0), 1.0)
+    if trace_dir is not None:
+        _config.trace_dir = Path(trace_dir)
+    return _config
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SPANS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class _Trace:
+    """Events collected for one sampled trace."""
+
+    __slots__ = ("trace_id", "events", "dropped", "threads", "_lock")
+
+    def __init__(self, trace_id: str):
+        self.trace_id = trace_id
+        self.events: List[Dict[str, Any]] = []
+        self.dropped = 0
+        self.threads: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def add(self, event: Dict[str, Any], tid: int) -> None:
+        with self._lock:
+            if len(self.events) >= MAX_EVENTS_PER_TRACE:
+                self.dropped += 1
+                return
+            self.events.append(event)
+            if tid not in self.threads:
+                self.threads[tid] = threading.current_thread().name
+
+
+class Span:
+    """
+    One timed operation. Use via span() / traced(), not directly.
+
+    Attributes set with set() (or annotate()) become the event's args.
+    """
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "attrs",
+        "_trace", "_start_ns", "_wall_us", "_token",
+    )
+
+    def __init__(self, name: str, attrs: Dict[str, Any]):
+        self.name = name
+        self.attrs = attrs
+        self._token = None
+
+        parent = _current_span.get()
+        if parent is None:
+            self.trace_id = os.urandom(8).hex()
+            self.parent_id: Optional[str] = None
+            sampled = _config.sample_rate > 0 and random.random() < _config.sample_rate
+            self._trace: Optional[_Trace] = _Trace(self.trace_id) if sampled else None
+        else:
+            self.trace_id = parent.trace_id
+            self.parent_id = parent.span_id
+            self._trace = parent._trace
+
+        self.span_id = os.urandom(8).hex() if self._trace is not None else ""
+
+    @property
+    def sampled(self) -> bool:
+        return self._trace is not None
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        self._wall_us = time.time_ns() // 1000
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        duration_ns = time.perf_counter_ns() - self._start_ns
+        _current_span.reset(self._token)
+
+        try:
+            REGISTRY.observe(SPAN_METRIC, duration_ns / 1e6, tags={"span": self.name})
+        except Exception as e:  # Never let telemetry break the traced operation
+            logger.debug(f"Span histogram update failed: {e}")
+
+        trace = self._trace
+        if trace is None:
+            return
+
+        args = dict(self.attrs)
+        args["span_id"] = self.span_id
+        if self.parent_id:
+            args["parent_id"] = self.parent_id
+        if exc_type is not None:
+            args["error"] = exc_type.__name__
+
+        tid = threading.get_ident()
+        trace.add({
+            "name": self.name,
+            "cat": self.name.split(".", 1)[0],
+            "ph": "X",
+            "ts": self._wall_us,
+            "dur": duration_ns / 1000,
+            "pid": os.getpid(),
+            "tid": tid,
+            "args": args,
+        }, tid)
+
+        if self.parent_id is None:
+            _write_trace(trace, self.name)
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("aibrain_current_span", default=None)
+
+
+class _NoopSpan:
+    """Returned when tracing is disabled."""
+
+    trace_id = ""
+    span_id = ""
+    sampled = False
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def span(name: str, **attrs: Any) -> Any:
+    """
+    Time a block as a span.
+
+    Args:
+        name: Dotted phase name ("claude.execute_task"); the part before the
+              first dot is the trace-event category
+        **attrs: Attributes recorded on the trace event (not on the
+                 histogram, so high-cardinality values are fine)
+    """
+    if not _config.enabled:
+        return _NOOP_SPAN
+    return Span(name, attrs)
+
+
+def traced(name: Optional[str] = None) -> Callable[[F], F]:
+    """Decorator form of span() for sync and async functions."""
+
+    def decorator(func: F) -> F:
+        span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with span(span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(span_name):
+                return func(*args, **kwargs)
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def annotate(**attrs: Any) -> None:
+    """Add attributes to the innermost active span (no-op outside spans)."""
+    current = _current_span.get()
+    if current is not None:
+        current.attrs.update(attrs)
+
+
+def current_trace_id() -> Optional[str]:
+    """Trace id of the active span, for correlating logs with traces."""
+    current = _current_span.get()
+    return current.trace_id if current is not None else None
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CHROME TRACE-EVENT OUTPUT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _write_trace(trace: _Trace, root_name: str) -> Optional[Path]:
+    """Write a finished trace as Chrome trace-event JSON."""
+    pid = os.getpid()
+    metadata = [
+        {"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "aibrain"}},
+    ]
+    metadata.extend(
+        {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_name}}
+        for tid, thread_name in trace.threads.items()
+    )
+
+    document = {
+        "traceEvents": metadata + trace.events,
+        "displayTimeUnit": "ms",
+        "otherData": {
+            "trace_id": trace.trace_id,
+            "root": root_name,
+            "dropped_events": trace.dropped,
+        },
+    }
+
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    path = _config.trace_dir / f"trace-{stamp}-{trace.trace_id}.json"
+    try:
+        _config.trace_dir.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(document, f, default=str)
+    except OSError as e:
+        logger.warning(f"Failed to write trace {trace.trace_id}: {e}")
+        return None
+    return path
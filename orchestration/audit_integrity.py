@@ -0,0 +1,261 @@
+"""
+Decision Audit Integrity - streaming, parallel verification with a hash chain
+
+Verifies the per-entry checksums written by DecisionEntry.to_json across
+many audit files at once, and optionally checks a Merkle-style hash chain
+over sealed (completed) days.
+
+Features:
+- Streaming: each file is read line by line in a worker; entries are never
+  materialized into DecisionEntry objects or held in a list
+- Parallel: files are verified in a process pool and per-file results are
+  yielded as soon as they (and every earlier file) are done
+- Hash chain: sealing a day records its file digest and a chained root
+  root_k = sha256(root_{k-1} | file_k | digest_k). A date range is verified
+  by rehashing only the files in the range and checking the links against
+  the root recorded just before it - no rehash from the start of history
+
+File Structure:
+    .aibrain/audit/chain-{project}.jsonl   (one line per sealed day)
+
+Usage:
+    from orchestration.audit_integrity import AuditChain, verify_files
+
+    for result in verify_files(paths, max_workers=8):
+        print(result["file"], result["integrity_ok"])
+
+    chain = AuditChain(audit_dir, project="credentialmate")
+    chain.seal()                       # Seal every finished day
+    chain.verify_links()               # Manifest self-consistency
+"""
+
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+GENESIS_ROOT = "0" * 64
+
+# Keep at most this many offending line numbers per file in results
+MAX_REPORTED_LINES = 20
+
+
+def entry_checksum(data: dict[str, Any]) -> str:
+    """Checksum of an entry dict (same recipe as DecisionEntry.to_json)."""
+    data_for_checksum = {k: v for k, v in data.items() if k != 'checksum'}
+    return hashlib.sha256(
+        json.dumps(data_for_checksum, sort_keys=True).encode()
+    ).hexdigest()[:16]
+
+
+def chain_root(prev_root: str, file_name: str, digest: str) -> str:
+    """Next root of the hash chain."""
+    return hashlib.sha256(f"{prev_root}|{file_name}|{digest}".encode()).hexdigest()
+
+
+def file_date(path: Path) -> Optional[date]:
+    """Date encoded in an audit file name (decisions-{project}-YYYYMMDD.jsonl)."""
+    try:
+        return datetime.strptime(path.stem.rsplit("-", 1)[-1], "%Y%m%d").date()
+    except ValueError:
+        return None
+
+
+def verify_file(path: str) -> dict[str, Any]:
+    """
+    Verify every entry checksum in one audit file, streaming.
+
+    Also computes the file digest (sha256 over the non-empty lines in
+    order) used by the hash chain. Runs in worker processes, so it takes
+    and returns only plain picklable values.
+    """
+    audit_file = Path(path)
+    digest = hashlib.sha256()
+    total = valid = invalid = missing_checksum = parse_errors = 0
+    invalid_lines: list[int] = []
+
+    with open(audit_file, 'rb') as f:
+        for line_no, raw in enumerate(f, start=1):
+            line = raw.strip()
+            if not line:
+                continue
+            digest.update(line)
+            digest.update(b"\n")
+            total += 1
+
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError:
+                parse_errors += 1
+                if len(invalid_lines) < MAX_REPORTED_LINES:
+                    invalid_lines.append(line_no)
+                continue
+
+            checksum = data.get('checksum')
+            if not checksum:
+                missing_checksum += 1
+            elif entry_checksum(data) == checksum:
+                valid += 1
+            else:
+                invalid += 1
+                if len(invalid_lines) < MAX_REPORTED_LINES:
+                    invalid_lines.append(line_no)
+
+    target_date = file_date(audit_file)
+    return {
+        "file": audit_file.name,
+        "date": target_date.isoformat() if target_date else None,
+        "total": total,
+        "valid": valid,
+        "invalid": invalid,
+        "missing_checksum": missing_checksum,
+        "parse_errors": parse_errors,
+        "invalid_lines": invalid_lines,
+        "digest": digest.hexdigest(),
+        "integrity_ok": invalid == 0 and parse_errors == 0,
+    }
+
+
+def verify_files(
+    paths: Iterable[Path],
+    max_workers: Optional[int] = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Verify audit files in a process pool, yielding results in input order.
+
+    Args:
+        paths: Audit files to verify
+        max_workers: Pool size (default: CPU count; 1 = verify inline)
+
+    Yields:
+        Per-file result dicts from verify_file()
+    """
+    path_strs = [str(p) for p in paths]
+    workers = min(max_workers or os.cpu_count() or 1, len(path_strs))
+
+    if workers <= 1:
+        for path in path_strs:
+            yield verify_file(path)
+        return
+
+    try:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    except (OSError, NotImplementedError) as e:
+        logger.warning(f"Process pool unavailable, verifying inline: {e}")
+        for path in path_strs:
+            yield verify_file(path)
+        return
+
+    with executor:
+        yield from executor.map(verify_file, path_strs)
+
+
+@dataclass
+class ChainLink:
+    """One sealed audit file in the hash chain."""
+    file: str
+    entries: int
+    digest: str
+    root: str
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "file": self.file,
+            "entries": self.entries,
+            "digest": self.digest,
+            "root": self.root,
+        })
+
+
+class AuditChain:
+    """
+    Hash chain over a project's sealed audit files.
+
+    Only finished days are sealed; today's file is still being appended to.
+    The latest root can be exported to an external system (ticket, WORM
+    storage) to anchor the chain.
+    """
+
+    def __init__(self, audit_dir: Path, project: str):
+        self.audit_dir = Path(audit_dir)
+        self.project = project
+        self.manifest_path = self.audit_dir / f"chain-{project}.jsonl"
+
+    def links(self) -> list[ChainLink]:
+        """Read the sealed links, oldest first."""
+        if not self.manifest_path.exists():
+            return []
+        links = []
+        with open(self.manifest_path, 'r') as f:
+            for line in f:
+                if line.strip():
+                    links.append(ChainLink(**json.loads(line)))
+        return links
+
+    @property
+    def head(self) -> str:
+        """Latest root (GENESIS_ROOT if nothing is sealed)."""
+        links = self.links()
+        return links[-1].root if links else GENESIS_ROOT
+
+    def seal(
+        self,
+        through: Optional[date] = None,
+        max_workers: Optional[int] = None,
+    ) -> list[ChainLink]:
+        """
+        Seal unsealed audit files dated up to `through` (default: yesterday).
+
+        Files are sealed in date order; a file older than the last sealed
+        one is skipped with a warning, since inserting it would break every
+        later link.
+
+        Returns:
+            Newly sealed links
+        """
+        through = through or date.fromordinal(date.today().toordinal() - 1)
+        links = self.links()
+        sealed = {link.file for link in links}
+        last_date = file_date(Path(links[-1].file)) if links else None
+
+        pending = []
+        for path in sorted(self.audit_dir.glob(f"decisions-{self.project}-*.jsonl")):
+            day = file_date(path)
+            if day is None or day > through or path.name in sealed:
+                continue
+            if last_date is not None and day <= last_date:
+                logger.warning(f"Not sealing {path.name}: older than last sealed file")
+                continue
+            pending.append(path)
+
+        root = links[-1].root if links else GENESIS_ROOT
+        new_links = []
+        with open(self.manifest_path, 'a') as f:
+            for result in verify_files(pending, max_workers=max_workers):
+                root = chain_root(root, result["file"], result["digest"])
+                link = ChainLink(
+                    file=result["file"],
+                    entries=result["total"],
+                    digest=result["digest"],
+                    root=root,
+                )
+                f.write(link.to_json() + '\n')
+                new_links.append(link)
+        return new_links
+
+    def verify_links(self, links: Optional[list[ChainLink]] = None) -> bool:
+        """Check that every recorded root follows from the previous one."""
+        links = self.links() if links is None else links
+        root = GENESIS_ROOT
+        for link in links:
+            root = chain_root(root, link.file, link.digest)
+            if root != link.root:
+                return False
+        return True
@@ -1,37 +1,314 @@
 """
-CLI Process Manager - Handles serialization and cleanup for Claude CLI processes
+CLI Process Manager - Scheduling and cleanup for Claude CLI processes
 
 Provides:
-- Serialization queue to prevent concurrent CLI runs ("database locked" errors)
-- Zombie process cleanup to prevent accumulation
-- Thread-safe process management
+- CliProcessScheduler: up to max_concurrent CLI processes at once, each in
+  its own worker slot with isolated config/session directories (so
+  parallel runs don't contend on one session database - the source of the
+  "database locked" errors that used to force one run at a time)
+- Fair queueing: waiting callers are served round-robin by owner (e.g.
+  specialist type), FIFO within an owner, so one busy specialist can't
+  starve the others
+- Zombie process cleanup as a periodic background task, off the run path
 
 Based on patterns from OpenClaw (anthropics/universal-orchestration)
+
+Usage:
+    from orchestration.cli_process_manager import CliProcessManager
+
+    scheduler = CliProcessManager.scheduler()
+    async with scheduler.slot(owner="qa") as worker:
+        result = await loop.run_in_executor(
+            None, lambda: wrapper.execute_task(prompt, env=worker.env())
+        )
 """
 
 import asyncio
 import os
+import shutil
 import signal
 import subprocess
-from typing import Any, Awaitable, Callable, Dict, TypeVar, Optional
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional, Set, TypeVar
 
 T = TypeVar("T")
 
+DEFAULT_MAX_CONCURRENT = 4
+DEFAULT_CLEANUP_INTERVAL_SECONDS = 60.0
+DEFAULT_WORKER_ROOT = Path.home() / ".cache" / "aibrain" / "cli-workers"
+
+# Shared into every worker's config dir so workers stay authenticated
+# (symlinked: a token refresh by one worker is seen by all)
+SHARED_CONFIG_FILES = (".credentials.json", "settings.json")
+
+
+@dataclass
+class CliWorker:
+    """One concurrency slot, with its own config and session directories."""
+    index: int
+    root: Path
+    isolate_home: bool = False
+    runs: int = 0
+
+    @property
+    def config_dir(self) -> Path:
+        return self.root / "claude"
+
+    def env(self, base: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """Environment for a CLI process running in this slot."""
+        env = dict(os.environ if base is None else base)
+        env["CLAUDE_CONFIG_DIR"] = str(self.config_dir)
+        env["XDG_CONFIG_HOME"] = str(self.root / "config")
+        env["XDG_CACHE_HOME"] = str(self.root / "cache")
+        env["XDG_STATE_HOME"] = str(self.root / "state")
+        env["XDG_DATA_HOME"] = str(self.root / "data")
+        if self.isolate_home:
+            # Breaks keychain-based auth (macOS); off by default
+            env["HOME"] = str(self.root)
+        return env
+
+    def prepare(self, user_config_dir: Optional[Path] = None) -> None:
+        """Create the slot's directories and seed its config from the user's."""
+        for name in ("claude", "config", "cache", "state", "data"):
+            (self.root / name).mkdir(parents=True, exist_ok=True)
+
+        source = user_config_dir or Path(
+            os.environ.get("CLAUDE_CONFIG_DIR", Path.home() / ".claude")
+        )
+        for name in SHARED_CONFIG_FILES:
+            target = self.config_dir / name
+            if (source / name).exists() and not target.exists() and not target.is_symlink():
+                target.symlink_to(source / name)
+
+        # Per-install state (onboarding, project trust) is written often:
+        # copy it once instead of sharing it
+        state_file = self.config_dir / ".claude.json"
+        user_state = source / ".claude.json"
+        if not user_state.exists() and user_config_dir is None:
+            user_state = Path.home() / ".claude.json"
+        if user_state.exists() and not state_file.exists():
+            try:
+                shutil.copyfile(user_state, state_file)
+            except OSError as e:
+                print(f"⚠️  Could not seed CLI worker {self.index} state: {e}")
+
+
+class CliProcessScheduler:
+    """
+    Bounded, fair scheduler for concurrent Claude CLI processes.
+
+    Not thread-safe: acquire()/release() must run on one event loop.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: Optional[int] = None,
+        worker_root: Optional[Path] = None,
+        isolate_home: bool = False,
+        cleanup_interval_seconds: Optional[float] = DEFAULT_CLEANUP_INTERVAL_SECONDS,
+        user_config_dir: Optional[Path] = None,
+    ):
+        """
+        Args:
+            max_concurrent: CLI processes allowed at once
+                            (default: AIBRAIN_CLI_MAX_CONCURRENT or 4)
+            worker_root: Parent of the per-worker directories
+                         (default: AIBRAIN_CLI_WORKER_DIR or ~/.cache/aibrain/cli-workers)
+            isolate_home: Also give each worker its own HOME
+            cleanup_interval_seconds: Zombie cleanup period (None disables)
+            user_config_dir: Claude config to seed workers from (default ~/.claude)
+        """
+        if max_concurrent is None:
+            max_concurrent = int(os.environ.get("AIBRAIN_CLI_MAX_CONCURRENT", DEFAULT_MAX_CONCURRENT))
+        if worker_root is None:
+            worker_root = Path(os.environ.get("AIBRAIN_CLI_WORKER_DIR", DEFAULT_WORKER_ROOT))
+
+        self.max_concurrent = max(1, max_concurrent)
+        self.worker_root = Path(worker_root)
+        self.isolate_home = isolate_home
+        self.cleanup_interval_seconds = cleanup_interval_seconds
+        self.user_config_dir = user_config_dir
+
+        self._workers = [
+            CliWorker(i, self.worker_root / f"worker-{i}", isolate_home)
+            for i in range(self.max_concurrent)
+        ]
+        self._prepared: Set[int] = set()
+        self._free: List[CliWorker] = list(reversed(self._workers))  # pop() -> worker-0 first
+        self._waiters: Dict[str, Deque["asyncio.Future[CliWorker]"]] = {}
+        self._rotation: Deque[str] = deque()  # Owners with waiters, next-served first
+        self._cleanup_task: Optional["asyncio.Task[None]"] = None
+
+        # Stats
+        self.acquired = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.cleanups = 0
+
+    @property
+    def active(self) -> int:
+        return self.max_concurrent - len(self._free)
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(q) for q in self._waiters.values())
+
+    async def acquire(self, owner: str = "default") -> CliWorker:
+        """Wait for a free slot; callers are served round-robin by owner."""
+        self._ensure_cleanup_task()
+        if self._free and not self._rotation:
+            return self._checkout(self._free.pop())
+
+        future: "asyncio.Future[CliWorker]" = asyncio.get_running_loop().create_future()
+        queue = self._waiters.get(owner)
+        if queue is None:
+            queue = self._waiters[owner] = deque()
+            self._rotation.append(owner)
+        queue.append(future)
+
+        self.waits += 1
+        waited_since = time.monotonic()
+        try:
+            worker = await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release(future.result())  # Handed a slot as we were cancelled
+            else:
+                self._forget(owner, future)
+            raise
+        waited = time.monotonic() - waited_since
+        self.wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        return worker
+
+    def release(self, worker: CliWorker) -> None:
+        """Return a slot and hand it to the next waiter."""
+        self._free.append(worker)
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, owner: str = "default") -> AsyncIterator[CliWorker]:
+        worker = await self.acquire(owner)
+        try:
+            yield worker
+        finally:
+            self.release(worker)
+
+    async def run(
+        self,
+        task_fn: Callable[[CliWorker], Awaitable[T]],
+        owner: str = "default",
+    ) -> T:
+        """Run task_fn(worker) once a slot is free."""
+        async with self.slot(owner) as worker:
+            return await task_fn(worker)
+
+    async def aclose(self) -> None:
+        """Stop the background cleanup task."""
+        task, self._cleanup_task = self._cleanup_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "active": self.active,
+            "waiting": self.waiting,
+            "waiting_by_owner": {owner: len(q) for owner, q in self._waiters.items()},
+            "acquired": self.acquired,
+            "waits": self.waits,
+            "avg_wait_ms": round(self.wait_seconds / self.waits * 1000, 2) if self.waits else 0.0,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 2),
+            "cleanups": self.cleanups,
+            "runs_per_worker": [w.runs for w in self._workers],
+        }
+
+    # ─── Internals ────────────────────────────────────────────────────────────
+
+    def _checkout(self, worker: CliWorker) -> CliWorker:
+        if worker.index not in self._prepared:
+            worker.prepare(self.user_config_dir)
+            self._prepared.add(worker.index)
+        worker.runs += 1
+        self.acquired += 1
+        return worker
+
+    def _dispatch(self) -> None:
+        while self._free and self._rotation:
+            owner = self._rotation.popleft()
+            queue = self._waiters[owner]
+            while queue and queue[0].done():
+                queue.popleft()  # Cancelled while waiting
+            if queue:
+                queue.popleft().set_result(self._checkout(self._free.pop()))
+            if queue:
+                self._rotation.append(owner)  # Back of the line
+            else:
+                del self._waiters[owner]
+
+    def _forget(self, owner: str, future: "asyncio.Future[CliWorker]") -> None:
+        queue = self._waiters.get(owner)
+        if queue is None:
+            return
+        try:
+            queue.remove(future)
+        except ValueError:
+            pass
+        if not queue:
+            del self._waiters[owner]
+            self._rotation.remove(owner)
+
+    def _ensure_cleanup_task(self) -> None:
+        if not self.cleanup_interval_seconds:
+            return
+        loop = asyncio.get_running_loop()
+        task = self._cleanup_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._cleanup_task = loop.create_task(self._cleanup_loop())
+
+    async def _cleanup_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.cleanup_interval_seconds or DEFAULT_CLEANUP_INTERVAL_SECONDS)
+            try:
+                await loop.run_in_executor(None, CliProcessManager.cleanup_zombie_processes)
+                self.cleanups += 1
+            except Exception as e:  # Keep the cleanup task alive
+                print(f"⚠️  CLI zombie cleanup failed: {e}")
+
 
 class CliProcessManager:
     """
-    Manages Claude CLI process execution with serialization and cleanup.
+    Manages Claude CLI process execution with scheduling and cleanup.
 
-    Prevents concurrent CLI runs which can cause "database locked" errors
-    when multiple processes access the same SQLite session database.
+    Concurrency is bounded by a shared CliProcessScheduler rather than a
+    global lock; each run gets its own worker slot, so parallel processes
+    no longer share (and lock) one session database.
     """
 
-    _lock: asyncio.Lock = asyncio.Lock()
-    _cleanup_interval: int = 10  # Run cleanup every N CLI executions
+    _scheduler: Optional[CliProcessScheduler] = None
 
-    def __init__(self) -> None:
-        """Initialize the CLI process manager."""
-        self._execution_count = 0
+    @classmethod
+    def scheduler(cls) -> CliProcessScheduler:
+        """The process-wide scheduler (created on first use)."""
+        if cls._scheduler is None:
+            cls._scheduler = CliProcessScheduler()
+        return cls._scheduler
+
+    @classmethod
+    def configure(cls, **kwargs: Any) -> CliProcessScheduler:
+        """Replace the process-wide scheduler (see CliProcessScheduler args)."""
+        cls._scheduler = CliProcessScheduler(**kwargs)
+        return cls._scheduler
 
     @classmethod
     async def run_serialized(
@@ -41,10 +318,11 @@ class CliProcessManager:
         **kwargs: Any
     ) -> T:
         """
-        Run a task with serialization (one CLI process at a time).
+        Run a task in a scheduler slot.
 
-        This prevents "database locked" errors when multiple Claude CLI
-        processes try to access the same session database simultaneously.
+        Kept for existing callers: despite the name, up to max_concurrent
+        tasks now run at once. Callers that launch the CLI themselves should
+        use scheduler().slot() to get the worker's isolated environment.
 
         Args:
             task_fn: Async function to execute
@@ -54,32 +332,25 @@ class CliProcessManager:
         Returns:
             Result from task_fn execution
         """
-        async with cls._lock:
-            result = await task_fn(*args, **kwargs)
-
-            # Periodically cleanup zombie processes
-            cls._execution_count = getattr(cls, "_execution_count", 0) + 1
-            if cls._execution_count % cls._cleanup_interval == 0:
-                cls.cleanup_zombie_processes()
-
-            return result
+        async with cls.scheduler().slot():
+            return await task_fn(*args, **kwargs)
 
     @staticmethod
     def cleanup_zombie_processes() -> None:
         """
-        Kill zombie Claude processes (status 'T' = stopped/suspended).
+        Kill stopped Claude processes (status 'T' = stopped/suspended).
 
-        Zombie processes can accumulate when CLI sessions are interrupted
-        or not properly closed. This prevents process accumulation and
-        potential resource exhaustion.
+        Stopped processes can accumulate when CLI sessions are interrupted
+        or not properly closed. Running processes are never touched, so this
+        is safe while other workers are mid-task.
 
-        Tries to use psutil if available, falls back to manual cleanup.
+        Tries to use psutil if available, falls back to ps.
         """
+        killed_count = 0
         try:
             # Try using psutil for better process detection
             import psutil  # type: ignore[import-untyped]
 
-            killed_count = 0
             for proc in psutil.process_iter(["pid", "name", "status"]):
                 try:
                     if (
@@ -91,33 +362,36 @@ class CliProcessManager:
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
 
-            if killed_count > 0:
-                print(f"🧹 Cleaned up {killed_count} zombie Claude process(es)")
-
         except ImportError:
-            # Fallback: Try to kill processes using ps and kill commands (Unix-like systems)
+            # Fallback: find stopped processes with ps (Unix-like systems)
             try:
                 result = subprocess.run(
-                    ["pgrep", "-f", "claude"],
+                    ["ps", "-eo", "pid=,stat=,comm="],
                     capture_output=True,
                     text=True,
                     timeout=5,
                 )
-                if result.stdout:
-                    pids = result.stdout.strip().split("\n")
-                    for pid in pids:
-                        if pid:
-                            try:
-                                os.kill(int(pid), signal.SIGTERM)
-                            except (ProcessLookupError, ValueError):
-                                pass
+                for line in result.stdout.splitlines():
+                    parts = line.split(None, 2)
+                    if len(parts) != 3:
+                        continue
+                    pid, stat, comm = parts
+                    if stat.startswith("T") and os.path.basename(comm.strip()) == "claude":
+                        try:
+                            os.kill(int(pid), signal.SIGKILL)
+                            killed_count += 1
+                        except (ProcessLookupError, PermissionError, ValueError):
+                            pass
             except (FileNotFoundError, subprocess.TimeoutExpired):
-                # pgrep not available or timeout
+                # ps not available or timeout
                 pass
-        except Exception as e:
+        except Exception:
             # Silently fail - cleanup is best-effort
             pass
 
+        if killed_count > 0:
+            print(f"🧹 Cleaned up {killed_count} zombie Claude process(es)")
+
     @staticmethod
     def get_active_claude_processes() -> int:
         """
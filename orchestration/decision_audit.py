@@ -14,6 +14,8 @@ Features:
 
 File Structure:
     .aibrain/audit/decisions-{project}-{YYYYMMDD}.jsonl
+    .aibrain/audit/decisions-{project}.index.db   (offset index, rebuildable)
+    .aibrain/audit/chain-{project}.jsonl          (hash chain over sealed days)
 
 Example Entry:
     {"id": "DEC-20260207-143052-001", "timestamp": "2026-02-07T14:30:52.123456",
@@ -38,6 +40,14 @@ Usage:
     # Query decisions
     decisions = audit.get_decisions_for_task("TASK-001")
     tree = audit.build_decision_tree("TASK-001")
+
+    # Rebuild the offset index (also: aibrain audit reindex)
+    audit.reindex()
+
+    # Verify a quarter in parallel, checking the hash chain
+    audit.seal()
+    for result in audit.verify_range(date(2026, 1, 1), date(2026, 3, 31), chain=True):
+        print(result["file"], result["integrity_ok"], result["chain_ok"])
 """
 
 import json
@@ -49,9 +59,24 @@ from pathlib import Path
 from typing import Optional, Any, Iterator
 from enum import Enum
 import logging
+import sqlite3
+
+from orchestration.audit_integrity import (
+    GENESIS_ROOT,
+    AuditChain,
+    ChainLink,
+    chain_root,
+    file_date,
+    verify_file,
+    verify_files,
+)
+from orchestration.decision_index import DecisionIndex
 
 logger = logging.getLogger(__name__)
 
+# Where audit files go when no audit_dir is given
+DEFAULT_AUDIT_DIR = Path(".aibrain/audit")
+
 
 class DecisionType(str, Enum):
     """Types of decisions that can be audited."""
@@ -147,6 +172,7 @@ class DecisionAudit:
         project: str,
         audit_dir: Optional[Path] = None,
         redact_pii: bool = False,
+        use_index: bool = True,
     ):
         """
         Initialize decision audit.
@@ -155,16 +181,24 @@ class DecisionAudit:
             project: Project name (e.g., "credentialmate")
             audit_dir: Directory for audit files (default: .aibrain/audit)
             redact_pii: Enable PII redaction for HIPAA compliance
+            use_index: Maintain the SQLite offset index for per-task lookups
         """
         self.project = project
         self.redact_pii = redact_pii
-        self.audit_dir = audit_dir or Path(".aibrain/audit")
+        self.audit_dir = audit_dir or DEFAULT_AUDIT_DIR
         self.audit_dir.mkdir(parents=True, exist_ok=True)
 
         self._lock = threading.Lock()
         self._decision_counter = 0
         self._parent_stack: list[str] = []  # For nested decision tracking
 
+        self._index: Optional[DecisionIndex] = None
+        if use_index:
+            try:
+                self._index = DecisionIndex(self.audit_dir, project)
+            except sqlite3.Error as e:
+                logger.warning(f"Decision index unavailable, falling back to scans: {e}")
+
     def _get_audit_file(self, for_date: Optional[date] = None) -> Path:
         """Get the audit file path for a given date."""
         target_date = for_date or date.today()
@@ -253,10 +287,20 @@ class DecisionAudit:
         )
 
         # Append to JSONL file (thread-safe)
+        line = (entry.to_json() + '\n').encode()
         with self._lock:
             audit_file = self._get_audit_file()
-            with open(audit_file, 'a') as f:
-                f.write(entry.to_json() + '\n')
+            with open(audit_file, 'ab') as f:
+                f.write(line)
+                f.flush()
+                # O_APPEND: position after our write is the end of our line
+                end = f.tell()
+
+            if self._index is not None:
+                try:
+                    self._index.add(audit_file.name, end - len(line), len(line), decision_id, task_id)
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to index decision {decision_id}: {e}")
 
         logger.debug(f"Decision logged: {decision_id} - {type_str}: {decision}")
         return decision_id
@@ -359,31 +403,87 @@ class DecisionAudit:
         )
 
     def get_decisions_for_task(self, task_id: str) -> list[DecisionEntry]:
-        """Get all decisions for a specific task."""
+        """
+        Get all decisions for a specific task.
+
+        Uses the offset index to read only the task's lines; falls back to
+        scanning every audit file if the index is unavailable.
+        """
+        if self._index is not None:
+            try:
+                self._index.catch_up()
+                locations = self._index.locate_task(task_id)
+            except sqlite3.Error as e:
+                logger.warning(f"Decision index lookup failed, scanning: {e}")
+            else:
+                decisions = [
+                    entry for entry in self._read_entries(locations)
+                    if entry.task_id == task_id
+                ]
+                return sorted(decisions, key=lambda d: d.timestamp)
+
         decisions = []
 
         # Search across all audit files
         for audit_file in sorted(self.audit_dir.glob(f"decisions-{self.project}-*.jsonl")):
-            with open(audit_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        entry = DecisionEntry.from_json(line)
-                        if entry.task_id == task_id:
-                            decisions.append(entry)
-                    except (json.JSONDecodeError, TypeError) as e:
-                        logger.warning(f"Failed to parse audit line: {e}")
+            for entry in self._iter_file(audit_file):
+                if entry.task_id == task_id:
+                    decisions.append(entry)
 
         return sorted(decisions, key=lambda d: d.timestamp)
 
-    def get_decisions_for_date(self, target_date: date) -> Iterator[DecisionEntry]:
-        """Get all decisions for a specific date."""
-        audit_file = self._get_audit_file(target_date)
-        if not audit_file.exists():
-            return
+    def get_decision(self, decision_id: str) -> Optional[DecisionEntry]:
+        """
+        Get a single decision by ID (None if not found).
+
+        Uses the offset index; falls back to scanning the audit files if the
+        index is unavailable, locked or corrupt.
+        """
+        if self._index is not None:
+            try:
+                self._index.catch_up()
+                location = self._index.locate_decision(decision_id)
+            except sqlite3.Error as e:
+                logger.warning(f"Decision index lookup failed, scanning: {e}")
+            else:
+                if location is None:
+                    return None
+                entries = self._read_entries([location])
+                return entries[0] if entries else None
+
+        for audit_file in sorted(self.audit_dir.glob(f"decisions-{self.project}-*.jsonl")):
+            for entry in self._iter_file(audit_file):
+                if entry.id == decision_id:
+                    return entry
+        return None
 
+    def _read_entries(self, locations: list[tuple[str, int, int]]) -> list[DecisionEntry]:
+        """Read entries at (file, offset, length) locations, one open per file."""
+        entries = []
+        handle = None
+        current = None
+        try:
+            for file_name, offset, length in locations:
+                if file_name != current:
+                    if handle is not None:
+                        handle.close()
+                    handle = open(self.audit_dir / file_name, 'rb')
+                    current = file_name
+                handle.seek(offset)
+                raw = handle.read(length)
+                try:
+                    entries.append(DecisionEntry.from_json(raw.decode()))
+                except (json.JSONDecodeError, TypeError, UnicodeDecodeError) as e:
+                    logger.warning(f"Stale index entry {file_name}@{offset}, run reindex: {e}")
+        except OSError as e:
+            logger.warning(f"Failed to read indexed audit entries: {e}")
+        finally:
+            if handle is not None:
+                handle.close()
+        return entries
+
+    def _iter_file(self, audit_file: Path) -> Iterator[DecisionEntry]:
+        """Parse every line of one audit file."""
         with open(audit_file, 'r') as f:
             for line in f:
                 line = line.strip()
@@ -394,6 +494,26 @@ class DecisionAudit:
                 except (json.JSONDecodeError, TypeError) as e:
                     logger.warning(f"Failed to parse audit line: {e}")
 
+    def reindex(self) -> int:
+        """
+        Rebuild the offset index from the audit files.
+
+        Returns:
+            Number of decisions indexed
+        """
+        if self._index is None:
+            self._index = DecisionIndex(self.audit_dir, self.project)
+        with self._lock:
+            return self._index.reindex()
+
+    def get_decisions_for_date(self, target_date: date) -> Iterator[DecisionEntry]:
+        """Get all decisions for a specific date."""
+        audit_file = self._get_audit_file(target_date)
+        if not audit_file.exists():
+            return
+
+        yield from self._iter_file(audit_file)
+
     def build_decision_tree(self, task_id: str) -> dict[str, Any]:
         """
         Build a decision tree for a task.
@@ -467,39 +587,84 @@ class DecisionAudit:
         }
 
     def verify_integrity(self, target_date: Optional[date] = None) -> dict[str, Any]:
-        """Verify checksum integrity of audit entries."""
+        """Verify checksum integrity of audit entries (streams the file)."""
         target_date = target_date or date.today()
-        decisions = list(self.get_decisions_for_date(target_date))
+        audit_file = self._get_audit_file(target_date)
 
-        valid = 0
-        invalid = 0
-        missing_checksum = 0
+        if not audit_file.exists():
+            return {
+                "date": target_date.isoformat(),
+                "total": 0,
+                "valid": 0,
+                "invalid": 0,
+                "missing_checksum": 0,
+                "integrity_ok": True,
+            }
 
-        for d in decisions:
-            if not d.checksum:
-                missing_checksum += 1
-                continue
+        result = verify_file(str(audit_file))
+        result["date"] = target_date.isoformat()
+        return result
 
-            # Recalculate checksum
-            data = asdict(d)
-            data_for_checksum = {k: v for k, v in data.items() if k != 'checksum'}
-            expected = hashlib.sha256(
-                json.dumps(data_for_checksum, sort_keys=True).encode()
-            ).hexdigest()[:16]
+    def verify_range(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        chain: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Verify every audit file in a date range in parallel, streaming results.
 
-            if expected == d.checksum:
-                valid += 1
-            else:
-                invalid += 1
+        Args:
+            start: First day (inclusive, default: earliest file)
+            end: Last day (inclusive, default: latest file)
+            chain: Also check each sealed file against the hash chain
+            max_workers: Process pool size (default: CPU count)
+
+        Yields:
+            Per-file result dicts in date order. With chain=True each has
+            "chain_ok": True/False for sealed files, None for unsealed ones.
+        """
+        files = []
+        for path in sorted(self.audit_dir.glob(f"decisions-{self.project}-*.jsonl")):
+            day = file_date(path)
+            if day is None or (start and day < start) or (end and day > end):
+                continue
+            files.append(path)
+
+        # file -> (root before it, its link); only the previous root is
+        # needed to check a link, so nothing outside the range is rehashed
+        links: dict[str, tuple[str, ChainLink]] = {}
+        if chain:
+            root = GENESIS_ROOT
+            for link in AuditChain(self.audit_dir, self.project).links():
+                links[link.file] = (root, link)
+                root = link.root
+
+        for result in verify_files(files, max_workers=max_workers):
+            if chain:
+                entry = links.get(result["file"])
+                if entry is None:
+                    result["chain_ok"] = None
+                else:
+                    prev, link = entry
+                    result["chain_ok"] = (
+                        link.digest == result["digest"]
+                        and chain_root(prev, link.file, result["digest"]) == link.root
+                    )
+                    if not result["chain_ok"]:
+                        result["integrity_ok"] = False
+            yield result
+
+    def seal(self, through: Optional[date] = None) -> list[ChainLink]:
+        """
+        Extend the hash chain with finished days (default: up to yesterday).
 
-        return {
-            "date": target_date.isoformat(),
-            "total": len(decisions),
-            "valid": valid,
-            "invalid": invalid,
-            "missing_checksum": missing_checksum,
-            "integrity_ok": invalid == 0,
-        }
+        Returns:
+            Newly sealed links
+        """
+        with self._lock:
+            return AuditChain(self.audit_dir, self.project).seal(through=through)
 
 
 # Convenience function for quick logging
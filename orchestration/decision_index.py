@@ -0,0 +1,265 @@
+"""
+Decision Audit Index - SQLite sidecar for the JSONL audit trail
+
+Maps decision_id and task_id to (file, byte offset, length) so that
+per-task lookups seek straight to the relevant lines instead of scanning
+and parsing every `decisions-{project}-*.jsonl` file ever written.
+
+Features:
+- Maintained on append by DecisionAudit.log_decision
+- Self-healing: files grown by other processes (or written before the index
+  existed) are caught up incrementally from the last indexed byte
+- Cheap catch-up: the file list is re-globbed only when the directory
+  changes, files whose (mtime, size) haven't changed are skipped, and
+  fully indexed files from before yesterday are no longer stat'ed
+- Rebuildable from the JSONL files at any time (`aibrain audit reindex`)
+
+File Structure:
+    .aibrain/audit/decisions-{project}.index.db
+
+Usage:
+    from orchestration.decision_index import DecisionIndex
+
+    index = DecisionIndex(audit_dir, project="credentialmate")
+    index.add("decisions-credentialmate-20260207.jsonl", offset, length,
+              decision_id="DEC-...", task_id="TASK-001")
+
+    for file_name, offset, length in index.locate_task("TASK-001"):
+        ...
+"""
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+_FILE_DATE_RE = re.compile(r"-(\d{8})\.jsonl$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    decision_id TEXT NOT NULL,
+    task_id     TEXT,
+    file        TEXT NOT NULL,
+    offset      INTEGER NOT NULL,
+    length      INTEGER NOT NULL,
+    PRIMARY KEY (file, offset)
+);
+CREATE INDEX IF NOT EXISTS idx_entries_task ON entries(task_id);
+CREATE INDEX IF NOT EXISTS idx_entries_decision ON entries(decision_id);
+CREATE TABLE IF NOT EXISTS files (
+    file          TEXT PRIMARY KEY,
+    indexed_bytes INTEGER NOT NULL
+);
+"""
+
+
+class DecisionIndex:
+    """
+    Offset index over one project's decision audit files.
+
+    Every row points at one JSONL line: (file, offset, length). Rows are
+    keyed by position, since decision IDs are only unique per writer. The `files`
+    table records how many bytes of each file are covered, so catch_up()
+    only parses lines appended since the last indexed byte.
+    """
+
+    def __init__(self, audit_dir: Path, project: str):
+        """
+        Open (or create) the index.
+
+        Args:
+            audit_dir: Directory holding the audit JSONL files
+            project: Project name (matches decisions-{project}-*.jsonl)
+        """
+        self.audit_dir = Path(audit_dir)
+        self.project = project
+        self.db_path = self.audit_dir / f"decisions-{project}.index.db"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+        # catch_up() bookkeeping (this process only)
+        self._dir_mtime_ns: Optional[int] = None
+        self._files: list[Path] = []
+        self._seen: dict[str, tuple[int, int]] = {}  # file -> (mtime_ns, size) last caught up
+        self._sealed: set[str] = set()  # Past days' files, fully indexed
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            try:
+                yield self._conn
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def _audit_files(self) -> list[Path]:
+        return sorted(self.audit_dir.glob(f"decisions-{self.project}-*.jsonl"))
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Maintenance
+    # ─────────────────────────────────────────────────────────────────────
+
+    def add(
+        self,
+        file_name: str,
+        offset: int,
+        length: int,
+        decision_id: str,
+        task_id: Optional[str],
+    ) -> None:
+        """
+        Index one appended line.
+
+        The file's coverage only advances when the line directly follows
+        what is already indexed; a gap (another process appended in
+        between) is left for catch_up() to fill.
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (decision_id, task_id, file_name, offset, length),
+            )
+            if offset == 0:
+                conn.execute(
+                    "INSERT OR IGNORE INTO files (file, indexed_bytes) VALUES (?, 0)",
+                    (file_name,),
+                )
+            conn.execute(
+                "UPDATE files SET indexed_bytes = ? WHERE file = ? AND indexed_bytes = ?",
+                (offset + length, file_name, offset),
+            )
+
+    def catch_up(self) -> int:
+        """
+        Index lines appended to any audit file since it was last indexed.
+
+        Returns:
+            Number of lines indexed
+        """
+        try:
+            dir_mtime_ns = self.audit_dir.stat().st_mtime_ns
+        except OSError:
+            return 0
+        if dir_mtime_ns != self._dir_mtime_ns:
+            self._files = self._audit_files()  # New or removed files
+            self._dir_mtime_ns = dir_mtime_ns
+
+        covered: Optional[dict[str, int]] = None
+        cutoff = (date.today() - timedelta(days=1)).strftime("%Y%m%d")
+        indexed = 0
+        for path in self._files:
+            if path.name in self._sealed:
+                continue
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            signature = (st.st_mtime_ns, st.st_size)
+            if self._seen.get(path.name) == signature:
+                continue
+
+            if covered is None:
+                with self._lock:
+                    covered = dict(self._conn.execute("SELECT file, indexed_bytes FROM files"))
+            start = covered.get(path.name, 0)
+            if st.st_size > start:
+                indexed += self._index_file(path, start)
+            if self._file_date(path) < cutoff:
+                self._sealed.add(path.name)  # Writers only append to today's file
+            self._seen[path.name] = signature
+        return indexed
+
+    @staticmethod
+    def _file_date(path: Path) -> str:
+        match = _FILE_DATE_RE.search(path.name)
+        return match.group(1) if match else "99999999"
+
+    def reindex(self) -> int:
+        """
+        Drop and rebuild the index from the JSONL files.
+
+        Returns:
+            Number of lines indexed
+        """
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM entries")
+            conn.execute("DELETE FROM files")
+        self._seen.clear()
+        self._sealed.clear()
+        indexed = sum(self._index_file(path, 0) for path in self._audit_files())
+        with self._lock:
+            self._conn.execute("VACUUM")
+        return indexed
+
+    def _index_file(self, path: Path, start: int) -> int:
+        """Index complete lines of a file from byte `start` onwards."""
+        rows = []
+        position = start
+        with open(path, "rb") as f:
+            f.seek(start)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # Partial line still being written
+                offset = position
+                position += len(raw)
+                if not raw.strip():
+                    continue
+                try:
+                    data = json.loads(raw)
+                    rows.append((data["id"], data.get("task_id"), path.name, offset, len(raw)))
+                except (json.JSONDecodeError, KeyError, TypeError) as e:
+                    logger.warning(f"Skipping unindexable audit line in {path.name}@{offset}: {e}")
+
+        with self._transaction() as conn:
+            conn.executemany("INSERT OR IGNORE INTO entries VALUES (?, ?, ?, ?, ?)", rows)
+            conn.execute(
+                """
+                INSERT INTO files (file, indexed_bytes) VALUES (?, ?)
+                ON CONFLICT(file) DO UPDATE SET indexed_bytes = MAX(indexed_bytes, excluded.indexed_bytes)
+                """,
+                (path.name, position),
+            )
+        return len(rows)
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Lookup
+    # ─────────────────────────────────────────────────────────────────────
+
+    def locate_task(self, task_id: str) -> list[tuple[str, int, int]]:
+        """Return (file, offset, length) for every line of a task, in file order."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT file, offset, length FROM entries WHERE task_id = ? ORDER BY file, offset",
+                (task_id,),
+            ).fetchall()
+
+    def locate_decision(self, decision_id: str) -> Optional[tuple[str, int, int]]:
+        """Return (file, offset, length) for one decision (first written), or None."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT file, offset, length FROM entries WHERE decision_id = ? "
+                "ORDER BY file, offset LIMIT 1",
+                (decision_id,),
+            ).fetchone()
+
+    def count(self) -> int:
+        """Number of indexed decisions."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
@@ -0,0 +1,236 @@
+"""
+Fan-out event broadcaster for the monitoring WebSocket server.
+
+One producer task drains the shared event queue and publishes each event to
+every subscriber's own bounded buffer. Each WebSocket connection sends from
+its own buffer in its own task, so clients are served concurrently and a
+slow client only ever falls behind itself.
+
+Features:
+- Per-subscriber bounded buffers with an overflow policy:
+  - "drop_oldest": discard the oldest pending event
+  - "coalesce": replace a pending event with the same key (type + task_id),
+    falling back to drop_oldest when nothing matches
+- Replay of the last N events to new subscribers
+- Events are JSON-encoded once per publish, not once per client
+- Backpressure metrics (queued, dropped, coalesced, high-water mark)
+
+Usage:
+    from orchestration.event_broadcaster import EventBroadcaster
+
+    broadcaster = EventBroadcaster(buffer_size=256, replay_size=50)
+    broadcaster.start(event_queue)           # Producer task
+
+    subscriber = broadcaster.subscribe()     # Per connection
+    try:
+        while (text := await subscriber.get()) is not None:
+            await websocket.send_text(text)
+    finally:
+        broadcaster.unsubscribe(subscriber)
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+from collections import deque
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DROP_OLDEST = "drop_oldest"
+COALESCE = "coalesce"
+
+DEFAULT_BUFFER_SIZE = 256
+DEFAULT_REPLAY_SIZE = 50
+
+
+def coalesce_key(event: dict[str, Any]) -> Optional[str]:
+    """
+    Key under which a newer event supersedes an older pending one.
+
+    Progress-style events for the same task collapse; events without a
+    task_id are never coalesced.
+    """
+    data = event.get("data")
+    task_id = data.get("task_id") if isinstance(data, dict) else None
+    if task_id is None:
+        return None
+    return f"{event.get('type')}:{task_id}"
+
+
+class Subscriber:
+    """
+    Bounded per-connection buffer of encoded events.
+
+    Publishing never blocks: when the buffer is full the overflow policy
+    makes room instead.
+    """
+
+    def __init__(self, subscriber_id: int, maxsize: int, policy: str):
+        self.id = subscriber_id
+        self.maxsize = maxsize
+        self.policy = policy
+        self._buffer: deque[tuple[Optional[str], str]] = deque()
+        self._ready = asyncio.Event()
+        self.closed = False
+
+        # Backpressure metrics
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.high_water = 0
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def offer(self, key: Optional[str], text: str) -> None:
+        """Enqueue an encoded event without blocking."""
+        if self.closed:
+            return
+
+        if self.policy == COALESCE and key is not None:
+            for i, (pending_key, _) in enumerate(self._buffer):
+                if pending_key == key:
+                    del self._buffer[i]
+                    self.coalesced += 1
+                    break
+
+        if len(self._buffer) >= self.maxsize:
+            self._buffer.popleft()
+            self.dropped += 1
+
+        self._buffer.append((key, text))
+        self.high_water = max(self.high_water, len(self._buffer))
+        self._ready.set()
+
+    async def get(self) -> Optional[str]:
+        """Wait for the next encoded event (None once the subscriber is closed)."""
+        while not self._buffer:
+            if self.closed:
+                return None
+            self._ready.clear()
+            await self._ready.wait()
+        _, text = self._buffer.popleft()
+        self.delivered += 1
+        return text
+
+    def close(self) -> None:
+        """Stop accepting events and wake any waiting get()."""
+        self.closed = True
+        self._ready.set()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "queued": len(self._buffer),
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "high_water": self.high_water,
+        }
+
+
+class EventBroadcaster:
+    """
+    Pub/sub fan-out from one event source to many subscribers.
+
+    Not thread-safe: publish() and subscribe() must run on the event loop.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        replay_size: int = DEFAULT_REPLAY_SIZE,
+        policy: str = DROP_OLDEST,
+    ):
+        if policy not in (DROP_OLDEST, COALESCE):
+            raise ValueError(f"Unknown overflow policy: {policy}")
+        self.buffer_size = buffer_size
+        self.policy = policy
+        self._history: deque[tuple[Optional[str], str]] = deque(maxlen=replay_size)
+        self._subscribers: dict[int, Subscriber] = {}
+        self._ids = itertools.count(1)
+        self._task: Optional[asyncio.Task[None]] = None
+        self.published = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def subscribe(self, replay: Optional[int] = None) -> Subscriber:
+        """
+        Register a subscriber, pre-filled with recent history.
+
+        Args:
+            replay: Number of past events to replay (None = all retained,
+                    0 = none)
+        """
+        subscriber = Subscriber(next(self._ids), self.buffer_size, self.policy)
+        history = list(self._history)
+        if replay is not None:
+            history = history[-replay:] if replay > 0 else []
+        for key, text in history:
+            subscriber.offer(key, text)
+        self._subscribers[subscriber.id] = subscriber
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        """Remove a subscriber and release its buffer."""
+        subscriber.close()
+        self._subscribers.pop(subscriber.id, None)
+
+    def publish(self, event: dict[str, Any]) -> None:
+        """Encode an event once and offer it to every subscriber."""
+        key = coalesce_key(event)
+        text = json.dumps(event, default=str)
+        self._history.append((key, text))
+        self.published += 1
+        for subscriber in list(self._subscribers.values()):
+            subscriber.offer(key, text)
+
+    async def run(self, source: "asyncio.Queue[dict[str, Any]]") -> None:
+        """Producer loop: drain the source queue and publish each event."""
+        while True:
+            event = await source.get()
+            try:
+                self.publish(event)
+            except (TypeError, ValueError) as e:
+                logger.error(f"Dropping unencodable event {event.get('type')}: {e}")
+
+    def start(self, source: "asyncio.Queue[dict[str, Any]]") -> None:
+        """Start the producer task on the running loop (idempotent)."""
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self.run(source))
+
+    async def stop(self) -> None:
+        """Cancel the producer task and close all subscribers."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for subscriber in list(self._subscribers.values()):
+            self.unsubscribe(subscriber)
+
+    def stats(self) -> dict[str, Any]:
+        """Backpressure metrics across all subscribers."""
+        subscribers = [s.stats() for s in self._subscribers.values()]
+        return {
+            "policy": self.policy,
+            "buffer_size": self.buffer_size,
+            "published": self.published,
+            "subscribers": len(subscribers),
+            "replay_available": len(self._history),
+            "queued_total": sum(s["queued"] for s in subscribers),
+            "dropped_total": sum(s["dropped"] for s in subscribers),
+            "coalesced_total": sum(s["coalesced"] for s in subscribers),
+            "max_queued": max((s["queued"] for s in subscribers), default=0),
+            "per_subscriber": subscribers,
+        }
@@ -5,13 +5,30 @@ Part of: AI Team Governance (AI-TEAM-SPEC-V3)
 
 Provides observability by logging significant events to detailed markdown files
 and counting all events in metrics.json.
+
+Write pipeline:
+    log_event() only assigns a sequence number (atomic in-process counter) and
+    puts the event on a queue. A single background writer thread per logger
+    drains the queue in batches, writes detail markdown files, aggregates
+    counter deltas in memory, and periodically merges them into metrics.json
+    under an exclusive file lock with an atomic rename. Counts are additive,
+    so parallel workers (threads or processes) never lose increments; a
+    failed merge keeps its delta for the next flush. The thread exits once
+    its logger is closed or garbage-collected, after writing what is pending.
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Any
+import fcntl
+import itertools
 import json
+import os
+import queue
+import re
+import threading
+import weakref
 
 
 def utc_now() -> datetime:
@@ -88,6 +105,16 @@ SIGNIFICANT_EVENTS = {
 }
 
 
+# Writer thread batching
+FLUSH_INTERVAL_SECONDS = 1.0  # Max delay before counters reach metrics.json
+MAX_BATCH_SIZE = 500          # Events drained per writer wake-up
+
+_EVENT_FILE_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})-(\d+)-")
+
+# Names tried for one detail log before giving up (ID, ID-p<pid>, ID-p<pid>-2, ...)
+MAX_EVENT_ID_ATTEMPTS = 100
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # EVENT DATA CLASSES
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -130,189 +157,218 @@ class Event:
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
-# EVENT LOGGER
+# EVENT WRITER
 # ═══════════════════════════════════════════════════════════════════════════════
 
-class EventLogger:
+class _EventWriter:
     """
-    Logs events for AI Team observability.
+    File side of an EventLogger: event queue, counter delta, writer thread.
 
-    - Significant events get detailed markdown files in events/current/
-    - All events update counts in events/metrics.json
+    Holds no reference to its logger, so the thread never keeps a logger
+    alive; the logger stops it on close(), garbage collection or exit.
     """
 
-    def __init__(self, project_root: Path):
-        """
-        Initialize EventLogger.
-
-        Args:
-            project_root: Path to project root (containing AI-Team-Plans/)
-        """
-        self.project_root = Path(project_root)
-        self.events_dir = self.project_root / "AI-Team-Plans" / "events"
-        self.current_dir = self.events_dir / "current"
-        self.archive_dir = self.events_dir / "archive"
-        self.metrics_file = self.events_dir / "metrics.json"
-
-        # Ensure directories exist
-        self._ensure_directories()
-
-    def _ensure_directories(self) -> None:
-        """Create event directories if they don't exist."""
-        self.current_dir.mkdir(parents=True, exist_ok=True)
-        self.archive_dir.mkdir(parents=True, exist_ok=True)
-
-    # ───────────────────────────────────────────────────────────────────────────
-    # Public API
-    # ───────────────────────────────────────────────────────────────────────────
-
-    def log_event(self, event: Event) -> str:
+    def __init__(self, project_name: str, events_dir: Path, flush_interval: float):
+        self.project_name = project_name
+        self.current_dir = events_dir / "current"
+        self.metrics_file = events_dir / "metrics.json"
+        self.lock_file = events_dir / ".metrics.lock"
+        self.flush_interval = flush_interval
+
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._pending_delta: Dict[str, Any] = {}
+        self._delta_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._pid = os.getpid()
+        self.closed = False
+
+    def submit(self, event: Event, event_id: Optional[str]) -> None:
+        """Queue an event for the writer thread."""
+        self._ensure_thread()
+        self._queue.put((event, event_id))
+
+    def write_now(self, event: Event, event_id: Optional[str]) -> Optional[str]:
         """
-        Log an event.
-
-        - Always updates metrics.json counts
-        - Creates detailed markdown if significant event
-
-        Args:
-            event: The event to log
+        Write an event and merge its counts on the caller's thread.
 
         Returns:
-            Event ID (filename for significant events, or "counted" for others)
+            Event ID of the detail log actually written (None if none)
         """
-        # Always update metrics
-        self._update_metrics(event)
-
-        # Create detailed log if significant
-        if self._is_significant(event):
-            event_id = self._write_detail_log(event)
-            return event_id
-
-        return "counted"
+        written = self._process(event, event_id)
+        self.flush_delta()
+        return written
+
+    def flush(self, timeout: Optional[float]) -> bool:
+        """Wait until everything queued so far is written and merged."""
+        thread = self._thread
+        if (
+            thread is not None and thread.is_alive() and os.getpid() == self._pid
+            and thread is not threading.current_thread()
+        ):
+            done = threading.Event()
+            self._queue.put(done)
+            return done.wait(timeout)
+
+        # No writer: drain anything left on the queue inline
+        self._drain(block=False)
+        self.flush_delta()
+        return True
+
+    def close(self) -> None:
+        """Flush pending events and stop the thread."""
+        if self.closed:
+            return
+        try:
+            self.flush(timeout=10.0)
+        except OSError as e:
+            print(f"EventLogger metrics flush error: {e}")
+        self.closed = True
+        thread = self._thread
+        if thread is not None and thread.is_alive() and os.getpid() == self._pid:
+            self._queue.put(None)
+            if thread is not threading.current_thread():
+                thread.join(timeout=5)
+        self._thread = None
+
+    def _ensure_thread(self) -> None:
+        """Start the writer thread (again, after a fork)."""
+        if os.getpid() != self._pid:
+            # Forked child: parent's queue and thread don't belong to us
+            self._pid = os.getpid()
+            self._queue = queue.SimpleQueue()
+            self._pending_delta = {}
+            self._thread = None
+
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"event-logger-{self.project_name}",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        """Drain the queue in batches; merge counters every flush_interval."""
+        while True:
+            stop = self._drain(block=True)
+            try:
+                self.flush_delta()
+            except OSError as e:
+                print(f"EventLogger metrics flush error: {e}")
+            if stop:
+                return
 
-    def log(
-        self,
-        event_type: str,
-        agent: str,
-        context: Optional[Dict[str, Any]] = None,
-        decision: Optional[Dict[str, Any]] = None,
-        impact: Optional[Dict[str, Any]] = None,
-        escalated: bool = False,
-        escalation_reason: Optional[str] = None,
-        session_id: Optional[str] = None,
-    ) -> str:
+    def _drain(self, block: bool) -> bool:
         """
-        Convenience method to log an event with individual parameters.
-
-        Args:
-            event_type: Type of event (use EventType constants)
-            agent: Name of agent that triggered the event
-            context: Context about what triggered the event
-            decision: Decision made (if applicable)
-            impact: Impact of the event
-            escalated: Whether this led to escalation
-            escalation_reason: Why escalation occurred
-            session_id: Current session ID
+        Process up to MAX_BATCH_SIZE queued items.
 
         Returns:
-            Event ID
-        """
-        event = Event(
-            type=event_type,
-            agent=agent,
-            context=context or {},
-            decision=decision,
-            impact=impact,
-            escalated=escalated,
-            escalation_reason=escalation_reason,
-            session_id=session_id,
-        )
-        return self.log_event(event)
-
-    def get_metrics(self) -> Dict[str, Any]:
+            True if a stop sentinel was received
         """
-        Get current metrics.
+        waiters: List[threading.Event] = []
+        stop = False
 
-        Returns:
-            Metrics dictionary
-        """
-        return self._load_metrics()
+        for i in range(MAX_BATCH_SIZE):
+            try:
+                if block and i == 0:
+                    item = self._queue.get(timeout=self.flush_interval)
+                else:
+                    item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if item is None:
+                stop = True
+                break
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+                break  # Flush now so the waiter sees everything before it
+
+            event, event_id = item
+            try:
+                self._process(event, event_id)
+            except OSError as e:
+                print(f"EventLogger write error: {e}")
 
-    def get_events_for_date(self, date: datetime) -> List[Path]:
+        if waiters:
+            try:
+                self.flush_delta()
+            except OSError as e:
+                print(f"EventLogger metrics flush error: {e}")
+            finally:
+                for waiter in waiters:
+                    waiter.set()
+
+        return stop
+
+    def _process(self, event: Event, event_id: Optional[str]) -> Optional[str]:
+        """Write the detail log (if any) and count the event in the delta."""
+        written = self.write_detail_log(event, event_id) if event_id is not None else None
+        self.count(event)
+        return written
+
+    def count(self, event: Event) -> None:
+        """Add an event to the pending counter delta."""
+        with self._delta_lock:
+            self._apply_event(self._pending_delta, event)
+
+    def flush_delta(self) -> None:
         """
-        Get all detailed event files for a specific date.
+        Merge pending counter deltas into metrics.json atomically.
 
-        Args:
-            date: Date to get events for
-
-        Returns:
-            List of event file paths
+        If the merge fails, the delta goes back into the pending buffer and
+        is retried on the next flush.
         """
-        date_str = date.strftime("%Y-%m-%d")
-        return sorted(self.current_dir.glob(f"{date_str}-*.md"))
-
-    def archive_old_events(self, days_to_keep: int = 7) -> int:
+        with self._delta_lock:
+            if not self._pending_delta:
+                return
+            delta = self._pending_delta
+            self._pending_delta = {}
+
+        try:
+            self.lock_file.touch(exist_ok=True)
+            with open(self.lock_file, "r+") as lock:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+                try:
+                    metrics = self.load_metrics()
+                    _merge_counts(metrics, delta)
+                    self.save_metrics(metrics)
+                finally:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+        except BaseException:
+            with self._delta_lock:
+                _merge_counts(self._pending_delta, delta)
+            raise
+
+    def write_detail_log(self, event: Event, event_id: str) -> str:
         """
-        Archive events older than specified days.
+        Write detailed markdown event file.
 
-        Args:
-            days_to_keep: Number of days of events to keep in current/
+        Uses exclusive create; if another process already took the ID, the
+        ID gets a PID suffix (then a counter) rather than overwriting a file.
 
         Returns:
-            Number of events archived
-        """
-        cutoff = utc_now().date()
-        archived = 0
+            Event ID actually written (filename without extension)
 
-        for event_file in self.current_dir.glob("*.md"):
+        Raises:
+            FileExistsError: Every candidate name was taken
+        """
+        for attempt in range(MAX_EVENT_ID_ATTEMPTS):
+            candidate = event_id
+            if attempt:
+                candidate += f"-p{os.getpid()}" + (f"-{attempt}" if attempt > 1 else "")
             try:
-                # Parse date from filename (YYYY-MM-DD-NNN-type.md)
-                date_str = event_file.name[:10]
-                file_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-
-                days_old = (cutoff - file_date).days
-                if days_old > days_to_keep:
-                    # Move to archive
-                    archive_path = self.archive_dir / event_file.name
-                    event_file.rename(archive_path)
-                    archived += 1
-            except (ValueError, IndexError):
-                # Skip files that don't match expected format
+                with open(self.current_dir / f"{candidate}.md", "x") as f:
+                    f.write(self._format_event_markdown(event, candidate))
+                return candidate
+            except FileExistsError:
                 continue
-
-        return archived
-
-    # ───────────────────────────────────────────────────────────────────────────
-    # Internal Methods
-    # ───────────────────────────────────────────────────────────────────────────
-
-    def _is_significant(self, event: Event) -> bool:
-        """Check if event should get detailed logging."""
-        return event.type in SIGNIFICANT_EVENTS
-
-    def _write_detail_log(self, event: Event) -> str:
-        """
-        Write detailed markdown event file.
-
-        Returns:
-            Event ID (filename without extension)
-        """
-        date_str = event.timestamp.strftime("%Y-%m-%d")
-
-        # Get next sequence number for today
-        existing = list(self.current_dir.glob(f"{date_str}-*.md"))
-        seq = len(existing) + 1
-
-        # Create filename
-        event_type_slug = event.type.lower().replace("_", "-")
-        event_id = f"{date_str}-{seq:03d}-{event_type_slug}"
-        filename = f"{event_id}.md"
-        filepath = self.current_dir / filename
-
-        # Generate markdown content
-        content = self._format_event_markdown(event, event_id)
-        filepath.write_text(content)
-
-        return event_id
+        raise FileExistsError(f"No free detail log name for {event_id}")
 
     def _format_event_markdown(self, event: Event, event_id: str) -> str:
         """Format event as markdown document."""
@@ -382,7 +438,7 @@ class EventLogger:
 
         return "\n".join(lines)
 
-    def _load_metrics(self) -> Dict[str, Any]:
+    def load_metrics(self) -> Dict[str, Any]:
         """Load metrics from file or create default."""
         if self.metrics_file.exists():
             try:
@@ -392,20 +448,22 @@ class EventLogger:
                 pass
 
         # Return default metrics structure
-        return self._create_default_metrics()
+        return self.create_default_metrics()
 
-    def _save_metrics(self, metrics: Dict[str, Any]) -> None:
-        """Save metrics to file."""
+    def save_metrics(self, metrics: Dict[str, Any]) -> None:
+        """Save metrics to file (write temp file, then atomic rename)."""
         metrics["generated_at"] = utc_now().isoformat()
 
-        with open(self.metrics_file, "w") as f:
+        tmp_file = self.metrics_file.with_name(f".{self.metrics_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "w") as f:
             json.dump(metrics, f, indent=2)
+        os.replace(tmp_file, self.metrics_file)
 
-    def _create_default_metrics(self) -> Dict[str, Any]:
+    def create_default_metrics(self) -> Dict[str, Any]:
         """Create default metrics structure."""
         return {
             "version": "3.0",
-            "project": self.project_root.name,
+            "project": self.project_name,
             "period": utc_now().strftime("%Y-%m-%d"),
             "generated_at": utc_now().isoformat(),
             "totals": {
@@ -449,100 +507,358 @@ class EventLogger:
             "daily_counts": [],
         }
 
-    def _update_metrics(self, event: Event) -> None:
-        """Update metrics.json with event counts."""
-        metrics = self._load_metrics()
+    def _apply_event(self, metrics: Dict[str, Any], event: Event) -> None:
+        """
+        Count an event into a metrics dict.
 
+        Works on both full metrics and sparse deltas: missing sections and
+        keys are created on demand (also keeps old metrics files compatible).
+        """
         # Update totals
-        metrics["totals"]["events_total"] += 1
-        if self._is_significant(event):
-            metrics["totals"]["events_logged_detail"] += 1
+        _incr(metrics, "totals", "events_total")
+        if event.type in SIGNIFICANT_EVENTS:
+            _incr(metrics, "totals", "events_logged_detail")
         else:
-            metrics["totals"]["events_counted_only"] += 1
+            _incr(metrics, "totals", "events_counted_only")
 
         # Update by-agent counts
         agent_key = event.agent.lower().replace(" ", "_").replace("-", "_")
-        if agent_key not in metrics["by_agent"]:
-            metrics["by_agent"][agent_key] = {}
-
-        event_key = event.type.lower()
-        metrics["by_agent"][agent_key][event_key] = \
-            metrics["by_agent"][agent_key].get(event_key, 0) + 1
+        _incr(metrics, "by_agent", agent_key, event.type.lower())
 
         # Update Ralph verdicts
         if event.type == EventType.RALPH_PASS:
-            metrics["ralph_verdicts"]["pass"] += 1
+            _incr(metrics, "ralph_verdicts", "pass")
         elif event.type == EventType.RALPH_FAIL:
-            metrics["ralph_verdicts"]["fail"] += 1
+            _incr(metrics, "ralph_verdicts", "fail")
         elif event.type == EventType.RALPH_BLOCKED:
-            metrics["ralph_verdicts"]["blocked"] += 1
+            _incr(metrics, "ralph_verdicts", "blocked")
 
         # Update escalation counts
         if event.escalated:
-            metrics["escalations"]["to_human"] += 1
+            _incr(metrics, "escalations", "to_human")
 
         if event.type == EventType.SCOPE_ESCALATION:
-            metrics["escalations"]["scope_triggers"] += 1
+            _incr(metrics, "escalations", "scope_triggers")
         elif event.type == EventType.ADR_CONFLICT:
-            metrics["escalations"]["adr_conflicts"] += 1
+            _incr(metrics, "escalations", "adr_conflicts")
 
         if event.escalation_reason == "LOW_CONFIDENCE":
-            metrics["escalations"]["low_confidence"] += 1
+            _incr(metrics, "escalations", "low_confidence")
         elif event.escalation_reason == "STRATEGIC_DOMAIN":
-            metrics["escalations"]["strategic_domain"] += 1
+            _incr(metrics, "escalations", "strategic_domain")
 
         # ADR-003: Update task discovery metrics
         if event.type == EventType.TASK_DISCOVERED:
-            # Ensure task_discovery section exists (backwards compatibility)
-            if "task_discovery" not in metrics:
-                metrics["task_discovery"] = {
-                    "total_discovered": 0,
-                    "by_source": {},
-                    "duplicates_skipped": 0,
-                }
-
-            metrics["task_discovery"]["total_discovered"] += 1
+            _incr(metrics, "task_discovery", "total_discovered")
 
             # Track by source (discovered_by field in context)
             source = event.context.get("discovered_by", "unknown")
-            metrics["task_discovery"]["by_source"][source] = \
-                metrics["task_discovery"]["by_source"].get(source, 0) + 1
+            _incr(metrics, "task_discovery", "by_source", source)
 
         elif event.type == EventType.TASK_DUPLICATE_SKIPPED:
-            if "task_discovery" not in metrics:
-                metrics["task_discovery"] = {
-                    "total_discovered": 0,
-                    "by_source": {},
-                    "duplicates_skipped": 0,
-                }
-            metrics["task_discovery"]["duplicates_skipped"] += 1
+            _incr(metrics, "task_discovery", "duplicates_skipped")
 
         # ADR-004: Update resource usage metrics
-        if event.type in (
-            EventType.RESOURCE_LIMIT_WARNING,
-            EventType.RESOURCE_LIMIT_EXCEEDED,
-            EventType.RETRY_ESCALATION,
-            EventType.COST_THRESHOLD_REACHED,
-        ):
-            # Ensure resource_usage section exists (backwards compatibility)
-            if "resource_usage" not in metrics:
-                metrics["resource_usage"] = {
-                    "limit_warnings": 0,
-                    "limit_exceeded": 0,
-                    "retry_escalations": 0,
-                    "cost_threshold_reached": 0,
-                }
-
-            if event.type == EventType.RESOURCE_LIMIT_WARNING:
-                metrics["resource_usage"]["limit_warnings"] += 1
-            elif event.type == EventType.RESOURCE_LIMIT_EXCEEDED:
-                metrics["resource_usage"]["limit_exceeded"] += 1
-            elif event.type == EventType.RETRY_ESCALATION:
-                metrics["resource_usage"]["retry_escalations"] += 1
-            elif event.type == EventType.COST_THRESHOLD_REACHED:
-                metrics["resource_usage"]["cost_threshold_reached"] += 1
-
-        self._save_metrics(metrics)
+        if event.type == EventType.RESOURCE_LIMIT_WARNING:
+            _incr(metrics, "resource_usage", "limit_warnings")
+        elif event.type == EventType.RESOURCE_LIMIT_EXCEEDED:
+            _incr(metrics, "resource_usage", "limit_exceeded")
+        elif event.type == EventType.RETRY_ESCALATION:
+            _incr(metrics, "resource_usage", "retry_escalations")
+        elif event.type == EventType.COST_THRESHOLD_REACHED:
+            _incr(metrics, "resource_usage", "cost_threshold_reached")
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# EVENT LOGGER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class EventLogger:
+    """
+    Logs events for AI Team observability.
+
+    - Significant events get detailed markdown files in events/current/
+    - All events update counts in events/metrics.json
+
+    Writes happen on a background writer thread (see module docstring);
+    call flush() to wait for pending events, or pass async_writes=False to
+    write inline. The thread stops when the logger is closed or
+    garbage-collected, after writing what is pending.
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        async_writes: bool = True,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+    ):
+        """
+        Initialize EventLogger.
+
+        Args:
+            project_root: Path to project root (containing AI-Team-Plans/)
+            async_writes: Queue events for the background writer (default)
+                instead of writing on the caller's thread
+            flush_interval: Max seconds between metrics.json merges
+        """
+        self.project_root = Path(project_root)
+        self.events_dir = self.project_root / "AI-Team-Plans" / "events"
+        self.current_dir = self.events_dir / "current"
+        self.archive_dir = self.events_dir / "archive"
+        self.metrics_file = self.events_dir / "metrics.json"
+        self.lock_file = self.events_dir / ".metrics.lock"
+
+        self.async_writes = async_writes
+        self.flush_interval = flush_interval
+
+        # Per-date sequence counters (next() is atomic under the GIL)
+        self._seq_counters: Dict[str, "itertools.count[int]"] = {}
+        self._seq_lock = threading.Lock()
+
+        # Writer pipeline; the finalizer stops it on close(), when this
+        # logger is garbage-collected, or at interpreter exit
+        self._writer = _EventWriter(self.project_root.name, self.events_dir, flush_interval)
+        self._finalizer = weakref.finalize(self, self._writer.close)
+
+        # Ensure directories exist
+        self._ensure_directories()
+
+    def _ensure_directories(self) -> None:
+        """Create event directories if they don't exist."""
+        self.current_dir.mkdir(parents=True, exist_ok=True)
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+
+    # ───────────────────────────────────────────────────────────────────────────
+    # Public API
+    # ───────────────────────────────────────────────────────────────────────────
+
+    def log_event(self, event: Event) -> str:
+        """
+        Log an event.
+
+        - Always updates metrics.json counts
+        - Creates detailed markdown if significant event
+
+        With async writes (default) this only assigns the event ID and
+        enqueues the event; the writer thread does all file I/O.
+
+        Args:
+            event: The event to log
+
+        Returns:
+            Event ID (filename for significant events, or "counted" for others).
+            With async writes, the file gets a suffix in the rare case another
+            process already took the ID; sync writes return the name written.
+        """
+        event_id = self._next_event_id(event) if self._is_significant(event) else None
+
+        if self.async_writes and not self._writer.closed:
+            self._writer.submit(event, event_id)
+        else:
+            event_id = self._writer.write_now(event, event_id)
+
+        return event_id or "counted"
+
+    def log(
+        self,
+        event_type: str,
+        agent: str,
+        context: Optional[Dict[str, Any]] = None,
+        decision: Optional[Dict[str, Any]] = None,
+        impact: Optional[Dict[str, Any]] = None,
+        escalated: bool = False,
+        escalation_reason: Optional[str] = None,
+        session_id: Optional[str] = None,
+    ) -> str:
+        """
+        Convenience method to log an event with individual parameters.
+
+        Args:
+            event_type: Type of event (use EventType constants)
+            agent: Name of agent that triggered the event
+            context: Context about what triggered the event
+            decision: Decision made (if applicable)
+            impact: Impact of the event
+            escalated: Whether this led to escalation
+            escalation_reason: Why escalation occurred
+            session_id: Current session ID
+
+        Returns:
+            Event ID
+        """
+        event = Event(
+            type=event_type,
+            agent=agent,
+            context=context or {},
+            decision=decision,
+            impact=impact,
+            escalated=escalated,
+            escalation_reason=escalation_reason,
+            session_id=session_id,
+        )
+        return self.log_event(event)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get current metrics.
+
+        Waits for this logger's pending events to be written first.
+
+        Returns:
+            Metrics dictionary
+        """
+        self.flush()
+        return self._load_metrics()
+
+    def flush(self, timeout: Optional[float] = 10.0) -> bool:
+        """
+        Wait until every event logged so far is written and merged.
+
+        Args:
+            timeout: Max seconds to wait for the writer thread
+
+        Returns:
+            True if everything was flushed
+        """
+        return self._writer.flush(timeout)
+
+    def close(self) -> None:
+        """Flush pending events and stop the writer thread."""
+        self._finalizer()
+
+    def get_events_for_date(self, date: datetime) -> List[Path]:
+        """
+        Get all detailed event files for a specific date.
+
+        Args:
+            date: Date to get events for
+
+        Returns:
+            List of event file paths
+        """
+        date_str = date.strftime("%Y-%m-%d")
+        return sorted(self.current_dir.glob(f"{date_str}-*.md"))
+
+    def archive_old_events(self, days_to_keep: int = 7) -> int:
+        """
+        Archive events older than specified days.
+
+        Args:
+            days_to_keep: Number of days of events to keep in current/
+
+        Returns:
+            Number of events archived
+        """
+        cutoff = utc_now().date()
+        archived = 0
+
+        for event_file in self.current_dir.glob("*.md"):
+            try:
+                # Parse date from filename (YYYY-MM-DD-NNN-type.md)
+                date_str = event_file.name[:10]
+                file_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+
+                days_old = (cutoff - file_date).days
+                if days_old > days_to_keep:
+                    # Move to archive
+                    archive_path = self.archive_dir / event_file.name
+                    event_file.rename(archive_path)
+                    archived += 1
+            except (ValueError, IndexError):
+                # Skip files that don't match expected format
+                continue
+
+        return archived
+
+    # ───────────────────────────────────────────────────────────────────────────
+    # Internal Methods
+    # ───────────────────────────────────────────────────────────────────────────
+
+    def _is_significant(self, event: Event) -> bool:
+        """Check if event should get detailed logging."""
+        return event.type in SIGNIFICANT_EVENTS
+
+    def _next_event_id(self, event: Event) -> str:
+        """
+        Assign the next event ID for the event's date.
+
+        The per-date counter is seeded once from existing files, so the
+        directory is scanned once per day instead of on every event.
+        """
+        date_str = event.timestamp.strftime("%Y-%m-%d")
+
+        counter = self._seq_counters.get(date_str)
+        if counter is None:
+            with self._seq_lock:
+                counter = self._seq_counters.get(date_str)
+                if counter is None:
+                    counter = itertools.count(self._max_existing_seq(date_str) + 1)
+                    self._seq_counters[date_str] = counter
+
+        seq = next(counter)
+        event_type_slug = event.type.lower().replace("_", "-")
+        return f"{date_str}-{seq:03d}-{event_type_slug}"
+
+    def _max_existing_seq(self, date_str: str) -> int:
+        """Highest sequence number already used for a date."""
+        max_seq = 0
+        for path in self.current_dir.glob(f"{date_str}-*.md"):
+            match = _EVENT_FILE_RE.match(path.name)
+            if match:
+                max_seq = max(max_seq, int(match.group(2)))
+        return max_seq
+
+    def _write_detail_log(self, event: Event, event_id: Optional[str] = None) -> str:
+        """
+        Write detailed markdown event file.
+
+        Returns:
+            Event ID (filename without extension)
+        """
+        if event_id is None:
+            event_id = self._next_event_id(event)
+        return self._writer.write_detail_log(event, event_id)
+
+    def _format_event_markdown(self, event: Event, event_id: str) -> str:
+        """Format event as markdown document."""
+        return self._writer._format_event_markdown(event, event_id)
+
+    def _load_metrics(self) -> Dict[str, Any]:
+        """Load metrics from file or create default."""
+        return self._writer.load_metrics()
+
+    def _save_metrics(self, metrics: Dict[str, Any]) -> None:
+        """Save metrics to file (write temp file, then atomic rename)."""
+        self._writer.save_metrics(metrics)
+
+    def _create_default_metrics(self) -> Dict[str, Any]:
+        """Create default metrics structure."""
+        return self._writer.create_default_metrics()
+
+    def _update_metrics(self, event: Event) -> None:
+        """Update metrics.json with event counts (synchronously)."""
+        self._writer.count(event)
+        self._writer.flush_delta()
+
+
+def _incr(metrics: Dict[str, Any], *path: str) -> None:
+    """Increment a nested counter, creating intermediate dicts as needed."""
+    node = metrics
+    for key in path[:-1]:
+        node = node.setdefault(key, {})
+    node[path[-1]] = node.get(path[-1], 0) + 1
+
+
+def _merge_counts(target: Dict[str, Any], delta: Dict[str, Any]) -> None:
+    """Add a sparse counter delta into a metrics dict."""
+    for key, value in delta.items():
+        if isinstance(value, dict):
+            existing = target.get(key)
+            if not isinstance(existing, dict):
+                existing = target[key] = {}
+            _merge_counts(existing, value)
+        else:
+            target[key] = target.get(key, 0) + value
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
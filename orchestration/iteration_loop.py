@@ -35,13 +35,14 @@ from governance.hooks.stop_hook import agent_stop_hook, StopDecision
 from ralph.baseline import BaselineRecorder
 from orchestration.state_file import write_state_file, read_state_file, cleanup_state_file, LoopState
 from orchestration.session_state import SessionState, format_session_markdown
+from monitoring.tracing import span, traced, annotate
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
 # Knowledge Object integration
-from knowledge.service import find_relevant, create_draft
+from knowledge.service import find_relevant, find_relevant_for_files, create_draft
 from orchestration.ko_helpers import extract_tags_from_task, format_ko_for_display, extract_learning_from_iterations
 from knowledge.metrics import record_consultation, record_outcome
 from knowledge.config import get_config
@@ -95,6 +96,9 @@ class IterationLoop:
         self.session: SessionState = None
         self.session_enabled = True  # Can be disabled for testing
 
+        # Warm SDK conversation reused across iterations (agent.config.reuse_session)
+        self.agent_session = None
+
         # Record baseline for regression detection
         baseline_recorder = BaselineRecorder(self.project_path, app_context)
         self.agent.baseline = baseline_recorder.record()
@@ -239,10 +243,15 @@ class IterationLoop:
 
         return log
 
+    @traced("iteration_loop.run")
     def run(self, task_id: str, task_description: str = "", max_iterations: int = None, resume: bool = False) -> IterationResult:
         """
         Run agent with iteration loop and stop hook.
 
+        With agent.config.reuse_session, every iteration runs in one warm
+        Agent SDK conversation and stop hook feedback is sent into it as the
+        next prompt, instead of a fresh process re-reading context each time.
+
         Args:
             task_id: Task identifier
             task_description: Description of the task (for state file)
@@ -252,6 +261,41 @@ class IterationLoop:
         Returns:
             IterationResult with final status
         """
+        annotate(task_id=task_id, agent=self.agent.config.agent_name)
+
+        self._open_agent_session()
+        try:
+            return self._run_iterations(task_id, task_description, max_iterations, resume)
+        finally:
+            self._close_agent_session()
+
+    def _open_agent_session(self) -> None:
+        """Open a warm SDK session for the agent if the config asks for one."""
+        config = self.agent.config
+        if not (getattr(config, "reuse_session", False) is True and getattr(config, "use_sdk", True)):
+            return
+
+        from claude.sdk_adapter import ClaudeSDKAdapter
+
+        try:
+            adapter = ClaudeSDKAdapter(self.project_path, repo_name=config.project_name)
+            self.agent_session = adapter.open_session(task_type=config.agent_name)
+        except RuntimeError as e:
+            print(f"⚠️  Session reuse unavailable, using a fresh run per iteration: {e}")
+            return
+        self.agent.agent_session = self.agent_session
+
+    def _close_agent_session(self) -> None:
+        session, self.agent_session = self.agent_session, None
+        if session is None:
+            return
+        self.agent.agent_session = None
+        stats = session.stats()
+        annotate(session_turns=stats["turns"], session_cost_usd=stats["total_cost_usd"])
+        logger.info(f"Agent session closed: {stats}")
+        session.close()
+
+    def _run_iterations(self, task_id: str, task_description: str, max_iterations: int, resume: bool) -> IterationResult:
         # Try to resume from state file
         if resume:
             state = read_state_file(self.state_dir / "agent-loop.local.md")
@@ -340,7 +384,8 @@ class IterationLoop:
 
             # Execute agent task
             try:
-                result = self.agent.execute(task_id)
+                with span("agent.execute", iteration=iteration_num):
+                    result = self.agent.execute(task_id)
             except CircuitBreakerTripped as e:
                 print(f"⚡ Circuit breaker tripped during iteration: {e}")
                 return IterationResult(
@@ -373,15 +418,19 @@ class IterationLoop:
             changes = self._get_changed_files()
             output = result.get("output", "")
 
+            # Surface KOs whose file patterns match the files being touched
+            self._consult_knowledge_for_files(changes, task_id)
+
             # Run stop hook
             try:
-                stop_result = agent_stop_hook(
-                    agent=self.agent,
-                    session_id=task_id,
-                    changes=changes,
-                    output=output,
-                    app_context=self.app_context
-                )
+                with span("stop_hook", iteration=iteration_num, changes=len(changes)):
+                    stop_result = agent_stop_hook(
+                        agent=self.agent,
+                        session_id=task_id,
+                        changes=changes,
+                        output=output,
+                        app_context=self.app_context
+                    )
             except KeyboardInterrupt:
                 # User aborted via stop hook
                 print("\n⚠️  Session aborted by user")
@@ -510,6 +559,9 @@ class IterationLoop:
 
             else:  # StopDecision.BLOCK
                 # Continue iteration - agent will retry
+                if self.agent_session is not None:
+                    # The stop hook's feedback is the next turn of the conversation
+                    self.agent_session.queue_follow_up(stop_result.system_message or stop_result.reason)
                 print(f"🔄 Continuing to iteration {iteration_num + 1}...")
                 continue
 
@@ -568,6 +620,55 @@ class IterationLoop:
             print(f"   Continuing without knowledge context...\n")
             return []
 
+    def _consult_knowledge_for_files(self, changed_files: list[str], task_id: str) -> list:
+        """
+        Consult Knowledge Objects whose file patterns match changed files.
+
+        Newly matched KOs (not already consulted for this task) are appended to
+        agent.relevant_knowledge so the next iteration sees them.
+        Fails gracefully if errors occur.
+
+        Args:
+            changed_files: Paths changed in the working tree
+            task_id: The task ID (for metrics tracking)
+
+        Returns:
+            List of newly matched KnowledgeObject instances
+        """
+        if not changed_files:
+            return []
+
+        try:
+            consulted_ids = list(getattr(self.agent, "consulted_ko_ids", None) or [])
+            consulted = set(consulted_ids)
+            new_kos = [
+                ko for ko in find_relevant_for_files(
+                    project=self.agent.config.project_name,
+                    file_paths=changed_files
+                )
+                if ko.id not in consulted
+            ]
+
+            if not new_kos:
+                return []
+
+            for ko in new_kos:
+                record_consultation(ko.id, task_id)
+
+            self.agent.relevant_knowledge = list(self.agent.relevant_knowledge or []) + new_kos
+            self.agent.consulted_ko_ids = consulted_ids + [ko.id for ko in new_kos]
+
+            print(f"\n📚 {len(new_kos)} KO(s) match files being changed:")
+            for ko in new_kos:
+                print(format_ko_for_display(ko))
+                print()
+
+            return new_kos
+
+        except Exception as e:
+            print(f"\n⚠️  File-pattern knowledge consultation failed: {e}")
+            return []
+
     def _create_draft_ko(self, task_id: str, task_description: str, verdict: Any) -> None:
         """
         Create draft Knowledge Object after successful multi-iteration fix.
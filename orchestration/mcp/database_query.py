@@ -5,8 +5,8 @@ Wraps database query execution as MCP server with:
 - Query validation and sanitization
 - Cost tracking per query
 - SQL injection prevention
-- Result caching
-- Connection pooling
+- Result caching (LRU + TTL + byte budget, invalidated by writes; see query_cache.py)
+- Connection pooling (checked-out SQLite/WAL or PostgreSQL connections; see db_pool.py)
 - Thread-safe concurrent operations
 
 Author: Claude Code (TDD Implementation)
@@ -15,7 +15,6 @@ Version: 1.0
 """
 
 import re
-import sqlite3
 import threading
 import time
 import hashlib
@@ -23,6 +22,15 @@ from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
+from .db_pool import DEFAULT_POOL_TIMEOUT_SECONDS, ConnectionPool, backend_for
+from .query_cache import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_ENTRIES,
+    DEFAULT_TTL_SECONDS,
+    QueryCache,
+    extract_tables,
+)
+
 
 @dataclass
 class QueryResult:
@@ -93,25 +101,40 @@ class DatabaseQueryMCP:
     def __init__(
         self,
         connection_string: str = "sqlite:///:memory:",
-        pool_size: int = 5
+        pool_size: int = 5,
+        pool_timeout_seconds: float = DEFAULT_POOL_TIMEOUT_SECONDS,
+        cache_max_entries: int = DEFAULT_MAX_ENTRIES,
+        cache_ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        cache_max_bytes: int = DEFAULT_MAX_BYTES
     ):
-        """Initialize Database Query MCP server"""
+        """
+        Initialize Database Query MCP server
+
+        Args:
+            connection_string: Database URL (sqlite:///path or postgresql://...)
+            pool_size: Maximum connections
+            pool_timeout_seconds: Longest wait for a free connection
+            cache_max_entries: Cached SELECT results kept (LRU beyond this)
+            cache_ttl_seconds: Seconds a cached result stays valid
+            cache_max_bytes: Estimated memory budget for cached rows
+        """
         self.connection_string = connection_string
         self.pool_size = pool_size
 
-        # For SQLite, extract path
-        if connection_string.startswith("sqlite:///"):
-            self.db_path = connection_string.replace("sqlite:///", "")
-        else:
-            self.db_path = ":memory:"
-
         # Connection management
-        self._connection: Optional[sqlite3.Connection] = None
-        self._connection_lock = threading.Lock()
+        self._pool = ConnectionPool(
+            backend_for(connection_string),
+            pool_size=pool_size,
+            timeout_seconds=pool_timeout_seconds
+        )
+        self.db_path = getattr(self._pool.backend, "db_path", None)
 
-        # Cache: query hash -> result
-        self._cache: Dict[str, QueryResult] = {}
-        self._cache_lock = threading.Lock()
+        # Cache: query hash -> result (bounded, invalidated per table by writes)
+        self._cache = QueryCache(
+            max_entries=cache_max_entries,
+            ttl_seconds=cache_ttl_seconds,
+            max_bytes=cache_max_bytes
+        )
 
         # Metrics tracking
         self._metrics: List[QueryMetric] = []
@@ -124,9 +147,8 @@ class DatabaseQueryMCP:
     def init_database(self) -> bool:
         """Initialize database connection"""
         try:
-            self._connection = sqlite3.connect(self.db_path)
-            self._connection.row_factory = sqlite3.Row
-            return True
+            with self._pool.connection():
+                return True
         except Exception:
             return False
 
@@ -150,36 +172,29 @@ class DatabaseQueryMCP:
         cache_key = self._generate_cache_key(sql, params)
 
         # Check cache
-        with self._cache_lock:
-            if cache_key in self._cache:
-                cached = self._cache[cache_key]
-                return QueryResult(
-                    success=cached.success,
-                    rows=cached.rows,
-                    rows_affected=cached.rows_affected,
-                    cost_usd=cached.cost_usd,
-                    execution_time_ms=cached.execution_time_ms,
-                    cached=True
-                )
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return QueryResult(
+                success=cached.success,
+                rows=cached.rows,
+                rows_affected=cached.rows_affected,
+                cost_usd=cached.cost_usd,
+                execution_time_ms=cached.execution_time_ms,
+                cached=True
+            )
 
-        try:
-            # Execute query
-            connection = self._get_connection()
-            if connection is None:
-                return QueryResult(
-                    success=False,
-                    error="No database connection"
-                )
+        # A write that commits while this query runs makes its result unsafe to cache
+        generation = self._cache.generation
 
-            cursor = connection.cursor()
-            if params:
-                cursor.execute(sql, params)
-            else:
-                cursor.execute(sql)
+        try:
+            # Execute query on a checked-out connection
+            backend = self._pool.backend
+            with self._pool.connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(backend.translate(sql), params or [])
 
-            # Fetch results
-            rows = cursor.fetchall()
-            row_dicts = [dict(row) for row in rows]
+                # Fetch results
+                row_dicts = backend.rows(cursor)
 
             execution_time_ms = (time.time() - start_time) * 1000
             cost = self._calculate_cost("select")
@@ -193,8 +208,9 @@ class DatabaseQueryMCP:
             )
 
             # Cache result
-            with self._cache_lock:
-                self._cache[cache_key] = result
+            tables = extract_tables(sql)
+            if tables is not None:
+                self._cache.put(cache_key, result, tables, generation)
 
             # Track cost
             with self._cost_lock:
@@ -237,23 +253,17 @@ class DatabaseQueryMCP:
             # Get query type
             query_type = self._get_query_type(sql)
 
-            # Execute query
-            connection = self._get_connection()
-            if connection is None:
-                return QueryResult(
-                    success=False,
-                    error="No database connection"
-                )
-
-            cursor = connection.cursor()
-            if params:
-                cursor.execute(sql, params)
-            else:
-                cursor.execute(sql)
+            # Execute query on a checked-out connection (rolled back on failure)
+            with self._pool.connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(self._pool.backend.translate(sql), params or [])
+                connection.commit()
+                rows_affected = cursor.rowcount
 
-            connection.commit()
+            # Drop cached results that read the written table (all of them
+            # when the target table can't be parsed)
+            self._cache.invalidate_tables(extract_tables(sql))
 
-            rows_affected = cursor.rowcount
             execution_time_ms = (time.time() - start_time) * 1000
             cost = self._calculate_cost(query_type)
 
@@ -340,13 +350,11 @@ class DatabaseQueryMCP:
 
     def clear_cache(self) -> None:
         """Clear query result cache"""
-        with self._cache_lock:
-            self._cache.clear()
+        self._cache.clear()
 
     def get_cache_size(self) -> int:
         """Get number of cached results"""
-        with self._cache_lock:
-            return len(self._cache)
+        return len(self._cache)
 
     def get_accumulated_cost(self) -> float:
         """Get total accumulated cost"""
@@ -358,12 +366,8 @@ class DatabaseQueryMCP:
         return self.COST_PER_QUERY.copy()
 
     def get_pool_stats(self) -> Dict[str, Any]:
-        """Get connection pool statistics"""
-        return {
-            "active_connections": 1,
-            "total_connections": 1,
-            "pool_size": self.pool_size
-        }
+        """Get connection pool statistics (sizing, checkouts, wait times)"""
+        return self._pool.stats()
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get aggregated metrics"""
@@ -372,7 +376,8 @@ class DatabaseQueryMCP:
                 return {
                     "total_queries": 0,
                     "total_cost_usd": 0.0,
-                    "average_execution_time_ms": 0.0
+                    "average_execution_time_ms": 0.0,
+                    "cache": self._cache.stats()
                 }
 
             total_time = sum(m.execution_time_ms for m in self._metrics)
@@ -382,7 +387,8 @@ class DatabaseQueryMCP:
                 "total_cost_usd": self.get_accumulated_cost(),
                 "average_execution_time_ms": (
                     total_time / len(self._metrics) if self._metrics else 0
-                )
+                ),
+                "cache": self._cache.stats()
             }
 
     def get_query_stats(self) -> Dict[str, Any]:
@@ -471,21 +477,11 @@ class DatabaseQueryMCP:
             raise ValueError(f"Unknown tool: {tool_name}")
 
     def close(self) -> None:
-        """Close database connection"""
-        with self._connection_lock:
-            if self._connection:
-                self._connection.close()
-                self._connection = None
+        """Close pooled connections (new ones are opened on the next query)"""
+        self._pool.close()
 
     # Private methods
 
-    def _get_connection(self) -> Optional[sqlite3.Connection]:
-        """Get or create database connection"""
-        with self._connection_lock:
-            if self._connection is None:
-                self.init_database()
-            return self._connection
-
     @staticmethod
     def _generate_cache_key(sql: str, params: Optional[List[Any]]) -> str:
         """Generate cache key from query and parameters"""
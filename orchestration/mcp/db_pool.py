@@ -0,0 +1,293 @@
+"""
+Database Connection Pool for DatabaseQueryMCP
+
+Bounded pool of checked-out connections, so concurrent specialists run
+queries in parallel instead of serializing on one shared connection.
+
+Features:
+- Checkout/return: each caller holds a connection exclusively; at most
+  pool_size exist, and callers beyond that wait (bounded by timeout)
+- SQLite: WAL mode so readers don't block on a writer, busy_timeout for
+  writer contention, and a per-connection prepared statement cache that
+  stays warm because connections are reused
+- PostgreSQL through psycopg2 (postgresql:// URLs); "?" placeholders are
+  translated to psycopg2's "%s"
+- Connections are returned clean: an open transaction is rolled back and
+  broken connections are discarded
+- Sizing and wait-time stats for get_pool_stats()
+
+Usage:
+    from orchestration.mcp.db_pool import ConnectionPool, backend_for
+
+    pool = ConnectionPool(backend_for("sqlite:///data.db"), pool_size=5)
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(pool.backend.translate("SELECT * FROM users WHERE id = ?"), [1])
+    pool.close()
+"""
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import psycopg2
+    import psycopg2.extensions
+    import psycopg2.extras
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    psycopg2 = None
+    PSYCOPG2_AVAILABLE = False
+
+DEFAULT_POOL_TIMEOUT_SECONDS = 30.0
+
+# Prepared statements kept per SQLite connection (sqlite3 default is 128)
+SQLITE_STATEMENT_CACHE_SIZE = 256
+
+# How long a SQLite writer waits for the database lock
+SQLITE_BUSY_TIMEOUT_MS = 5000
+
+
+class PoolTimeoutError(RuntimeError):
+    """No connection became free within the pool timeout."""
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Backends
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class SQLiteBackend:
+    """sqlite3 connections in WAL mode with a statement cache."""
+
+    name = "sqlite"
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        # Every ":memory:" connection is a separate database: share one
+        self.max_connections: Optional[int] = 1 if db_path == ":memory:" else None
+
+    def connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,  # Checked out by one thread at a time
+            cached_statements=SQLITE_STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS}")
+        if self.db_path != ":memory:":
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+        return conn
+
+    @staticmethod
+    def translate(sql: str) -> str:
+        return sql
+
+    @staticmethod
+    def rows(cursor: Any) -> List[Dict[str, Any]]:
+        return [dict(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def reset(conn: sqlite3.Connection) -> None:
+        if conn.in_transaction:
+            conn.rollback()
+
+    @staticmethod
+    def is_usable(conn: sqlite3.Connection) -> bool:
+        return True
+
+
+class PostgresBackend:
+    """psycopg2 connections; rows come back as dicts."""
+
+    name = "postgresql"
+    max_connections: Optional[int] = None
+
+    def __init__(self, dsn: str):
+        if not PSYCOPG2_AVAILABLE:
+            raise RuntimeError("psycopg2 is required for PostgreSQL connections")
+        self.dsn = dsn
+
+    def connect(self) -> Any:
+        return psycopg2.connect(self.dsn, cursor_factory=psycopg2.extras.RealDictCursor)
+
+    @staticmethod
+    def translate(sql: str) -> str:
+        """Rewrite qmark placeholders as %s (and escape literal %) outside quotes."""
+        out = []
+        quote: Optional[str] = None
+        for ch in sql:
+            if quote:
+                if ch == quote:
+                    quote = None
+            elif ch in ("'", '"'):
+                quote = ch
+            elif ch == "?":
+                out.append("%s")
+                continue
+            if ch == "%":
+                out.append("%%")
+                continue
+            out.append(ch)
+        return "".join(out)
+
+    @staticmethod
+    def rows(cursor: Any) -> List[Dict[str, Any]]:
+        return [dict(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def reset(conn: Any) -> None:
+        if conn.info.transaction_status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+            conn.rollback()
+
+    @staticmethod
+    def is_usable(conn: Any) -> bool:
+        return not conn.closed
+
+
+def backend_for(connection_string: str) -> Any:
+    """Backend for a sqlite:///path or postgresql:// connection string."""
+    if connection_string.startswith(("postgresql://", "postgres://")):
+        return PostgresBackend(connection_string)
+    if connection_string.startswith("sqlite:///"):
+        return SQLiteBackend(connection_string.replace("sqlite:///", "", 1))
+    return SQLiteBackend(":memory:")
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Pool
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class ConnectionPool:
+    """Thread-safe pool of up to pool_size connections."""
+
+    def __init__(
+        self,
+        backend: Any,
+        pool_size: int = 5,
+        timeout_seconds: float = DEFAULT_POOL_TIMEOUT_SECONDS,
+    ):
+        self.backend = backend
+        self.pool_size = max(1, pool_size)
+        if backend.max_connections is not None:
+            self.pool_size = min(self.pool_size, backend.max_connections)
+        self.timeout_seconds = timeout_seconds
+
+        self._idle: List[Any] = []  # LIFO: the warmest connection is reused first
+        self._total = 0  # Idle + checked out + being opened
+        self._generation = 0  # Bumped by close(); older connections are discarded
+        self._cond = threading.Condition()
+
+        # Stats
+        self.created = 0
+        self.checkouts = 0
+        self.waits = 0
+        self.timeouts = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Check out a connection; it is reset and returned on exit."""
+        conn, generation = self._acquire()
+        try:
+            yield conn
+        finally:
+            self._release(conn, generation)
+
+    def _acquire(self) -> tuple:
+        waited_since: Optional[float] = None
+        with self._cond:
+            while not self._idle and self._total >= self.pool_size:
+                if waited_since is None:
+                    waited_since = time.monotonic()
+                    self.waits += 1
+                remaining = self.timeout_seconds - (time.monotonic() - waited_since)
+                if remaining <= 0 or not self._cond.wait(remaining):
+                    if not self._idle and self._total >= self.pool_size:
+                        self.timeouts += 1
+                        self._record_wait(waited_since)
+                        raise PoolTimeoutError(
+                            f"No database connection free after {self.timeout_seconds}s "
+                            f"(pool_size={self.pool_size})"
+                        )
+            if waited_since is not None:
+                self._record_wait(waited_since)
+            self.checkouts += 1
+            generation = self._generation
+            if self._idle:
+                return self._idle.pop(), generation
+            self._total += 1
+
+        try:
+            conn = self.backend.connect()
+        except BaseException:
+            with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self.created += 1
+        return conn, generation
+
+    def _release(self, conn: Any, generation: int) -> None:
+        keep = generation == self._generation
+        if keep:
+            try:
+                self.backend.reset(conn)
+                keep = self.backend.is_usable(conn)
+            except Exception:
+                keep = False
+        if not keep:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+        with self._cond:
+            if keep and generation == self._generation:
+                self._idle.append(conn)
+            else:
+                self._total -= 1
+                if keep:
+                    conn.close()  # close() ran while we were resetting
+            self._cond.notify()
+
+    def _record_wait(self, waited_since: float) -> None:
+        waited = time.monotonic() - waited_since
+        self.wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def close(self) -> None:
+        """Close idle connections; checked-out ones are closed when returned."""
+        with self._cond:
+            self._generation += 1
+            idle, self._idle = self._idle, []
+            self._total -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            idle = len(self._idle)
+            return {
+                "backend": self.backend.name,
+                "pool_size": self.pool_size,
+                "total_connections": self._total,
+                "active_connections": self._total - idle,
+                "idle_connections": idle,
+                "created": self.created,
+                "checkouts": self.checkouts,
+                "waits": self.waits,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.wait_seconds / self.waits * 1000, 2) if self.waits else 0.0,
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 2),
+            }
@@ -7,6 +7,10 @@ Exposes orchestration capabilities via Model Context Protocol:
 - Knowledge Object queries
 - Session state management
 
+Work queues are parsed once per file version (see queue_view.py); list_tasks
+pages through them with cursors and field projection, and tool responses are
+minified JSON (or TOON with format="toon").
+
 Usage:
     python -m orchestration.mcp.orchestrator_server
 
@@ -27,6 +31,7 @@ Version: 1.0
 """
 
 import json
+import os
 import asyncio
 from pathlib import Path
 from typing import Any
@@ -36,21 +41,38 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
+from orchestration.mcp.queue_view import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    RESPONSE_FORMATS,
+    QueueCache,
+    QueueSnapshot,
+    encode_response,
+    paginate,
+    select_fields,
+)
+
 # Initialize the MCP server
 server = Server("ai-orchestrator")
 
+# Parsed work queues, reloaded when the file's mtime changes
+_queue_cache = QueueCache()
+
 
 def get_project_root() -> Path:
     """Get the AI Orchestrator project root directory."""
     return Path(__file__).parent.parent.parent
 
 
-def load_work_queue(project: str) -> dict[str, Any]:
-    """Load work queue for a project."""
-    root = get_project_root()
+def work_queue_path(project: str) -> Path:
+    """Path of a project's work queue file."""
+    return get_project_root() / "tasks" / f"work_queue_{project}.json"
 
+
+def load_work_queue(project: str) -> dict[str, Any]:
+    """Load work queue for a project (a private copy, safe to modify)."""
     # Try JSON file first
-    json_path = root / "tasks" / f"work_queue_{project}.json"
+    json_path = work_queue_path(project)
     if json_path.exists():
         with open(json_path) as f:
             return json.load(f)
@@ -58,14 +80,22 @@ def load_work_queue(project: str) -> dict[str, Any]:
     return {"tasks": [], "error": f"No work queue found for {project}"}
 
 
+def get_work_queue_snapshot(project: str) -> QueueSnapshot | None:
+    """Cached, indexed work queue for read-only use (None if missing)."""
+    return _queue_cache.get(work_queue_path(project))
+
+
 def save_work_queue(project: str, data: dict[str, Any]) -> bool:
     """Save work queue for a project."""
-    root = get_project_root()
-    json_path = root / "tasks" / f"work_queue_{project}.json"
+    json_path = work_queue_path(project)
+    tmp_path = json_path.with_suffix(".json.tmp")
 
     try:
-        with open(json_path, "w") as f:
+        # Write then rename so readers never parse a half-written queue
+        with open(tmp_path, "w") as f:
             json.dump(data, f, indent=2)
+        os.replace(tmp_path, json_path)
+        _queue_cache.invalidate(json_path)
         return True
     except Exception:
         return False
@@ -129,8 +159,23 @@ async def list_tools() -> list[Tool]:
                     },
                     "limit": {
                         "type": "integer",
-                        "description": "Maximum number of tasks to return",
-                        "default": 10
+                        "description": f"Maximum number of tasks to return (at most {MAX_PAGE_SIZE})",
+                        "default": DEFAULT_PAGE_SIZE
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "next_cursor from the previous page"
+                    },
+                    "fields": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Task fields to return (default: all)"
+                    },
+                    "format": {
+                        "type": "string",
+                        "description": "Response encoding (toon: one task per line)",
+                        "enum": list(RESPONSE_FORMATS),
+                        "default": "json"
                     }
                 },
                 "required": ["project"]
@@ -149,6 +194,17 @@ async def list_tools() -> list[Tool]:
                     "task_id": {
                         "type": "string",
                         "description": "Task ID to retrieve"
+                    },
+                    "fields": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Task fields to return (default: all)"
+                    },
+                    "format": {
+                        "type": "string",
+                        "description": "Response encoding",
+                        "enum": list(RESPONSE_FORMATS),
+                        "default": "json"
                     }
                 },
                 "required": ["project", "task_id"]
@@ -304,40 +360,57 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle tool invocations."""
 
     if name == "list_tasks":
-        project = arguments.get("project", "")
+        project_name = arguments.get("project", "")
         status_filter = arguments.get("status")
-        limit = arguments.get("limit", 10)
-
-        queue = load_work_queue(project)
-        tasks = queue.get("tasks", [])
+        limit = arguments.get("limit", DEFAULT_PAGE_SIZE)
+        fmt = arguments.get("format", "json")
 
-        if status_filter:
-            tasks = [t for t in tasks if t.get("status") == status_filter]
+        snapshot = get_work_queue_snapshot(project_name)
+        if snapshot is None:
+            return [TextContent(
+                type="text",
+                text=encode_response(
+                    {"tasks": [], "count": 0, "error": f"No work queue found for {project_name}"}, fmt
+                )
+            )]
 
-        tasks = tasks[:limit]
+        try:
+            tasks, next_cursor = paginate(
+                snapshot,
+                status=status_filter,
+                limit=limit,
+                cursor=arguments.get("cursor"),
+                fields=arguments.get("fields"),
+            )
+        except ValueError as e:
+            return [TextContent(type="text", text=encode_response({"error": str(e)}, fmt))]
 
         return [TextContent(
             type="text",
-            text=json.dumps({"tasks": tasks, "count": len(tasks)}, indent=2)
+            text=encode_response({
+                "tasks": tasks,
+                "count": len(tasks),
+                "total": snapshot.count(status_filter),
+                "next_cursor": next_cursor,
+            }, fmt)
         )]
 
     elif name == "get_task":
-        project = arguments.get("project", "")
+        project_name = arguments.get("project", "")
         task_id = arguments.get("task_id", "")
+        fmt = arguments.get("format", "json")
 
-        queue = load_work_queue(project)
-        tasks = queue.get("tasks", [])
-
-        for task in tasks:
-            if task.get("id") == task_id:
-                return [TextContent(
-                    type="text",
-                    text=json.dumps(task, indent=2)
-                )]
+        snapshot = get_work_queue_snapshot(project_name)
+        task = snapshot.get_task(task_id) if snapshot else None
+        if task is not None:
+            return [TextContent(
+                type="text",
+                text=encode_response(select_fields(task, arguments.get("fields")), fmt)
+            )]
 
         return [TextContent(
             type="text",
-            text=json.dumps({"error": f"Task {task_id} not found"})
+            text=encode_response({"error": f"Task {task_id} not found"}, fmt)
         )]
 
     elif name == "update_task_status":
@@ -359,17 +432,17 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
                 if save_work_queue(project, queue):
                     return [TextContent(
                         type="text",
-                        text=json.dumps({"success": True, "task": task}, indent=2)
+                        text=encode_response({"success": True, "task": task})
                     )]
                 else:
                     return [TextContent(
                         type="text",
-                        text=json.dumps({"error": "Failed to save work queue"})
+                        text=encode_response({"error": "Failed to save work queue"})
                     )]
 
         return [TextContent(
             type="text",
-            text=json.dumps({"error": f"Task {task_id} not found"})
+            text=encode_response({"error": f"Task {task_id} not found"})
         )]
 
     elif name == "verify_changes":
@@ -393,7 +466,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
 
         return [TextContent(
             type="text",
-            text=json.dumps(result, indent=2)
+            text=encode_response(result)
         )]
 
     elif name == "search_knowledge_objects":
@@ -415,14 +488,14 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
 
         return [TextContent(
             type="text",
-            text=json.dumps({"knowledge_objects": kos, "count": len(kos)}, indent=2)
+            text=encode_response({"knowledge_objects": kos, "count": len(kos)})
         )]
 
     elif name == "get_session_state":
         state = get_session_state()
         return [TextContent(
             type="text",
-            text=json.dumps(state, indent=2)
+            text=encode_response(state)
         )]
 
     elif name == "get_autonomy_contract":
@@ -439,7 +512,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
 
         return [TextContent(
             type="text",
-            text=json.dumps({"error": f"Contract {team}.yaml not found"})
+            text=encode_response({"error": f"Contract {team}.yaml not found"})
         )]
 
     # UI/UX Tool Handlers
@@ -492,7 +565,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
 
         return [TextContent(
             type="text",
-            text=json.dumps(result, indent=2)
+            text=encode_response(result)
         )]
 
     elif name == "get_design_patterns":
@@ -528,7 +601,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
 
         return [TextContent(
             type="text",
-            text=json.dumps(result, indent=2)
+            text=encode_response(result)
         )]
 
     elif name == "check_ai_slop":
@@ -569,12 +642,12 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
 
         return [TextContent(
             type="text",
-            text=json.dumps(result, indent=2)
+            text=encode_response(result)
         )]
 
     return [TextContent(
         type="text",
-        text=json.dumps({"error": f"Unknown tool: {name}"})
+        text=encode_response({"error": f"Unknown tool: {name}"})
     )]
 
 
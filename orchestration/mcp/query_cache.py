@@ -0,0 +1,251 @@
+"""
+Query Result Cache for DatabaseQueryMCP
+
+Bounded cache of SELECT results that is invalidated by writes.
+
+Features:
+- LRU eviction by entry count and by estimated result size (bytes)
+- TTL expiry, so results never outlive ttl_seconds even without writes
+- Table-level invalidation: each entry records the tables its SELECT reads,
+  and a write drops every entry that read a table it touches
+- Generation check: a result computed while a write committed is not cached
+- Hit / miss / eviction counters for get_metrics()
+
+Usage:
+    from orchestration.mcp.query_cache import QueryCache, extract_tables
+
+    cache = QueryCache(max_entries=1000, ttl_seconds=300, max_bytes=64 * 1024 * 1024)
+    generation = cache.generation
+    ...execute the SELECT...
+    cache.put(key, result, extract_tables(sql), generation)
+
+    cache.invalidate_tables(extract_tables("UPDATE users SET name = ?"))
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Set
+
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_TTL_SECONDS = 300.0
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Identifier: plain, "quoted", `quoted` or [bracketed], optionally schema-qualified
+_IDENT = r'(?:"[^"]+"|`[^`]+`|\[[^\]]+\]|[A-Za-z_][\w$]*)'
+_QUALIFIED = rf'{_IDENT}(?:\s*\.\s*{_IDENT})?'
+
+# Every name after FROM, JOIN or a comma: over-includes column names in
+# select lists (harmless: an extra invalidation key) but never misses a table
+# in a comma join
+_READ_TABLES = re.compile(rf'(?:\bFROM|\bJOIN|,)\s*({_QUALIFIED})', re.IGNORECASE)
+_WRITE_TABLE = re.compile(
+    rf'^\s*(?:'
+    rf'INSERT\s+(?:OR\s+\w+\s+)?INTO|REPLACE\s+INTO|UPDATE(?:\s+OR\s+\w+)?|DELETE\s+FROM'
+    rf'|(?:CREATE|ALTER|DROP)\s+(?:TEMP(?:ORARY)?\s+)?(?:TABLE|VIEW)(?:\s+IF\s+(?:NOT\s+)?EXISTS)?'
+    rf'|CREATE\s+(?:UNIQUE\s+)?INDEX(?:\s+IF\s+NOT\s+EXISTS)?\s+{_QUALIFIED}\s+ON'
+    rf')\s+({_QUALIFIED})',
+    re.IGNORECASE,
+)
+
+
+def _normalize(identifier: str) -> str:
+    """users, "Users", main.users -> users"""
+    name = identifier.split(".")[-1].strip()
+    return name.strip('"`[]').lower()
+
+
+def extract_tables(sql: str) -> Optional[FrozenSet[str]]:
+    """
+    Tables a statement reads (SELECT) or writes (everything else).
+
+    Returns:
+        Lower-cased table names, or None when a write's target can't be
+        determined (callers should then invalidate everything)
+    """
+    first_word = sql.lstrip().split(None, 1)[0].upper() if sql.strip() else ""
+    if first_word in ("SELECT", "WITH", "VALUES"):
+        tables: Set[str] = set()
+        for match in _READ_TABLES.finditer(sql):
+            tables.add(_normalize(match.group(1)))
+        return frozenset(tables)
+
+    match = _WRITE_TABLE.match(sql)
+    if not match:
+        return None
+    return frozenset({_normalize(match.group(1))})
+
+
+def _estimate_size(value: Any) -> int:
+    """Rough in-memory size of a result's rows, in bytes."""
+    if isinstance(value, dict):
+        return 64 + sum(_estimate_size(k) + _estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return 56 + sum(_estimate_size(v) for v in value)
+    if isinstance(value, (str, bytes)):
+        return 49 + len(value)
+    return 28
+
+
+@dataclass
+class _Entry:
+    value: Any
+    tables: FrozenSet[str]
+    size: int
+    expires_at: float
+
+
+class QueryCache:
+    """Thread-safe LRU + TTL + byte-budget cache with table invalidation."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._by_table: Dict[str, Set[str]] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.generation = 0  # Bumped by every invalidation
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.rejected = 0  # Results larger than the whole budget
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._drop(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def put(
+        self,
+        key: str,
+        value: Any,
+        tables: Iterable[str],
+        generation: Optional[int] = None,
+        size: Optional[int] = None,
+    ) -> bool:
+        """
+        Cache a result.
+
+        Args:
+            key: Cache key
+            value: Result to cache
+            tables: Tables the query read
+            generation: self.generation read before running the query; the
+                result is dropped if an invalidation happened since
+            size: Size in bytes (estimated from value if omitted)
+
+        Returns:
+            True if cached
+        """
+        if size is None:
+            size = _estimate_size(getattr(value, "rows", value))
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return False
+            if size > self.max_bytes or self.max_entries <= 0:
+                self.rejected += 1
+                return False
+
+            if key in self._entries:
+                self._drop(key)
+            entry = _Entry(value, frozenset(tables), size, time.monotonic() + self.ttl_seconds)
+            self._entries[key] = entry
+            self._bytes += size
+            for table in entry.tables:
+                self._by_table.setdefault(table, set()).add(key)
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+            return True
+
+    def invalidate_tables(self, tables: Optional[Iterable[str]]) -> int:
+        """
+        Drop entries that read any of tables (None = everything).
+
+        Returns:
+            Entries dropped
+        """
+        with self._lock:
+            self.generation += 1
+            if tables is None:
+                dropped = len(self._entries)
+                self._clear()
+            else:
+                keys = set()
+                for table in tables:
+                    keys |= self._by_table.get(table, set())
+                for key in keys:
+                    self._drop(key)
+                dropped = len(keys)
+            self.invalidations += dropped
+            return dropped
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "rejected": self.rejected,
+            }
+
+    # Private (caller holds the lock)
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        for table in entry.tables:
+            keys = self._by_table.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_table[table]
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self._by_table.clear()
+        self._bytes = 0
@@ -0,0 +1,233 @@
+"""
+Work Queue Views for the Orchestrator MCP Server
+
+Parsed work queues cached by file mtime, with cursor pagination, field
+projection and compact response encoding, so list_tasks / get_task don't
+re-parse the queue JSON or return pretty-printed megabytes per call.
+
+Features:
+- QueueCache: one parse per queue file version (keyed by mtime_ns + size),
+  with id and status indexes built once per parse
+- Cursor pagination: opaque cursors resume after the last returned task,
+  and survive tasks being appended or reordered between pages
+- Field projection: return only the task fields an agent asked for
+- Compact encoding: minified JSON, or TOON (one task per line) via
+  optimization.toon_format
+
+Usage:
+    from orchestration.mcp.queue_view import QueueCache, paginate, encode_response
+
+    cache = QueueCache()
+    snapshot = cache.get(Path("tasks/work_queue_karematch.json"))
+    tasks, next_cursor = paginate(snapshot, status="pending", limit=20)
+    text = encode_response({"tasks": tasks, "next_cursor": next_cursor}, fmt="toon")
+"""
+
+import base64
+import binascii
+import bisect
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from optimization.toon_format import TOONFormatter
+
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 100
+
+RESPONSE_FORMATS = ("json", "toon")
+
+_toon = TOONFormatter()
+
+
+@dataclass
+class QueueSnapshot:
+    """One parsed version of a work queue file."""
+    path: Path
+    mtime_ns: int
+    size: int
+    data: Dict[str, Any]
+    by_id: Dict[str, int] = field(default_factory=dict)  # task id -> position
+    by_status: Dict[str, List[int]] = field(default_factory=dict)  # status -> positions
+
+    @property
+    def tasks(self) -> List[Dict[str, Any]]:
+        return self.data.get("tasks", [])
+
+    def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
+        position = self.by_id.get(task_id)
+        return self.tasks[position] if position is not None else None
+
+    def count(self, status: Optional[str] = None) -> int:
+        return len(self.by_status.get(status, ())) if status else len(self.tasks)
+
+
+class QueueCache:
+    """Parsed work queues, re-read only when the file changes on disk."""
+
+    def __init__(self):
+        self._snapshots: Dict[Path, QueueSnapshot] = {}
+        self._lock = threading.Lock()
+
+        # Stats
+        self.hits = 0
+        self.loads = 0
+
+    def get(self, path: Path) -> Optional[QueueSnapshot]:
+        """
+        Current snapshot of a queue file.
+
+        Returns:
+            Snapshot, or None if the file doesn't exist
+
+        Raises:
+            json.JSONDecodeError: File isn't valid JSON (and wasn't cached)
+        """
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._snapshots.pop(path, None)
+            return None
+
+        with self._lock:
+            cached = self._snapshots.get(path)
+            if cached and (cached.mtime_ns, cached.size) == (st.st_mtime_ns, st.st_size):
+                self.hits += 1
+                return cached
+
+        with open(path) as f:
+            data = json.load(f)
+        snapshot = _index(QueueSnapshot(path, st.st_mtime_ns, st.st_size, data))
+
+        with self._lock:
+            self._snapshots[path] = snapshot
+            self.loads += 1
+        return snapshot
+
+    def invalidate(self, path: Path) -> None:
+        with self._lock:
+            self._snapshots.pop(path, None)
+
+
+def _index(snapshot: QueueSnapshot) -> QueueSnapshot:
+    for position, task in enumerate(snapshot.tasks):
+        task_id = task.get("id")
+        if task_id is not None:
+            snapshot.by_id.setdefault(str(task_id), position)
+        snapshot.by_status.setdefault(task.get("status"), []).append(position)
+    return snapshot
+
+
+# ─── Pagination ──────────────────────────────────────────────────────────────
+
+
+def encode_cursor(position: int, task_id: Any) -> str:
+    raw = json.dumps({"p": position, "id": task_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[int, Any]:
+    """(position, task id) of the last task on the previous page."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        decoded = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return int(decoded["p"]), decoded.get("id")
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def paginate(
+    snapshot: QueueSnapshot,
+    status: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    One page of tasks in queue order.
+
+    Args:
+        snapshot: Queue to page through
+        status: Only tasks with this status
+        limit: Page size (capped at MAX_PAGE_SIZE)
+        cursor: next_cursor from the previous page
+        fields: Task fields to return (all when omitted)
+
+    Returns:
+        (tasks, next_cursor); next_cursor is None on the last page
+
+    Raises:
+        ValueError: Malformed cursor
+    """
+    limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+    start = 0
+    if cursor:
+        position, task_id = decode_cursor(cursor)
+        # Resume after the same task even if earlier tasks were inserted
+        position = snapshot.by_id.get(str(task_id), position) if task_id is not None else position
+        start = position + 1
+
+    positions: Sequence[int]
+    if status:
+        matching = snapshot.by_status.get(status, [])
+        positions = matching[bisect.bisect_left(matching, start):]
+    else:
+        positions = range(start, len(snapshot.tasks))
+
+    page = list(positions[:limit + 1])
+    has_more = len(page) > limit
+    page = page[:limit]
+
+    tasks = [select_fields(snapshot.tasks[p], fields) for p in page]
+    next_cursor = None
+    if has_more and page:
+        last = page[-1]
+        next_cursor = encode_cursor(last, snapshot.tasks[last].get("id"))
+    return tasks, next_cursor
+
+
+def select_fields(task: Dict[str, Any], fields: Optional[Sequence[str]]) -> Dict[str, Any]:
+    """Task restricted to fields (plus its id)."""
+    if not fields:
+        return task
+    wanted = ["id", *(f for f in fields if f != "id")]
+    return {f: task[f] for f in wanted if f in task}
+
+
+# ─── Encoding ────────────────────────────────────────────────────────────────
+
+
+def encode_response(payload: Any, fmt: str = "json") -> str:
+    """
+    Encode a tool response compactly.
+
+    "json" is minified JSON. "toon" renders the top-level scalars as one TOON
+    line and each item of a "tasks" list as its own TOON line; payloads
+    without a tasks list become a single TOON line. Line breaks inside
+    values are written as a literal "\\n" so each task stays on one line.
+    """
+    if fmt == "toon" and isinstance(payload, dict):
+        payload = _single_line(payload)
+        items = payload.get("tasks")
+        if isinstance(items, list) and all(isinstance(t, dict) for t in items):
+            header = {k: v for k, v in payload.items() if k != "tasks" and v is not None}
+            return "\n".join([_toon.to_toon(header), *(_toon.to_toon(t) for t in items)])
+        return _toon.to_toon(payload)
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+
+def _single_line(value: Any) -> Any:
+    """Copy of value with line breaks in strings (and keys) escaped as "\\n"."""
+    if isinstance(value, str):
+        if "\n" in value or "\r" in value:
+            return value.replace("\r\n", "\\n").replace("\r", "\\n").replace("\n", "\\n")
+        return value
+    if isinstance(value, dict):
+        return {_single_line(k): _single_line(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_single_line(v) for v in value]
+    return value
@@ -4,8 +4,8 @@ Ralph Verification MCP Server (Phase 2A-1)
 Wraps Ralph verification tool as MCP server with:
 - Secure verification execution
 - Cost tracking per verification
-- Result caching
-- Batch operations
+- Result caching per (content hash, check), LRU-bounded
+- Batch operations: identical contents deduped, checks run in a worker pool
 - Integration with SpecialistAgent
 
 Author: Claude Code (TDD Implementation)
@@ -14,13 +14,24 @@ Version: 1.0
 """
 
 import hashlib
+import queue
 import time
 import threading
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
+# Check results kept in the (content hash, check) cache
+DEFAULT_CACHE_MAX_ENTRIES = 4096
+
+# Worker threads for verify_batch
+DEFAULT_MAX_WORKERS = 8
+
+# Guardrail checks that run whatever checks were requested
+ALWAYS_RUN_CHECKS = ("security", "linting")
+
 
 class VerificationResult(str, Enum):
     """Ralph verification results"""
@@ -44,6 +55,16 @@ class RalphVerificationResponse:
     cached: bool
 
 
+@dataclass
+class CheckOutcome:
+    """Result of one check on one file content"""
+    passed: int = 0
+    failed: int = 0
+    blocked: int = 0
+    issues: List[str] = field(default_factory=list)
+    execution_time_ms: float = 0.0
+
+
 @dataclass
 class VerificationMetrics:
     """Metrics for a single verification"""
@@ -67,14 +88,25 @@ class RalphVerificationMCP:
         "formatting": 0.0002,
     }
 
-    def __init__(self, timeout_seconds: int = 30, enable_caching: bool = True):
+    def __init__(
+        self,
+        timeout_seconds: int = 30,
+        enable_caching: bool = True,
+        cache_max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
         """Initialize Ralph Verification MCP server"""
         self.timeout_seconds = timeout_seconds
         self.enable_caching = enable_caching
+        self.cache_max_entries = cache_max_entries
+        self.max_workers = max_workers
 
-        # Cache: hash -> response
-        self._cache: Dict[str, RalphVerificationResponse] = {}
+        # Cache: (content hash, check name) -> outcome, least recently used first
+        self._cache: "OrderedDict[Tuple[str, str], CheckOutcome]" = OrderedDict()
         self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
 
         # Metrics tracking
         self._metrics: List[VerificationMetrics] = []
@@ -94,69 +126,17 @@ class RalphVerificationMCP:
         if not file_path:
             raise ValueError("file_path cannot be empty")
 
-        # Generate cache key
-        cache_key = self._generate_cache_key(file_path, code_content)
-
-        # Check cache
-        if self.enable_caching:
-            with self._cache_lock:
-                if cache_key in self._cache:
-                    cached = self._cache[cache_key]
-                    return self._return_cached_response(cached)
-
-        # Perform verification
-        start_time = time.time()
         checks_list = checks or ["linting"]
-        result = self._do_verify(file_path, code_content, checks_list)
-        execution_time_ms = (time.time() - start_time) * 1000
-
-        # Calculate cost
-        cost = self._calculate_cost(checks_list)
+        content_hash = self._hash_content(code_content)
 
-        # Create response
-        response = RalphVerificationResponse(
-            file_path=file_path,
-            result=result["status"],
-            passed_count=result.get("passed", 0),
-            failed_count=result.get("failed", 0),
-            blocked_count=result.get("blocked", 0),
-            issues=result.get("issues", []),
-            cost_usd=cost,
-            execution_time_ms=execution_time_ms,
-            cached=False,
-        )
+        outcomes = self._cached_outcomes(content_hash, checks_list)
+        missing = [c for c in self._checks_to_run(checks_list) if c not in outcomes]
+        for check in missing:
+            outcomes[check] = self._run_check(check, code_content)
+            self._cache_outcome(content_hash, check, outcomes[check])
 
-        # Cache result
-        if self.enable_caching:
-            with self._cache_lock:
-                self._cache[cache_key] = response
-
-        # Track cost
-        with self._cost_lock:
-            self._total_cost += cost
-
-        # Track metrics
-        self._track_metric(
-            file_path, code_content, result["status"],
-            execution_time_ms, cost
-        )
-
-        return response
-
-    def _return_cached_response(
-        self, cached_response: RalphVerificationResponse
-    ) -> RalphVerificationResponse:
-        """Return a cached response with cached flag set to True"""
-        return RalphVerificationResponse(
-            file_path=cached_response.file_path,
-            result=cached_response.result,
-            passed_count=cached_response.passed_count,
-            failed_count=cached_response.failed_count,
-            blocked_count=cached_response.blocked_count,
-            issues=cached_response.issues,
-            cost_usd=cached_response.cost_usd,
-            execution_time_ms=cached_response.execution_time_ms,
-            cached=True,
+        return self._build_response(
+            file_path, content_hash, checks_list, outcomes, cached=not missing
         )
 
     def verify_batch(
@@ -164,21 +144,76 @@ class RalphVerificationMCP:
         files: List[Tuple[str, str]],
         checks: Optional[List[str]] = None,
         stop_on_failure: bool = False,
+        max_workers: Optional[int] = None,
     ) -> List[RalphVerificationResponse]:
-        """Verify multiple files"""
-        results = []
+        """
+        Verify multiple files concurrently.
+
+        Identical contents are checked once, and every (content, check) pair
+        not already cached runs in a worker pool, so a batch takes roughly as
+        long as its slowest file.
+
+        Args:
+            files: (file_path, code_content) pairs
+            checks: Check types to run (default: linting)
+            stop_on_failure: Drop results after the first FAIL (in input order)
+            max_workers: Worker threads (default: self.max_workers)
+
+        Returns:
+            Responses in input order (files whose checks errored are skipped)
+        """
+        checks_list = checks or ["linting"]
+        to_run = self._checks_to_run(checks_list)
 
+        # Dedupe contents, then find the (content, check) pairs to compute
+        contents: Dict[str, str] = {}
+        hashes = []
         for file_path, code_content in files:
-            try:
-                result = self.verify_file(file_path, code_content, checks)
-                results.append(result)
+            if not file_path:
+                print("Error verifying <empty path>: file_path cannot be empty")
+                hashes.append(None)
+                continue
+            content_hash = self._hash_content(code_content)
+            contents.setdefault(content_hash, code_content)
+            hashes.append(content_hash)
+
+        outcomes = {h: self._cached_outcomes(h, checks_list) for h in contents}
+        jobs = [(h, c) for h in contents for c in to_run if c not in outcomes[h]]
+        computed = set()
+        errors: Dict[str, Exception] = {}
+
+        if jobs:
+            workers = max(1, min(max_workers or self.max_workers, len(jobs)))
+            finished = self._run_checks(jobs, contents, workers)
+            for h, c in jobs:
+                outcome = finished.get((h, c))
+                if outcome is None:
+                    outcome = TimeoutError(f"{c} check exceeded {self.timeout_seconds}s")
+                if isinstance(outcome, Exception):
+                    errors.setdefault(h, outcome)
+                    continue
+                outcomes[h][c] = outcome
+                computed.add(h)
+                self._cache_outcome(h, c, outcome)
 
-                if stop_on_failure and result.result == VerificationResult.FAIL:
-                    break
-            except Exception as e:
-                # Log error but continue
-                print(f"Error verifying {file_path}: {e}")
+        results = []
+        reported = set()  # Duplicate contents are charged once
+        for (file_path, _), content_hash in zip(files, hashes):
+            if content_hash is None:
                 continue
+            if content_hash in errors:
+                error = errors[content_hash]
+                print(f"Error verifying {file_path}: {str(error) or type(error).__name__}")
+                continue
+            fresh = content_hash in computed and content_hash not in reported
+            reported.add(content_hash)
+            result = self._build_response(
+                file_path, content_hash, checks_list, outcomes[content_hash], cached=not fresh
+            )
+            results.append(result)
+
+            if stop_on_failure and result.result == VerificationResult.FAIL:
+                break
 
         return results
 
@@ -221,7 +256,7 @@ class RalphVerificationMCP:
             self._cache.clear()
 
     def get_cache_size(self) -> int:
-        """Get number of cached results"""
+        """Get number of cached (content, check) results"""
         with self._cache_lock:
             return len(self._cache)
 
@@ -233,6 +268,7 @@ class RalphVerificationMCP:
                     "total_verifications": 0,
                     "total_cost_usd": 0.0,
                     "average_execution_time_ms": 0.0,
+                    "cache": self._cache_stats(),
                 }
 
             total_time = sum(m.execution_time_ms for m in self._metrics)
@@ -240,6 +276,19 @@ class RalphVerificationMCP:
                 "total_verifications": len(self._metrics),
                 "total_cost_usd": self.get_accumulated_cost(),
                 "average_execution_time_ms": total_time / len(self._metrics),
+                "cache": self._cache_stats(),
+            }
+
+    def _cache_stats(self) -> Dict[str, Any]:
+        with self._cache_lock:
+            lookups = self._cache_hits + self._cache_misses
+            return {
+                "entries": len(self._cache),
+                "max_entries": self.cache_max_entries,
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "hit_rate": round(self._cache_hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._cache_evictions,
             }
 
     def get_pass_fail_stats(self) -> Dict[str, int]:
@@ -268,7 +317,7 @@ class RalphVerificationMCP:
                 },
             },
             "verify_batch": {
-                "description": "Verify multiple files",
+                "description": "Verify multiple files concurrently",
                 "parameters": {
                     "files":
                         "List of (file_path, code_content) tuples",
@@ -303,26 +352,157 @@ class RalphVerificationMCP:
     # Private methods
 
     @staticmethod
-    def _generate_cache_key(file_path: str, code_content: str) -> str:
-        """Generate cache key from file path and content"""
-        content_hash = hashlib.md5(code_content.encode()).hexdigest()
-        return f"{file_path}:{content_hash}"
-
-    def _do_verify(
-        self, file_path: str, code_content: str, checks: List[str]
-    ) -> Dict[str, Any]:
-        """Perform actual verification (placeholder - would call Ralph)"""
+    def _hash_content(code_content: str) -> str:
+        """Hash file content (cache key component, shared by identical files)"""
+        return hashlib.md5(code_content.encode()).hexdigest()
+
+    @staticmethod
+    def _checks_to_run(checks: List[str]) -> List[str]:
+        """Guardrail checks plus the requested ones, without duplicates"""
+        return list(dict.fromkeys([*ALWAYS_RUN_CHECKS, *checks]))
+
+    def _cached_outcomes(
+        self, content_hash: str, checks: List[str]
+    ) -> Dict[str, CheckOutcome]:
+        """Cached outcomes for the checks that would run on this content"""
+        outcomes = {}
+        if not self.enable_caching:
+            return outcomes
+        with self._cache_lock:
+            for check in self._checks_to_run(checks):
+                outcome = self._cache.get((content_hash, check))
+                if outcome is None:
+                    self._cache_misses += 1
+                    continue
+                self._cache.move_to_end((content_hash, check))
+                self._cache_hits += 1
+                outcomes[check] = outcome
+        return outcomes
+
+    def _cache_outcome(
+        self, content_hash: str, check: str, outcome: CheckOutcome
+    ) -> None:
+        if not self.enable_caching or self.cache_max_entries <= 0:
+            return
+        with self._cache_lock:
+            self._cache[(content_hash, check)] = outcome
+            self._cache.move_to_end((content_hash, check))
+            while len(self._cache) > self.cache_max_entries:
+                self._cache.popitem(last=False)
+                self._cache_evictions += 1
+
+    def _build_response(
+        self,
+        file_path: str,
+        content_hash: str,
+        checks: List[str],
+        outcomes: Dict[str, CheckOutcome],
+        cached: bool,
+    ) -> RalphVerificationResponse:
+        """Combine per-check outcomes; fresh responses are charged and tracked"""
+        ordered = [outcomes[c] for c in self._checks_to_run(checks)]
+        issues = [issue for o in ordered for issue in o.issues]
+        blocked = sum(o.blocked for o in ordered)
+
+        if not issues:
+            status = VerificationResult.PASS
+        elif blocked > 0:
+            status = VerificationResult.BLOCKED
+        else:
+            status = VerificationResult.FAIL
+
+        cost = self._calculate_cost(checks)
+        execution_time_ms = sum(o.execution_time_ms for o in ordered)
+        response = RalphVerificationResponse(
+            file_path=file_path,
+            result=status,
+            passed_count=sum(o.passed for o in ordered),
+            failed_count=sum(o.failed for o in ordered),
+            blocked_count=blocked,
+            issues=issues,
+            cost_usd=cost,
+            execution_time_ms=execution_time_ms,
+            cached=cached,
+        )
+
+        if not cached:
+            with self._cost_lock:
+                self._total_cost += cost
+            self._track_metric(file_path, content_hash, status, execution_time_ms, cost)
+
+        return response
+
+    def _run_checks(
+        self, jobs: List[Tuple[str, str]], contents: Dict[str, str], workers: int
+    ) -> Dict[Tuple[str, str], Any]:
+        """
+        Run (content hash, check) jobs on daemon worker threads.
+
+        Returns when every job finished or timeout_seconds elapsed. On timeout,
+        queued jobs are cancelled and workers stop taking new ones; a check
+        already running can't be interrupted, so its thread is left to finish
+        as a daemon (it never delays the caller or interpreter exit) and its
+        result is discarded.
+
+        Returns:
+            (content hash, check) -> CheckOutcome or the exception raised,
+            for the jobs that finished in time
+        """
+        pending: "queue.SimpleQueue[Tuple[str, str]]" = queue.SimpleQueue()
+        for job in jobs:
+            pending.put(job)
+        finished: Dict[Tuple[str, str], Any] = {}
+        cancelled = threading.Event()
+        done = threading.Condition()
+
+        def work() -> None:
+            while not cancelled.is_set():
+                try:
+                    h, c = pending.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    outcome: Any = self._run_check(c, contents[h])
+                except Exception as e:
+                    outcome = e
+                with done:
+                    if cancelled.is_set():
+                        return  # Timed out; the caller has moved on
+                    finished[(h, c)] = outcome
+                    done.notify()
+
+        for i in range(workers):
+            threading.Thread(target=work, name=f"ralph-verify-{i}", daemon=True).start()
+
+        deadline = time.monotonic() + self.timeout_seconds
+        with done:
+            while len(finished) < len(jobs):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                done.wait(remaining)
+            cancelled.set()
+            return dict(finished)
+
+    def _run_check(self, check: str, code_content: str) -> CheckOutcome:
+        """Run one check (placeholder - would call Ralph)"""
         # This is a placeholder implementation
         # In production, this would call the actual Ralph CLI or API
-        # Note: file_path and checks used for routing to specific verifiers
-
-        # Simulate verification based on code patterns
-        issues = []
-        failed = 0
-        blocked = 0
-        passed = 0
+        start_time = time.perf_counter()
+        if check == "security":
+            outcome = self._check_dangerous_patterns(code_content)
+        elif check == "linting":
+            outcome = self._check_operator_spacing(code_content)
+        else:
+            # No local verifier for this check type yet; passed_count keeps
+            # counting the linting verdict only, as before per-check runs
+            outcome = CheckOutcome()
+        outcome.execution_time_ms = (time.perf_counter() - start_time) * 1000
+        return outcome
 
-        # Detect dangerous patterns
+    @staticmethod
+    def _check_dangerous_patterns(code_content: str) -> CheckOutcome:
+        """Guardrail: block dangerous calls"""
         dangerous_patterns = [
             "os.system(",
             "subprocess.run(",
@@ -333,36 +513,23 @@ class RalphVerificationMCP:
             "open('/etc/",
         ]
 
+        outcome = CheckOutcome()
         for pattern in dangerous_patterns:
             if pattern in code_content:
-                blocked += 1
-                issues.append(f"Security issue: {pattern} detected")
+                outcome.blocked += 1
+                outcome.issues.append(f"Security issue: {pattern} detected")
+        return outcome
 
-        # Detect basic formatting issues
+    @staticmethod
+    def _check_operator_spacing(code_content: str) -> CheckOutcome:
+        """Detect basic formatting issues"""
         if code_content.count("=") > code_content.count(" = "):
             msg = (
                 "Formatting issue: "
                 "Missing spaces around operators"
             )
-            issues.append(msg)
-            failed += 1
-        else:
-            passed += 1
-
-        if not issues:
-            status = VerificationResult.PASS
-        elif blocked > 0:
-            status = VerificationResult.BLOCKED
-        else:
-            status = VerificationResult.FAIL
-
-        return {
-            "status": status,
-            "passed": passed,
-            "failed": failed,
-            "blocked": blocked,
-            "issues": issues,
-        }
+            return CheckOutcome(failed=1, issues=[msg])
+        return CheckOutcome(passed=1)
 
     def _calculate_cost(self, checks: List[str]) -> float:
         """Calculate verification cost"""
@@ -374,14 +541,14 @@ class RalphVerificationMCP:
         return cost
 
     def _track_metric(
-        self, file_path: str, code_content: str, result: VerificationResult,
+        self, file_path: str, code_hash: str, result: VerificationResult,
         execution_time_ms: float, cost_usd: float
     ) -> None:
         """Track verification metric"""
         metric = VerificationMetrics(
             timestamp=datetime.now(),
             file_path=file_path,
-            code_hash=hashlib.md5(code_content.encode()).hexdigest(),
+            code_hash=code_hash,
             result=result,
             execution_time_ms=execution_time_ms,
             cost_usd=cost_usd,
@@ -33,6 +33,7 @@ class LoopConfig:
     auto_commit: bool = True
     work_queue_path: Optional[Path] = None
     enable_metrics: bool = True  # Enable metrics collection
+    reuse_session: bool = False  # One Agent SDK conversation per task across retries
 
     def __post_init__(self) -> None:
         if self.work_queue_path is None:
@@ -80,6 +81,7 @@ class SimplifiedLoop:
         self.iterations = 0
         self._result = LoopResult()
         self._metrics: Optional[MetricsCollector] = None
+        self._session: Optional[Any] = None  # AgentSession for the current task
         if config.enable_metrics:
             metrics_dir = config.project_dir / ".metrics"
             self._metrics = MetricsCollector(storage_dir=metrics_dir)
@@ -210,7 +212,32 @@ class SimplifiedLoop:
         )
 
     async def _execute_task_with_retries(self, task: Task) -> TaskResult:
-        """Execute a task with bounded retries and self-correction."""
+        """
+        Execute a task with bounded retries and self-correction.
+
+        With config.reuse_session, all attempts share one warm Agent SDK
+        conversation and retry context is sent as a follow-up message.
+        """
+        if self.config.reuse_session:
+            self._session = await self._open_session()
+        try:
+            return await self._attempt_task(task)
+        finally:
+            session, self._session = self._session, None
+            if session is not None:
+                await asyncio.get_running_loop().run_in_executor(None, session.close)
+
+    async def _open_session(self) -> Optional[Any]:
+        from claude.sdk_adapter import ClaudeSDKAdapter
+
+        adapter = ClaudeSDKAdapter(self.config.project_dir, enable_startup_protocol=False)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(None, adapter.open_session)
+        except RuntimeError as e:
+            print(f"⚠️  Session reuse unavailable, using a fresh run per attempt: {e}")
+            return None
+
+    async def _attempt_task(self, task: Task) -> TaskResult:
         max_retries = getattr(task, 'max_iterations', 5)
         previous_errors: List[str] = []
         files: List[str] = []
@@ -302,6 +329,27 @@ class SimplifiedLoop:
         if hasattr(task, 'tests') and task.tests:
             prompt_parts.append(f"Tests: {', '.join(task.tests)}")
 
+        if self._session is not None:
+            # Same conversation: the task was already sent, context is the follow-up
+            self._session.queue_follow_up(context)
+            result = await self._session.execute_task_async(
+                prompt="\n".join(prompt_parts), timeout=300
+            )
+            try:
+                files = self._git_changed_files()
+            except (FileNotFoundError, subprocess.TimeoutExpired):
+                files = []
+            files += [f for f in result.files_changed if f not in files]
+
+            session_result: dict[str, Any] = {
+                "success": result.success,
+                "files": files if files else [task.file],
+                "output": result.output
+            }
+            if result.error:
+                session_result["error"] = result.error
+            return session_result
+
         if context:
             prompt_parts.append(f"\n{context}")
 
@@ -318,14 +366,7 @@ class SimplifiedLoop:
             )
 
             # Get changed files from git
-            changed = subprocess.run(
-                ["git", "diff", "--name-only", "HEAD"],
-                cwd=self.config.project_dir,
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            files = [f.strip() for f in changed.stdout.split('\n') if f.strip()]
+            files = self._git_changed_files()
 
             return {
                 "success": result.returncode == 0,
@@ -338,6 +379,17 @@ class SimplifiedLoop:
             # Claude CLI not installed - return mock for testing
             return {"success": True, "files": [task.file]}
 
+    def _git_changed_files(self) -> List[str]:
+        """Files changed relative to HEAD."""
+        changed = subprocess.run(
+            ["git", "diff", "--name-only", "HEAD"],
+            cwd=self.config.project_dir,
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        return [f.strip() for f in changed.stdout.split('\n') if f.strip()]
+
     def _fast_verify(self, files: List[str]) -> VerifyResult:
         """Fast verification of changes using tiered verification."""
         verifier = FastVerify(self.config.project_dir)
@@ -587,20 +587,21 @@ class SpecialistAgent:
             # Run in thread pool (execute_task is synchronous)
             loop = asyncio.get_event_loop()
 
-            # Wrap execution in serialization queue to prevent "database locked" errors
-            # when multiple CLI processes access the same session database
-            result = await CliProcessManager.run_serialized(
-                lambda: loop.run_in_executor(
+            # Bounded, fair scheduling: each run gets its own worker slot
+            # (isolated config/session dirs), so parallel specialists don't
+            # contend on one session database
+            async with CliProcessManager.scheduler().slot(owner=self.agent_type) as worker:
+                result = await loop.run_in_executor(
                     None,
                     lambda: wrapper.execute_task(
                         prompt=prompt,
                         files=subtask.get("files", []),
                         timeout=self.iteration_budget * 60,  # 1 min per iteration
                         allow_dangerous_permissions=True,  # Skip permission prompts
-                        task_type=self.agent_type  # For startup protocol
+                        task_type=self.agent_type,  # For startup protocol
+                        env=worker.env()
                     )
                 )
-            )
 
             # Parse CLI result and return output
             return self._parse_cli_result(result)
@@ -674,10 +675,12 @@ Now proceed with the task.
         """
         Parse Claude CLI wrapper result.
 
-        When --output-format json is used, the output is a JSON string like:
+        The CLI runs with --output-format stream-json --verbose, and the
+        output pipeline assembles result.output from the streamed text
+        events. Older callers may still hand over a single JSON result like:
         {"type":"result","subtype":"success","result":"...actual agent text..."}
 
-        This method extracts the inner "result" field so that completion
+        This method unwraps that inner "result" field so that completion
         signal detection (<promise> tags) works correctly.
 
         Args:
@@ -695,8 +698,8 @@ Now proceed with the task.
             else:
                 raw_output = str(result)
 
-            # Try to extract the inner "result" field from JSON output
-            # Claude CLI with --output-format json wraps output like:
+            # Output assembled by the pipeline from stream-json events is
+            # plain text; unwrap a bare JSON result object if one is passed:
             # {"type":"result","result":"<actual agent text>"}
             if raw_output.strip().startswith("{"):
                 try:
@@ -6,16 +6,26 @@ Provides live updates to React dashboard showing:
 - Ralph verdict results
 - Agent iteration counts
 - Full execution history
+
+Events flow: stream_event() -> event_queue -> EventBroadcaster (one producer
+task) -> per-client bounded buffer -> per-client send loop. Clients are
+served concurrently; a slow client drops/coalesces its own backlog instead
+of stalling everyone else.
 """
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 import asyncio
 import json
+import os
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional
 import logging
 
+from monitoring.metrics import REGISTRY, render_prometheus
+from orchestration.event_broadcaster import EventBroadcaster
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -46,6 +56,16 @@ event_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
 # Active WebSocket connections
 active_connections: list[WebSocket] = []
 
+# Fan-out from event_queue to per-client buffers
+broadcaster = EventBroadcaster(
+    buffer_size=int(os.environ.get("AIBRAIN_WS_BUFFER_SIZE", "256")),
+    replay_size=int(os.environ.get("AIBRAIN_WS_REPLAY_SIZE", "50")),
+    policy=os.environ.get("AIBRAIN_WS_OVERFLOW_POLICY", "drop_oldest"),
+)
+
+# Disconnect clients whose socket has not accepted a frame for this long
+SEND_TIMEOUT_SECONDS = 10.0
+
 
 @app.get("/health")
 async def health_check() -> dict[str, Any]:
@@ -53,10 +73,48 @@ async def health_check() -> dict[str, Any]:
     return {
         "status": "healthy",
         "active_connections": len(active_connections),
-        "events_queued": event_queue.qsize()
+        "events_queued": event_queue.qsize(),
+        "broadcast": {
+            key: value for key, value in broadcaster.stats().items()
+            if key != "per_subscriber"
+        },
     }
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics() -> PlainTextResponse:
+    """Prometheus scrape endpoint (all live MetricsCollectors + server gauges)."""
+    stats = broadcaster.stats()
+    REGISTRY.set("websocket.connections", len(active_connections))
+    REGISTRY.set("websocket.events_queued", event_queue.qsize())
+    REGISTRY.set("websocket.broadcast.published", stats["published"])
+    REGISTRY.set("websocket.broadcast.buffered", stats["queued_total"])
+    REGISTRY.set("websocket.broadcast.dropped", stats["dropped_total"])
+    REGISTRY.set("websocket.broadcast.coalesced", stats["coalesced_total"])
+
+    return PlainTextResponse(
+        render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+@app.get("/ws/stats")
+async def websocket_stats() -> dict[str, Any]:
+    """Broadcaster backpressure metrics, per subscriber."""
+    return broadcaster.stats()
+
+
+async def _watch_disconnect(websocket: WebSocket, subscriber: Any) -> None:
+    """Close the subscriber as soon as the client goes away, even when idle."""
+    try:
+        while True:
+            await websocket.receive_text()
+    except Exception:
+        pass
+    finally:
+        subscriber.close()
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket) -> None:
     """
@@ -64,11 +122,24 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
 
     Accepts connections from React dashboard and streams events
     from the autonomous loop (task starts, completions, Ralph verdicts, etc.).
+
+    Query params:
+        replay: Number of recent events to replay on connect (default: all
+                retained, 0 = none)
     """
     await websocket.accept()
     active_connections.append(websocket)
     logger.info(f"✅ WebSocket client connected (total: {len(active_connections)})")
 
+    # Started on startup; also start lazily if the lifespan hooks did not run
+    broadcaster.start(event_queue)
+
+    replay: Optional[int] = None
+    if websocket.query_params.get("replay", "").isdigit():
+        replay = int(websocket.query_params["replay"])
+    subscriber = broadcaster.subscribe(replay=replay)
+    watcher = asyncio.create_task(_watch_disconnect(websocket, subscriber))
+
     try:
         # Send connection confirmation
         await websocket.send_text(json.dumps({
@@ -76,28 +147,25 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
             "timestamp": datetime.now().isoformat(),
             "data": {
                 "message": "Connected to AI Orchestrator monitoring",
-                "active_connections": len(active_connections)
+                "active_connections": len(active_connections),
+                "replayed_events": len(subscriber),
             }
         }))
 
-        # Main event loop - wait for events and send to client
-        while True:
-            # Wait for event from autonomous loop
-            event = await event_queue.get()
-
-            # Send to all connected clients
-            for connection in active_connections:
-                try:
-                    await connection.send_text(json.dumps(event))
-                except Exception as e:
-                    logger.error(f"Failed to send event to client: {e}")
+        # Send loop - drains only this client's buffer
+        while (text := await subscriber.get()) is not None:
+            await asyncio.wait_for(websocket.send_text(text), timeout=SEND_TIMEOUT_SECONDS)
 
     except WebSocketDisconnect:
         logger.info("🔌 WebSocket client disconnected")
+    except asyncio.TimeoutError:
+        logger.warning(f"🐢 Dropping WebSocket client {subscriber.id}: send timed out")
     except Exception as e:
         logger.error(f"❌ WebSocket error: {e}")
     finally:
         # Clean up connection
+        watcher.cancel()
+        broadcaster.unsubscribe(subscriber)
         if websocket in active_connections:
             active_connections.remove(websocket)
         logger.info(f"Connections remaining: {len(active_connections)}")
@@ -142,12 +210,9 @@ async def broadcast_event(event: dict[str, Any]) -> None:
     Broadcast event to all connected WebSocket clients immediately.
 
     Alternative to stream_event() when you already have a formatted event dict.
+    Bypasses event_queue; each client's send loop delivers it concurrently.
     """
-    for connection in active_connections:
-        try:
-            await connection.send_text(json.dumps(event))
-        except Exception as e:
-            logger.error(f"Failed to broadcast to client: {e}")
+    broadcaster.publish(event)
 
 
 def get_active_connections_count() -> int:
@@ -165,6 +230,7 @@ def get_event_queue_size() -> int:
 async def startup_event() -> None:
     """Initialize server on startup."""
     logger.info("🚀 WebSocket server starting...")
+    broadcaster.start(event_queue)
     logger.info("Listening for connections at ws://localhost:8080/ws")
 
 
@@ -173,6 +239,9 @@ async def shutdown_event() -> None:
     """Clean up on server shutdown."""
     logger.info("🛑 WebSocket server shutting down...")
 
+    # Stop fan-out; closing subscribers ends every send loop
+    await broadcaster.stop()
+
     # Close all active connections
     for connection in active_connections:
         try:
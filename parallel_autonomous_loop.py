@@ -71,6 +71,8 @@ from orchestration.circuit_breaker import (
 from governance.resource_tracker import ResourceTracker, ResourceLimits
 from governance.cost_estimator import estimate_iteration_cost, format_cost
 from agents.coordinator.parallel_executor import ParallelExecutor
+from monitoring.profiler import profiling
+from monitoring.tracing import span
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -141,13 +143,15 @@ class GitCommitQueue:
 
     def wait_for_commit(self, task_id: str, timeout: float = 30.0) -> bool:
         """Wait for a specific commit to complete."""
-        start = datetime.now()
-        while (datetime.now() - start).total_seconds() < timeout:
-            with self._lock:
-                if task_id in self._commit_results:
-                    return self._commit_results.pop(task_id)
-            time.sleep(0.1)
-        return False
+        with span("git_commit_queue.wait", task_id=task_id) as wait_span:
+            start = datetime.now()
+            while (datetime.now() - start).total_seconds() < timeout:
+                with self._lock:
+                    if task_id in self._commit_results:
+                        return self._commit_results.pop(task_id)
+                time.sleep(0.1)
+            wait_span.set(timed_out=True)
+            return False
 
     def _commit_worker(self):
         """Worker thread that processes commits sequentially."""
@@ -169,34 +173,35 @@ class GitCommitQueue:
 
     def _do_commit(self, request: CommitRequest) -> bool:
         """Execute a git commit."""
-        try:
-            # Stage all changes
-            subprocess.run(
-                ["git", "add", "-A"],
-                cwd=request.project_dir,
-                check=True,
-                capture_output=True
-            )
-
-            # Commit with message
-            subprocess.run(
-                ["git", "commit", "-m", request.message],
-                cwd=request.project_dir,
-                check=True,
-                capture_output=True
-            )
+        with span("git_commit_queue.commit", task_id=request.task_id, worker=request.worker_id):
+            try:
+                # Stage all changes
+                subprocess.run(
+                    ["git", "add", "-A"],
+                    cwd=request.project_dir,
+                    check=True,
+                    capture_output=True
+                )
 
-            print(f"✅ [Worker {request.worker_id}] Committed: {request.task_id}")
-            return True
+                # Commit with message
+                subprocess.run(
+                    ["git", "commit", "-m", request.message],
+                    cwd=request.project_dir,
+                    check=True,
+                    capture_output=True
+                )
 
-        except subprocess.CalledProcessError as e:
-            stderr = e.stderr.decode() if e.stderr else str(e)
-            # Empty commits are OK (no changes)
-            if "nothing to commit" in stderr.lower():
-                print(f"⚪ [Worker {request.worker_id}] No changes to commit: {request.task_id}")
+                print(f"✅ [Worker {request.worker_id}] Committed: {request.task_id}")
                 return True
-            print(f"❌ [Worker {request.worker_id}] Commit failed: {stderr}")
-            return False
+
+            except subprocess.CalledProcessError as e:
+                stderr = e.stderr.decode() if e.stderr else str(e)
+                # Empty commits are OK (no changes)
+                if "nothing to commit" in stderr.lower():
+                    print(f"⚪ [Worker {request.worker_id}] No changes to commit: {request.task_id}")
+                    return True
+                print(f"❌ [Worker {request.worker_id}] Commit failed: {stderr}")
+                return False
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -738,6 +743,17 @@ Features:
         action="store_true",
         help="Auto-revert guardrail violations instead of prompting"
     )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Write hourly stack-sampling flamegraphs to .aibrain/profiles/ (also AIBRAIN_PROFILE=1)"
+    )
+    parser.add_argument(
+        "--profile-hz",
+        type=float,
+        default=None,
+        help="Profiler sampling rate in samples/second (default: 50)"
+    )
 
     args = parser.parse_args()
 
@@ -751,14 +767,15 @@ Features:
 
     # Run loop
     try:
-        asyncio.run(run_parallel_loop(
-            project_dir=project_dir,
-            max_iterations=args.max_iterations,
-            project_name=args.project,
-            max_parallel=args.max_parallel,
-            queue_type=args.queue,
-            non_interactive=args.non_interactive
-        ))
+        with profiling("parallel_loop", enabled=args.profile or None, hz=args.profile_hz):
+            asyncio.run(run_parallel_loop(
+                project_dir=project_dir,
+                max_iterations=args.max_iterations,
+                project_name=args.project,
+                max_parallel=args.max_parallel,
+                queue_type=args.queue,
+                non_interactive=args.non_interactive
+            ))
     except KeyboardInterrupt:
         print("\n\n⚠️  Interrupted by user")
         print("   To resume, run the same command again")
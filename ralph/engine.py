@@ -30,6 +30,7 @@ from enum import Enum
 from typing import TYPE_CHECKING, Any
 
 from governance.require_harness import require_harness
+from monitoring.tracing import annotate, span, traced
 
 if TYPE_CHECKING:
     from ralph.baseline import Baseline
@@ -139,6 +140,7 @@ class Verdict:
 
 
 @require_harness
+@traced("ralph.verify")
 def verify(
     project: str,
     changes: list[str],
@@ -171,6 +173,8 @@ def verify(
     from ralph.guardrails import scan_for_violations
     from ralph.steps import StepConfig, run_step
 
+    annotate(project=project, session_id=session_id, changes=len(changes))
+
     # For MVP, if no app_context provided, return a placeholder
     if app_context is None:
         return Verdict(
@@ -185,11 +189,12 @@ def verify(
     steps_results = []
 
     # Step 0: Guardrail scan (CRITICAL - runs first)
-    violations = scan_for_violations(
-        project_path=project_path,
-        changed_files=changes,
-        source_paths=app_context.source_paths
-    )
+    with span("ralph.step.guardrails"):
+        violations = scan_for_violations(
+            project_path=project_path,
+            changed_files=changes,
+            source_paths=app_context.source_paths
+        )
 
     if violations:
         # BLOCKED verdict - guardrail violations detected
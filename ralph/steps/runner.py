@@ -12,6 +12,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+from monitoring.tracing import span
 from ralph.engine import StepResult
 
 
@@ -38,14 +39,16 @@ def run_step(config: StepConfig) -> StepResult:
 
     try:
         # Run command in project directory
-        result = subprocess.run(
-            config.command,
-            shell=True,
-            cwd=config.cwd,
-            capture_output=True,
-            text=True,
-            timeout=config.timeout_seconds
-        )
+        with span(f"ralph.step.{config.name}", command=config.command) as step_span:
+            result = subprocess.run(
+                config.command,
+                shell=True,
+                cwd=config.cwd,
+                capture_output=True,
+                text=True,
+                timeout=config.timeout_seconds
+            )
+            step_span.set(returncode=result.returncode)
 
         duration_ms = int((time.time() - start_time) * 1000)
 
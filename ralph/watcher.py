@@ -15,6 +15,9 @@ Usage:
 
     # Run as daemon
     python -m ralph.watcher --project karematch --daemon
+
+    # Profile overnight (hourly flamegraphs in .aibrain/profiles/)
+    python -m ralph.watcher --project karematch --profile
 """
 
 import argparse
@@ -40,6 +43,7 @@ except ImportError:
 from ralph.risk import classify_risk, RiskLevel, requires_immediate_verification
 from ralph.engine import verify, VerdictType
 from adapters import get_adapter
+from monitoring.profiler import profiling
 
 
 # Configure logging
@@ -279,6 +283,10 @@ def main():
     parser.add_argument("--project", required=True, help="Project name (karematch, credentialmate)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     parser.add_argument("--daemon", "-d", action="store_true", help="Run as daemon (background)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Write hourly stack-sampling flamegraphs to .aibrain/profiles/ (also AIBRAIN_PROFILE=1)")
+    parser.add_argument("--profile-hz", type=float, default=None,
+                        help="Profiler sampling rate in samples/second (default: 50)")
 
     args = parser.parse_args()
 
@@ -290,7 +298,9 @@ def main():
                 print(f"Ralph watcher started as daemon (PID: {pid})")
                 sys.exit(0)
 
-    run_watcher(args.project, args.verbose)
+    # Start the sampler after forking: threads don't survive fork()
+    with profiling("ralph_watcher", enabled=args.profile or None, hz=args.profile_hz):
+        run_watcher(args.project, args.verbose)
 
 
 if __name__ == "__main__":
@@ -24,6 +24,8 @@ from typing import Any, Dict, Optional, Literal
 from dataclasses import dataclass, asdict, field
 from datetime import datetime, timezone
 
+from monitoring.tracing import annotate, traced
+
 
 TaskStatus = Literal["pending", "in_progress", "complete", "blocked", "parked"]
 
@@ -124,8 +126,10 @@ class WorkQueue:
         )
         return queue
 
+    @traced("work_queue.save")
     def save(self, path: Path) -> None:
         """Save work queue to JSON file (thread-safe)"""
+        annotate(tasks=len(self.features))
         with self._lock:
             features = []
             for task in self.features:
@@ -0,0 +1,139 @@
+"""
+Tests for TraceabilityEngine
+
+Verifies that the indexed link graph:
+1. Answers forward/reverse lookups and dedupes links
+2. Persists via journal + snapshot and reloads the same graph
+3. Memoizes chains without leaking caller mutations
+4. Invalidates memoized chains when links or board state change
+"""
+
+import json
+import os
+
+import pytest
+
+from agents.coordinator import traceability
+from agents.coordinator.traceability import TraceabilityEngine
+
+
+@pytest.fixture
+def kanban(tmp_path, monkeypatch):
+    """Point the engine at an empty vibe-kanban tree."""
+    root = tmp_path / "vibe-kanban"
+    monkeypatch.setattr(traceability, "VIBE_KANBAN_ROOT", root)
+    monkeypatch.setattr(traceability, "VIBE_KANBAN_OBJECTIVES", root / "objectives")
+    monkeypatch.setattr(traceability, "BOARD_STATE_PATH", root / "board-state.json")
+    monkeypatch.setattr(traceability, "TRACEABILITY_LOG", root / "traceability-log.json")
+    monkeypatch.setattr(traceability, "TRACEABILITY_JOURNAL", root / "traceability-log.jsonl")
+    return root
+
+
+def _decompose(engine, objective_id="OBJ-1", n_adrs=2, tasks_per_adr=3):
+    adrs = [{"id": f"ADR-{a}", "title": f"ADR {a}"} for a in range(n_adrs)]
+    tasks = [
+        {"id": f"TASK-{a}-{t}", "title": f"Task {a}.{t}", "adr_id": f"ADR-{a}"}
+        for a in range(n_adrs) for t in range(tasks_per_adr)
+    ]
+    return engine.record_decomposition(objective_id, adrs, tasks)
+
+
+def _write_board(kanban, tasks, mtime):
+    path = kanban / "board-state.json"
+    path.write_text(json.dumps({"tasks": tasks}))
+    os.utime(path, (mtime, mtime))
+
+
+class TestLinkIndex:
+    """Test forward/reverse lookups"""
+
+    def test_lookups_and_dedupe(self, kanban):
+        engine = TraceabilityEngine()
+        summary = _decompose(engine)
+        assert summary["total_links"] == 8
+
+        assert {l.target_id for l in engine.get_links_from("adr", "ADR-1")} == {
+            "TASK-1-0", "TASK-1-1", "TASK-1-2"
+        }
+        assert [l.source_id for l in engine.get_links_to("task", "TASK-0-2")] == ["ADR-0"]
+
+        # Re-recording adds nothing
+        _decompose(engine)
+        assert len(engine.links) == 8
+
+        report = engine.get_full_traceability_report()
+        assert report["link_summary"] == {"objective_to_adr": 2, "adr_to_task": 6, "task_to_ris": 0}
+
+
+class TestPersistence:
+    """Test journal + snapshot persistence"""
+
+    def test_decomposition_is_one_journal_append(self, kanban):
+        engine = TraceabilityEngine()
+        _decompose(engine)
+        lines = (kanban / "traceability-log.jsonl").read_text().splitlines()
+        assert len(lines) == 8
+        assert not (kanban / "traceability-log.json").exists()
+
+        reloaded = TraceabilityEngine()
+        assert len(reloaded.links) == 8
+        assert len(reloaded.build_chain_from_objective("OBJ-1")) == 6
+
+    def test_compaction_rewrites_snapshot(self, kanban, monkeypatch):
+        monkeypatch.setattr(traceability, "COMPACT_AFTER_LINKS", 5)
+        engine = TraceabilityEngine()
+        _decompose(engine)
+        engine.add_link("task", "TASK-0-0", "ris", "RIS-1", "resolved_by")
+
+        snapshot = json.loads((kanban / "traceability-log.json").read_text())
+        assert len(snapshot["links"]) == 8
+        journal = (kanban / "traceability-log.jsonl").read_text().splitlines()
+        assert len(journal) == 1
+
+        reloaded = TraceabilityEngine()
+        assert len(reloaded.links) == 9
+        assert reloaded.get_links_from("task", "TASK-0-0")[0].target_id == "RIS-1"
+
+    def test_torn_journal_line_is_skipped(self, kanban):
+        engine = TraceabilityEngine()
+        _decompose(engine)
+        with open(kanban / "traceability-log.jsonl", "a") as f:
+            f.write('{"source_type": "adr", "sour')
+
+        assert len(TraceabilityEngine().links) == 8
+
+
+class TestChainMemoization:
+    """Test memoized chain construction"""
+
+    def test_returned_chains_are_copies(self, kanban):
+        engine = TraceabilityEngine()
+        _decompose(engine)
+
+        chain = engine.build_chain_from_task("TASK-0-0")
+        assert chain.adr_id == "ADR-0" and chain.objective_id == "OBJ-1"
+        chain.adr_id = "mutated"
+        chain.links.clear()
+
+        again = engine.build_chain_from_task("TASK-0-0")
+        assert again.adr_id == "ADR-0"
+        assert len(again.links) == 2
+
+    def test_new_link_invalidates(self, kanban):
+        engine = TraceabilityEngine()
+        _decompose(engine)
+        assert engine.build_chain_from_task("TASK-0-0").ris_resolutions == []
+
+        engine.add_link("task", "TASK-0-0", "ris", "RIS-7", "resolved_by")
+        assert engine.build_chain_from_task("TASK-0-0").ris_resolutions == ["RIS-7"]
+        assert len(engine.build_chain_from_objective("OBJ-1")) == 6
+
+    def test_board_state_change_invalidates(self, kanban):
+        engine = TraceabilityEngine()
+        _decompose(engine)
+        _write_board(kanban, [{"id": "TASK-0-0", "title": "Old", "status": "pending"}], 1000)
+        assert engine.build_chain_from_task("TASK-0-0").task_title == "Old"
+
+        _write_board(kanban, [{"id": "TASK-0-0", "title": "New", "status": "completed"}], 2000)
+        assert engine.build_chain_from_task("TASK-0-0").task_title == "New"
+        assert engine.get_objective_progress("OBJ-1")["completed_tasks"] == 1
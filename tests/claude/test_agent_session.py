@@ -0,0 +1,211 @@
+"""
+Tests for warm Agent SDK sessions
+
+Verifies that:
+1. All turns of a task go into one SDK conversation (one connect, one client)
+2. Only the first turn carries the full prompt; later turns carry follow-ups
+3. A failed turn drops the conversation and the next turn starts over
+4. SimplifiedLoop retries reuse the session when reuse_session is set
+"""
+
+import asyncio
+import types
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from claude import sdk_adapter
+from claude.sdk_adapter import CONTINUE_PROMPT, ClaudeSDKAdapter
+
+
+class FakeClient:
+    instances: list = []
+    turns: list = []  # One entry per query(): list of replies, or an exception
+    hang_connect = False  # Reconnects (not the first connect) never finish
+
+    def __init__(self, options=None):
+        self.options = options
+        self.queries = []
+        self.connects = 0
+        self.disconnects = 0
+        FakeClient.instances.append(self)
+
+    async def connect(self):
+        self.connects += 1
+        if FakeClient.hang_connect and len(FakeClient.instances) > 1:
+            await asyncio.sleep(60)
+
+    async def disconnect(self):
+        self.disconnects += 1
+
+    async def query(self, prompt):
+        self.queries.append(prompt)
+
+    async def receive_response(self):
+        turn = FakeClient.turns.pop(0)
+        if isinstance(turn, Exception):
+            raise turn
+        for reply in turn:
+            yield reply
+
+
+def _text(text):
+    return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+def _edit(path):
+    return SimpleNamespace(content=[SimpleNamespace(name="Edit", input={"file_path": path})])
+
+
+def _result(is_error=False, cost=0.01):
+    return SimpleNamespace(
+        is_error=is_error, result="done", session_id="sess-1", total_cost_usd=cost,
+        usage={"input_tokens": 10, "cache_read_input_tokens": 1000},
+    )
+
+
+@pytest.fixture
+def fake_sdk(monkeypatch):
+    FakeClient.instances = []
+    FakeClient.turns = []
+    FakeClient.hang_connect = False
+    module = types.ModuleType("claude_agent_sdk")
+    module.ClaudeSDKClient = FakeClient
+    module.ClaudeAgentOptions = lambda **kwargs: kwargs
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    with patch.dict("sys.modules", {"claude_agent_sdk": module}):
+        yield FakeClient
+
+
+def _session(tmp_path):
+    adapter = ClaudeSDKAdapter(tmp_path, enable_startup_protocol=False)
+    return adapter.open_session(task_type="bugfix")
+
+
+def test_turns_share_one_conversation(tmp_path, fake_sdk):
+    fake_sdk.turns = [
+        [_text("Looking"), _edit("src/a.py"), _result()],
+        [_edit("src/b.py"), _text("Fixed"), _result()],
+        [_result()],
+    ]
+
+    with _session(tmp_path) as session:
+        first = session.execute_task("Fix the bug", files=["src/a.py"])
+        session.queue_follow_up("Ralph: 2 type errors in src/a.py")
+        second = session.execute_task("Fix the bug", files=["src/a.py"])
+        third = session.execute_task("Fix the bug")
+        stats = session.stats()
+
+    (client,) = fake_sdk.instances
+    assert client.connects == 1 and client.disconnects == 1
+    assert client.queries[0].startswith("Fix the bug") and "- src/a.py" in client.queries[0]
+    assert client.queries[1:] == ["Ralph: 2 type errors in src/a.py", CONTINUE_PROMPT]
+
+    assert first.success and first.files_changed == ["src/a.py"] and first.output == "Looking"
+    assert second.files_changed == ["src/b.py"] and third.success
+    assert stats["turns"] == 3 and stats["session_id"] == "sess-1"
+    assert stats["usage"]["cache_read_input_tokens"] == 3000
+    assert stats["total_cost_usd"] == pytest.approx(0.03)
+
+
+def test_failed_turn_starts_a_new_conversation(tmp_path, fake_sdk):
+    fake_sdk.turns = [[_result()], RuntimeError("connection reset"), [_result()]]
+
+    with _session(tmp_path) as session:
+        assert session.execute_task("Fix the bug").success
+        failed = session.execute_task("Fix the bug")
+        session.queue_follow_up("Tests still failing")
+        assert session.execute_task("Fix the bug").success
+        assert session.reconnects == 1
+
+    assert not failed.success and failed.error == "connection reset"
+    first, second = fake_sdk.instances
+    assert first.disconnects == 1
+    # The new conversation gets the whole task again, then the feedback
+    assert second.queries == ["Fix the bug\n\nTests still failing"]
+
+
+def test_reconnect_has_its_own_timeout(tmp_path, fake_sdk, monkeypatch):
+    fake_sdk.turns = [RuntimeError("connection reset")]
+    fake_sdk.hang_connect = True
+    monkeypatch.setattr(sdk_adapter, "SESSION_CONNECT_TIMEOUT", 0.1)
+
+    with _session(tmp_path) as session:
+        assert not session.execute_task("Fix the bug").success
+        result = session.execute_task("Fix the bug", timeout=30)
+        assert not session.connected
+
+    assert not result.success and "Reconnect timed out" in result.error
+    assert fake_sdk.instances[1].disconnects == 1  # Half-started client is cleaned up
+
+
+def test_wedged_turn_returns_a_failed_result(tmp_path, fake_sdk, monkeypatch):
+    async def wedged(message, timeout, context):
+        await asyncio.sleep(60)
+
+    with _session(tmp_path) as session:
+        monkeypatch.setattr(sdk_adapter, "SESSION_CONNECT_TIMEOUT", 0)
+        monkeypatch.setattr(sdk_adapter, "SESSION_TURN_GRACE", 0.1)
+        monkeypatch.setattr(session, "_turn", wedged)
+        result = session.execute_task("Fix the bug", timeout=0)
+        assert not session.connected
+
+    assert not result.success and "did not finish" in result.error
+    assert fake_sdk.instances[0].disconnects == 1
+
+
+def test_follow_ups_can_be_queued_during_a_turn(tmp_path, fake_sdk, monkeypatch):
+    fake_sdk.turns = [[_result()], [_result()]]
+    real_query = FakeClient.query
+
+    with _session(tmp_path) as session:
+        async def query(client, prompt):
+            await real_query(client, prompt)
+            if len(client.queries) == 1:
+                # On the session's loop thread, mid-turn (e.g. from an SDK hook)
+                session.queue_follow_up("Hook: lint failed")
+
+        monkeypatch.setattr(FakeClient, "query", query)
+        assert session.execute_task("Fix the bug", timeout=5).success
+        assert session.execute_task("Fix the bug", timeout=5).success
+
+    (client,) = fake_sdk.instances
+    assert client.queries[1] == "Hook: lint failed"
+
+
+def test_error_result_is_failure(tmp_path, fake_sdk):
+    fake_sdk.turns = [[_result(is_error=True)]]
+    with _session(tmp_path) as session:
+        result = session.execute_task("Fix the bug")
+    assert not result.success and result.error == "done"
+
+
+def test_open_requires_sdk(tmp_path, monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    with patch.dict("sys.modules", {"claude_agent_sdk": None}):
+        with pytest.raises(RuntimeError, match="not installed"):
+            ClaudeSDKAdapter(tmp_path).open_session()
+
+
+def test_simplified_loop_retries_in_one_session(tmp_path, fake_sdk):
+    from orchestration.simplified_loop import LoopConfig, SimplifiedLoop
+    from ralph.fast_verify import VerifyResult, VerifyStatus, VerifyTier
+
+    fake_sdk.turns = [[_edit("src/a.py"), _result()], [_result()]]
+    loop = SimplifiedLoop(LoopConfig(project_dir=tmp_path, enable_metrics=False, reuse_session=True))
+    task = SimpleNamespace(id="T-1", description="Fix the bug", file="src/a.py", tests=[], max_iterations=3)
+    verdicts = iter([
+        VerifyResult(status=VerifyStatus.FAIL, tier=VerifyTier.INSTANT, types_passed=False,
+                     errors=["src/a.py:3: type error"]),
+        VerifyResult(status=VerifyStatus.PASS, tier=VerifyTier.INSTANT),
+    ])
+
+    with patch.object(loop, "_fast_verify", side_effect=lambda files: next(verdicts)):
+        result = asyncio.run(loop._execute_task_with_retries(task))
+
+    assert result.success and result.attempts == 2
+    (client,) = fake_sdk.instances
+    assert client.queries[0].startswith("Task: Fix the bug")
+    assert client.queries[1].startswith("Retry attempt 2.") and "type error" in client.queries[1]
+    assert client.disconnects == 1 and loop._session is None
@@ -0,0 +1,217 @@
+"""
+Tests for the Claude CLI output pipeline
+
+Verifies that:
+1. stream-json output is parsed incrementally, across arbitrary chunk boundaries
+2. files_changed comes from tool-use events, and retained output is capped
+3. Sinks receive batched events off the reader thread and never block it
+4. ClaudeCliWrapper.execute_task streams a real subprocess through the pipeline
+"""
+
+import io
+import json
+import os
+import stat
+import threading
+import time
+
+from claude.cli_wrapper import ClaudeCliWrapper
+from claude.output_pipeline import (
+    LogFileSink,
+    OutputAccumulator,
+    OutputPipeline,
+    OutputSink,
+    StreamJsonParser,
+    TerminalSink,
+    WebSocketSink,
+)
+
+
+def _assistant(*blocks):
+    return {"type": "assistant", "session_id": "s-1", "message": {"content": list(blocks)}}
+
+
+def _tool_use(name, **tool_input):
+    return {"type": "tool_use", "name": name, "input": tool_input}
+
+
+EVENTS = [
+    {"type": "system", "subtype": "init", "session_id": "s-1"},
+    _assistant({"type": "text", "text": "Fixing the bug"}),
+    _assistant(_tool_use("Read", file_path="src/a.py")),
+    _assistant(_tool_use("Edit", file_path="src/a.py"), _tool_use("Write", file_path="src/b.py")),
+    _assistant(_tool_use("Edit", file_path="src/a.py")),
+    _assistant({"type": "text", "text": "<promise>DONE</promise>"}),
+    {"type": "result", "subtype": "success", "is_error": False,
+     "result": "<promise>DONE</promise>", "duration_ms": 12},
+]
+
+STREAM = "".join(json.dumps(e) + "\n" for e in EVENTS).encode()
+
+
+class RecordingSink(OutputSink):
+    def __init__(self):
+        self.batches = []
+        self.closed = False
+
+    def write(self, events):
+        self.batches.append(list(events))
+
+    def close(self):
+        self.closed = True
+
+
+class TestStreamJsonParser:
+    """Test incremental NDJSON decoding"""
+
+    def test_chunk_boundaries_do_not_matter(self):
+        parser = StreamJsonParser()
+        events = []
+        for i in range(0, len(STREAM), 7):
+            events.extend(parser.feed(STREAM[i:i + 7]))
+        events.extend(parser.close())
+        assert events == EVENTS
+
+    def test_non_json_lines_become_raw_events(self):
+        parser = StreamJsonParser()
+        events = parser.feed(b"Modified: src/x.py\n{not json}\n") + parser.feed(b"tail")
+        events += parser.close()
+        assert [e["text"] for e in events] == ["Modified: src/x.py", "{not json}", "tail"]
+        assert all(e["type"] == "raw" for e in events)
+
+
+class TestOutputAccumulator:
+    """Test what execute_task keeps from the stream"""
+
+    def test_files_from_tool_use_events(self, tmp_path):
+        accumulator = OutputAccumulator(tmp_path)
+        for event in EVENTS:
+            accumulator.add(event)
+        # The final result isn't repeated when it was already streamed
+        assert accumulator.output == "Fixing the bug\n<promise>DONE</promise>"
+
+        accumulator.add(_assistant(_tool_use("MultiEdit", file_path=str(tmp_path / "src" / "c.py"))))
+        accumulator.add({"type": "raw", "text": "Created: docs/x.md"})
+
+        assert accumulator.files_changed == ["src/a.py", "src/b.py", "src/c.py", "docs/x.md"]
+        assert accumulator.session_id == "s-1"
+        assert not accumulator.is_error
+
+    def test_retained_output_keeps_the_tail(self):
+        accumulator = OutputAccumulator(max_retained_bytes=100)
+        for i in range(50):
+            accumulator.add(_assistant({"type": "text", "text": f"line {i:02d} " + "x" * 20}))
+        accumulator.add(_assistant({"type": "text", "text": "y" * 500}))
+
+        assert accumulator.truncated
+        assert accumulator.output == "y" * 100
+
+
+class TestOutputPipeline:
+    """Test fan-out to sinks"""
+
+    def test_sinks_receive_batches_in_order(self, tmp_path):
+        recording = RecordingSink()
+        terminal = io.StringIO()
+        pipeline = OutputPipeline(
+            [recording, TerminalSink(stream=terminal), LogFileSink(tmp_path / "run.ndjson")]
+        )
+        for event in EVENTS:
+            pipeline.publish(event)
+        pipeline.close()
+
+        assert [e for batch in recording.batches for e in batch] == EVENTS
+        assert recording.closed
+        assert "→ Edit src/a.py" in terminal.getvalue()
+        assert "<promise>DONE</promise>" in terminal.getvalue()
+        logged = [json.loads(line) for line in (tmp_path / "run.ndjson").read_text().splitlines()]
+        assert logged == EVENTS
+
+    def test_slow_sink_drops_instead_of_blocking(self):
+        release = threading.Event()
+
+        class StalledSink(OutputSink):
+            def write(self, events):
+                release.wait(5)
+
+        pipeline = OutputPipeline([StalledSink()], max_pending=3)
+        accepted = [pipeline.publish({"type": "raw", "text": str(i)}) for i in range(20)]
+        release.set()
+        pipeline.close()
+
+        assert accepted.count(False) == pipeline.dropped >= 16
+
+    def test_close_does_not_hang_on_a_stalled_sink(self):
+        entered, release = threading.Event(), threading.Event()
+
+        class StalledSink(OutputSink):
+            def write(self, events):
+                entered.set()
+                release.wait(5)
+
+        pipeline = OutputPipeline([StalledSink()], max_pending=3)
+        pipeline.publish({"type": "raw", "text": "first"})
+        assert entered.wait(2)
+        for i in range(3):
+            assert pipeline.publish({"type": "raw", "text": str(i)})  # Fills the queue
+
+        started = time.monotonic()
+        pipeline.close(timeout=0.2)
+        release.set()
+
+        assert time.monotonic() - started < 1.0
+        assert pipeline.dropped == 3
+
+    def test_websocket_sink_publishes_agent_output(self):
+        published = []
+        pipeline = OutputPipeline([WebSocketSink(published.append, task_id="T-1")])
+        for event in EVENTS:
+            pipeline.publish(event)
+        pipeline.close()
+
+        assert published and all(e["type"] == "agent_output" for e in published)
+        assert all(e["data"]["task_id"] == "T-1" for e in published)
+        assert "Fixing the bug" in "".join(e["data"]["output"] for e in published)
+
+
+class TestExecuteTaskStreaming:
+    """Test execute_task against a fake claude executable"""
+
+    def _fake_cli(self, tmp_path, monkeypatch, exit_code=0):
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        (tmp_path / "stream.ndjson").write_bytes(STREAM)
+        script = bin_dir / "claude"
+        script.write_text(
+            "#!/bin/sh\n"
+            "cat > /dev/null\n"
+            f"cat '{tmp_path / 'stream.ndjson'}'\n"
+            "echo 'warning: something' >&2\n"
+            f"exit {exit_code}\n"
+        )
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    def test_result_built_from_events(self, tmp_path, monkeypatch):
+        self._fake_cli(tmp_path, monkeypatch)
+        sink = RecordingSink()
+        wrapper = ClaudeCliWrapper(tmp_path, enable_startup_protocol=False, sinks=[sink])
+
+        result = wrapper.execute_task("fix it", timeout=30)
+
+        assert result.success, result.error
+        assert result.files_changed == ["src/a.py", "src/b.py"]
+        assert result.output.endswith("<promise>DONE</promise>")
+        streamed = [e for batch in sink.batches for e in batch]
+        assert [e for e in streamed if e["type"] != "stderr"] == EVENTS
+        assert {"type": "stderr", "text": "warning: something\n"} in streamed
+
+    def test_nonzero_exit_is_failure(self, tmp_path, monkeypatch):
+        self._fake_cli(tmp_path, monkeypatch, exit_code=2)
+        wrapper = ClaudeCliWrapper(tmp_path, enable_startup_protocol=False, sinks=[])
+
+        result = wrapper.execute_task("fix it", timeout=30)
+
+        assert not result.success
+        assert result.files_changed == []
+        assert "warning" in result.error
@@ -0,0 +1,206 @@
+"""
+Tests for MCPGovernanceHook rate limiting and audit logging
+
+Verifies that:
+1. The token bucket allows at most its capacity in any burst and refills smoothly
+2. Buckets in the same SQLite file share one budget (across processes)
+3. Audit entries are written off the caller's thread, bounded, and flushed at exit
+"""
+
+import json
+import sqlite3
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+
+from governance.hooks import mcp_hook
+from governance.hooks.mcp_hook import AuditSink, MCPGovernanceHook, TokenBucketLimiter
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(mcp_hook.time, "time", fake.time)
+    return fake
+
+
+def _hook(tmp_path, per_minute=60):
+    return MCPGovernanceHook(
+        servers={"fs": {"allowed_agents": ["*"]}},
+        agent_overrides={},
+        limits={"max_calls_per_minute": per_minute},
+        security={"audit_log_path": str(tmp_path / "audit" / "mcp-tools.log")},
+    )
+
+
+class TestTokenBucket:
+    """Test token bucket semantics"""
+
+    @pytest.mark.parametrize("shared", [False, True])
+    def test_no_double_burst_at_window_edge(self, tmp_path, clock, shared):
+        limiter = TokenBucketLimiter(
+            capacity=60, refill_per_second=1.0,
+            db_path=tmp_path / "buckets.db" if shared else None,
+        )
+
+        # Spend the whole budget just before a fixed window would reset...
+        assert sum(limiter.try_acquire("qa") for _ in range(100)) == 60
+        clock.now += 1.0
+        # ...and only one second's refill is available just after it
+        assert sum(limiter.try_acquire("qa") for _ in range(100)) == 1
+
+        clock.now += 30
+        assert sum(limiter.try_acquire("qa") for _ in range(100)) == 30
+        assert limiter.try_acquire("dev")  # Buckets are per key
+
+    def test_buckets_shared_through_sqlite(self, tmp_path, clock):
+        db_path = tmp_path / "buckets.db"
+        first = TokenBucketLimiter(capacity=10, refill_per_second=0, db_path=db_path)
+        second = TokenBucketLimiter(capacity=10, refill_per_second=0, db_path=db_path)
+
+        taken = [first.try_acquire("qa") or second.try_acquire("qa") for _ in range(8)]
+        assert all(taken)
+        assert second.try_acquire("qa", tokens=2)
+        assert not first.try_acquire("qa")
+
+    def test_shared_across_processes(self, tmp_path):
+        db_path = tmp_path / "buckets.db"
+        script = textwrap.dedent(f"""
+            from governance.hooks.mcp_hook import TokenBucketLimiter
+            limiter = TokenBucketLimiter(capacity=5, refill_per_second=0, db_path={str(db_path)!r})
+            print(sum(limiter.try_acquire("qa") for _ in range(5)))
+        """)
+        child = subprocess.run(
+            [sys.executable, "-c", script], cwd=REPO_ROOT, capture_output=True, text=True
+        )
+        assert child.stdout.strip() == "5", child.stderr
+
+        limiter = TokenBucketLimiter(capacity=5, refill_per_second=0, db_path=db_path)
+        assert not limiter.try_acquire("qa")
+
+    def test_busy_database_does_not_refill_the_bucket(self, tmp_path, clock, capsys):
+        db_path = tmp_path / "buckets.db"
+        limiter = TokenBucketLimiter(capacity=10, refill_per_second=0, db_path=db_path)
+        newcomer = TokenBucketLimiter(capacity=10, refill_per_second=0, db_path=db_path)
+        for each in (limiter, newcomer):
+            each._conn.execute("PRAGMA busy_timeout=0")
+        assert sum(limiter.try_acquire("qa") for _ in range(3)) == 3
+
+        holder = sqlite3.connect(str(db_path), isolation_level=None)
+        holder.execute("BEGIN IMMEDIATE")
+        try:
+            # Continues from the last shared level (7), not a fresh 10
+            assert sum(limiter.try_acquire("qa") for _ in range(20)) == 7
+            # Never saw the shared level: only the small fallback burst
+            assert sum(newcomer.try_acquire("qa") for _ in range(20)) == 1
+        finally:
+            holder.execute("ROLLBACK")
+            holder.close()
+
+        assert limiter.fallbacks == 20
+        assert capsys.readouterr().out.count("using in-process buckets") == 2  # Once per limiter
+
+
+class TestHookRateLimit:
+    """Test rate limiting through the hook"""
+
+    def test_pre_tool_use_spends_tokens(self, tmp_path, clock):
+        hook = _hook(tmp_path, per_minute=3)
+        tools = [{"server": "fs", "name": "read_file"}]
+
+        # Listing tools doesn't spend the budget
+        for _ in range(5):
+            assert hook.get_filtered_tools("qa", tools) == tools
+
+        results = [hook.pre_tool_use("qa", "fs", "read_file").allowed for _ in range(4)]
+        assert results == [True, True, True, False]
+        assert hook.pre_tool_use("qa", "fs", "read_file").approval_reason == "Rate limit exceeded"
+
+        clock.now += 20  # 3 per minute: one token back
+        assert hook.pre_tool_use("qa", "fs", "read_file").allowed
+        hook.close()
+
+    def test_limits_read_from_security_section(self, tmp_path):
+        hook = MCPGovernanceHook(
+            servers={"fs": {"allowed_agents": ["*"]}},
+            agent_overrides={},
+            limits={},
+            security={
+                "audit_log_path": str(tmp_path / "mcp-tools.log"),
+                "max_calls_per_minute": 2,
+            },
+        )
+        assert [hook.pre_tool_use("qa", "fs", "x").allowed for _ in range(3)] == [True, True, False]
+        hook.close()
+
+    def test_governance_latency(self, tmp_path):
+        hook = _hook(tmp_path, per_minute=100_000)
+
+        started = time.perf_counter()
+        for _ in range(200):
+            hook.pre_tool_use("qa", "fs", "read_file")
+            hook.post_tool_use("qa", "fs", "read_file", result="ok")
+        per_call_ms = (time.perf_counter() - started) / 200 * 1000
+
+        assert per_call_ms < 5
+        hook.close()
+
+
+class TestAuditSink:
+    """Test background audit writing"""
+
+    def test_entries_written_by_background_thread(self, tmp_path):
+        hook = _hook(tmp_path)
+        for i in range(3):
+            hook.post_tool_use("qa", "fs", "read_file", result="x" * i, duration_ms=i)
+
+        assert hook.flush_audit()
+        lines = (tmp_path / "audit" / "mcp-tools.log").read_text().splitlines()
+        assert [json.loads(line)["result_size_bytes"] for line in lines] == [0, 1, 2]
+        hook.close()
+
+    def test_pending_entries_are_bounded(self, tmp_path, monkeypatch):
+        sink = AuditSink(tmp_path / "audit.log", max_pending=2)
+        monkeypatch.setattr(sink, "_ensure_writer", lambda: None)  # Writer stalled
+
+        accepted = [sink.write({"n": i}) for i in range(5)]
+        assert accepted == [True, True, False, False, False]
+
+        sink.close()
+        records = [json.loads(line) for line in (tmp_path / "audit.log").read_text().splitlines()]
+        assert records[:2] == [{"n": 0}, {"n": 1}]
+        assert records[2]["event"] == "audit_dropped" and records[2]["count"] == 3
+
+    def test_flushed_at_interpreter_exit(self, tmp_path):
+        audit_log = tmp_path / "mcp-tools.log"
+        script = textwrap.dedent(f"""
+            from governance.hooks.mcp_hook import MCPGovernanceHook
+            hook = MCPGovernanceHook(
+                servers={{"fs": {{"allowed_agents": ["*"]}}}},
+                agent_overrides={{}},
+                limits={{}},
+                security={{"audit_log_path": {str(audit_log)!r}}},
+            )
+            for i in range(50):
+                hook.post_tool_use("qa", "fs", "read_file", result="ok")
+        """)
+        child = subprocess.run(
+            [sys.executable, "-c", script], cwd=REPO_ROOT, capture_output=True, text=True
+        )
+
+        assert child.returncode == 0, child.stderr
+        assert len(audit_log.read_text().splitlines()) == 50
@@ -0,0 +1,163 @@
+"""
+Tests for the oversight session index
+
+Verifies that DataCollector:
+1. Parses each session file once and re-parses only changed files
+2. Drops deleted sessions and honours the date window
+3. Produces the same OperationalMetrics from SQL aggregates as from sessions
+"""
+
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from governance.oversight import session_index
+from governance.oversight.coo_metrics import OperationalMetrics
+from governance.oversight.data_collector import DataCollector
+
+
+def _day(days_ago: int) -> str:
+    return (datetime.now() - timedelta(days=days_ago)).strftime("%Y-%m-%d")
+
+
+def _write_session(sessions_dir: Path, days_ago: int, name: str, content: str) -> Path:
+    path = sessions_dir / f"{_day(days_ago)}-{name}.md"
+    path.write_text(content)
+    return path
+
+
+@pytest.fixture
+def collector(tmp_path, monkeypatch):
+    sessions_dir = tmp_path / "sessions"
+    sessions_dir.mkdir()
+    collector = DataCollector(tmp_path, index_path=tmp_path / "session_index.db")
+
+    parsed = []
+    original = collector._parse_session_file
+
+    def counting_parse(path):
+        parsed.append(path.name)
+        return original(path)
+
+    monkeypatch.setattr(collector, "_parse_session_file", counting_parse)
+    collector.parsed = parsed
+    return collector
+
+
+class TestIncrementalParsing:
+    """Test that only new or changed files are parsed"""
+
+    def test_unchanged_files_are_not_reparsed(self, collector):
+        sessions_dir = collector.sessions_dir
+        _write_session(sessions_dir, 1, "a", "✅ ✅ Verdict: PASS\nCOMPLETE")
+        _write_session(sessions_dir, 2, "b", "✅ BLOCKED on approval")
+        (sessions_dir / "notes.md").write_text("no date in name")
+
+        assert len(collector.collect_sessions()) == 2
+        assert len(collector.parsed) == 2
+
+        collector.parsed.clear()
+        assert len(collector.collect_sessions()) == 2
+        assert collector.parsed == []
+
+        # A fresh collector reuses the on-disk index
+        again = DataCollector(collector.root, index_path=collector.index_path)
+        assert again.refresh_sessions() == 0
+
+    def test_changed_and_deleted_files(self, collector):
+        sessions_dir = collector.sessions_dir
+        changed = _write_session(sessions_dir, 1, "a", "✅ Verdict: PASS")
+        deleted = _write_session(sessions_dir, 2, "b", "✅")
+        collector.collect_sessions()
+        collector.parsed.clear()
+
+        changed.write_text("✅ ✅ ✅ Verdict: FAIL")
+        os.utime(changed, ns=(changed.stat().st_mtime_ns + 10**9,) * 2)
+        deleted.unlink()
+
+        sessions = collector.collect_sessions()
+        assert collector.parsed == [changed.name]
+        assert [(s["filename"], s["tasks_completed"], s["ralph_verdict"]) for s in sessions] == [
+            (changed.name, 3, "FAIL")
+        ]
+
+    def test_parser_version_change_reparses(self, collector, monkeypatch):
+        _write_session(collector.sessions_dir, 1, "a", "✅")
+        collector.collect_sessions()
+        collector.session_index.close()
+
+        monkeypatch.setattr(session_index, "PARSER_VERSION", session_index.PARSER_VERSION + 1)
+        fresh = DataCollector(collector.root, index_path=collector.index_path)
+        assert fresh.refresh_sessions() == 1
+
+    def test_unparsable_files_are_not_retried_until_changed(self, tmp_path):
+        sessions_dir = tmp_path / "sessions"
+        sessions_dir.mkdir()
+        good = _write_session(sessions_dir, 1, "good", "✅")
+        bad = _write_session(sessions_dir, 2, "bad", "garbled")
+        parsed = []
+
+        def parse(path):
+            parsed.append(path.name)
+            return None if "garbled" in path.read_text() else {"tasks_completed": 1}
+
+        index = session_index.SessionIndex(tmp_path / "index.db")
+        assert index.refresh(sessions_dir, parse) == 1
+        assert index.refresh(sessions_dir, parse) == 0
+        assert sorted(parsed) == sorted([good.name, bad.name])
+        assert [s["filename"] for s in index.sessions()] == [good.name]
+        assert index.aggregate().total_sessions == 1
+
+        bad.write_text("fixed")
+        os.utime(bad, ns=(bad.stat().st_mtime_ns + 10**9,) * 2)
+        assert index.refresh(sessions_dir, parse) == 1
+        assert index.aggregate().total_sessions == 2
+
+        bad.unlink()
+        good.write_text("garbled")
+        os.utime(good, ns=(good.stat().st_mtime_ns + 10**9,) * 2)
+        assert index.refresh(sessions_dir, parse) == 0
+        assert index.sessions() == []
+        index.close()
+
+
+class TestAggregates:
+    """Test SQL aggregates against the in-Python calculation"""
+
+    def test_date_window(self, collector):
+        for days_ago in (1, 10, 40, 100):
+            _write_session(collector.sessions_dir, days_ago, f"s{days_ago}", "✅")
+
+        assert len(collector.collect_sessions(days_back=30)) == 2
+        assert collector.session_aggregates(days_back=30).total_sessions == 2
+        assert collector.session_aggregates(days_back=180, end_days_back=90).total_sessions == 1
+
+    def test_metrics_match_from_sessions(self, collector):
+        for i in range(25):
+            content = "✅ " * (i % 4 + 1)
+            if i % 5 == 0 or i >= 20:
+                content += "BLOCKED"
+            content += f"\n{i % 3 + 1} iterations\nVerdict: PASS" if i % 2 else ""
+            _write_session(collector.sessions_dir, 25 - i, f"s{i:02d}", content)
+
+        sessions = collector.collect_sessions(days_back=30)
+        expected = OperationalMetrics.from_sessions(sessions)
+        actual = OperationalMetrics.from_aggregates(collector.session_aggregates(days_back=30))
+
+        assert actual.total_sessions == expected.total_sessions == 25
+        assert actual.total_tasks == expected.total_tasks
+        assert actual.current_autonomy_pct == pytest.approx(expected.current_autonomy_pct)
+        assert actual.tasks_per_session_avg == pytest.approx(expected.tasks_per_session_avg)
+        assert actual.autonomy_trend == expected.autonomy_trend == "declining"
+
+        totals = collector.session_aggregates(days_back=30)
+        assert sum(totals.verdicts.values()) == 25
+        assert totals.verdicts.get("PASS", 0) == sum(
+            1 for s in sessions if s["ralph_verdict"] == "PASS"
+        )
+
+    def test_empty_window(self, collector):
+        metrics = OperationalMetrics.from_aggregates(collector.session_aggregates())
+        assert metrics.total_sessions == 0 and metrics.autonomy_trend == "stable"
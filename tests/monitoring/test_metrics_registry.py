@@ -0,0 +1,141 @@
+"""
+Tests for the bounded metrics registry, incremental flush and exposition.
+"""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from monitoring import metrics as metrics_module
+from monitoring.metrics import (
+    MetricsCollector,
+    MetricsRegistry,
+    MetricType,
+    generate_dashboard,
+    render_prometheus,
+)
+
+
+class TestMetricsRegistry:
+
+    def test_counter_series_per_label_set(self):
+        registry = MetricsRegistry()
+        registry.inc("task.failed", tags={"error_type": "lint", "task_id": "T-1"})
+        registry.inc("task.failed", tags={"error_type": "lint", "task_id": "T-2"})
+        registry.inc("task.failed", tags={"error_type": "test"})
+
+        # task_id is dropped from aggregated series
+        assert registry.breakdown("task.failed", "error_type") == {"lint": 2, "test": 1}
+        assert registry.total("task.failed") == 3
+        assert registry.series_count() == 2
+
+    def test_series_cardinality_is_capped(self, monkeypatch):
+        monkeypatch.setattr(metrics_module, "MAX_SERIES_PER_METRIC", 10)
+        registry = MetricsRegistry()
+        for i in range(100):
+            registry.inc("requests", tags={"path": f"/item/{i}"})
+
+        assert registry.series_count() == 11  # 10 + overflow
+        assert registry.total("requests") == 100
+        assert registry.breakdown("requests", "overflow", default="no")["true"] == 90
+
+    def test_histogram_buckets_and_exposition(self):
+        registry = MetricsRegistry()
+        for value in (0.003, 0.2, 0.2, 7.0, 50.0):
+            registry.observe("step.seconds", value, tags={"step": "lint"})
+
+        assert registry.histogram_totals("step.seconds") == (5, pytest.approx(57.403))
+        text = render_prometheus([registry])
+        assert "# TYPE step_seconds histogram" in text
+        assert 'step_seconds_bucket{step="lint",le="0.005"} 1' in text
+        assert 'step_seconds_bucket{step="lint",le="0.25"} 3' in text
+        assert 'step_seconds_bucket{step="lint",le="+Inf"} 5' in text
+        assert 'step_seconds_count{step="lint"} 5' in text
+
+    def test_metric_type_is_fixed_at_registration(self):
+        registry = MetricsRegistry()
+        registry.observe("step.seconds", 0.2)
+        with pytest.raises(ValueError, match="histogram"):
+            registry.inc("step.seconds")
+        assert registry.histogram_totals("step.seconds") == (1, pytest.approx(0.2))
+
+    def test_counter_exposition_escapes_labels(self):
+        registry = MetricsRegistry()
+        registry.inc("ko.lookups", tags={"query": 'say "hi"'})
+        text = render_prometheus([registry])
+        assert "# TYPE ko_lookups_total counter" in text
+        assert 'ko_lookups_total{query="say \\"hi\\""} 1' in text
+
+
+class TestCollectorPersistence:
+
+    def test_flush_writes_only_new_points(self, tmp_path: Path):
+        collector = MetricsCollector(storage_dir=tmp_path)
+        collector.increment("tasks.completed")
+        collector.flush()
+        collector.flush()
+        collector.increment("tasks.completed")
+        collector.flush()
+
+        lines = (tmp_path / "metrics.jsonl").read_text().splitlines()
+        assert len(lines) == 2
+
+    def test_restart_restores_registry_without_replay(self, tmp_path: Path):
+        collector = MetricsCollector(storage_dir=tmp_path)
+        for i in range(4):
+            collector.record("task.duration_ms", 1000 * (i + 1))
+            collector.task_failed(f"T-{i}", error_type="lint")
+        collector.set_gauge("agent.total", 4)
+        collector.flush()
+
+        # Even with the JSONL gone, aggregates come back from state.json
+        (tmp_path / "metrics.jsonl").unlink()
+        restored = MetricsCollector(storage_dir=tmp_path)
+        dashboard = generate_dashboard(restored)
+
+        assert dashboard.avg_task_duration_ms == 2500
+        assert dashboard.error_breakdown == {"lint": 4}
+        assert restored.get_gauge("agent.total") == 4
+
+    def test_tagged_gauge_reads_back_latest_value(self, tmp_path: Path):
+        collector = MetricsCollector(storage_dir=tmp_path)
+        collector.set_gauge("agent.active", 3, tags={"project": "karematch"})
+        collector.set_gauge("agent.active", 5, tags={"project": "credentialmate"})
+        collector.set_gauge("agent.active", 1, tags={"project": "karematch"})
+
+        assert collector.get_gauge("agent.active") == 1
+        assert collector.get_gauge("agent.active", tags={"project": "credentialmate"}) == 5
+        collector.flush()
+        assert MetricsCollector(storage_dir=tmp_path).get_gauge("agent.active") == 1
+
+    def test_concurrent_flushes_write_each_point_once(self, tmp_path: Path):
+        collector = MetricsCollector(storage_dir=tmp_path)
+        for _ in range(200):
+            collector.increment("tasks.completed")
+        threads = [threading.Thread(target=collector.flush) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len((tmp_path / "metrics.jsonl").read_text().splitlines()) == 200
+
+    def test_legacy_state_file_is_imported(self, tmp_path: Path):
+        (tmp_path / "state.json").write_text(json.dumps({
+            "gauges": {"agent.active": 2},
+            "counters": {"tasks.completed": 7},
+        }))
+        collector = MetricsCollector(storage_dir=tmp_path)
+        assert collector.get_total("tasks.completed") == 7
+        assert collector.get_gauge("agent.active") == 2
+
+    def test_point_buffers_are_bounded(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(metrics_module, "MAX_POINTS_PER_NAME", 50)
+        collector = MetricsCollector(storage_dir=tmp_path)
+        for _ in range(500):
+            collector.record("iteration", 1, metric_type=MetricType.COUNTER)
+
+        assert len(collector.get_points("iteration")) == 50
+        assert collector.get_total("iteration") == 500
@@ -0,0 +1,110 @@
+"""
+Tests for the continuous stack-sampling profiler.
+"""
+
+import threading
+import time
+from collections import Counter
+
+from monitoring.profiler import (
+    StackSampler,
+    diff_profiles,
+    load_folded,
+    profiling,
+    write_diff_folded,
+)
+
+
+def _spin(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(i * i for i in range(200))
+
+
+def test_sample_once_collapses_other_thread_stacks(tmp_path):
+    stop = threading.Event()
+    worker = threading.Thread(target=_spin, args=(stop,), name="spinner")
+    worker.start()
+    try:
+        sampler = StackSampler("test", output_dir=tmp_path)
+        for _ in range(5):
+            sampler.sample_once()
+    finally:
+        stop.set()
+        worker.join()
+
+    stacks = [s for counts in sampler._pending.values() for s in counts]
+    spinner = [s for s in stacks if s.startswith("spinner;")]
+    assert spinner
+    assert any(f"{__name__}:_spin" in s.split(";") for s in spinner)
+    assert not any("StackSampler" in s for s in stacks)
+
+
+def test_idle_threads_skipped_unless_requested(tmp_path):
+    stop = threading.Event()
+    idler = threading.Thread(target=stop.wait, name="idler")
+    idler.start()
+    try:
+        busy_only = StackSampler("a", output_dir=tmp_path)
+        with_idle = StackSampler("b", output_dir=tmp_path, include_idle=True)
+        busy_only.sample_once()
+        with_idle.sample_once()
+    finally:
+        stop.set()
+        idler.join()
+
+    def idler_stacks(sampler):
+        return [s for c in sampler._pending.values() for s in c if s.startswith("idler;")]
+
+    assert idler_stacks(busy_only) == []
+    assert idler_stacks(with_idle)
+
+
+def test_flush_merges_into_hourly_file(tmp_path):
+    sampler = StackSampler("loop", output_dir=tmp_path)
+    sampler._pending = {"20260101-02": Counter({"MainThread;a:f;a:g": 3})}
+    sampler.flush()
+    sampler._pending = {"20260101-02": Counter({"MainThread;a:f;a:g": 2, "MainThread;a:h": 1})}
+    (path,) = sampler.flush()
+
+    assert path.name == "loop-20260101-02.folded"
+    assert load_folded(path) == Counter({"MainThread;a:f;a:g": 5, "MainThread;a:h": 1})
+
+
+def test_background_sampling_writes_profile(tmp_path):
+    stop = threading.Event()
+    worker = threading.Thread(target=_spin, args=(stop,), name="spinner")
+    worker.start()
+    try:
+        with profiling("bg", enabled=True, hz=200, output_dir=tmp_path) as sampler:
+            time.sleep(0.2)
+    finally:
+        stop.set()
+        worker.join()
+
+    files = list(tmp_path.glob("bg-*.folded"))
+    assert len(files) == 1
+    assert sampler.samples > 0
+    assert sum(load_folded(files[0]).values()) == sampler.stacks
+
+
+def test_profiling_disabled_yields_none(tmp_path, monkeypatch):
+    monkeypatch.delenv("AIBRAIN_PROFILE", raising=False)
+    with profiling("off", output_dir=tmp_path) as sampler:
+        assert sampler is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_diff_profiles_ranks_shifted_frames(tmp_path):
+    before = Counter({"T;m:loop;m:parse": 80, "T;m:loop;m:save": 20})
+    after = Counter({"T;m:loop;m:parse": 20, "T;m:loop;m:save": 80})
+
+    rows = diff_profiles(before, after, top=3)
+    by_frame = {r.frame: r for r in rows}
+    assert by_frame["m:save"].delta_pct == 60.0
+    assert by_frame["m:parse"].delta_pct == -60.0
+    assert by_frame["m:loop"].delta_pct == 0.0
+    assert by_frame["m:save"].after_self_pct == 80.0
+
+    out = tmp_path / "diff.folded"
+    write_diff_folded(out, before, after)
+    assert "T;m:loop;m:save 20 80" in out.read_text().splitlines()
@@ -0,0 +1,121 @@
+"""
+Tests for tracing spans: context propagation, sampling, Chrome trace output,
+and per-phase histograms.
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from monitoring import tracing
+from monitoring.metrics import REGISTRY
+from monitoring.tracing import annotate, current_trace_id, span, traced
+
+
+@pytest.fixture
+def trace_dir(tmp_path):
+    original = (tracing._config.enabled, tracing._config.sample_rate, tracing._config.trace_dir)
+    tracing.configure(enabled=True, sample_rate=1.0, trace_dir=tmp_path)
+    yield tmp_path
+    tracing._config.enabled, tracing._config.sample_rate, tracing._config.trace_dir = original
+
+
+def _load_single_trace(trace_dir):
+    files = list(trace_dir.glob("trace-*.json"))
+    assert len(files) == 1
+    document = json.loads(files[0].read_text())
+    spans = {e["name"]: e for e in document["traceEvents"] if e["ph"] == "X"}
+    return document, spans
+
+
+def test_nested_spans_share_trace_and_link_parents(trace_dir):
+    with span("iteration_loop.run", task_id="T-1") as root:
+        with span("claude.execute_task"):
+            with span("ko.find_relevant"):
+                inner_trace_id = current_trace_id()
+
+    assert inner_trace_id == root.trace_id
+    document, spans = _load_single_trace(trace_dir)
+    assert document["otherData"]["trace_id"] == root.trace_id
+    assert "parent_id" not in spans["iteration_loop.run"]["args"]
+    assert spans["claude.execute_task"]["args"]["parent_id"] == spans["iteration_loop.run"]["args"]["span_id"]
+    assert spans["ko.find_relevant"]["args"]["parent_id"] == spans["claude.execute_task"]["args"]["span_id"]
+    assert spans["iteration_loop.run"]["args"]["task_id"] == "T-1"
+    assert spans["claude.execute_task"]["cat"] == "claude"
+    assert current_trace_id() is None
+
+
+def test_unsampled_traces_write_nothing_but_feed_histogram(trace_dir):
+    tracing.configure(sample_rate=0.0)
+    before = REGISTRY.histogram_totals(tracing.SPAN_METRIC)
+
+    with span("test.unsampled") as s:
+        assert not s.sampled
+
+    after = REGISTRY.histogram_totals(tracing.SPAN_METRIC)
+    assert list(trace_dir.iterdir()) == []
+    assert after[0] == before[0] + 1
+
+
+def test_disabled_tracing_is_noop(trace_dir):
+    tracing.configure(enabled=False)
+    with span("test.disabled") as s:
+        annotate(ignored=True)
+    assert s.trace_id == ""
+    assert list(trace_dir.iterdir()) == []
+
+
+def test_exception_recorded_and_propagated(trace_dir):
+    with pytest.raises(ValueError):
+        with span("test.failing"):
+            raise ValueError("boom")
+
+    _, spans = _load_single_trace(trace_dir)
+    assert spans["test.failing"]["args"]["error"] == "ValueError"
+
+
+def test_traced_decorator_and_annotate(trace_dir):
+    @traced("test.decorated")
+    def work(n):
+        annotate(items=n)
+        return n * 2
+
+    @traced("test.decorated_async")
+    async def async_work():
+        with span("test.child"):
+            await asyncio.sleep(0)
+        return "done"
+
+    assert work(21) == 42
+    assert asyncio.run(async_work()) == "done"
+
+    files = sorted(trace_dir.glob("trace-*.json"))
+    assert len(files) == 2
+    names = set()
+    for f in files:
+        events = json.loads(f.read_text())["traceEvents"]
+        names.update(e["name"] for e in events if e["ph"] == "X")
+        for e in events:
+            if e["name"] == "test.decorated":
+                assert e["args"]["items"] == 21
+    assert names == {"test.decorated", "test.decorated_async", "test.child"}
+
+
+def test_threads_start_their_own_traces(trace_dir):
+    seen = []
+
+    def worker():
+        seen.append(current_trace_id())
+        with span("test.thread"):
+            seen.append(current_trace_id())
+
+    with span("test.main") as root:
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+    assert seen[0] is None
+    assert seen[1] != root.trace_id
+    assert len(list(trace_dir.glob("trace-*.json"))) == 2
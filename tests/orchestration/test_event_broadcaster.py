@@ -0,0 +1,99 @@
+"""
+Tests for the WebSocket fan-out broadcaster.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from orchestration.event_broadcaster import COALESCE, EventBroadcaster
+
+
+def _event(event_type, **data):
+    return {"type": event_type, "severity": "info", "timestamp": "t", "data": data}
+
+
+def test_every_subscriber_gets_every_event():
+    """Events are fanned out, not consumed by whichever client wins."""
+    async def scenario():
+        broadcaster = EventBroadcaster()
+        subs = [broadcaster.subscribe() for _ in range(3)]
+        for i in range(5):
+            broadcaster.publish(_event("tick", index=i))
+        return [[json.loads(await s.get())["data"]["index"] for _ in range(5)] for s in subs]
+
+    assert asyncio.run(scenario()) == [[0, 1, 2, 3, 4]] * 3
+
+
+def test_slow_subscriber_drops_oldest_without_blocking_others():
+    async def scenario():
+        broadcaster = EventBroadcaster(buffer_size=3)
+        slow = broadcaster.subscribe()
+        fast = broadcaster.subscribe()
+        received = []
+        for i in range(10):
+            broadcaster.publish(_event("tick", index=i))
+            received.append(json.loads(await fast.get())["data"]["index"])
+        backlog = [json.loads(await slow.get())["data"]["index"] for _ in range(len(slow))]
+        return received, backlog, slow.stats()
+
+    received, backlog, stats = asyncio.run(scenario())
+    assert received == list(range(10))
+    assert backlog == [7, 8, 9]
+    assert stats["dropped"] == 7
+    assert stats["high_water"] == 3
+
+
+def test_coalesce_replaces_pending_event_for_same_task():
+    async def scenario():
+        broadcaster = EventBroadcaster(buffer_size=10, policy=COALESCE)
+        sub = broadcaster.subscribe()
+        broadcaster.publish(_event("iteration", task_id="T-1", n=1))
+        broadcaster.publish(_event("iteration", task_id="T-2", n=1))
+        broadcaster.publish(_event("iteration", task_id="T-1", n=2))
+        broadcaster.publish(_event("loop_start"))
+        events = [json.loads(await sub.get()) for _ in range(len(sub))]
+        return events, sub.stats()
+
+    events, stats = asyncio.run(scenario())
+    assert [(e["data"].get("task_id"), e["data"].get("n")) for e in events] == [
+        ("T-2", 1), ("T-1", 2), (None, None)
+    ]
+    assert stats["coalesced"] == 1
+
+
+def test_replay_last_n_on_subscribe():
+    async def scenario():
+        broadcaster = EventBroadcaster(replay_size=4)
+        for i in range(6):
+            broadcaster.publish(_event("tick", index=i))
+        full = broadcaster.subscribe()
+        partial = broadcaster.subscribe(replay=2)
+        none = broadcaster.subscribe(replay=0)
+        return len(full), [json.loads(await partial.get())["data"]["index"] for _ in range(2)], len(none)
+
+    assert asyncio.run(scenario()) == (4, [4, 5], 0)
+
+
+def test_producer_task_drains_source_queue_and_stops():
+    async def scenario():
+        source = asyncio.Queue()
+        broadcaster = EventBroadcaster()
+        sub = broadcaster.subscribe()
+        broadcaster.start(source)
+        await source.put(_event("task_start", task_id="T-1"))
+        first = json.loads(await asyncio.wait_for(sub.get(), timeout=1))
+        await broadcaster.stop()
+        return first, await sub.get(), broadcaster.stats()
+
+    first, after_stop, stats = asyncio.run(scenario())
+    assert first["type"] == "task_start"
+    assert after_stop is None
+    assert stats["published"] == 1
+    assert stats["subscribers"] == 0
+
+
+def test_unknown_policy_rejected():
+    with pytest.raises(ValueError):
+        EventBroadcaster(policy="block")
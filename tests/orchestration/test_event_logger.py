@@ -0,0 +1,143 @@
+"""Tests for the EventLogger write pipeline."""
+
+import gc
+import json
+import multiprocessing
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from orchestration.event_logger import EventLogger, EventType
+
+
+def _log_many(project_root: str, count: int) -> None:
+    logger = EventLogger(Path(project_root))
+    for _ in range(count):
+        logger.log(EventType.RALPH_PASS, agent="worker", session_id="s")
+    logger.close()
+
+
+def test_log_returns_before_write_and_flush_persists(tmp_path):
+    logger = EventLogger(tmp_path)
+
+    event_id = logger.log(EventType.RALPH_BLOCKED, agent="qa-team", context={"file": "a.py"})
+    assert event_id.endswith("-001-ralph-blocked")
+
+    assert logger.flush()
+    assert (logger.current_dir / f"{event_id}.md").exists()
+    metrics = json.loads(logger.metrics_file.read_text())
+    assert metrics["totals"]["events_total"] == 1
+    assert metrics["ralph_verdicts"]["blocked"] == 1
+    assert metrics["by_agent"]["qa_team"]["ralph_blocked"] == 1
+    logger.close()
+
+
+def test_sequence_numbers_unique_across_threads(tmp_path):
+    logger = EventLogger(tmp_path)
+    ids = []
+    ids_lock = threading.Lock()
+
+    def worker():
+        for _ in range(50):
+            event_id = logger.log(EventType.RALPH_BLOCKED, agent="qa")
+            with ids_lock:
+                ids.append(event_id)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    metrics = logger.get_metrics()
+    assert len(set(ids)) == 400
+    assert len(list(logger.current_dir.glob("*.md"))) == 400
+    assert metrics["totals"]["events_total"] == 400
+    assert metrics["totals"]["events_logged_detail"] == 400
+    logger.close()
+
+
+def test_counter_resumes_after_existing_files(tmp_path):
+    first = EventLogger(tmp_path, async_writes=False)
+    first.log(EventType.RALPH_BLOCKED, agent="qa")
+    first.log(EventType.RALPH_BLOCKED, agent="qa")
+
+    second = EventLogger(tmp_path, async_writes=False)
+    event_id = second.log(EventType.RALPH_BLOCKED, agent="qa")
+    assert "-003-" in event_id
+
+
+def test_colliding_ids_never_overwrite(tmp_path, monkeypatch):
+    logger = EventLogger(tmp_path, async_writes=False)
+    monkeypatch.setattr(logger, "_next_event_id", lambda event: "2026-01-01-001-ralph-blocked")
+
+    ids = [logger.log(EventType.RALPH_BLOCKED, agent=f"qa-{i}") for i in range(3)]
+
+    pid = os.getpid()
+    base = "2026-01-01-001-ralph-blocked"
+    assert ids == [base, f"{base}-p{pid}", f"{base}-p{pid}-2"]
+    for i, event_id in enumerate(ids):
+        content = (logger.current_dir / f"{event_id}.md").read_text()
+        assert content.startswith(f"# EVENT-{event_id.upper()}") and f"**Agent**: qa-{i}" in content
+    logger.close()
+
+
+def test_counted_only_events_are_aggregated(tmp_path):
+    logger = EventLogger(tmp_path, flush_interval=60)
+    for _ in range(25):
+        assert logger.log(EventType.RALPH_PASS, agent="dev") == "counted"
+
+    metrics = logger.get_metrics()
+    assert metrics["totals"]["events_counted_only"] == 25
+    assert metrics["ralph_verdicts"]["pass"] == 25
+    assert list(logger.current_dir.glob("*.md")) == []
+    logger.close()
+
+
+def test_parallel_processes_lose_no_counts(tmp_path):
+    ctx = multiprocessing.get_context("fork")
+    procs = [ctx.Process(target=_log_many, args=(str(tmp_path), 100)) for _ in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(timeout=30)
+        assert p.exitcode == 0
+
+    metrics = EventLogger(tmp_path).get_metrics()
+    assert metrics["totals"]["events_total"] == 400
+    assert metrics["ralph_verdicts"]["pass"] == 400
+
+
+def test_writer_thread_stops_when_logger_is_collected(tmp_path):
+    logger = EventLogger(tmp_path)
+    logger.log(EventType.RALPH_PASS, agent="dev")
+    thread = logger._writer._thread
+    metrics_file = logger.metrics_file
+
+    del logger
+    gc.collect()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    # Pending counts were written on the way out
+    assert json.loads(metrics_file.read_text())["totals"]["events_total"] == 1
+
+
+def test_failed_save_keeps_delta_for_next_flush(tmp_path, monkeypatch):
+    logger = EventLogger(tmp_path, async_writes=False)
+    writer = logger._writer
+    real_save = writer.save_metrics
+
+    def disk_full(metrics):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(writer, "save_metrics", disk_full)
+    with pytest.raises(OSError):
+        logger.log(EventType.RALPH_PASS, agent="dev")
+    monkeypatch.setattr(writer, "save_metrics", real_save)
+
+    logger.log(EventType.RALPH_PASS, agent="dev")
+    assert logger.get_metrics()["ralph_verdicts"]["pass"] == 2
+    logger.close()
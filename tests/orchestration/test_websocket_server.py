@@ -10,7 +10,8 @@ from orchestration.websocket_server import (
     app,
     stream_event,
     event_queue,
-    active_connections
+    active_connections,
+    broadcast_event,
 )
 
 
@@ -125,6 +126,38 @@ def test_websocket_event_delivery():
         loop.close()
 
 
+def test_websocket_replays_recent_events():
+    """Test new clients receive the last N broadcast events."""
+    with TestClient(app) as client:
+        client.portal.call(broadcast_event, {"type": "task_complete", "data": {"task_id": "t-1"}})
+
+        with client.websocket_connect("/ws?replay=1") as websocket:
+            hello = json.loads(websocket.receive_text())
+            assert hello["data"]["replayed_events"] == 1
+
+            replayed = json.loads(websocket.receive_text())
+            assert replayed["type"] == "task_complete"
+
+        stats = client.get("/ws/stats").json()
+        assert stats["published"] >= 1
+        assert "dropped_total" in client.get("/health").json()["broadcast"]
+
+
+def test_prometheus_metrics_endpoint(client, tmp_path):
+    """Test /metrics exposes live collectors in Prometheus text format."""
+    from monitoring.metrics import MetricsCollector
+
+    collector = MetricsCollector(storage_dir=tmp_path)
+    collector.task_completed("task-1", duration_ms=1200)
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "task_completed_total 1" in response.text
+    assert 'task_duration_ms_bucket{le="2500"} 1' in response.text
+    assert "websocket_connections" in response.text
+
+
 def test_cors_headers(client):
     """Test CORS headers are set correctly."""
     response = client.get(
@@ -0,0 +1,57 @@
+"""
+Smoke tests for the benchmark suite: every case sets up and runs at a tiny
+scale, and baseline comparison flags regressions.
+"""
+
+import json
+
+import pytest
+
+from benchmarks.cases import BENCHMARKS
+from benchmarks.runner import compare, main, run_benchmark
+
+
+@pytest.mark.parametrize("name", sorted(BENCHMARKS))
+def test_case_runs_at_tiny_scale(name):
+    result = run_benchmark(BENCHMARKS[name], scale=0.01, rounds=1, min_time=0)
+    if "skipped" in result:
+        pytest.skip(result["skipped"])
+    assert result["median_us"] > 0
+    assert result["n"] >= 1
+
+
+def _doc(**medians):
+    return {"results": {name: {"n": 10, "median_us": value} for name, value in medians.items()}}
+
+
+def test_compare_flags_regressions_and_improvements():
+    baseline = _doc(a=100.0, b=100.0, c=100.0)
+    baseline["thresholds"] = {"c": 1.0}
+    current = _doc(a=130.0, b=70.0, c=180.0, d=5.0)
+
+    comparison = compare(current, baseline, threshold=0.25)
+
+    assert comparison["a"]["status"] == "regression"
+    assert comparison["b"]["status"] == "improved"
+    assert comparison["c"]["status"] == "ok"   # Per-benchmark threshold
+    assert comparison["d"]["status"] == "new"
+
+
+def test_compare_skips_mismatched_sizes():
+    baseline = _doc(a=100.0)
+    current = {"results": {"a": {"n": 20, "median_us": 500.0}}}
+    assert compare(current, baseline)["a"]["status"] == "incomparable"
+
+
+def test_main_writes_results_and_fails_on_regression(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"results": {
+        "toon.to_toon": {"n": 2, "median_us": 1e-6},
+    }}))
+    output = tmp_path / "results.json"
+
+    code = main(["-k", "toon.to_toon", "--scale", "0.01", "--rounds", "1", "--min-time", "0",
+                 "--baseline", str(baseline), "--output", str(output)])
+
+    assert code == 1
+    assert "toon.to_toon" in json.loads(output.read_text())["results"]
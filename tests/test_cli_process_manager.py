@@ -0,0 +1,178 @@
+"""
+Tests for the CLI process scheduler
+
+Verifies that:
+1. At most max_concurrent CLI runs are in flight, and they do run in parallel
+2. Waiters are served round-robin by owner, FIFO within an owner
+3. Each worker slot has its own config/session directories, seeded with auth
+4. Zombie cleanup runs in the background and never touches running processes
+"""
+
+import asyncio
+import os
+import subprocess
+
+import pytest
+
+from orchestration import cli_process_manager
+from orchestration.cli_process_manager import CliProcessManager, CliProcessScheduler
+
+
+@pytest.fixture
+def scheduler_factory(tmp_path):
+    def make(**kwargs):
+        kwargs.setdefault("worker_root", tmp_path / "workers")
+        kwargs.setdefault("user_config_dir", tmp_path / "user-claude")
+        kwargs.setdefault("cleanup_interval_seconds", None)
+        return CliProcessScheduler(**kwargs)
+    return make
+
+
+def test_concurrency_cap(scheduler_factory):
+    scheduler = scheduler_factory(max_concurrent=3)
+    running, peak = 0, 0
+
+    async def task(worker):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+        return worker.index
+
+    async def main():
+        return await asyncio.gather(*(scheduler.run(task, owner="qa") for _ in range(9)))
+
+    indexes = asyncio.run(main())
+    assert peak == 3
+    assert sorted(set(indexes)) == [0, 1, 2]
+    assert scheduler.stats()["active"] == 0 and scheduler.stats()["acquired"] == 9
+
+
+def test_round_robin_by_owner(scheduler_factory):
+    scheduler = scheduler_factory(max_concurrent=1)
+    order = []
+
+    async def job(owner, name):
+        async with scheduler.slot(owner):
+            order.append(name)
+            await asyncio.sleep(0)
+
+    async def main():
+        holder = await scheduler.acquire("qa")
+        jobs = [asyncio.ensure_future(job("qa", f"qa-{i}")) for i in range(3)]
+        jobs.append(asyncio.ensure_future(job("dev", "dev-0")))
+        jobs.append(asyncio.ensure_future(job("docs", "docs-0")))
+        await asyncio.sleep(0)
+        assert scheduler.stats()["waiting_by_owner"] == {"qa": 3, "dev": 1, "docs": 1}
+        scheduler.release(holder)
+        await asyncio.gather(*jobs)
+
+    asyncio.run(main())
+    assert order == ["qa-0", "dev-0", "docs-0", "qa-1", "qa-2"]
+
+
+def test_cancelled_waiter_does_not_leak_slot(scheduler_factory):
+    scheduler = scheduler_factory(max_concurrent=1)
+
+    async def main():
+        holder = await scheduler.acquire("qa")
+        waiter = asyncio.ensure_future(scheduler.acquire("dev"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        scheduler.release(holder)
+        worker = await asyncio.wait_for(scheduler.acquire("docs"), 1)
+        scheduler.release(worker)
+
+    asyncio.run(main())
+    assert scheduler.stats()["waiting"] == 0 and scheduler.active == 0
+
+
+def test_workers_have_isolated_dirs(scheduler_factory, tmp_path):
+    user_config = tmp_path / "user-claude"
+    user_config.mkdir()
+    (user_config / ".credentials.json").write_text('{"token": "t"}')
+    (user_config / ".claude.json").write_text('{"projects": {}}')
+    scheduler = scheduler_factory(max_concurrent=2)
+
+    async def main():
+        first = await scheduler.acquire()
+        second = await scheduler.acquire()
+        return first.env({"PATH": "/bin"}), second.env({"PATH": "/bin"}), first
+
+    env_a, env_b, first = asyncio.run(main())
+
+    for key in ("CLAUDE_CONFIG_DIR", "XDG_CONFIG_HOME", "XDG_CACHE_HOME", "XDG_STATE_HOME"):
+        assert env_a[key] != env_b[key]
+        assert os.path.isdir(env_a[key])
+    assert env_a["PATH"] == "/bin" and "HOME" not in env_a
+
+    config_dir = first.config_dir
+    assert (config_dir / ".credentials.json").read_text() == '{"token": "t"}'
+    assert (config_dir / ".credentials.json").is_symlink()
+    assert not (config_dir / ".claude.json").is_symlink()  # Copied, not shared
+
+
+def test_cleanup_runs_in_background(scheduler_factory, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        CliProcessManager, "cleanup_zombie_processes", staticmethod(lambda: calls.append(1))
+    )
+    scheduler = scheduler_factory(cleanup_interval_seconds=0.01)
+
+    async def main():
+        async with scheduler.slot():
+            pass  # Nothing runs inline
+        assert calls == []
+        await asyncio.sleep(0.1)
+        await scheduler.aclose()
+
+    asyncio.run(main())
+    assert len(calls) >= 2 and scheduler.cleanups == len(calls)
+
+
+def test_run_serialized_uses_scheduler(tmp_path, monkeypatch):
+    monkeypatch.setattr(CliProcessManager, "_scheduler", None)
+    scheduler = CliProcessManager.configure(
+        max_concurrent=2, worker_root=tmp_path, cleanup_interval_seconds=None
+    )
+    running, peak = 0, 0
+
+    async def task(value):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+        return value * 2
+
+    async def main():
+        return await asyncio.gather(*(CliProcessManager.run_serialized(task, i) for i in range(4)))
+
+    assert asyncio.run(main()) == [0, 2, 4, 6]
+    assert peak == 2 and CliProcessManager.scheduler() is scheduler
+
+
+def test_fallback_cleanup_only_kills_stopped_processes(monkeypatch):
+    import builtins
+
+    real_import = builtins.__import__
+
+    def no_psutil(name, *args, **kwargs):
+        if name == "psutil":
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    ps_output = "  101 S    claude\n  102 T    /usr/local/bin/claude\n  103 T    vim\n  104 R+   claude\n"
+    killed = []
+    monkeypatch.setattr(builtins, "__import__", no_psutil)
+    monkeypatch.setattr(
+        cli_process_manager.subprocess, "run",
+        lambda *a, **k: subprocess.CompletedProcess(a, 0, stdout=ps_output),
+    )
+    monkeypatch.setattr(cli_process_manager.os, "kill", lambda pid, sig: killed.append(pid))
+
+    CliProcessManager.cleanup_zombie_processes()
+    assert killed == [102]
@@ -651,5 +651,193 @@ class TestDatabaseQueryMCPConcurrency:
         assert total_cost > 0
 
 
+class TestDatabaseQueryMCPCacheBounds:
+    """Test cache invalidation, eviction and stats"""
+
+    @pytest.fixture
+    def temp_db(self):
+        """Create a temporary database with a small cache"""
+        from orchestration.mcp.database_query import DatabaseQueryMCP
+
+        temp_dir = tempfile.mkdtemp()
+        db_path = os.path.join(temp_dir, "test.db")
+
+        mcp = DatabaseQueryMCP(
+            connection_string=f"sqlite:///{db_path}",
+            cache_max_entries=3
+        )
+        mcp.init_database()
+        mcp.execute_query("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+        mcp.execute_query("CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INTEGER)")
+
+        yield db_path, mcp
+
+        mcp.close()
+        import shutil
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_write_invalidates_reading_queries(self, temp_db):
+        """A write drops cached results for its table only"""
+        db_path, mcp = temp_db
+
+        assert mcp.query("SELECT * FROM users").rows == []
+        mcp.query("SELECT * FROM orders")
+        mcp.query("SELECT u.name FROM orders o JOIN users u ON u.id = o.user_id")
+
+        mcp.execute_query("INSERT INTO users (name) VALUES (?)", ["Alice"])
+
+        fresh = mcp.query("SELECT * FROM users")
+        assert fresh.cached is False
+        assert [r["name"] for r in fresh.rows] == ["Alice"]
+        assert mcp.query("SELECT * FROM orders").cached is True
+        assert mcp.get_metrics()["cache"]["invalidations"] == 2
+
+    def test_lru_and_byte_budget_eviction(self, temp_db):
+        """Entry count and byte budget are both enforced"""
+        db_path, mcp = temp_db
+
+        for i in range(5):
+            mcp.query("SELECT * FROM users WHERE id = ?", [i])
+        assert mcp.get_cache_size() == 3
+        assert mcp.query("SELECT * FROM users WHERE id = ?", [4]).cached is True
+        assert mcp.query("SELECT * FROM users WHERE id = ?", [0]).cached is False
+
+        mcp._cache.max_bytes = 500
+        mcp.execute_query("INSERT INTO users (name) VALUES (?)", ["x" * 1000])
+        mcp.query("SELECT * FROM users")
+        assert mcp.get_metrics()["cache"]["rejected"] == 1
+        assert mcp.get_metrics()["cache"]["bytes"] <= 500
+
+    def test_ttl_expiry(self, temp_db):
+        """Results expire after the TTL"""
+        import time
+
+        db_path, mcp = temp_db
+        mcp._cache.ttl_seconds = 0.05
+
+        mcp.query("SELECT * FROM users")
+        assert mcp.query("SELECT * FROM users").cached is True
+        time.sleep(0.1)
+        assert mcp.query("SELECT * FROM users").cached is False
+        assert mcp.get_metrics()["cache"]["expirations"] == 1
+
+    def test_cache_stats(self, temp_db):
+        """Hit, miss and hit-rate stats are reported"""
+        db_path, mcp = temp_db
+
+        mcp.query("SELECT * FROM users")
+        mcp.query("SELECT * FROM users")
+        mcp.query("SELECT * FROM users")
+
+        stats = mcp.get_metrics()["cache"]
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(2 / 3, abs=1e-3)
+
+    def test_extract_tables(self):
+        """Tables read and written are parsed from SQL"""
+        from orchestration.mcp.query_cache import extract_tables
+
+        assert extract_tables(
+            'SELECT * FROM main."Users" u JOIN orders o ON o.uid = u.id, items'
+        ) >= {"users", "orders", "items"}
+        assert extract_tables("INSERT OR REPLACE INTO users VALUES (1)") == {"users"}
+        assert extract_tables("update orders set x = 1") == {"orders"}
+        assert extract_tables("CREATE INDEX idx ON users(name)") == {"users"}
+        assert extract_tables("PRAGMA foreign_keys = ON") is None
+
+
+class TestDatabaseQueryMCPPoolCheckout:
+    """Test checked-out connection pooling"""
+
+    @pytest.fixture
+    def temp_db(self):
+        """Create a temporary database with a small pool"""
+        from orchestration.mcp.database_query import DatabaseQueryMCP
+
+        temp_dir = tempfile.mkdtemp()
+        db_path = os.path.join(temp_dir, "test.db")
+
+        mcp = DatabaseQueryMCP(
+            connection_string=f"sqlite:///{db_path}",
+            pool_size=2,
+            pool_timeout_seconds=0.2
+        )
+        mcp.execute_query("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+
+        yield db_path, mcp
+
+        mcp.close()
+        import shutil
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_concurrent_threads_get_own_connections(self, temp_db):
+        """Threads query in parallel on separate WAL connections"""
+        import threading
+
+        db_path, mcp = temp_db
+        barrier = threading.Barrier(2)
+        results = []
+
+        def do_query(i):
+            barrier.wait()
+            results.append(mcp.query("SELECT * FROM users WHERE id = ?", [i]))
+
+        threads = [threading.Thread(target=do_query, args=(i,)) for i in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert all(r.success for r in results)
+        stats = mcp.get_pool_stats()
+        assert stats["total_connections"] <= 2
+        assert stats["active_connections"] == 0
+        with mcp._pool.connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_exhausted_pool_waits_then_times_out(self, temp_db):
+        """Callers wait for a free connection, bounded by the pool timeout"""
+        db_path, mcp = temp_db
+
+        with mcp._pool.connection(), mcp._pool.connection():
+            result = mcp.query("SELECT * FROM users")
+
+        assert result.success is False
+        assert "No database connection free" in result.error
+        stats = mcp.get_pool_stats()
+        assert stats["waits"] == 1 and stats["timeouts"] == 1
+        assert stats["max_wait_ms"] >= 200
+        assert mcp.query("SELECT * FROM users").success is True
+
+    def test_failed_write_returns_clean_connection(self, temp_db):
+        """A failed statement doesn't leave a transaction open on the pooled connection"""
+        db_path, mcp = temp_db
+
+        mcp.execute_query("INSERT INTO users (id, name) VALUES (1, 'a')")
+        assert mcp.execute_query("INSERT INTO users (id, name) VALUES (1, 'b')").success is False
+
+        with mcp._pool.connection() as conn:
+            assert conn.in_transaction is False
+        assert mcp.get_pool_stats()["created"] == 1  # Reused throughout
+
+    def test_close_then_reconnect(self, temp_db):
+        """close() drops pooled connections; the next query opens a new one"""
+        db_path, mcp = temp_db
+
+        mcp.query("SELECT * FROM users")
+        mcp.close()
+        assert mcp.get_pool_stats()["total_connections"] == 0
+        assert mcp.query("SELECT * FROM users WHERE id = 1").success is True
+
+    def test_postgres_placeholder_translation(self):
+        """qmark placeholders become %s outside string literals"""
+        from orchestration.mcp.db_pool import PostgresBackend
+
+        assert PostgresBackend.translate(
+            "SELECT * FROM t WHERE a = ? AND b LIKE 'x?%' AND c = ?"
+        ) == "SELECT * FROM t WHERE a = %s AND b LIKE 'x?%%' AND c = %s"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
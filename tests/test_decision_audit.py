@@ -3,6 +3,7 @@ Tests for Decision Audit Trail (Phase 4)
 """
 
 import json
+import sqlite3
 import tempfile
 from datetime import date, datetime
 from pathlib import Path
@@ -408,25 +409,191 @@ class TestIntegrity:
         assert result["integrity_ok"] is True
 
 
+class TestRangeVerification:
+    """Tests for streaming range verification and the hash chain."""
+
+    def _write_days(self, temp_audit_dir, days):
+        """Write one file per day, backdated by renaming today's file."""
+        paths = []
+        for day in days:
+            audit = DecisionAudit(project="p", audit_dir=temp_audit_dir, use_index=False)
+            for i in range(5):
+                audit.log_decision(decision_type="custom", decision=f"d{i}", reason="r", task_id="T-1")
+            target = temp_audit_dir / f"decisions-p-{day.strftime('%Y%m%d')}.jsonl"
+            audit._get_audit_file().rename(target)
+            paths.append(target)
+        return paths
+
+    def _tamper(self, path):
+        lines = path.read_text().splitlines()
+        data = json.loads(lines[2])
+        data["decision"] = "forged"
+        lines[2] = json.dumps(data)
+        path.write_text("\n".join(lines) + "\n")
+
+    def test_verify_range_parallel(self, temp_audit_dir):
+        """Test that a range is verified per file, in date order."""
+        days = [date(2026, 1, d) for d in (1, 2, 3, 4)]
+        paths = self._write_days(temp_audit_dir, days)
+        self._tamper(paths[2])
+
+        audit = DecisionAudit(project="p", audit_dir=temp_audit_dir)
+        results = list(audit.verify_range(date(2026, 1, 2), date(2026, 1, 4), max_workers=2))
+
+        assert [r["date"] for r in results] == ["2026-01-02", "2026-01-03", "2026-01-04"]
+        assert [r["integrity_ok"] for r in results] == [True, False, True]
+        assert results[1]["invalid"] == 1
+        assert results[1]["invalid_lines"] == [3]
+
+    def test_chain_detects_reordered_lines(self, temp_audit_dir):
+        """Test that the chain catches edits the per-entry checksums miss."""
+        days = [date(2026, 1, d) for d in (1, 2, 3)]
+        paths = self._write_days(temp_audit_dir, days)
+
+        audit = DecisionAudit(project="p", audit_dir=temp_audit_dir)
+        links = audit.seal(through=date(2026, 1, 2))
+        assert [link.file for link in links] == [paths[0].name, paths[1].name]
+
+        # Swap two lines: every checksum is still valid
+        lines = paths[1].read_text().splitlines()
+        lines[0], lines[1] = lines[1], lines[0]
+        paths[1].write_text("\n".join(lines) + "\n")
+
+        results = list(audit.verify_range(chain=True, max_workers=1))
+        assert [r["chain_ok"] for r in results] == [True, False, None]
+        assert results[1]["invalid"] == 0
+        assert results[1]["integrity_ok"] is False
+
+    def test_seal_is_incremental(self, temp_audit_dir):
+        """Test that sealing extends the chain without resealing old days."""
+        self._write_days(temp_audit_dir, [date(2026, 1, 1), date(2026, 1, 2)])
+        audit = DecisionAudit(project="p", audit_dir=temp_audit_dir)
+
+        assert len(audit.seal(through=date(2026, 1, 1))) == 1
+        assert len(audit.seal(through=date(2026, 1, 2))) == 1
+        assert audit.seal(through=date(2026, 1, 2)) == []
+
+        from orchestration.audit_integrity import AuditChain
+        assert AuditChain(temp_audit_dir, "p").verify_links()
+
+
+class TestDecisionIndex:
+    """Tests for the per-task offset index."""
+
+    def _log_tasks(self, audit, tasks, per_task=3):
+        for i in range(per_task):
+            for task_id in tasks:
+                audit.log_iteration(task_id=task_id, iteration=i, action="edit", result="ok")
+
+    def test_index_file_created(self, audit, temp_audit_dir):
+        """Test that the sidecar index lives next to the JSONL files."""
+        audit.log_decision(decision_type="custom", decision="x", reason="y", task_id="T-1")
+
+        assert (temp_audit_dir / "decisions-test-project.index.db").exists()
+        assert len(list(temp_audit_dir.glob("*.jsonl"))) == 1
+
+    def test_indexed_lookup_matches_scan(self, temp_audit_dir):
+        """Test that indexed and scanning lookups return the same entries."""
+        indexed = DecisionAudit(project="p", audit_dir=temp_audit_dir)
+        self._log_tasks(indexed, ["T-1", "T-2", "T-3"])
+        scanning = DecisionAudit(project="p", audit_dir=temp_audit_dir, use_index=False)
+
+        for task_id in ["T-1", "T-2", "T-3"]:
+            via_index = indexed.get_decisions_for_task(task_id)
+            via_scan = scanning.get_decisions_for_task(task_id)
+            assert [d.id for d in via_index] == [d.id for d in via_scan]
+            assert len(via_index) == 3
+
+    def test_catches_up_on_unindexed_appends(self, temp_audit_dir):
+        """Test that lines written without the index are picked up on lookup."""
+        writer = DecisionAudit(project="p", audit_dir=temp_audit_dir, use_index=False)
+        self._log_tasks(writer, ["T-1"], per_task=2)
+
+        reader = DecisionAudit(project="p", audit_dir=temp_audit_dir)
+        assert len(reader.get_decisions_for_task("T-1")) == 2
+
+        self._log_tasks(writer, ["T-1"], per_task=1)
+        assert len(reader.get_decisions_for_task("T-1")) == 3
+
+    def test_get_decision_by_id(self, audit):
+        """Test direct lookup of a single decision."""
+        decision_id = audit.log_decision(
+            decision_type=DecisionType.TASK_ROUTED,
+            decision="route_to_bugfix",
+            reason="Low complexity",
+            task_id="T-9",
+        )
+
+        entry = audit.get_decision(decision_id)
+        assert entry is not None
+        assert entry.decision == "route_to_bugfix"
+        assert audit.get_decision("DEC-missing") is None
+
+    def test_reindex_rebuilds_from_files(self, audit, temp_audit_dir):
+        """Test that reindex recovers from a deleted index."""
+        self._log_tasks(audit, ["T-1", "T-2"])
+        audit._index.close()
+        (temp_audit_dir / "decisions-test-project.index.db").unlink()
+
+        rebuilt = DecisionAudit(project="test-project", audit_dir=temp_audit_dir)
+        assert rebuilt.reindex() == 6
+        assert len(rebuilt.get_decisions_for_task("T-2")) == 3
+        assert rebuilt.build_decision_tree("T-1")["decision_count"] == 3
+
+    def test_get_decision_scans_when_index_fails(self, audit, monkeypatch):
+        """Test that a locked or corrupt index falls back to the JSONL files."""
+        decision_id = audit.log_decision(decision_type="custom", decision="x", reason="y", task_id="T-1")
+
+        def locked(_decision_id):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(audit._index, "locate_decision", locked)
+        entry = audit.get_decision(decision_id)
+        assert entry is not None and entry.decision == "x"
+
+    def test_catch_up_skips_unchanged_files(self, temp_audit_dir, monkeypatch):
+        """Test that lookups don't re-glob, re-read or keep stat'ing settled files."""
+        writer = DecisionAudit(project="p", audit_dir=temp_audit_dir, use_index=False)
+        self._log_tasks(writer, ["T-1"], per_task=2)
+        old_file = temp_audit_dir / "decisions-p-20200101.jsonl"
+        old_file.write_text(writer._get_audit_file().read_text())
+
+        reader = DecisionAudit(project="p", audit_dir=temp_audit_dir)
+        index = reader._index
+        globs, reads = [], []
+        real_glob, real_index_file = index._audit_files, index._index_file
+        monkeypatch.setattr(index, "_audit_files", lambda: globs.append(1) or real_glob())
+        monkeypatch.setattr(index, "_index_file", lambda path, start: reads.append(path.name) or real_index_file(path, start))
+
+        assert len(reader.get_decisions_for_task("T-1")) == 4
+        assert len(reader.get_decisions_for_task("T-1")) == 4
+        assert len(globs) == 1 and len(reads) == 2
+        assert index._sealed == {old_file.name}
+
+        self._log_tasks(writer, ["T-1"], per_task=1)  # Grows today's file only
+        assert len(reader.get_decisions_for_task("T-1")) == 5
+        assert reads[2:] == [writer._get_audit_file().name]
+
+
 class TestGlobalFunctions:
     """Tests for global convenience functions."""
 
-    def test_get_audit_returns_singleton(self, temp_audit_dir, monkeypatch):
-        """Test that get_audit returns the same instance."""
-        # Clear the global dict
+    @pytest.fixture(autouse=True)
+    def isolated_defaults(self, temp_audit_dir, monkeypatch):
+        """Keep default audits (and their index files) out of .aibrain/audit."""
         import orchestration.decision_audit as module
-        module._default_audits = {}
+        monkeypatch.setattr(module, "DEFAULT_AUDIT_DIR", temp_audit_dir)
+        monkeypatch.setattr(module, "_default_audits", {})
 
+    def test_get_audit_returns_singleton(self):
+        """Test that get_audit returns the same instance."""
         audit1 = get_audit("test-project")
         audit2 = get_audit("test-project")
 
         assert audit1 is audit2
 
-    def test_log_decision_global(self, temp_audit_dir, monkeypatch):
+    def test_log_decision_global(self, temp_audit_dir):
         """Test the global log_decision function."""
-        import orchestration.decision_audit as module
-        module._default_audits = {}
-
         decision_id = log_decision(
             project="test-global",
             decision_type=DecisionType.TASK_STARTED,
@@ -435,3 +602,4 @@ class TestGlobalFunctions:
         )
 
         assert decision_id.startswith("DEC-")
+        assert list(temp_audit_dir.glob("decisions-test-global-*.jsonl"))
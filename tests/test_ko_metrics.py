@@ -0,0 +1,165 @@
+"""
+Tests for batched Knowledge Object consultation metrics.
+"""
+
+import json
+import threading
+from contextlib import contextmanager
+
+import pytest
+
+import knowledge.metrics as metrics
+from knowledge.metrics import MetricsAggregator
+
+
+@pytest.fixture
+def metrics_db(tmp_path, monkeypatch):
+    """Point the module-level aggregator at a temp database."""
+    monkeypatch.setattr(metrics, "METRICS_DB", tmp_path / "metrics.db")
+    monkeypatch.setattr(metrics, "METRICS_FILE", tmp_path / "metrics.json")
+    yield tmp_path / "metrics.db"
+    if metrics._aggregator is not None:
+        metrics._aggregator.close()
+    metrics._aggregator = None
+
+
+class TestMetricsAggregator:
+    def test_records_are_buffered_until_flush(self, tmp_path):
+        agg = MetricsAggregator(tmp_path / "m.db", flush_interval=0)
+        agg.record_consultation("KO-1")
+        agg.record_retrievals(["KO-1", "KO-2"])
+
+        assert not (tmp_path / "m.db").exists()
+        assert agg.flush() == 2
+
+        loaded = agg.load()
+        assert loaded["KO-1"].total_consultations == 1
+        assert loaded["KO-1"].total_retrievals == 1
+        assert loaded["KO-2"].total_retrievals == 1
+        assert loaded["KO-1"].first_consulted is not None
+
+    def test_inline_flush_when_max_pending_reached(self, tmp_path):
+        agg = MetricsAggregator(tmp_path / "m.db", flush_interval=0, max_pending=3)
+        agg.record_retrievals(["KO-1", "KO-2", "KO-3"])
+
+        assert (tmp_path / "m.db").exists()
+        assert agg._pending == {}
+
+    def test_concurrent_writers_lose_no_counts(self, tmp_path):
+        db = tmp_path / "m.db"
+        writers = [MetricsAggregator(db, flush_interval=0, max_pending=7) for _ in range(4)]
+
+        def work(agg):
+            for _ in range(250):
+                agg.record_consultation("KO-1")
+            agg.flush()
+
+        threads = [threading.Thread(target=work, args=(agg,)) for agg in writers]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert writers[0].load()["KO-1"].total_consultations == 1000
+
+    def test_first_and_last_consulted_merge_across_flushes(self, tmp_path):
+        agg = MetricsAggregator(tmp_path / "m.db", flush_interval=0)
+        agg.record_consultation("KO-1", timestamp="2026-01-02T00:00:00")
+        agg.flush()
+        agg.record_consultation("KO-1", timestamp="2026-01-05T00:00:00")
+        agg.record_consultation("KO-1", timestamp="2026-01-01T00:00:00")
+
+        m = agg.load("KO-1")["KO-1"]
+        assert m.first_consulted == "2026-01-01T00:00:00"
+        assert m.last_consulted == "2026-01-05T00:00:00"
+
+    def test_failed_flush_keeps_earliest_and_latest_timestamps(self, tmp_path, monkeypatch):
+        agg = MetricsAggregator(tmp_path / "m.db", flush_interval=0)
+        agg.record_consultation("KO-1", timestamp="2026-01-02T00:00:00")
+        agg.record_consultation("KO-1", timestamp="2026-01-04T00:00:00")
+
+        @contextmanager
+        def locked_db():
+            # A consultation recorded while the flush is in flight
+            agg.record_consultation("KO-1", timestamp="2026-01-03T00:00:00")
+            raise metrics.sqlite3.OperationalError("database is locked")
+            yield
+
+        monkeypatch.setattr(agg, "_connect", locked_db)
+        with pytest.raises(metrics.sqlite3.OperationalError):
+            agg.flush()
+
+        merged = agg._pending["KO-1"]
+        assert merged.counters["total_consultations"] == 3
+        assert merged.first_consulted == "2026-01-02T00:00:00"
+        assert merged.last_consulted == "2026-01-04T00:00:00"
+
+    def test_imports_legacy_json_once(self, tmp_path):
+        legacy = tmp_path / "metrics.json"
+        legacy.write_text(json.dumps({
+            "KO-old": {"ko_id": "KO-old", "total_consultations": 5, "successful_outcomes": 2}
+        }))
+
+        MetricsAggregator(tmp_path / "m.db", flush_interval=0, legacy_json=legacy).load()
+        loaded = MetricsAggregator(tmp_path / "m.db", flush_interval=0, legacy_json=legacy).load()
+
+        assert loaded["KO-old"].total_consultations == 5
+        assert loaded["KO-old"].successful_outcomes == 2
+
+
+class TestModuleApi:
+    def test_effectiveness_reports(self, metrics_db):
+        for _ in range(10):
+            metrics.record_consultation("KO-a", task_id="T-1")
+        metrics.record_consultation("KO-b", task_id="T-2")
+        metrics.record_outcome("T-1", success=True, iterations=3, consulted_ko_ids=["KO-a"])
+        metrics.record_outcome("T-2", success=False, iterations=5, consulted_ko_ids=["KO-b"])
+
+        report = metrics.get_effectiveness("KO-a")
+        assert report["success_rate"] == 100.0
+        assert report["avg_iterations"] == 3.0
+        assert report["impact_score"] == 100.0
+        assert metrics.get_effectiveness("KO-missing") is None
+
+        ranked = metrics.get_all_effectiveness()
+        assert [r["ko_id"] for r in ranked] == ["KO-a", "KO-b"]
+        assert [r["ko_id"] for r in metrics.get_all_effectiveness(min_consultations=2)] == ["KO-a"]
+        assert len(metrics.get_all_effectiveness(limit=1)) == 1
+
+        summary = metrics.get_summary_stats()
+        assert summary["total_consultations"] == 11
+        assert summary["overall_success_rate"] == 50.0
+
+    def test_retrieval_only_kos_are_not_reported_as_consulted(self, metrics_db):
+        metrics.record_consultation("KO-a", task_id="T-1")
+        metrics.record_outcome("T-1", success=True, iterations=1, consulted_ko_ids=["KO-a"])
+        metrics.record_retrievals(["KO-a", "KO-b", "KO-c"])
+
+        summary = metrics.get_summary_stats()
+
+        assert summary["total_kos_with_consultations"] == 1
+        assert [r["ko_id"] for r in summary["top_kos"]] == ["KO-a"]
+
+
+class TestOversightCollector:
+    def test_reads_metrics_db(self, tmp_path):
+        from governance.oversight.data_collector import DataCollector
+
+        knowledge_dir = tmp_path / "knowledge"
+        agg = MetricsAggregator(knowledge_dir / "metrics.db", flush_interval=0)
+        agg.record_consultation("KO-1", timestamp="2026-01-02T00:00:00")
+        agg.record_outcome(["KO-1"], success=True, iterations=2)
+        agg.record_retrievals(["KO-1", "KO-2"])
+        agg.flush()
+
+        ko_metrics = DataCollector(tmp_path).collect_ko_metrics()
+
+        assert ko_metrics["KO-1"]["total_consultations"] == 1
+        assert ko_metrics["KO-1"]["successful_outcomes"] == 1
+        assert ko_metrics["KO-1"]["last_consulted"] == "2026-01-02T00:00:00"
+        assert "KO-2" not in ko_metrics  # Retrieved, never consulted
+
+    def test_no_metrics_yet(self, tmp_path):
+        from governance.oversight.data_collector import DataCollector
+
+        assert DataCollector(tmp_path).collect_ko_metrics() is None
@@ -0,0 +1,101 @@
+"""
+Tests for the glob-aware file-pattern index over Knowledge Objects.
+"""
+
+import pytest
+
+from knowledge.pattern_index import FilePatternIndex, compile_pattern
+
+
+@pytest.fixture
+def index():
+    idx = FilePatternIndex()
+    idx.add("KO-auth", ["src/auth/*"])
+    idx.add("KO-py", ["*.py"])
+    idx.add("KO-tests", ["tests/**/test_*.py"])
+    idx.add("KO-migrations", ["db/migrations/"])
+    idx.add("KO-exact", ["package.json"])
+    idx.add("KO-dir", ["apps/web"])
+    return idx
+
+
+class TestCompilePattern:
+    def test_basename_pattern_matches_anywhere(self):
+        assert compile_pattern("*.py") == [("**", "*.py")]
+
+    def test_literal_pattern_also_matches_as_directory(self):
+        assert compile_pattern("./src/auth") == [("src", "auth"), ("src", "auth", "**")]
+
+    def test_collapses_repeated_globstar(self):
+        assert compile_pattern("a/**/**/b.ts") == [("a", "**", "b.ts")]
+
+
+class TestFilePatternIndex:
+    def test_single_level_wildcard(self, index):
+        assert index.match(["src/auth/login.ts"]) == ["KO-auth"]
+        assert index.match(["src/auth/deep/login.ts"]) == []
+
+    def test_basename_glob(self, index):
+        assert set(index.match(["agents/base.py"])) == {"KO-py"}
+
+    def test_globstar_matches_zero_or_more_segments(self, index):
+        assert set(index.match(["tests/test_a.py"])) == {"KO-py", "KO-tests"}
+        assert set(index.match(["tests/x/y/test_b.py"])) == {"KO-py", "KO-tests"}
+        assert set(index.match(["tests/x/helper.py"])) == {"KO-py"}
+
+    def test_directory_patterns(self, index):
+        assert index.match(["db/migrations/001_init.sql"]) == ["KO-migrations"]
+        assert index.match(["apps/web/src/page.tsx"]) == ["KO-dir"]
+        assert index.match(["apps/webapp/page.tsx"]) == []
+
+    def test_exact_pattern_string_still_matches(self, index):
+        assert index.match(["src/auth/*"]) == ["KO-auth"]
+        assert index.match(["package.json"]) == ["KO-exact"]
+
+    def test_many_paths_in_one_pass_deduplicates(self, index):
+        result = index.match(["src/auth/a.ts", "src/auth/b.ts", "./package.json", "x.py"])
+        assert result == ["KO-auth", "KO-py", "KO-exact"]
+
+    def test_remove_and_replace(self, index):
+        assert index.remove("KO-auth")
+        assert index.match(["src/auth/login.ts"]) == []
+
+        index.add("KO-py", ["*.pyi"])
+        assert index.match(["mod.py"]) == []
+        assert index.match(["mod.pyi"]) == ["KO-py"]
+        assert index.patterns_for("KO-py") == ["*.pyi"]
+
+
+class TestFindRelevantForFiles:
+    def test_returns_all_matching_kos_for_project(self, monkeypatch, tmp_path):
+        import knowledge.service as service
+
+        drafts_dir = tmp_path / "drafts"
+        approved_dir = tmp_path / "approved"
+        drafts_dir.mkdir()
+        approved_dir.mkdir()
+        monkeypatch.setattr(service, "KO_DRAFTS_DIR", drafts_dir)
+        monkeypatch.setattr(service, "KO_APPROVED_DIR", approved_dir)
+        monkeypatch.setattr(service, "_record_retrievals", lambda ko_ids: None)
+        service.invalidate_cache()
+
+        ids = []
+        for project, patterns in [("test", ["src/auth/**"]), ("test", ["*.sql"]), ("other", ["*.sql"])]:
+            ko = service.create_draft(
+                project=project,
+                title="Pattern KO",
+                what_was_learned="x",
+                why_it_matters="y",
+                prevention_rule="z",
+                tags=[],
+                file_patterns=patterns,
+            )
+            service.approve(ko.id)
+            ids.append(ko.id)
+
+        results = service.find_relevant_for_files("test", ["src/auth/mw/session.ts", "db/001.sql"])
+        assert sorted(ko.id for ko in results) == sorted(ids[:2])
+
+        via_find = service.find_relevant(project="test", file_patterns=["db/001.sql"])
+        assert [ko.id for ko in via_find] == [ids[1]]
+        service.invalidate_cache()
@@ -0,0 +1,128 @@
+"""
+Tests for the BM25 full-text index over Knowledge Objects.
+"""
+
+import pytest
+
+from knowledge.service import KnowledgeObject
+from knowledge.text_index import BM25Index, tokenize
+
+
+def _ko(ko_id, title, learned="", rule="", tags=None, project="test"):
+    return KnowledgeObject(
+        id=ko_id,
+        project=project,
+        title=title,
+        what_was_learned=learned,
+        why_it_matters="",
+        prevention_rule=rule,
+        tags=tags or [],
+        status="approved",
+        created_at="2026-01-01T00:00:00",
+    )
+
+
+@pytest.fixture
+def kos():
+    return [
+        _ko("KO-t-001", "Null check in auth middleware",
+            "Session may be missing on expired tokens", "Guard req.session", ["auth", "null-check"]),
+        _ko("KO-t-002", "Database migrations need rollback",
+            "Alembic downgrade was missing", "Always write downgrade()", ["database", "migrations"]),
+        _ko("KO-t-003", "Retry flaky HTTP calls",
+            "Upstream API times out under load", "Use exponential backoff", ["http", "retry"]),
+        _ko("KO-o-001", "Auth tokens expire silently",
+            "Token refresh was skipped", "Refresh before expiry", ["auth"], project="other"),
+    ]
+
+
+class TestTokenize:
+    def test_splits_punctuation_and_drops_stopwords(self):
+        assert tokenize("The null-check in auth_middleware") == ["null", "check", "auth", "middleware"]
+
+
+class TestBM25Index:
+    def test_search_ranks_keyword_matches(self, kos):
+        index = BM25Index()
+        index.sync(kos)
+
+        hits = index.search("auth session null", project="test")
+
+        assert hits[0][0] == "KO-t-001"
+        assert all(ko_id.startswith("KO-t-") for ko_id, _ in hits)
+
+    def test_project_filter_and_exclude(self, kos):
+        index = BM25Index()
+        index.sync(kos)
+
+        assert [h[0] for h in index.search("auth", project="other")] == ["KO-o-001"]
+        assert index.search("auth", project="test", exclude_ids={"KO-t-001"}) == []
+
+    def test_sync_is_incremental(self, kos):
+        index = BM25Index()
+        assert index.sync(kos) == (4, 0)
+        assert index.sync(kos) == (0, 0)
+
+        kos[1].prevention_rule = "Test downgrade() in CI"
+        assert index.sync(kos[:3]) == (1, 1)
+        assert "KO-o-001" not in index
+        assert index.search("CI")[0][0] == "KO-t-002"
+
+    def test_removed_terms_do_not_match(self, kos):
+        index = BM25Index()
+        index.sync(kos)
+        index.remove("KO-t-003")
+
+        assert index.search("backoff") == []
+        assert len(index) == 3
+
+    def test_save_and_load_roundtrip(self, kos, tmp_path):
+        index = BM25Index()
+        index.sync(kos)
+        index.remove("KO-t-002")
+        path = tmp_path / "bm25.json.gz"
+        index.save(path)
+
+        loaded = BM25Index.load(path)
+
+        assert len(loaded) == 3
+        assert loaded.search("retry http") == index.search("retry http")
+        assert loaded.sync(kos[:1] + kos[2:]) == (0, 0)
+
+    def test_load_missing_or_corrupt_returns_empty(self, tmp_path):
+        assert len(BM25Index.load(tmp_path / "missing.json.gz")) == 0
+
+        bad = tmp_path / "bad.json.gz"
+        bad.write_bytes(b"not gzip")
+        assert len(BM25Index.load(bad)) == 0
+
+
+class TestFindRelevantKeywordStage:
+    def test_hybrid_query_returns_bm25_matches_without_tags(self, monkeypatch, tmp_path):
+        import knowledge.service as service
+
+        drafts_dir = tmp_path / "drafts"
+        approved_dir = tmp_path / "approved"
+        drafts_dir.mkdir()
+        approved_dir.mkdir()
+        monkeypatch.setattr(service, "KO_DRAFTS_DIR", drafts_dir)
+        monkeypatch.setattr(service, "KO_APPROVED_DIR", approved_dir)
+        monkeypatch.setattr(service, "_check_semantic_available", lambda: False)
+        monkeypatch.setattr(service, "_record_retrievals", lambda ko_ids: None)
+        service.invalidate_cache()
+
+        ko = service.create_draft(
+            project="test",
+            title="Exponential backoff for webhooks",
+            what_was_learned="Webhook delivery failed on 429",
+            why_it_matters="Lost events",
+            prevention_rule="Retry with jitter",
+            tags=["webhooks"],
+        )
+        service.approve(ko.id)
+
+        results = service.find_relevant(project="test", query="429 retry jitter")
+
+        assert [r.id for r in results] == [ko.id]
+        assert (tmp_path / "index" / "bm25.json.gz").exists()
+        service.invalidate_cache()
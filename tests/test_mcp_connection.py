@@ -0,0 +1,284 @@
+"""
+Tests for MCPConnection's multiplexed JSON-RPC client and MCPConnectionPool.
+
+Runs a small stdio MCP server (written to tmp_path) that answers tool calls
+from worker threads, so responses come back out of order.
+"""
+
+import asyncio
+import sys
+import textwrap
+import time
+
+import pytest
+
+from mcp_integration.connection import MCPConnection, MCPTimeoutError
+from mcp_integration.pool import MCPConnectionPool
+from mcp_integration.provider import MCPProvider
+from mcp_integration.server_config import MCPServerConfig, MCPServerType
+
+FAKE_SERVER = textwrap.dedent('''
+    import json, sys, threading, time
+
+    lock = threading.Lock()
+    cancelled = []
+
+    def send(message):
+        with lock:
+            sys.stdout.write(json.dumps(message) + "\\n")
+            sys.stdout.flush()
+
+    def handle(request):
+        name = request["params"]["name"]
+        args = request["params"]["arguments"]
+        if name == "sleep":
+            time.sleep(args["seconds"])
+            send({"jsonrpc": "2.0", "id": request["id"],
+                  "result": {"content": [{"type": "text", "text": args["tag"]}]}})
+        elif name == "notify":
+            send({"jsonrpc": "2.0", "method": "notifications/progress", "params": {"n": args["n"]}})
+            send({"jsonrpc": "2.0", "id": 9999, "method": "ping"})
+            send({"jsonrpc": "2.0", "id": request["id"], "result": {"ok": True}})
+        elif name == "cancelled":
+            send({"jsonrpc": "2.0", "id": request["id"], "result": {"cancelled": cancelled}})
+        elif name == "crash":
+            sys.stderr.write("fatal: boom\\n")
+            sys.stderr.flush()
+            sys.stdout.flush()
+            import os
+            os._exit(1)
+        else:
+            send({"jsonrpc": "2.0", "id": request["id"],
+                  "error": {"code": -32602, "message": "unknown tool"}})
+
+    for line in sys.stdin:
+        message = json.loads(line)
+        method = message.get("method")
+        if method == "initialize":
+            send({"jsonrpc": "2.0", "id": message["id"], "result": {"capabilities": {}}})
+        elif method == "tools/list":
+            send({"jsonrpc": "2.0", "id": message["id"],
+                  "result": {"tools": [{"name": "sleep"}, {"name": "notify"}]}})
+        elif method == "tools/call":
+            threading.Thread(target=handle, args=(message,), daemon=True).start()
+        elif method == "notifications/cancelled":
+            cancelled.append(message["params"]["requestId"])
+        elif method == "ping":
+            send({"jsonrpc": "2.0", "id": message["id"], "result": {}})
+        elif method == "freeze":
+            time.sleep(60)  # Stops reading stdin: a hung server
+''')
+
+
+@pytest.fixture
+def config(tmp_path):
+    script = tmp_path / "fake_mcp_server.py"
+    script.write_text(FAKE_SERVER)
+    return MCPServerConfig(
+        name="fake",
+        type=MCPServerType.STDIO,
+        command=sys.executable,
+        args=[str(script)],
+        timeout_seconds=10,
+    )
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_concurrent_calls_are_matched_by_id(config):
+    async def scenario():
+        conn = MCPConnection(server_name="fake", config=config)
+        assert await conn.connect(), conn.last_error
+        assert [t.name for t in conn.tools] == ["sleep", "notify"]
+        try:
+            started = time.perf_counter()
+            results = await asyncio.gather(*(
+                conn.call_tool("sleep", {"seconds": delay, "tag": f"call-{i}"})
+                for i, delay in enumerate([0.3, 0.1, 0.2, 0.0])
+            ))
+            elapsed = time.perf_counter() - started
+        finally:
+            await conn.disconnect()
+        return results, elapsed
+
+    results, elapsed = _run(scenario())
+    assert [r["content"][0]["text"] for r in results] == ["call-0", "call-1", "call-2", "call-3"]
+    assert elapsed < 0.55  # Overlapped, not 0.6s serialized
+
+
+def test_notifications_and_server_ping(config):
+    async def scenario():
+        conn = MCPConnection(server_name="fake", config=config)
+        assert await conn.connect(), conn.last_error
+        received = []
+        conn.on_notification("notifications/progress", received.append)
+        try:
+            result = await conn.call_tool("notify", {"n": 3})
+        finally:
+            await conn.disconnect()
+        return result, received
+
+    result, received = _run(scenario())
+    assert result == {"ok": True}
+    assert received == [{"n": 3}]
+
+
+def test_timeout_cancels_request(config):
+    async def scenario():
+        conn = MCPConnection(server_name="fake", config=config)
+        assert await conn.connect(), conn.last_error
+        try:
+            with pytest.raises(RuntimeError, match="Timed out"):
+                await conn.call_tool("sleep", {"seconds": 1, "tag": "slow"}, timeout=0.05)
+
+            # Caller-side cancellation is forwarded too
+            task = asyncio.create_task(conn.call_tool("sleep", {"seconds": 1, "tag": "x"}))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            await asyncio.sleep(0.05)
+            cancelled = await conn.call_tool("cancelled", {})
+            assert conn._pending == {}
+            # Later calls are unaffected by the abandoned ones
+            ok = await conn.call_tool("sleep", {"seconds": 0, "tag": "after"})
+        finally:
+            await conn.disconnect()
+        return cancelled, ok
+
+    cancelled, ok = _run(scenario())
+    assert len(cancelled["cancelled"]) == 2
+    assert ok["content"][0]["text"] == "after"
+
+
+def test_error_response_and_server_exit(config):
+    async def scenario():
+        conn = MCPConnection(server_name="fake", config=config)
+        assert await conn.connect(), conn.last_error
+        with pytest.raises(RuntimeError, match="Tool call failed"):
+            await conn.call_tool("missing", {})
+
+        pending = asyncio.create_task(conn.call_tool("sleep", {"seconds": 5, "tag": "lost"}))
+        await asyncio.sleep(0.05)
+        with pytest.raises(RuntimeError, match="closed connection"):
+            await asyncio.gather(conn.call_tool("crash", {}), pending)
+        await asyncio.sleep(0)
+        await conn.disconnect()
+        return conn
+
+    conn = _run(scenario())
+    assert not conn.connected
+    assert conn.last_error == "fatal: boom"
+
+
+def test_provider_connects_once_for_concurrent_callers(config):
+    async def scenario():
+        provider = MCPProvider(servers={"fake": config}, summarize_large_responses=False)
+        try:
+            results = await asyncio.gather(*(
+                provider.call_tool("fake", "sleep", {"seconds": 0.05, "tag": str(i)})
+                for i in range(5)
+            ))
+            return results, provider.get_pool_stats()["fake"]["connections"]
+        finally:
+            await provider.disconnect_all()
+
+    results, connections = _run(scenario())
+    assert [r["content"][0]["text"] for r in results] == ["0", "1", "2", "3", "4"]
+    assert connections == 1
+
+
+# ─── Pool ────────────────────────────────────────────────────────────────────
+
+def test_warm_up_shares_tools_list(config):
+    config.pool_size = 3
+    config.warm_spares = 2
+
+    async def scenario():
+        provider = MCPProvider(servers={"fake": config}, summarize_large_responses=False)
+        try:
+            await provider.warm_up()
+            pool = provider._pools["fake"]
+            warm = pool.stats()
+            tools_shared = all(c.tools is pool.tools for c in pool._connections)
+            available = [t.name for t in provider.get_available_tools()]
+
+            # Checking one out tops the idle spares back up
+            async with pool.connection():
+                await asyncio.sleep(0.5)
+                topped_up = pool.stats()
+            return warm, tools_shared, available, topped_up
+        finally:
+            await provider.disconnect_all()
+
+    warm, tools_shared, available, topped_up = _run(scenario())
+    assert warm["connections"] == 2 and warm["spawned"] == 2
+    assert tools_shared
+    assert available == ["sleep", "notify"]
+    assert topped_up["connections"] == 3 and topped_up["idle"] == 2
+
+
+def test_unsafe_server_runs_one_call_per_process(config):
+    config.pool_size = 2
+    config.concurrency_safe = False
+
+    async def scenario():
+        pool = MCPConnectionPool("fake", config)
+        try:
+            started = time.perf_counter()
+            results = await asyncio.gather(*(
+                _pooled_call(pool, "sleep", {"seconds": 0.2, "tag": str(i)}) for i in range(4)
+            ))
+            return results, time.perf_counter() - started, pool.stats()
+        finally:
+            await pool.close()
+
+    results, elapsed, stats = _run(scenario())
+    assert [r["content"][0]["text"] for r in results] == ["0", "1", "2", "3"]
+    assert stats["connections"] == 2 and stats["waits"] == 2
+    assert 0.4 <= elapsed < 0.8
+
+
+def test_crashed_and_hung_processes_are_recycled(config):
+    config.health_check_interval = 0
+    config.timeout_seconds = 1  # Also bounds the health-check ping
+
+    async def scenario():
+        pool = MCPConnectionPool("fake", config)
+        try:
+            with pytest.raises(RuntimeError, match="closed connection"):
+                await _pooled_call(pool, "crash", {})
+            assert (await _pooled_call(pool, "sleep", {"seconds": 0, "tag": "a"}))["content"]
+
+            # A call that times out on a hung process gets the process recycled
+            async with pool.connection() as conn:
+                await conn.notify("freeze")
+            with pytest.raises(MCPTimeoutError):
+                await _pooled_call(pool, "sleep", {"seconds": 0, "tag": "b"}, timeout=0.1)
+            await asyncio.sleep(1.5)
+            after_hang = pool.stats()
+
+            # Idle processes killed externally are caught by the health check
+            await _pooled_call(pool, "sleep", {"seconds": 0, "tag": "c"})
+            pool._connections[0].process.kill()
+            await asyncio.sleep(0.2)
+            await pool.check_health()
+            recycled = pool.stats()["recycled"] - after_hang["recycled"]
+            result = await _pooled_call(pool, "sleep", {"seconds": 0, "tag": "d"})
+            return after_hang, recycled, pool.stats(), result
+        finally:
+            await pool.close()
+
+    after_hang, recycled, final, result = _run(scenario())
+    assert after_hang["recycled"] == 2 and after_hang["connections"] == 0
+    assert recycled == 1
+    assert result["content"][0]["text"] == "d"
+    assert final["connections"] == 1 and final["recycled"] == 3
+
+
+async def _pooled_call(pool, tool, arguments, timeout=None):
+    async with pool.connection() as conn:
+        return await conn.call_tool(tool, arguments, timeout=timeout)
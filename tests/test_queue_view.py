@@ -0,0 +1,130 @@
+"""
+Tests for the orchestrator MCP server's work queue views.
+
+Verifies that queues are parsed once per file version, that cursors page
+through status-filtered tasks without gaps, and that responses are compact.
+"""
+
+import json
+import os
+
+import pytest
+
+from optimization.toon_format import from_toon
+from orchestration.mcp.queue_view import (
+    MAX_PAGE_SIZE,
+    QueueCache,
+    encode_response,
+    paginate,
+    select_fields,
+)
+
+
+def _write_queue(path, tasks):
+    path.write_text(json.dumps({"project": "demo", "tasks": tasks}, indent=2))
+
+
+def _tasks(n):
+    return [
+        {
+            "id": f"T-{i:03d}",
+            "status": "pending" if i % 3 else "completed",
+            "title": f"Task {i}",
+            "description": "x" * 200,
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def queue_path(tmp_path):
+    path = tmp_path / "work_queue_demo.json"
+    _write_queue(path, _tasks(25))
+    return path
+
+
+def test_queue_parsed_once_per_version(queue_path):
+    cache = QueueCache()
+
+    first = cache.get(queue_path)
+    assert cache.get(queue_path) is first
+    assert (cache.loads, cache.hits) == (1, 1)
+    assert first.get_task("T-004")["title"] == "Task 4"
+    assert first.count("completed") == 9
+
+    _write_queue(queue_path, _tasks(26))
+    os.utime(queue_path, ns=(first.mtime_ns + 10**9,) * 2)
+    assert cache.get(queue_path).count() == 26
+    assert cache.loads == 2
+
+    queue_path.unlink()
+    assert cache.get(queue_path) is None
+
+
+def test_cursor_pages_through_filtered_tasks(queue_path):
+    snapshot = QueueCache().get(queue_path)
+
+    seen, cursor = [], None
+    while True:
+        tasks, cursor = paginate(snapshot, status="pending", limit=4, cursor=cursor)
+        seen.extend(t["id"] for t in tasks)
+        if cursor is None:
+            break
+
+    expected = [t["id"] for t in snapshot.tasks if t["status"] == "pending"]
+    assert seen == expected and len(seen) == 16
+
+
+def test_cursor_survives_inserted_tasks(queue_path):
+    cache = QueueCache()
+    page, cursor = paginate(cache.get(queue_path), limit=5)
+
+    tasks = _tasks(25)
+    tasks.insert(0, {"id": "T-NEW", "status": "pending"})
+    _write_queue(queue_path, tasks)
+    os.utime(queue_path, ns=(cache.get(queue_path).mtime_ns + 10**9,) * 2)
+
+    next_page, _ = paginate(cache.get(queue_path), limit=5, cursor=cursor)
+    assert page[-1]["id"] == "T-004"
+    assert next_page[0]["id"] == "T-005"
+
+
+def test_limit_and_bad_cursor(queue_path):
+    snapshot = QueueCache().get(queue_path)
+
+    tasks, cursor = paginate(snapshot, limit=MAX_PAGE_SIZE * 10)
+    assert len(tasks) == 25 and cursor is None
+
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        paginate(snapshot, cursor="not-a-cursor")
+
+
+def test_projection_and_compact_encoding(queue_path):
+    snapshot = QueueCache().get(queue_path)
+    tasks, cursor = paginate(snapshot, limit=3, fields=["status"])
+    payload = {"tasks": tasks, "count": 3, "next_cursor": cursor}
+
+    assert select_fields(snapshot.tasks[0], ["title"]) == {"id": "T-000", "title": "Task 0"}
+    assert tasks[0] == {"id": "T-000", "status": "completed"}
+
+    compact = encode_response(payload)
+    assert json.loads(compact) == payload
+    assert len(compact) < len(json.dumps(payload, indent=2))
+
+    header, *lines = encode_response(payload, fmt="toon").splitlines()
+    assert from_toon(header)["next_cursor"] == cursor
+    assert [from_toon(line) for line in lines] == tasks
+
+
+def test_toon_keeps_multiline_task_on_one_line():
+    tasks = [
+        {"id": "T-001", "description": "Fix login\nthen add tests\r\nand docs", "files": ["a\nb"]},
+        {"id": "T-002", "description": "One line"},
+    ]
+
+    lines = encode_response({"tasks": tasks, "count": 2}, fmt="toon").splitlines()
+
+    assert len(lines) == 3
+    assert from_toon(lines[1])["description"] == "Fix login\\nthen add tests\\nand docs"
+    assert from_toon(lines[2])["id"] == "T-002"
+    assert tasks[0]["description"].count("\n") == 2  # Input left untouched
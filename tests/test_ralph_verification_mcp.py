@@ -406,5 +406,117 @@ class TestRalphVerificationMCPConcurrency:
         assert total_cost > 0
 
 
+class TestRalphVerificationMCPBatchCache:
+    """Test deduped, parallel and incremental batch verification"""
+
+    @staticmethod
+    def _counting_server(monkeypatch, delay=0.0, **kwargs):
+        import time
+
+        server = RalphVerificationMCP(**kwargs)
+        calls = []
+        original = server._run_check
+
+        def run_check(check, code_content):
+            calls.append((check, code_content))
+            if delay:
+                time.sleep(delay(code_content) if callable(delay) else delay)
+            return original(check, code_content)
+
+        monkeypatch.setattr(server, "_run_check", run_check)
+        return server, calls
+
+    def test_batch_dedupes_identical_contents(self, monkeypatch):
+        """Identical contents are checked once and charged once"""
+        server, calls = self._counting_server(monkeypatch)
+        files = [(f"f{i}.py", "x=1" if i % 2 else "y = 2") for i in range(10)]
+
+        results = server.verify_batch(files)
+
+        assert [r.file_path for r in results] == [f"f{i}.py" for i in range(10)]
+        assert [r.result for r in results[:2]] == [VerificationResult.PASS, VerificationResult.FAIL]
+        assert len(calls) == 4  # 2 contents x (security, linting)
+        assert sum(not r.cached for r in results) == 2
+        assert server.get_metrics()["total_verifications"] == 2
+
+    def test_new_check_reuses_cached_checks(self, monkeypatch):
+        """Adding a check runs only that check"""
+        server, calls = self._counting_server(monkeypatch)
+
+        server.verify_file("a.py", "x = 1", checks=["linting"])
+        calls.clear()
+        result = server.verify_file("b.py", "x = 1", checks=["linting", "type_checking"])
+
+        assert calls == [("type_checking", "x = 1")]
+        assert result.cached is False
+        assert server.verify_batch([("c.py", "x = 1")], checks=["type_checking"])[0].cached is True
+
+    def test_cache_is_bounded(self):
+        """Least recently used check results are evicted"""
+        server = RalphVerificationMCP(cache_max_entries=4)
+
+        server.verify_batch([(f"f{i}.py", f"x = {i}") for i in range(5)])
+
+        assert server.get_cache_size() == 4
+        assert server.get_metrics()["cache"]["evictions"] == 6
+
+    def test_batch_runs_in_parallel(self, monkeypatch):
+        """A batch takes about as long as its slowest file"""
+        import time
+
+        server, calls = self._counting_server(monkeypatch, delay=0.1, max_workers=40)
+        files = [(f"f{i}.py", f"x = {i}") for i in range(20)]
+
+        started = time.perf_counter()
+        results = server.verify_batch(files)
+        elapsed = time.perf_counter() - started
+
+        assert len(results) == 20 and len(calls) == 40
+        assert elapsed < 1.0  # 4s if run one check at a time
+
+    def test_batch_timeout_skips_slow_files(self, monkeypatch):
+        """Files whose checks overrun the timeout are skipped without waiting"""
+        import time
+
+        server, calls = self._counting_server(
+            monkeypatch, delay=lambda code: 2.0 if "slow" in code else 0.0,
+            timeout_seconds=0.2,
+        )
+
+        started = time.perf_counter()
+        results = server.verify_batch([("fast.py", "x = 1"), ("slow.py", "slow = 1")])
+
+        assert time.perf_counter() - started < 1.0
+        assert [r.file_path for r in results] == ["fast.py"]
+
+    def test_batch_timeout_cancels_queued_checks(self, monkeypatch):
+        """Checks still queued at the timeout never run; workers are daemons"""
+        import threading
+        import time
+
+        server, calls = self._counting_server(
+            monkeypatch, delay=lambda code: 1.0 if "slow" in code else 0.0,
+            timeout_seconds=0.2, max_workers=1,
+        )
+
+        results = server.verify_batch([("slow.py", "slow = 1"), ("a.py", "x = 1")])
+
+        assert results == []
+        assert calls == [("security", "slow = 1")]
+        workers = [t for t in threading.enumerate() if t.name.startswith("ralph-verify")]
+        assert workers and all(t.daemon for t in workers)
+        time.sleep(1.0)
+        assert len(calls) == 1 and server.get_cache_size() == 0
+
+    def test_extra_checks_do_not_change_passed_count(self):
+        """passed_count keeps its meaning however many checks are requested"""
+        server = RalphVerificationMCP()
+
+        plain = server.verify_file("a.py", "x = 1", checks=["linting"])
+        more = server.verify_file("b.py", "y = 2", checks=["linting", "type_checking", "formatting"])
+
+        assert plain.passed_count == more.passed_count == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
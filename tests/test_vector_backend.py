@@ -0,0 +1,206 @@
+"""
+Tests for the unified KO vector backend (pre-filtering and adaptive over-fetch).
+"""
+
+from knowledge.vector_backend import ChromaBackend, LanceDBBackend, VectorFilter
+from knowledge.vector_store import SearchResult
+
+
+class FakeEmbedder:
+    def embed(self, text):
+        return [0.0]
+
+    def embed_batch(self, texts):
+        return [[0.0] for _ in texts]
+
+
+class FakeLanceStore:
+    """Ranked corpus of (ko_id, project); records every query."""
+
+    def __init__(self, rows, has_filter_columns):
+        self.rows = rows
+        self.has_filter_columns = has_filter_columns
+        self.calls = []
+        self.indexed = []
+
+    def search(self, query_embedding, top_k=5, where=None):
+        self.calls.append((top_k, where))
+        rows = self.rows
+        if where:
+            # Only project prefilters are exercised here
+            project = where.split("project = '")[1].split("'")[0]
+            rows = [r for r in rows if r[1] == project]
+        return [
+            SearchResult(ko_id=ko_id, score=1.0 - i / 1000, metadata={"project": project})
+            for i, (ko_id, project) in enumerate(rows[:top_k])
+        ]
+
+    def index_batch(self, items):
+        self.indexed.extend(items)
+        return len(items)
+
+
+def _corpus():
+    # 200 KOs from a big project rank above the 3 KOs of a small project
+    rows = [(f"KO-big-{i}", "big") for i in range(200)]
+    rows += [(f"KO-small-{i}", "small") for i in range(3)]
+    return rows
+
+
+class TestLanceDBBackend:
+    def test_prefilter_pushes_project_into_query(self):
+        store = FakeLanceStore(_corpus(), has_filter_columns=True)
+        backend = LanceDBBackend(store=store, embedder=FakeEmbedder())
+
+        hits = backend.search("q", top_k=3, flt=VectorFilter(project="small"))
+
+        assert [h.ko_id for h in hits] == ["KO-small-0", "KO-small-1", "KO-small-2"]
+        assert len(store.calls) == 1
+        assert "project = 'small'" in store.calls[0][1]
+
+    def test_where_clause_combines_filters(self):
+        backend = LanceDBBackend(store=FakeLanceStore([], True), embedder=FakeEmbedder())
+        where = backend._where_clause(VectorFilter(
+            project="p", status="approved", tags=["auth"], exclude_ids={"KO-1"}
+        ))
+
+        assert where == (
+            "project = 'p' AND status = 'approved' AND (tags LIKE '%,auth,%') "
+            "AND ko_id NOT IN ('KO-1')"
+        )
+
+    def test_legacy_table_overfetches_until_k_matches(self):
+        store = FakeLanceStore(_corpus(), has_filter_columns=False)
+        backend = LanceDBBackend(store=store, embedder=FakeEmbedder())
+
+        hits = backend.search("q", top_k=3, flt=VectorFilter(project="small"))
+
+        assert [h.ko_id for h in hits] == ["KO-small-0", "KO-small-1", "KO-small-2"]
+        assert [top_k for top_k, _ in store.calls] == [3, 12, 48, 192, 768]
+        assert all(where is None for _, where in store.calls)
+
+    def test_overfetch_stops_when_store_exhausted(self):
+        store = FakeLanceStore(_corpus(), has_filter_columns=False)
+        backend = LanceDBBackend(store=store, embedder=FakeEmbedder())
+
+        hits = backend.search("q", top_k=5, flt=VectorFilter(project="missing"))
+
+        assert hits == []
+        assert store.calls[-1][0] > len(store.rows)
+
+    def test_upsert_batches_embeddings(self):
+        from knowledge.service import KnowledgeObject
+
+        store = FakeLanceStore([], True)
+        backend = LanceDBBackend(store=store, embedder=FakeEmbedder())
+        kos = [
+            KnowledgeObject(id=f"KO-{i}", project="p", title="t", what_was_learned="w",
+                            why_it_matters="", prevention_rule="r", tags=["x"],
+                            status="approved", created_at="")
+            for i in range(3)
+        ]
+
+        assert backend.upsert(kos) == 3
+        assert store.indexed[0][2]["project"] == "p"
+
+
+class FakeChromaStore:
+    def __init__(self):
+        self.calls = []
+
+    def ids_missing_metadata(self):
+        return []
+
+    def search(self, query, tags=None, top_k=5, where=None):
+        self.calls.append((top_k, where))
+        return [
+            {"id": f"KO-{i}", "score": 0.9, "tags": [], "project": "p"}
+            for i in range(top_k)
+        ]
+
+
+class TestChromaBackend:
+    def test_project_and_status_become_where_clause(self):
+        store = FakeChromaStore()
+        backend = ChromaBackend(store=store)
+
+        hits = backend.search("q", top_k=2, flt=VectorFilter(project="p", status="approved"))
+
+        assert len(hits) == 2
+        assert store.calls == [(2, {"$and": [
+            {"project": {"$eq": "p"}}, {"status": {"$eq": "approved"}}
+        ]})]
+
+    def test_excluded_ids_are_post_filtered_with_overfetch(self):
+        store = FakeChromaStore()
+        backend = ChromaBackend(store=store)
+
+        hits = backend.search("q", top_k=2, flt=VectorFilter(project="p", exclude_ids={"KO-0", "KO-1"}))
+
+        assert [h.ko_id for h in hits] == ["KO-2", "KO-3"]
+        assert store.calls[0][0] == 4
+
+
+class LegacyChromaStore:
+    """Ranked entries; like Chroma, `$eq` never matches a missing metadata key."""
+
+    def __init__(self, entries):
+        self.entries = entries  # [(ko_id, metadata)], best match first
+        self.calls = []
+
+    def ids_missing_metadata(self):
+        return [ko_id for ko_id, metadata in self.entries if "project" not in metadata]
+
+    def update_metadata(self, items):
+        updates = {ko_id: {"project": project, "status": status} for ko_id, _, project, status in items}
+        self.entries = [(ko_id, {**metadata, **updates.get(ko_id, {})}) for ko_id, metadata in self.entries]
+        return len(items)
+
+    def search(self, query, tags=None, top_k=5, where=None):
+        self.calls.append((top_k, where))
+        wanted = where["project"]["$eq"] if where else None
+        return [
+            {"id": ko_id, "score": 0.9, "tags": [], "project": metadata.get("project", "")}
+            for ko_id, metadata in self.entries
+            if wanted is None or metadata.get("project") == wanted
+        ][:top_k]
+
+
+class TestChromaLegacyEntries:
+    def _store(self):
+        # KO-km-* were indexed before project metadata was stored
+        return LegacyChromaStore(
+            [(f"KO-km-{i}", {}) for i in range(3)]
+            + [(f"KO-cm-{i}", {"project": "credentialmate"}) for i in range(3)]
+        )
+
+    def _kos(self):
+        from knowledge.service import KnowledgeObject
+
+        return [
+            KnowledgeObject(id=f"KO-{prefix}-{i}", project=project, title="t", what_was_learned="w",
+                            why_it_matters="", prevention_rule="r", tags=[],
+                            status="approved", created_at="")
+            for prefix, project in (("km", "karematch"), ("cm", "credentialmate"))
+            for i in range(3)
+        ]
+
+    def test_legacy_entries_disable_pushdown(self):
+        store = self._store()
+        backend = ChromaBackend(store=store)
+
+        hits = backend.search("q", top_k=2, flt=VectorFilter(project="credentialmate"))
+
+        assert [h.ko_id for h in hits] == ["KO-cm-0", "KO-cm-1"]
+        assert all(where is None for _, where in store.calls)
+
+    def test_backfill_restores_legacy_entries(self):
+        store = self._store()
+        backend = ChromaBackend(store=store)
+
+        assert backend.backfill(self._kos()) == 3
+        assert backend.backfill(self._kos()) == 0
+        hits = backend.search("q", top_k=5, flt=VectorFilter(project="karematch"))
+
+        assert [h.ko_id for h in hits] == ["KO-km-0", "KO-km-1", "KO-km-2"]
+        assert store.calls == [(5, {"project": {"$eq": "karematch"}})]
@@ -156,6 +156,28 @@ class TestKOVectorStore:
         if results:
             assert results[0].ko_id != "test_ko"
 
+    def test_index_batch_upserts(self, temp_db_path):
+        """Test bulk indexing updates existing KOs instead of duplicating them."""
+        pytest.importorskip("lancedb")
+        from knowledge.vector_store import KOVectorStore
+
+        store = KOVectorStore(db_path=temp_db_path, embedding_dim=4)
+        store.index_batch([
+            ("ko1", [1.0, 0.0, 0.0, 0.0], {"v": 1}),
+            ("ko2", [0.0, 1.0, 0.0, 0.0], {"v": 1}),
+        ])
+        store.index_batch([
+            ("ko2", [0.0, 0.0, 1.0, 0.0], {"v": 2}),
+            ("ko3", [0.0, 0.0, 0.0, 1.0], {"v": 1}),
+        ])
+
+        assert store.count() == 3
+        assert sorted(store.get_all_ids()) == ["ko1", "ko2", "ko3"]
+
+        results = store.search([0.0, 0.0, 1.0, 0.0], top_k=1)
+        assert results[0].ko_id == "ko2"
+        assert results[0].metadata == {"v": 2}
+
 
 class TestHybridSearch:
     """Tests for hybrid search in knowledge service."""